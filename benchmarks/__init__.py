@@ -0,0 +1 @@
+"""Offline end-to-end performance benchmarks (``python -m scripts.check bench``)."""
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for citekey resolution on a synthetic N-reference manuscript.
+
+Times citation numbering (``convert_to_numbered_citations``), grounding
+verification and hallucination repair against the citation ledger, once with a
+fresh ``CitationIndex`` built on every call (approximating the per-call map
+rebuilding these passes did before the index was shared) and once with the
+memoized per-workflow index.
+
+    PYTHONPATH=. python benchmarks/citations.py --refs 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from src.citation.index import CitationIndex, citation_index_for_keys, citation_index_for_rows
+from src.export.markdown_refs import convert_to_numbered_citations
+from src.writing.citation_grounding import repair_hallucinated_citekeys, verify_citation_grounding
+
+_SURNAMES = (
+    "Smith", "Okafor", "Pérez-Encinas", "Nguyen", "Müller", "Adeyemi", "García", "Kowalski",
+    "Haddad", "Johansson", "Tanaka", "Mensah", "O'Brien", "Van der Berg", "Ibrahim", "Silva",
+)  # fmt: skip
+_SECTIONS = ("introduction", "methods", "results", "discussion", "conclusion")
+
+
+def synthesize_citations(n_refs: int, *, rng_seed: int = 20261019) -> tuple[list[tuple], list[str]]:
+    """Return *n_refs* citation-ledger rows and one markdown body per manuscript section.
+
+    Bodies cite every reference several times in single and grouped brackets,
+    mixing accented, alias (space/punctuation) and hallucinated variants.
+    """
+    rng = random.Random(rng_seed)
+    rows: list[tuple] = []
+    for i in range(n_refs):
+        surname = _SURNAMES[i % len(_SURNAMES)]
+        year = 2000 + (i * 7) % 25
+        citekey = f"{surname.replace(' ', '').replace(chr(39), '')}{year}{'abcdefghij'[i // len(_SURNAMES) % 10]}"
+        authors = json.dumps([f"{surname}, A.", "Doe, J."])
+        rows.append((f"c{i}", citekey, f"10.1000/bench.{i}", f"Study {i}", authors, year, "J Bench", None, None))
+    keys = [row[1] for row in rows]
+    bodies: list[str] = []
+    for section in _SECTIONS:
+        paragraphs: list[str] = [f"## {section.title()}"]
+        for _ in range(n_refs // 2):
+            picked = rng.sample(keys, k=rng.randint(1, 3))
+            variants = []
+            for key in picked:
+                roll = rng.random()
+                if roll < 0.1:
+                    variants.append(key.lower())
+                elif roll < 0.15:
+                    variants.append(f"{key[:5]}Fake{key[-5:]}")
+                else:
+                    variants.append(key)
+            paragraphs.append(f"Finding reported across cohorts [{', '.join(variants)}].")
+        bodies.append("\n\n".join(paragraphs))
+    return rows, bodies
+
+
+def _timed(fn: Callable[[], Any], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return round((time.perf_counter() - start) * 1000 / repeat, 3)
+
+
+def run_citation_benchmark(n_refs: int = 500, *, repeat: int = 3) -> dict[str, Any]:
+    """Per-call milliseconds for each citation pass, rebuilt vs shared index."""
+    rows, bodies = synthesize_citations(n_refs)
+    manuscript = "\n\n".join(bodies)
+    valid_keys = [row[1] for row in rows]
+    shared_rows = citation_index_for_rows(rows)
+    shared_keys = citation_index_for_keys(valid_keys)
+
+    def _numbering(index_factory: Callable[[], CitationIndex]) -> None:
+        convert_to_numbered_citations(manuscript, rows, index=index_factory())
+
+    def _grounding(index_factory: Callable[[], CitationIndex]) -> None:
+        for body in bodies:
+            _, hallucinated = verify_citation_grounding(body, index_factory(), "bench")
+            repair_hallucinated_citekeys(body, hallucinated, index_factory())
+
+    numbered, ordered = convert_to_numbered_citations(manuscript, rows, index=shared_rows)
+    return {
+        "refs": n_refs,
+        "citation_groups": manuscript.count("]."),
+        "numbered_refs": len(ordered),
+        "index_build_ms": _timed(lambda: CitationIndex.from_rows(rows), repeat),
+        "numbering_rebuilt_ms": _timed(lambda: _numbering(lambda: CitationIndex.from_rows(rows)), repeat),
+        "numbering_shared_ms": _timed(lambda: _numbering(lambda: shared_rows), repeat),
+        "grounding_repair_rebuilt_ms": _timed(lambda: _grounding(lambda: CitationIndex(valid_keys)), repeat),
+        "grounding_repair_shared_ms": _timed(lambda: _grounding(lambda: shared_keys), repeat),
+        "unresolved_after_numbering": sum(1 for line in numbered.splitlines() if "Fake" in line),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--refs", type=int, default=500, help="Citation-ledger size")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions per pass")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    print(json.dumps(run_citation_benchmark(args.refs, repeat=args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
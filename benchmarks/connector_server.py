@@ -0,0 +1,43 @@
+"""Local HTTP stand-in for the OpenAlex ``/works`` endpoint.
+
+Serves a pre-built list of work records with OpenAlex-style cursor paging, so
+the real ``OpenAlexConnector`` (request building, retries, JSON parsing,
+``_to_candidate``) is exercised without network access.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from aiohttp import web
+
+
+def _app(works: list[dict[str, Any]]) -> web.Application:
+    async def handle_works(request: web.Request) -> web.Response:
+        per_page = min(200, int(request.query.get("per_page", "25")))
+        cursor = request.query.get("cursor", "*")
+        offset = 0 if cursor == "*" else int(cursor)
+        page = works[offset : offset + per_page]
+        next_offset = offset + len(page)
+        meta = {"count": len(works), "next_cursor": str(next_offset) if next_offset < len(works) else None}
+        return web.json_response({"meta": meta, "results": page})
+
+    app = web.Application()
+    app.router.add_get("/works", handle_works)
+    return app
+
+
+@asynccontextmanager
+async def serve_openalex(works: list[dict[str, Any]]) -> AsyncIterator[str]:
+    """Serve *works* on an ephemeral localhost port; yields the ``/works`` URL."""
+    runner = web.AppRunner(_app(works), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    try:
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        yield f"http://127.0.0.1:{port}/works"
+    finally:
+        await runner.cleanup()
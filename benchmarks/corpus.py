@@ -0,0 +1,157 @@
+"""Synthetic benchmark corpus seeded from the replay fixture.
+
+The replay fixture (``tests/fixtures/replay``) holds 70 real papers and a
+finished manuscript.  ``synthesize_works`` scales that seed to any size as
+OpenAlex-shaped work records: titles and abstracts are recombined from the
+seed vocabulary so they stay distinct for MinHash deduplication, and a fixed
+share of the records are exact-DOI or near-title duplicates so the dedup phase
+has real work to do.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from src.models import ReviewConfig, ReviewType, SettingsConfig
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+FIXTURE_DIR = REPO_ROOT / "tests" / "fixtures" / "replay"
+SETTINGS_PATH = REPO_ROOT / "config" / "settings.yaml"
+
+BENCH_EMBED_MODEL = "test:bench"
+BENCH_EMBED_DIM = 64
+
+
+@dataclass(frozen=True)
+class SeedCorpus:
+    topic: str
+    papers: list[dict[str, Any]]
+    manuscript_md: str
+
+
+def load_seed_corpus(fixture_dir: Path = FIXTURE_DIR) -> SeedCorpus:
+    """Read seed papers, the review topic and the manuscript from the replay fixture."""
+    # The fixture is a WAL database: ``immutable=1`` keeps SQLite from creating
+    # -shm/-wal sidecars next to the checked-in file.
+    conn = sqlite3.connect(f"file:{fixture_dir / 'runtime.db'}?mode=ro&immutable=1", uri=True)
+    try:
+        (topic,) = conn.execute("SELECT topic FROM workflows LIMIT 1").fetchone()
+        rows = conn.execute(
+            "SELECT title, abstract, authors, year, journal, country FROM papers ORDER BY paper_id"
+        ).fetchall()
+    finally:
+        conn.close()
+    papers = [
+        {
+            "title": title,
+            "abstract": abstract or "",
+            "authors": json.loads(authors or "[]") or ["Anonymous"],
+            "year": year,
+            "journal": journal,
+            "country": country,
+        }
+        for title, abstract, authors, year, journal, country in rows
+    ]
+    manuscript = (fixture_dir / "doc_manuscript.md").read_text(encoding="utf-8")
+    return SeedCorpus(topic=topic, papers=papers, manuscript_md=manuscript)
+
+
+def _inverted_index(text: str) -> dict[str, list[int]]:
+    index: dict[str, list[int]] = {}
+    for pos, word in enumerate(text.split()):
+        index.setdefault(word, []).append(pos)
+    return index
+
+
+def synthesize_works(
+    seed: SeedCorpus,
+    n: int,
+    *,
+    duplicate_rate: float = 0.1,
+    rng_seed: int = 20260518,
+) -> list[dict[str, Any]]:
+    """Return *n* OpenAlex ``/works`` records derived from *seed*.
+
+    About ``duplicate_rate`` of the records repeat an earlier work, alternating
+    between an exact DOI match and a lightly edited title without a DOI.
+    """
+    rng = random.Random(rng_seed)
+    title_vocab = sorted({w for p in seed.papers for w in p["title"].split() if len(w) > 3})
+    abstract_words = [w for p in seed.papers for w in p["abstract"].split()]
+    works: list[dict[str, Any]] = []
+    for i in range(n):
+        if works and rng.random() < duplicate_rate:
+            original = rng.choice(works)
+            dup = dict(original, id=f"https://openalex.org/W9{i:08d}")
+            if i % 2:
+                dup["display_name"] = original["display_name"].rstrip(".") + " (preprint)"
+                dup["doi"] = None
+            works.append(dup)
+            continue
+        base = seed.papers[i % len(seed.papers)]
+        title = " ".join(rng.sample(title_vocab, 9)).capitalize()
+        start = rng.randrange(max(1, len(abstract_words) - 180))
+        abstract = " ".join(abstract_words[start : start + 180]) or base["title"]
+        works.append(
+            {
+                "id": f"https://openalex.org/W1{i:08d}",
+                "display_name": title,
+                "doi": f"https://doi.org/10.5555/bench.{i:07d}",
+                "publication_year": base["year"] or 2020 + i % 6,
+                "abstract_inverted_index": _inverted_index(abstract),
+                "authorships": [
+                    {"author": {"display_name": name}, "countries": [base["country"]] if base["country"] else []}
+                    for name in base["authors"][:6]
+                ],
+                "primary_location": {
+                    "source": {"display_name": base["journal"] or "Journal of Benchmarking"},
+                    "landing_page_url": f"https://example.org/works/{i}",
+                },
+            }
+        )
+    return works
+
+
+def bench_review(seed: SeedCorpus) -> ReviewConfig:
+    keywords = ["modular vehicle", "extendable frame", "urban mobility", "spatial efficiency"]
+    return ReviewConfig(
+        research_question=seed.topic,
+        review_type=ReviewType.SYSTEMATIC,
+        pico={
+            "population": "urban vehicles and fleets",
+            "intervention": "modular or extendable vehicle frames",
+            "comparison": "fixed-frame vehicles",
+            "outcome": "mobility, spatial efficiency and operational performance",
+        },
+        keywords=keywords,
+        domain="transportation engineering",
+        scope="urban mobility",
+        inclusion_criteria=["evaluates modular or extendable vehicle frame technology"],
+        exclusion_criteria=["not peer reviewed"],
+        date_range_start=2000,
+        date_range_end=2026,
+        target_databases=["openalex"],
+    )
+
+
+def bench_settings(screen_cap: int) -> SettingsConfig:
+    """Repo settings with every agent on pydantic_ai's offline ``test`` model."""
+    raw = yaml.safe_load(SETTINGS_PATH.read_text(encoding="utf-8"))
+    settings = SettingsConfig.model_validate(raw)
+    for agent in settings.agents.values():
+        agent.model = "test"
+    settings.screening.max_llm_screen = screen_cap
+    settings.screening.reviewer_batch_size = 10
+    settings.rag.embed_model = BENCH_EMBED_MODEL
+    settings.rag.embed_dim = BENCH_EMBED_DIM
+    # Provider quotas are not under test; pace the stubs as fast as the limiter allows.
+    settings.llm.flash_rpm = settings.llm.flash_lite_rpm = 1000
+    settings.llm.pro_rpm = 500
+    return settings
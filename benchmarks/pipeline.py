@@ -0,0 +1,264 @@
+"""End-to-end benchmark pipeline over a synthetic corpus.
+
+Each phase calls the same production entry points the workflow nodes use:
+
+- ``search``: ``OpenAlexConnector`` against the local stand-in server, then
+  ``save_search_result``
+- ``dedup``: ``deduplicate_papers``
+- ``prefilter``: ``bm25_rank_and_cap`` plus the bulk tail-decision insert
+- ``screening``: ``DualReviewerScreener.screen_batch`` (title/abstract)
+- ``extraction``: ``ExtractionService.extract`` for every include
+- ``embedding``: ``EmbeddingNode``
+- ``retrieval``: ``embed_query`` plus ``RAGRetriever.search`` per section query
+- ``writing``: ``SectionWriter.write_section_structured_async`` on pydantic_ai's
+  ``test`` model
+- ``export``: ``markdown_to_latex`` on the fixture manuscript and ``build_bibtex``
+
+Every phase runs inside one ``runtime_db_scope`` with a ``QueryProfiler``, so
+DB time is attributed per phase exactly as ``diagnostics.db_profiling`` does in
+a real run.  Only the LLM, embedding and connector transports are replaced.
+"""
+
+from __future__ import annotations
+
+import json
+import resource
+import sys
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from benchmarks.connector_server import serve_openalex
+from benchmarks.corpus import bench_review, bench_settings, load_seed_corpus, synthesize_works
+from benchmarks.stub_llm import StubEmbeddingModel, StubLLMBackend, StubScreeningClient
+from src.config.env_context import async_env_override_context
+from src.db.connection_manager import RuntimeConnectionManager, runtime_db_scope
+from src.db.database import get_db
+from src.db.query_profiler import QueryProfiler
+from src.db.repositories import WorkflowRepository
+from src.models import CandidatePaper, ScreeningDecisionType, StudyDesign
+
+BENCH_WORKFLOW_ID = "wf-bench"
+
+
+@dataclass
+class PhaseResult:
+    name: str
+    wall_seconds: float
+    peak_rss_mb: float
+    db_ms: float = 0.0
+    db_calls: int = 0
+    items: int = 0
+
+
+@dataclass
+class BenchmarkReport:
+    papers: int
+    screen_cap: int
+    phases: list[PhaseResult] = field(default_factory=list)
+    counts: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_seconds(self) -> float:
+        return round(sum(p.wall_seconds for p in self.phases), 3)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "papers": self.papers,
+            "screen_cap": self.screen_cap,
+            "python": sys.version.split()[0],
+            "total_seconds": self.total_seconds,
+            "peak_rss_mb": max((p.peak_rss_mb for p in self.phases), default=0.0),
+            "phases": {p.name: {k: v for k, v in asdict(p).items() if k != "name"} for p in self.phases},
+            "counts": dict(self.counts),
+        }
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class _PhaseClock:
+    def __init__(self, report: BenchmarkReport, scope: RuntimeConnectionManager, profiler: QueryProfiler) -> None:
+        self._report = report
+        self._scope = scope
+        self._profiler = profiler
+
+    def _db_totals(self, phase: str) -> tuple[float, int]:
+        rows = [row for row in self._profiler.rows() if row["phase"] == phase]
+        return round(sum(r["total_ms"] for r in rows), 3), sum(r["calls"] for r in rows)
+
+    @asynccontextmanager
+    async def phase(self, name: str) -> AsyncIterator[PhaseResult]:
+        self._scope.set_phase(name)
+        result = PhaseResult(name=name, wall_seconds=0.0, peak_rss_mb=0.0)
+        started = time.perf_counter()
+        yield result
+        result.wall_seconds = round(time.perf_counter() - started, 3)
+        result.peak_rss_mb = _peak_rss_mb()
+        result.db_ms, result.db_calls = self._db_totals(name)
+        self._report.phases.append(result)
+
+
+def _bibtex_rows(papers: list[CandidatePaper]) -> list[tuple]:
+    return [
+        (
+            f"cit-{i}",
+            f"Bench{i:05d}",
+            paper.doi,
+            paper.title,
+            json.dumps(paper.authors),
+            paper.year,
+            paper.journal,
+            None,
+        )
+        for i, paper in enumerate(papers, start=1)
+    ]
+
+
+async def run_pipeline(
+    n_papers: int,
+    work_dir: Path,
+    *,
+    screen_cap: int = 200,
+    llm_latency_seconds: float = 0.0,
+) -> BenchmarkReport:
+    """Replay a synthetic *n_papers* workflow in *work_dir* and return per-phase measurements."""
+    from pydantic_graph import GraphRunContext
+
+    from src.export.bibtex_builder import build_bibtex
+    from src.export.ieee_latex import markdown_to_latex
+    from src.extraction.extractor import ExtractionService
+    from src.llm.factory import get_embedder
+    from src.llm.provider import LLMProvider
+    from src.orchestration.embedding_node import EmbeddingNode
+    from src.orchestration.state import ReviewState
+    from src.rag.embedder import embed_query
+    from src.rag.retriever import RAGRetriever
+    from src.screening.dual_screener import DualReviewerScreener
+    from src.screening.keyword_filter import bm25_rank_and_cap
+    from src.search.deduplication import deduplicate_papers
+    from src.search.openalex import OpenAlexConnector
+    from src.writing.prompts.sections import SECTIONS
+    from src.writing.section_writer import SectionWriter
+
+    work_dir.mkdir(parents=True, exist_ok=True)
+    db_path = str(work_dir / "runtime.db")
+    seed = load_seed_corpus()
+    review = bench_review(seed)
+    settings = bench_settings(screen_cap)
+    works = synthesize_works(seed, n_papers)
+    report = BenchmarkReport(papers=n_papers, screen_cap=screen_cap)
+    profiler = QueryProfiler(slow_query_ms=1_000_000.0, explain_slow_queries=False)
+    embedder = get_embedder(settings.rag.embed_model, settings.rag.embed_dim)
+    stub_embeddings = StubEmbeddingModel(dimensions=settings.rag.embed_dim)
+
+    async with (
+        serve_openalex(works) as works_url,
+        async_env_override_context({"OPENALEX_API_KEY": "bench"}),
+        runtime_db_scope(profiler=profiler) as scope,
+    ):
+        clock = _PhaseClock(report, scope, profiler)
+        with embedder.override(model=stub_embeddings):
+            async with clock.phase("search") as phase:
+                connector = OpenAlexConnector(BENCH_WORKFLOW_ID)
+                connector.base_url = works_url
+                result = await connector.search(review.research_question, max_results=n_papers)
+                async with get_db(db_path) as db:
+                    repo = WorkflowRepository(db)
+                    await repo.create_workflow(BENCH_WORKFLOW_ID, review.research_question, "bench")
+                    await repo.save_search_result(result)
+                phase.items = len(result.papers)
+
+            async with clock.phase("dedup") as phase:
+                unique, n_duplicates = deduplicate_papers(result.papers)
+                phase.items = len(unique)
+                report.counts["duplicates_removed"] = n_duplicates
+
+            async with clock.phase("prefilter") as phase:
+                to_screen, tail = bm25_rank_and_cap(unique, review, settings.screening)
+                tail_ids = {d.paper_id for d in tail}
+                async with get_db(db_path) as db:
+                    await WorkflowRepository(db).bulk_save_screening_decisions(
+                        BENCH_WORKFLOW_ID,
+                        "title_abstract",
+                        [p for p in unique if p.paper_id in tail_ids],
+                        tail,
+                    )
+                phase.items = len(to_screen)
+
+            async with clock.phase("screening") as phase:
+                async with get_db(db_path) as db:
+                    repo = WorkflowRepository(db)
+                    screener = DualReviewerScreener(
+                        repo,
+                        LLMProvider(settings, repo),
+                        review,
+                        settings,
+                        llm_client=StubScreeningClient(latency_seconds=llm_latency_seconds),
+                    )
+                    decisions = await screener.screen_batch(BENCH_WORKFLOW_ID, "title_abstract", to_screen)
+                included_ids = {d.paper_id for d in decisions if d.decision == ScreeningDecisionType.INCLUDE}
+                included = [p for p in to_screen if p.paper_id in included_ids]
+                phase.items = len(decisions)
+                report.counts["included"] = len(included)
+
+            async with clock.phase("extraction") as phase:
+                async with get_db(db_path) as db:
+                    service = ExtractionService(
+                        WorkflowRepository(db),
+                        llm_client=StubLLMBackend(latency_seconds=llm_latency_seconds),
+                        settings=settings,
+                        review=review,
+                    )
+                    records = [
+                        await service.extract(BENCH_WORKFLOW_ID, paper, StudyDesign.RCT, paper.abstract or paper.title)
+                        for paper in included
+                    ]
+                phase.items = len(records)
+
+            async with clock.phase("embedding") as phase:
+                state = ReviewState(
+                    review_path="",
+                    settings_path="",
+                    run_root=str(work_dir),
+                    workflow_id=BENCH_WORKFLOW_ID,
+                    review=review,
+                    settings=settings,
+                    db_path=db_path,
+                    extraction_records=records,
+                )
+                await EmbeddingNode().run(GraphRunContext(state=state, deps=None))
+                phase.items = len(records)
+
+            sections = [s for s in SECTIONS if s != "abstract"]
+            async with clock.phase("retrieval") as phase:
+                contexts: dict[str, str] = {}
+                async with get_db(db_path) as db:
+                    retriever = RAGRetriever(db, BENCH_WORKFLOW_ID)
+                    for section in sections:
+                        query = f"{section}: {review.research_question}"
+                        vector = await embed_query(query, settings.rag.embed_model, settings.rag.embed_dim)
+                        chunks = await retriever.search(vector, top_k=10, query_text=query)
+                        contexts[section] = "\n\n".join(c.content for c in chunks)
+                        phase.items += len(chunks)
+
+        async with clock.phase("writing") as phase:
+            writer = SectionWriter(review, settings)
+            for section in sections:
+                await writer.write_section_structured_async(section, contexts[section])
+                phase.items += 1
+
+        async with clock.phase("export") as phase:
+            latex = markdown_to_latex(seed.manuscript_md)
+            bibtex = build_bibtex(_bibtex_rows(included))
+            (work_dir / "manuscript.tex").write_text(latex, encoding="utf-8")
+            (work_dir / "references.bib").write_text(bibtex, encoding="utf-8")
+            phase.items = len(included)
+
+    return report
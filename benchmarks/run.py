@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Run the offline end-to-end benchmark and compare it with a stored baseline.
+
+Writes a JSON report with per-phase wall time, peak RSS and DB time.  When a
+baseline exists for the corpus size (``benchmarks/baselines/papers-<n>.json``
+by default), each phase's wall and DB time is compared against it and phases
+slower than ``--tolerance`` (and by more than 50 ms) are listed as
+regressions.  Metrics under 50 ms in the baseline are not judged; at that
+scale the timings are noise.  Baselines
+are machine-specific: regenerate with ``--update-baseline`` on the machine that
+runs the comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+_COMPARED_METRICS = ("wall_seconds", "db_ms")
+
+
+def default_baseline_path(n_papers: int) -> Path:
+    return BASELINE_DIR / f"papers-{n_papers}.json"
+
+
+def compare_to_baseline(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    tolerance: float = 0.25,
+    min_seconds: float = 0.05,
+) -> dict[str, Any]:
+    """Return per-phase ratios (current / baseline) and the phases that regressed."""
+    phases: dict[str, dict[str, float | None]] = {}
+    regressions: list[str] = []
+    for name, current in report["phases"].items():
+        before = baseline.get("phases", {}).get(name)
+        if before is None:
+            continue
+        ratios: dict[str, float | None] = {}
+        for metric in _COMPARED_METRICS:
+            floor = min_seconds * (1000 if metric == "db_ms" else 1)
+            old, new = before.get(metric, 0.0), current.get(metric, 0.0)
+            if old < floor:
+                ratios[metric] = None
+                continue
+            ratios[metric] = round(new / old, 3)
+            if new > old * (1 + tolerance) and new - old > floor:
+                regressions.append(f"{name}.{metric}")
+        phases[name] = ratios
+    return {"tolerance": tolerance, "phases": phases, "regressions": regressions}
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--papers", type=int, default=1000, help="Synthetic corpus size (1k-100k)")
+    parser.add_argument("--screen-cap", type=int, default=200, help="settings.screening.max_llm_screen")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Simulated latency per stub LLM call")
+    parser.add_argument("--output", default="", help="Report path (default: print only)")
+    parser.add_argument("--work-dir", default="", help="Keep runtime.db and exports here (default: temp dir)")
+    parser.add_argument("--baseline", default="", help="Baseline JSON (default: baselines/papers-<n>.json)")
+    parser.add_argument("--update-baseline", action="store_true", help="Overwrite the baseline with this run")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown per phase (0.25 = 25%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit non-zero when a phase regressed")
+    return parser.parse_args()
+
+
+def _run(args: argparse.Namespace, work_dir: Path) -> dict[str, Any]:
+    from benchmarks.pipeline import run_pipeline
+
+    report = asyncio.run(
+        run_pipeline(
+            args.papers,
+            work_dir,
+            screen_cap=args.screen_cap,
+            llm_latency_seconds=args.llm_latency_ms / 1000,
+        )
+    )
+    return report.to_dict()
+
+
+def main() -> int:
+    args = _parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    if args.work_dir:
+        report = _run(args, Path(args.work_dir))
+    else:
+        with tempfile.TemporaryDirectory(prefix="bench-") as tmp:
+            report = _run(args, Path(tmp))
+
+    baseline_path = Path(args.baseline) if args.baseline else default_baseline_path(args.papers)
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    elif baseline_path.is_file():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        report["comparison"] = compare_to_baseline(report, baseline, tolerance=args.tolerance)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+    regressions = report.get("comparison", {}).get("regressions", [])
+    return 1 if args.fail_on_regression and regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
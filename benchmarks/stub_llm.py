@@ -0,0 +1,203 @@
+"""Deterministic, network-free stand-ins for the LLM and embedding backends.
+
+``StubLLMBackend`` satisfies ``src.llm.base_client.LLMBackend`` by synthesising
+JSON straight from the requested schema.  Arrays whose items carry a
+``paper_id`` enum (batch envelopes) get one item per allowed id, so batched
+extraction and quality calls resolve every paper instead of falling back.
+``StubScreeningClient`` implements the screener client protocol with a stable
+include rate derived from the paper id.  ``StubEmbeddingModel`` returns hashed
+bag-of-words vectors so dense retrieval still has something to rank.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import math
+import re
+from collections.abc import Sequence
+from typing import Any
+
+from pydantic_ai.embeddings import EmbeddingResult, EmbeddingSettings
+from pydantic_ai.embeddings.base import EmbedInputType
+from pydantic_ai.embeddings.test import TestEmbeddingModel
+from pydantic_ai.usage import RequestUsage
+
+from src.models import ScreeningDecisionType
+from src.models.screening import (
+    BatchScreeningItemPayload,
+    BatchScreeningResponsePayload,
+    ScreeningResponsePayload,
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_PAPER_ID_RE = re.compile(r"paper_id[=:]\s*([\w-]+)")
+
+
+def _stable_fraction(text: str) -> float:
+    digest = hashlib.sha1(text.encode("utf-8")).digest()
+    return int.from_bytes(digest[:4], "big") / 0xFFFFFFFF
+
+
+def _resolve(schema: dict[str, Any], defs: dict[str, Any]) -> dict[str, Any]:
+    ref = schema.get("$ref")
+    if isinstance(ref, str):
+        return _resolve(defs[ref.rsplit("/", 1)[-1]], defs)
+    return schema
+
+
+def sample_from_schema(schema: dict[str, Any], defs: dict[str, Any] | None = None, *, text: str = "") -> Any:
+    """Return a value valid for *schema* (the subset of JSON Schema pydantic emits)."""
+    defs = defs if defs is not None else schema.get("$defs", {})
+    schema = _resolve(schema, defs)
+    for key in ("anyOf", "oneOf"):
+        if key in schema:
+            options = [_resolve(o, defs) for o in schema[key]]
+            non_null = [o for o in options if o.get("type") != "null"]
+            return sample_from_schema((non_null or options)[0], defs, text=text)
+    if "enum" in schema:
+        return schema["enum"][0]
+    if "const" in schema:
+        return schema["const"]
+    kind = schema.get("type")
+    if kind == "object":
+        return {name: _sample_property(name, prop, defs, text) for name, prop in schema.get("properties", {}).items()}
+    if kind == "array":
+        items = _resolve(schema.get("items", {}), defs)
+        paper_ids = items.get("properties", {}).get("paper_id", {}).get("enum")
+        if paper_ids:
+            return [{**sample_from_schema(items, defs, text=text), "paper_id": pid} for pid in paper_ids]
+        return [sample_from_schema(items, defs, text=text)]
+    if kind == "integer":
+        return int(schema.get("minimum", schema.get("exclusiveMinimum", 0) + 1))
+    if kind == "number":
+        low = float(schema.get("minimum", 0.0))
+        high = float(schema.get("maximum", low + 1.0))
+        return round((low + high) / 2, 3)
+    if kind == "boolean":
+        return True
+    if kind == "string":
+        return text or "Reported in the source abstract."
+    return None
+
+
+def _sample_property(name: str, prop: dict[str, Any], defs: dict[str, Any], text: str) -> Any:
+    if name == "participant_count":
+        return "120"
+    if name in {"results_summary", "reasoning", "overall_rationale", "overall_summary"}:
+        return text or "Outcomes improved relative to the comparator."
+    return sample_from_schema(prop, defs)
+
+
+class StubLLMBackend:
+    """``LLMBackend`` returning schema-shaped JSON after an optional fixed latency."""
+
+    def __init__(self, latency_seconds: float = 0.0) -> None:
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+
+    async def complete(self, prompt: str, *, model: str, temperature: float, json_schema: dict | None = None) -> str:
+        _ = (model, temperature)
+        self.calls += 1
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        if json_schema is None:
+            return "Stub completion."
+        return json.dumps(sample_from_schema(json_schema))
+
+
+class StubScreeningClient:
+    """Screener client protocol with a deterministic include rate keyed on paper id."""
+
+    def __init__(self, include_rate: float = 0.25, latency_seconds: float = 0.0) -> None:
+        self.include_rate = include_rate
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+
+    def _decision(self, key: str) -> ScreeningDecisionType:
+        if _stable_fraction(key) < self.include_rate:
+            return ScreeningDecisionType.INCLUDE
+        return ScreeningDecisionType.EXCLUDE
+
+    def _single(self, prompt: str) -> ScreeningResponsePayload:
+        match = _PAPER_ID_RE.search(prompt)
+        decision = self._decision(match.group(1) if match else prompt)
+        return ScreeningResponsePayload(
+            decision=decision,
+            confidence=0.95,
+            short_reason="Stub decision",
+            reasoning="Deterministic benchmark decision.",
+        )
+
+    async def _tick(self) -> None:
+        self.calls += 1
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+
+    async def complete_json(self, prompt: str, *, agent_name: str, model: str, temperature: float) -> str:
+        _ = (agent_name, model, temperature)
+        await self._tick()
+        return self._single(prompt).model_dump_json()
+
+    async def complete_json_with_usage(
+        self, prompt: str, *, agent_name: str, model: str, temperature: float
+    ) -> tuple[str, int, int, int, int]:
+        raw = await self.complete_json(prompt, agent_name=agent_name, model=model, temperature=temperature)
+        return raw, len(prompt.split()), 40, 0, 0
+
+    async def complete_screening_response_with_usage(
+        self, prompt: str, *, agent_name: str, model: str, temperature: float
+    ) -> tuple[ScreeningResponsePayload, int, int, int, int]:
+        _ = (agent_name, model, temperature)
+        await self._tick()
+        return self._single(prompt), len(prompt.split()), 40, 0, 0
+
+    async def complete_batch_screening_with_usage(
+        self,
+        prompt: str,
+        *,
+        agent_name: str,
+        model: str,
+        temperature: float,
+        item_schema: dict[str, object],
+    ) -> tuple[BatchScreeningResponsePayload, int, int, int, int]:
+        _ = (agent_name, model, temperature)
+        await self._tick()
+        paper_ids = item_schema.get("properties", {}).get("paper_id", {}).get("enum", [])  # type: ignore[union-attr]
+        decisions = [
+            BatchScreeningItemPayload(
+                paper_id=pid,
+                decision=self._decision(pid),
+                confidence=0.95,
+                short_reason="Stub decision",
+                reasoning="Deterministic benchmark decision.",
+            )
+            for pid in paper_ids
+        ]
+        return BatchScreeningResponsePayload(decisions=decisions), len(prompt.split()), 40 * len(decisions), 0, 0
+
+
+class StubEmbeddingModel(TestEmbeddingModel):
+    """Hashed bag-of-words embeddings: deterministic, unit length, cheap."""
+
+    async def embed(
+        self, inputs: str | Sequence[str], *, input_type: EmbedInputType, settings: EmbeddingSettings | None = None
+    ) -> EmbeddingResult:
+        inputs, settings = self.prepare_embed(inputs, settings)
+        dimensions = settings.get("dimensions") or self._dimensions
+        vectors = []
+        for text in inputs:
+            vec = [0.0] * dimensions
+            for token in _TOKEN_RE.findall(text.lower()):
+                vec[int(hashlib.md5(token.encode("utf-8")).hexdigest(), 16) % dimensions] += 1.0
+            norm = math.sqrt(sum(v * v for v in vec)) or 1.0
+            vectors.append([v / norm for v in vec])
+        return EmbeddingResult(
+            embeddings=vectors,
+            inputs=inputs,
+            input_type=input_type,
+            usage=RequestUsage(input_tokens=sum(len(t.split()) for t in inputs)),
+            model_name=self.model_name,
+            provider_name=self.system,
+        )
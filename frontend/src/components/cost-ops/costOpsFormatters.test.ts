@@ -1,5 +1,6 @@
 import { describe, expect, it } from "vitest"
 import {
+  formatCacheHitRatio,
   formatPhaseName,
   formatCostGroupAxisLabel,
   formatSpendBucketAxisLabel,
@@ -67,3 +68,11 @@ describe("formatPhaseName", () => {
     expect(formatPhaseName("some_other_phase")).toBe("Some Other Phase")
   })
 })
+
+describe("formatCacheHitRatio", () => {
+  it("formats ratios as percentages and unknown values as a dash", () => {
+    expect(formatCacheHitRatio(0.4567)).toBe("45.7%")
+    expect(formatCacheHitRatio(0)).toBe("0.0%")
+    expect(formatCacheHitRatio(undefined)).toBe("--")
+  })
+})
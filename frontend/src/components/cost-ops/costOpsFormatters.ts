@@ -57,6 +57,11 @@ export function formatInteger(value: number): string {
   return new Intl.NumberFormat("en-US").format(value)
 }
 
+export function formatCacheHitRatio(ratio: number | undefined): string {
+  if (ratio === undefined || !Number.isFinite(ratio)) return "--"
+  return `${(ratio * 100).toFixed(1)}%`
+}
+
 export function formatPhaseName(phase: string): string {
   if (phase in PHASE_LABEL_MAP) return PHASE_LABEL_MAP[phase]
   return phase
@@ -13,6 +13,8 @@ export interface PhaseStat {
   phase: string
   cost_usd: number
   calls: number
+  /** Only known from the DB dashboard; SSE events do not carry cache usage. */
+  cache_hit_ratio?: number
 }
 
 export interface CostStats {
@@ -87,6 +89,7 @@ export function buildCostStatsFromDashboard(dashboard: CostDashboardResponse): C
       phase: p.phase,
       cost_usd: p.cost_usd,
       calls: p.calls,
+      cache_hit_ratio: p.cache_hit_ratio,
     }))
     .sort((a, b) => b.cost_usd - a.cost_usd)
 
@@ -178,8 +178,29 @@ function capEvents(events: ReviewEvent[], maxEvents: number): ReviewEvent[] {
   return merged
 }
 
+/**
+ * Keep only the newest live section preview per section and LaTeX compile
+ * log per document. Both are cumulative, so older ones (and ones the backend
+ * marked superseded) carry no information and would otherwise crowd out real
+ * events under the cap.
+ */
+function collapseSectionPreviews(events: ReviewEvent[]): ReviewEvent[] {
+  const seenSections = new Set<string>()
+  const out: ReviewEvent[] = []
+  for (let i = events.length - 1; i >= 0; i--) {
+    const ev = events[i]
+    if (ev.type === "section_preview" || ev.type === "compile_log") {
+      const key = ev.type === "section_preview" ? `section:${ev.section}` : `compile:${ev.document}`
+      if (ev.superseded || seenSections.has(key)) continue
+      seenSections.add(key)
+    }
+    out.push(ev)
+  }
+  return out.reverse()
+}
+
 function mergeForUi(previous: ReviewEvent[], incoming: ReviewEvent[]): ReviewEvent[] {
-  return capEvents(dedup([...previous, ...incoming]), MAX_UI_EVENTS)
+  return capEvents(collapseSectionPreviews(dedup([...previous, ...incoming])), MAX_UI_EVENTS)
 }
 
 type SetState = React.Dispatch<React.SetStateAction<SSEState>>
@@ -106,6 +106,10 @@ export interface CostDashboardPhaseRow {
   tokens_in: number
   tokens_out: number
   cost_usd: number
+  cache_read_tokens?: number
+  cache_write_tokens?: number
+  /** cache_read_tokens / tokens_in for the phase (0 when nothing was cached). */
+  cache_hit_ratio?: number
 }
 
 export interface CostDashboardModelRow {
@@ -1,7 +1,7 @@
 type ReviewEventIdentity = { id?: string }
 
 /** Present on SSE events when the backend labels durability for replay contracts. */
-export type EventDurability = "durable" | "eventual"
+export type EventDurability = "durable" | "eventual" | "ephemeral"
 
 export type ReviewEvent = (
   | ({ type: "phase_start"; phase: string; description: string; total: number | null; ts: string; reason_code?: string | null; reason_label?: string | null; action?: string | null; entity_type?: string | null; entity_id?: string | null } & ReviewEventIdentity)
@@ -16,6 +16,8 @@ export type ReviewEvent = (
   | ({ type: "rate_limit_resolved"; tier: string; waited_seconds: number; ts: string } & ReviewEventIdentity)
   | ({ type: "search_override_status"; database: string; status: "applied" | "miss" | "absent"; detail: string; ts: string } & ReviewEventIdentity)
   | ({ type: "status"; message: string; ts: string } & ReviewEventIdentity)
+  | ({ type: "section_preview"; section: string; stage: "draft" | "humanize"; text: string; word_count: number; superseded?: boolean; ts: string } & ReviewEventIdentity)
+  | ({ type: "compile_log"; document: string; step: string; text: string; superseded?: boolean; ts: string } & ReviewEventIdentity)
   | ({ type: "screening_prefilter_done"; deduped: number; metadata_rejected: number; after_metadata: number; automation_excluded: number; to_llm: number; dual_review_cap?: number | null; bm25_validation_forwarded?: number; empty_abstract_pool?: number; empty_abstract_excluded?: number; empty_abstract_rescued?: number; reason_breakdown?: Record<string, number>; ts: string; reason_code?: string | null; reason_label?: string | null; action?: string | null; entity_type?: string | null; entity_id?: string | null } & ReviewEventIdentity)
   | ({ type: "deterministic_exclusion_qa_sample"; sample_size: number; pool_size: number; items: Array<{ paper_id: string; reason_code: string; title: string }>; ts: string; reason_code?: string | null; reason_label?: string | null; action?: string | null; entity_type?: string | null; entity_id?: string | null } & ReviewEventIdentity)
   | ({ type: "batch_screen_done"; scored: number; forwarded: number; excluded: number; skipped_resume: number; threshold: number; ts: string; reason_code?: string | null; reason_label?: string | null; action?: string | null; entity_type?: string | null; entity_id?: string | null } & ReviewEventIdentity)
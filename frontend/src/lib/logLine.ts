@@ -197,6 +197,34 @@ export function eventToLogEntry(ev: ReviewEvent): LogRenderEntry {
       })
     }
 
+    case "section_preview": {
+      const snippet = ev.text.length > 120 ? `...${ev.text.slice(-120)}` : ev.text
+      return finalize({
+        text: `[${fmtTs(ev.ts)}] WRITE   ${ev.section} (${ev.stage}, ~${ev.word_count} words) ${snippet.replace(/\s+/g, " ")}`,
+        level: "dim",
+        severity: "dim",
+        kind: "status",
+        compactable: true,
+        groupKey: `section_preview:${ev.section}`,
+        isResumeRelated: false,
+        isResumeNoOp: false,
+      })
+    }
+
+    case "compile_log": {
+      const lastLine = ev.text.trimEnd().split("\n").pop() ?? ""
+      return finalize({
+        text: `[${fmtTs(ev.ts)}] LATEX   ${ev.document} ${ev.step}: ${lastLine.slice(-160)}`,
+        level: "dim",
+        severity: "dim",
+        kind: "status",
+        compactable: true,
+        groupKey: `compile_log:${ev.document}`,
+        isResumeRelated: false,
+        isResumeNoOp: false,
+      })
+    }
+
     case "screening_calibration": {
       const inc = Math.round(ev.include_threshold * 100)
       const exc = Math.round(ev.exclude_threshold * 100)
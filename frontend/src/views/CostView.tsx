@@ -34,6 +34,7 @@ import {
 import {
   buildPresetRange,
   costOpsGridClass,
+  formatCacheHitRatio,
   formatInteger,
   formatPhaseName,
   formatUsd,
@@ -278,6 +279,7 @@ export function CostView({ costStats, dbRunId, workflowId, isLive, isSSEConnecte
                   <tr className="glass-table-head border-b border-border/70">
                     <th className="text-left px-5 py-2.5 label-caps">Phase</th>
                     <th className="text-right px-4 py-2.5 label-caps">Calls</th>
+                    <th className="text-right px-4 py-2.5 label-caps" title="Share of input tokens served from the provider prompt cache">Cache Hit</th>
                     <th className="text-right px-5 py-2.5 label-caps">Cost</th>
                   </tr>
                 </thead>
@@ -300,6 +302,9 @@ export function CostView({ costStats, dbRunId, workflowId, isLive, isSSEConnecte
                         </div>
                       </td>
                       <td className="px-4 py-3 text-right tabular-nums text-muted text-xs">{p.calls}</td>
+                      <td className="px-4 py-3 text-right tabular-nums text-muted text-xs">
+                        {formatCacheHitRatio(p.cache_hit_ratio)}
+                      </td>
                       <td className="px-5 py-3 text-right tabular-nums font-mono font-medium text-intent-success text-xs">
                         ${p.cost_usd.toFixed(4)}
                       </td>
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Run individual quality checks (API docs, replay fixture, workflow replay)."""
+"""Run individual quality checks (API docs, replay fixture, workflow replay, index audit, benchmark)."""
 
 from __future__ import annotations
 
@@ -49,9 +49,64 @@ def _build_parser() -> argparse.ArgumentParser:
         default="runs",
         help="Runs root used for registry lookups",
     )
+
+    audit = subparsers.add_parser(
+        "index-audit",
+        help="EXPLAIN QUERY PLAN + timings for hot runtime.db queries (replay fixture by default)",
+    )
+    audit.add_argument("--db-path", default="", help="Optional runtime.db to audit instead of the fixture")
+    audit.add_argument("--workflow-id", default="", help="Workflow ID bound into audited queries")
+    audit.add_argument("--repeat", type=int, default=25, help="Timing iterations per query")
+    audit.add_argument("--fail-on-scan", action="store_true", help="Exit non-zero on unindexed plan steps")
+
+    bench = subparsers.add_parser(
+        "bench",
+        help="Offline end-to-end benchmark on a synthetic corpus (per-phase wall, RSS, DB time)",
+    )
+    bench.add_argument("--papers", type=int, default=1000, help="Synthetic corpus size (1k-100k)")
+    bench.add_argument("--screen-cap", type=int, default=200, help="settings.screening.max_llm_screen")
+    bench.add_argument("--llm-latency-ms", type=float, default=0.0, help="Simulated latency per stub LLM call")
+    bench.add_argument("--output", default="", help="Write the JSON report here")
+    bench.add_argument("--baseline", default="", help="Baseline JSON (default: benchmarks/baselines/papers-<n>.json)")
+    bench.add_argument("--update-baseline", action="store_true", help="Overwrite the baseline with this run")
+    bench.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown per phase")
+    bench.add_argument("--fail-on-regression", action="store_true", help="Exit non-zero when a phase regressed")
     return parser
 
 
+def _index_audit_argv(args: argparse.Namespace) -> list[str]:
+    argv = ["--repeat", str(args.repeat)]
+    if args.db_path:
+        argv.extend(["--db-path", args.db_path])
+    if args.workflow_id:
+        argv.extend(["--workflow-id", args.workflow_id])
+    if args.fail_on_scan:
+        argv.append("--fail-on-scan")
+    return argv
+
+
+def _bench_argv(args: argparse.Namespace) -> list[str]:
+    argv = [
+        "--papers",
+        str(args.papers),
+        "--screen-cap",
+        str(args.screen_cap),
+        "--llm-latency-ms",
+        str(args.llm_latency_ms),
+        "--tolerance",
+        str(args.tolerance),
+    ]
+    if args.output:
+        argv.extend(["--output", args.output])
+    if args.baseline:
+        argv.extend(["--baseline", args.baseline])
+    if args.update_baseline:
+        argv.append("--update-baseline")
+    if args.fail_on_regression:
+        argv.append("--fail-on-regression")
+    return argv
+
+
 def _replay_workflow_argv(args: argparse.Namespace) -> list[str]:
     argv = ["--workflow-id", args.workflow_id, "--profile", args.profile, "--run-root", args.run_root]
     if args.db_path:
@@ -103,6 +158,16 @@ def main(argv: list[str] | None = None) -> int:
             _replay_workflow_argv(args),
         )
 
+    if args.command == "index-audit":
+        from scripts.lib.check_index_audit import main as audit_main
+
+        return _run_subcommand_main(audit_main, "check_index_audit.py", _index_audit_argv(args))
+
+    if args.command == "bench":
+        from benchmarks.run import main as bench_main
+
+        return _run_subcommand_main(bench_main, "benchmarks/run.py", _bench_argv(args))
+
     parser.error(f"unknown command: {args.command}")
     return 2
 
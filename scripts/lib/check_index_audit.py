@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Audit runtime.db index coverage for hot repository queries.
+
+Copies the replay fixture runtime.db (or ``--db-path``) to a temp dir, migrates
+it to the current schema, and runs ``EXPLAIN QUERY PLAN`` plus a timing loop
+for each query in ``AUDIT_QUERIES``.  The same queries are then timed again
+with the migration-24 composite indexes swapped back for the indexes they
+replaced, giving a before/after comparison.  Plan steps that full-scan a table
+are flagged unless the query lists the table in ``allow_scan`` (e.g. the
+explorer legitimately walks every paper).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from scripts.lib._paths import resolve_repo_root
+
+console = Console()
+
+REPO_ROOT = resolve_repo_root()
+FIXTURE_DIR = REPO_ROOT / "tests" / "fixtures" / "replay"
+MANIFEST_PATH = FIXTURE_DIR / "manifest.json"
+
+# Indexes added by migration 24 and the pre-24 indexes they superseded.
+MIGRATION_24_INDEXES: tuple[str, ...] = (
+    "idx_cost_records_workflow_created",
+    "idx_chunks_workflow_paper",
+    "idx_event_log_workflow_type_ts",
+    "idx_event_log_type",
+    "idx_dual_screening_paper_stage",
+)
+PRE_24_INDEXES: dict[str, str] = {
+    "idx_chunks_workflow": "CREATE INDEX IF NOT EXISTS idx_chunks_workflow ON paper_chunks_meta(workflow_id)",
+    "idx_event_log_workflow_type": (
+        "CREATE INDEX IF NOT EXISTS idx_event_log_workflow_type ON event_log(workflow_id, event_type)"
+    ),
+}
+
+
+@dataclass(frozen=True)
+class AuditQuery:
+    """One hot query as issued by the repositories/routers (``:workflow_id`` is bound per run)."""
+
+    name: str
+    sql: str
+    allow_scan: tuple[str, ...] = ()
+
+
+AUDIT_QUERIES: tuple[AuditQuery, ...] = (
+    AuditQuery(
+        "costs.total_for_workflow",
+        "SELECT COALESCE(SUM(cost_usd), 0.0) FROM cost_records WHERE workflow_id = :workflow_id",
+    ),
+    AuditQuery(
+        "costs.phase_performance",
+        """
+        SELECT phase, COUNT(*), COALESCE(SUM(tokens_in), 0), COALESCE(SUM(cost_usd), 0.0)
+        FROM cost_records WHERE workflow_id = :workflow_id GROUP BY phase
+        """,
+    ),
+    AuditQuery(
+        "costs.daily_buckets_for_workflow",
+        """
+        SELECT date(created_at) AS bucket, COUNT(*), COALESCE(SUM(cost_usd), 0.0)
+        FROM cost_records WHERE workflow_id = :workflow_id GROUP BY bucket ORDER BY bucket
+        """,
+    ),
+    AuditQuery(
+        "chunks.embedded_papers",
+        "SELECT DISTINCT paper_id FROM paper_chunks_meta WHERE workflow_id = :workflow_id",
+    ),
+    AuditQuery(
+        "chunks.count_for_workflow",
+        "SELECT COUNT(*) FROM paper_chunks_meta WHERE workflow_id = :workflow_id",
+    ),
+    AuditQuery(
+        "events.replay",
+        "SELECT id, payload, ts FROM event_log WHERE workflow_id = :workflow_id ORDER BY id ASC",
+    ),
+    AuditQuery(
+        "events.latest_of_type",
+        """
+        SELECT payload FROM event_log
+        WHERE workflow_id = :workflow_id AND event_type = 'phase_done'
+        ORDER BY ts DESC LIMIT 1
+        """,
+    ),
+    AuditQuery(
+        "events.latest_phase_done_any_workflow",
+        """
+        SELECT payload FROM event_log
+        WHERE event_type = 'phase_done'
+          AND json_extract(payload, '$.phase') = 'phase_3_screening'
+        ORDER BY id DESC LIMIT 1
+        """,
+    ),
+    AuditQuery(
+        "screening.explorer_join",
+        """
+        SELECT p.paper_id, ta.final_decision, ft.final_decision
+        FROM papers p
+        LEFT JOIN dual_screening_results ta ON p.paper_id = ta.paper_id AND ta.stage = 'title_abstract'
+        LEFT JOIN dual_screening_results ft ON p.paper_id = ft.paper_id AND ft.stage = 'fulltext'
+        """,
+        allow_scan=("papers",),
+    ),
+    AuditQuery(
+        "screening.fulltext_includes",
+        """
+        SELECT p.paper_id
+        FROM papers p
+        JOIN dual_screening_results ft ON p.paper_id = ft.paper_id AND ft.stage = 'fulltext'
+        WHERE ft.workflow_id = :workflow_id AND ft.final_decision = 'include'
+        ORDER BY p.paper_id
+        """,
+    ),
+)
+
+
+@dataclass
+class QueryAudit:
+    name: str
+    plan: list[str]
+    flagged: list[str]
+    after_ms: float
+    before_ms: float | None = None
+    before_plan: list[str] = field(default_factory=list)
+
+
+def _query_plan(conn: sqlite3.Connection, query: AuditQuery, params: dict[str, str]) -> list[str]:
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {query.sql}", params).fetchall()
+    return [str(row[-1]) for row in rows]
+
+
+def _flag_plan(plan: list[str], allow_scan: tuple[str, ...]) -> list[str]:
+    flagged: list[str] = []
+    for step in plan:
+        if step.startswith("SCAN ") and "USING" not in step:
+            table = step.split()[1]
+            if table not in allow_scan and not any(f"{t} AS {table}" in step for t in allow_scan):
+                flagged.append(step)
+    return flagged
+
+
+def _time_query(conn: sqlite3.Connection, query: AuditQuery, params: dict[str, str], repeat: int) -> float:
+    samples: list[float] = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        conn.execute(query.sql, params).fetchall()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return statistics.median(samples)
+
+
+def _swap_to_pre_24_indexes(conn: sqlite3.Connection) -> None:
+    for name in MIGRATION_24_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+    for create_sql in PRE_24_INDEXES.values():
+        conn.execute(create_sql)
+    conn.commit()
+
+
+async def _migrate(db_path: Path) -> None:
+    from src.db.database import get_db
+
+    async with get_db(str(db_path)):
+        pass
+
+
+def audit_database(
+    db_path: Path,
+    workflow_id: str,
+    *,
+    repeat: int = 25,
+    compare: bool = True,
+    queries: tuple[AuditQuery, ...] = AUDIT_QUERIES,
+) -> list[QueryAudit]:
+    """Audit ``queries`` against a migrated temp copy of ``db_path``; the source file is never modified."""
+    with tempfile.TemporaryDirectory(prefix="index-audit-") as tmp:
+        work_db = Path(tmp) / "runtime.db"
+        shutil.copy2(db_path, work_db)
+        asyncio.run(_migrate(work_db))
+        params = {"workflow_id": workflow_id}
+        conn = sqlite3.connect(str(work_db))
+        try:
+            results: list[QueryAudit] = []
+            for query in queries:
+                plan = _query_plan(conn, query, params)
+                results.append(
+                    QueryAudit(
+                        name=query.name,
+                        plan=plan,
+                        flagged=_flag_plan(plan, query.allow_scan),
+                        after_ms=_time_query(conn, query, params, repeat),
+                    )
+                )
+            if compare:
+                _swap_to_pre_24_indexes(conn)
+                for query, result in zip(queries, results, strict=True):
+                    result.before_plan = _query_plan(conn, query, params)
+                    result.before_ms = _time_query(conn, query, params, repeat)
+        finally:
+            conn.close()
+    return results
+
+
+def _default_workflow_id() -> str:
+    if MANIFEST_PATH.is_file():
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+        return str(manifest.get("workflow_id") or "")
+    return ""
+
+
+def _render(results: list[QueryAudit]) -> None:
+    table = Table(title="runtime.db index audit")
+    table.add_column("Query", style="cyan")
+    table.add_column("Plan (current schema)", overflow="fold")
+    table.add_column("Before ms", justify="right")
+    table.add_column("After ms", justify="right")
+    for result in results:
+        plan = "\n".join(f"[yellow]{step}[/yellow]" if step in result.flagged else step for step in result.plan)
+        before = f"{result.before_ms:.3f}" if result.before_ms is not None else "-"
+        table.add_row(result.name, plan, before, f"{result.after_ms:.3f}")
+    console.print(table)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--db-path",
+        type=Path,
+        default=FIXTURE_DIR / "runtime.db",
+        help="runtime.db to audit (default: replay fixture)",
+    )
+    parser.add_argument("--workflow-id", default="", help="Workflow ID bound into queries (default: manifest)")
+    parser.add_argument("--repeat", type=int, default=25, help="Timing iterations per query (median reported)")
+    parser.add_argument("--no-compare", action="store_true", help="Skip the pre-migration-24 timing pass")
+    parser.add_argument("--fail-on-scan", action="store_true", help="Exit non-zero when any plan step is flagged")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    db_path = args.db_path.expanduser().resolve()
+    if not db_path.is_file():
+        console.print(f"[red]index audit failed:[/red] runtime.db not found: {db_path}")
+        return 1
+    workflow_id = args.workflow_id.strip() or _default_workflow_id()
+    results = audit_database(db_path, workflow_id, repeat=args.repeat, compare=not args.no_compare)
+    _render(results)
+    flagged = [r for r in results if r.flagged]
+    for result in flagged:
+        for step in result.flagged:
+            console.print(f"[yellow]unindexed step[/yellow] {result.name}: {step}")
+    if flagged and args.fail_on_scan:
+        return 1
+    console.print(f"[green]index audit complete[/green] ({len(results)} queries, {len(flagged)} flagged)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -50,6 +50,7 @@ from src.export.markdown_refs import (
     is_extraction_failed,
 )
 from src.export.submission_packager import _build_number_to_citekey, llm_resolve_unmatched_citations
+from src.fulltext.manifest import has_papers_manifest, load_papers_manifest
 from src.writing.prompts.sections import SECTIONS
 
 # Methodology citekeys that must NOT be counted as "missing" included-study refs.
@@ -352,12 +353,10 @@ async def main(run_dir_str: str) -> int:
     # Build set of paper_ids that have full-text on disk
     _manifest_path = run_path / "data_papers_manifest.json"
     _fulltext_paper_ids: set[str] = set()
-    if _manifest_path.exists():
+    if has_papers_manifest(_manifest_path):
         try:
-            import json as _json
-
             _manifest_dir = _manifest_path.parent
-            _manifest_data = _json.loads(_manifest_path.read_text(encoding="utf-8"))
+            _manifest_data = load_papers_manifest(_manifest_path)
             for _pid, _entry in _manifest_data.items():
                 _fp_raw = (_entry or {}).get("file_path", "")
                 if not _fp_raw:
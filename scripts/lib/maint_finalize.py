@@ -46,6 +46,7 @@ from src.export.markdown_refs import (
     is_extraction_failed,
     strip_appended_sections,
 )
+from src.fulltext.manifest import has_papers_manifest, load_papers_manifest
 
 # ---------------------------------------------------------------------------
 # Unresolved citekey cleanup
@@ -444,12 +445,10 @@ async def main(run_dir: str) -> int:
     # were stored relative to a different working directory.
     _manifest_path = run_path / "data_papers_manifest.json"
     _fulltext_paper_ids: set[str] = set()
-    if _manifest_path.exists():
+    if has_papers_manifest(_manifest_path):
         try:
-            import json as _json
-
             _manifest_dir = _manifest_path.parent
-            _manifest_data = _json.loads(_manifest_path.read_text(encoding="utf-8"))
+            _manifest_data = load_papers_manifest(_manifest_path)
             for _pid, _entry in _manifest_data.items():
                 _fp_raw = (_entry or {}).get("file_path", "")
                 if not _fp_raw:
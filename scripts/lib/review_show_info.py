@@ -25,7 +25,6 @@ import json
 import pathlib
 import sqlite3
 import sys
-from typing import Any
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent.parent))
 
@@ -301,12 +300,9 @@ async def _fetch_pdfs_for_included(
     papers_dir.mkdir(exist_ok=True)
 
     manifest_path = run_dir / "data_papers_manifest.json"
-    manifest: dict[str, Any] = {}
-    if manifest_path.exists():
-        try:
-            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-        except Exception:
-            manifest = {}
+    from src.fulltext.manifest import load_papers_manifest, write_papers_manifest
+
+    manifest = load_papers_manifest(manifest_path)
 
     fetch_table = Table(title="Full-Text Retrieval Attempt", box=box.SIMPLE_HEAVY, show_lines=True)
     fetch_table.add_column("#", width=3)
@@ -380,7 +376,7 @@ async def _fetch_pdfs_for_included(
             saved_label,
         )
 
-    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    write_papers_manifest(manifest_path, manifest)
     console.print(fetch_table)
     console.print(f"\n[green]Manifest updated:[/] {manifest_path}")
     console.print(f"[green]Papers directory:[/] {papers_dir}")
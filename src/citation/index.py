@@ -0,0 +1,169 @@
+"""Compiled citekey resolution index.
+
+Numbering, grounding, hallucination repair and section validation all resolve
+bracketed citation tokens against the same citation ledger.  ``CitationIndex``
+builds the lookup tables once (exact, ASCII-folded, canonical and alias keys,
+plus a year -> author-prefix table for fuzzy repair) and memoizes indexes by
+their source, so sections, the humanizer, post-assembly and export share one
+index per workflow instead of rebuilding maps and regexes per call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+
+from src.export.bibtex_builder import build_citekey_alias_map
+from src.export.markdown_utils import ascii_citekey
+
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]")
+_DIGITS_RE = re.compile(r"\d+")
+_KEY_YEAR_RE = re.compile(r"(\d{4})[a-z]?$", re.IGNORECASE)
+_UNKNOWN_YEAR_RE = re.compile(r"(\d{4})")
+_NON_ALPHA_RE = re.compile(r"[^a-z]")
+_PLACEHOLDER_CITEKEY_RE = re.compile(r"^(Ref\d+|Paper_[A-Za-z0-9_\-]+)$")
+
+_CACHE_MAX_INDEXES = 16
+
+
+def canonical_citekey(raw: str) -> str:
+    """Forgiving match key for legacy variants (spaces, punctuation, accents)."""
+    return _NON_ALNUM_RE.sub("", ascii_citekey(raw)).lower()
+
+
+class CitationIndex:
+    """Read-only citekey lookup tables for one citation ledger or catalog."""
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        rows: dict[str, tuple] | None = None,
+        aliases: dict[str, str] | None = None,
+    ) -> None:
+        self.keys: frozenset[str] = frozenset(keys)
+        self.rows: dict[str, tuple] = dict(rows or {})
+        self._aliases: dict[str, str] = dict(aliases or {})
+        self._ascii: dict[str, str] = {}
+        self._canonical: dict[str, str] = {}
+        self._by_year: dict[str, list[tuple[str, str]]] = {}
+        for key in keys:
+            folded = ascii_citekey(key)
+            self._ascii[folded] = key
+            self._canonical[canonical_citekey(folded)] = key
+            m = _KEY_YEAR_RE.search(key)
+            if m:
+                self._by_year.setdefault(m.group(1), []).append((_DIGITS_RE.sub("", key).lower(), key))
+        for alias, mapped in self._aliases.items():
+            self._canonical.setdefault(canonical_citekey(alias), ascii_citekey(mapped))
+        self._resolved: dict[str, str | None] = {}
+
+    @classmethod
+    def from_rows(cls, citation_rows: Iterable[tuple]) -> CitationIndex:
+        """Index citation-ledger rows ``(cid, citekey, doi, title, authors_json, year, ...)``."""
+        rows = list(citation_rows)
+        by_key = {ascii_citekey(row[1]): row for row in rows}
+        return cls(list(by_key), rows=by_key, aliases=build_citekey_alias_map(rows))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def resolve(self, token: str) -> str | None:
+        """Ledger key a bracket token refers to, or None.
+
+        Tries the ASCII-folded key, then the citekey alias map, then the
+        canonical (alphanumeric, lower-case) form.  When the index was built
+        from ledger rows, only keys that have a row are returned.
+        """
+        if token in self._resolved:
+            return self._resolved[token]
+        folded = ascii_citekey(token)
+        resolved: str | None = None
+        candidates = (
+            folded if self.rows else self._ascii.get(folded),
+            self._aliases.get(folded),
+            self._canonical.get(canonical_citekey(folded)),
+        )
+        for candidate in candidates:
+            if candidate and (candidate in self.rows if self.rows else candidate in self.keys):
+                resolved = candidate
+                break
+        self._resolved[token] = resolved
+        return resolved
+
+    def fuzzy_match(self, unknown: str) -> str | None:
+        """Unique key sharing *unknown*'s year and 4-letter author prefix, or None.
+
+        Placeholder keys (``Ref12``, ``Paper_x``) carry no author-year semantics
+        and never match.
+        """
+        if _PLACEHOLDER_CITEKEY_RE.fullmatch(unknown):
+            return None
+        year_m = _UNKNOWN_YEAR_RE.search(unknown)
+        if not year_m:
+            return None
+        author_token = unknown[: year_m.start()].lower()
+        if len(author_token) < 2:
+            return None
+        year_candidates = self._by_year.get(year_m.group(1))
+        if not year_candidates:
+            return None
+        prefix = _NON_ALPHA_RE.sub("", author_token)[:4]
+        if len(prefix) < 4:
+            return None
+        matches = [key for stripped, key in year_candidates if stripped.startswith(prefix)]
+        return matches[0] if len(matches) == 1 else None
+
+
+_indexes: OrderedDict[tuple[str, str], CitationIndex] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def _memoized(kind: str, digest: str, build: Callable[[], CitationIndex]) -> CitationIndex:
+    with _indexes_lock:
+        index = _indexes.get((kind, digest))
+        if index is not None:
+            _indexes.move_to_end((kind, digest))
+            return index
+    index = build()
+    with _indexes_lock:
+        _indexes[(kind, digest)] = index
+        if len(_indexes) > _CACHE_MAX_INDEXES:
+            _indexes.popitem(last=False)
+    return index
+
+
+def citation_index_for_rows(citation_rows: Sequence[tuple]) -> CitationIndex:
+    """Return the (memoized) index for a list of citation-ledger rows."""
+    digest = hashlib.sha256(repr([tuple(row) for row in citation_rows]).encode("utf-8")).hexdigest()
+    return _memoized("rows", digest, lambda: CitationIndex.from_rows(citation_rows))
+
+
+def citation_index_for_keys(citekeys: Iterable[str]) -> CitationIndex:
+    """Return the (memoized) index for a plain list of valid citekeys."""
+    keys = list(dict.fromkeys(citekeys))
+    digest = hashlib.sha256("\n".join(keys).encode("utf-8")).hexdigest()
+    return _memoized("keys", digest, lambda: CitationIndex(keys))
+
+
+def citation_index_for_catalog(citation_catalog: str) -> CitationIndex:
+    """Return the (memoized) index of ``[citekey] ...`` lines in a prompt catalog."""
+    digest = hashlib.sha256(citation_catalog.encode("utf-8")).hexdigest()
+
+    def _build() -> CitationIndex:
+        keys: list[str] = []
+        for line in citation_catalog.splitlines():
+            stripped = line.strip()
+            if stripped.startswith("[") and "]" in stripped:
+                keys.append(stripped[1 : stripped.index("]")].strip())
+        return CitationIndex(list(dict.fromkeys(keys)))
+
+    return _memoized("catalog", digest, _build)
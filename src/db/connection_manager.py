@@ -0,0 +1,255 @@
+"""Run-scoped runtime.db connection reuse.
+
+``get_db`` and ``open_runtime_db`` open a fresh aiosqlite connection (thread,
+PRAGMAs, and for ``get_db`` the migration check) on every call.  Inside a
+``runtime_db_scope()`` -- entered once per workflow run -- released connections
+are parked per (db_path, mode) and handed to the next caller instead, so each
+phase reuses warm connections.  Checkouts stay exclusive: a connection is never
+shared by two concurrent ``async with get_db(...)`` blocks, which keeps
+transaction boundaries identical to the unscoped behaviour.
+
+The manager also attributes connection acquire/hold time to the current phase
+label (the graph node being executed) so slow phases can be told apart from
+connection churn.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
+
+from src.db.query_profiler import ProfilingCursor, QueryProfiler
+
+_logger = logging.getLogger(__name__)
+
+_MAX_IDLE_PER_KEY = 4
+_UNSCOPED_PHASE = "unscoped"
+
+
+class _CursorTrackingConnection(sqlite3.Connection):
+    """sqlite3 connection that remembers its cursors.
+
+    A partially iterated SELECT cursor keeps its WAL read snapshot open until the
+    cursor is closed or garbage-collected.  A parked connection must not carry
+    such a snapshot into the next checkout, so pools close leftover cursors on
+    release -- the same effect ``Connection.close()`` had before reuse existed.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._tracked_cursors: weakref.WeakSet[sqlite3.Cursor] = weakref.WeakSet()
+        self.profiler: QueryProfiler | None = None
+
+    def cursor(self, factory: Any = sqlite3.Cursor) -> sqlite3.Cursor:  # type: ignore[override]
+        if self.profiler is not None and factory is sqlite3.Cursor:
+            cur = super().cursor(ProfilingCursor)
+            cur.profiler = self.profiler
+        else:
+            cur = super().cursor(factory)
+        self._tracked_cursors.add(cur)
+        return cur
+
+    # sqlite3's C-level execute helpers bypass cursor(); route them through it.
+    def execute(self, sql: str, parameters: Any = (), /) -> sqlite3.Cursor:  # type: ignore[override]
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, parameters: Any, /) -> sqlite3.Cursor:  # type: ignore[override]
+        return self.cursor().executemany(sql, parameters)
+
+    def executescript(self, script: str, /) -> sqlite3.Cursor:  # type: ignore[override]
+        return self.cursor().executescript(script)
+
+    def close_cursors(self) -> int:
+        closed = 0
+        for cur in list(self._tracked_cursors):
+            try:
+                cur.close()
+                closed += 1
+            except sqlite3.Error:
+                pass
+        self._tracked_cursors = weakref.WeakSet()
+        return closed
+
+
+_RAW_CONNECTIONS: weakref.WeakKeyDictionary[aiosqlite.Connection, _CursorTrackingConnection] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def connect_reusable(
+    database: str,
+    *,
+    profiler: QueryProfiler | None = None,
+    **kwargs: Any,
+) -> aiosqlite.Connection:
+    """``aiosqlite.connect`` for connections that will be parked and handed out again.
+
+    The underlying sqlite3 connection tracks its cursors so :func:`reset_cursors`
+    can drop stale read snapshots between checkouts.  ``check_same_thread`` is
+    disabled because the reset runs on the event-loop thread while the
+    connection's worker thread is idle.  With a ``profiler`` every statement is
+    timed through :class:`~src.db.query_profiler.ProfilingCursor`.
+    """
+    holder: list[_CursorTrackingConnection] = []
+
+    def _factory(*args: Any, **factory_kwargs: Any) -> _CursorTrackingConnection:
+        conn = _CursorTrackingConnection(*args, **factory_kwargs)
+        conn.profiler = profiler
+        holder.append(conn)
+        return conn
+
+    db = await aiosqlite.connect(database, factory=_factory, check_same_thread=False, **kwargs)
+    if holder:
+        _RAW_CONNECTIONS[db] = holder[0]
+    return db
+
+
+def reset_cursors(db: aiosqlite.Connection) -> int:
+    """Close cursors left open on a reusable connection; returns how many were closed."""
+    raw = _RAW_CONNECTIONS.get(db)
+    return raw.close_cursors() if raw is not None else 0
+
+
+@dataclass
+class PhaseConnectionStats:
+    """Connection usage attributed to one phase label."""
+
+    acquisitions: int = 0
+    reused: int = 0
+    opened: int = 0
+    open_ms: float = 0.0
+    hold_ms: float = 0.0
+    hold_ms_max: float = 0.0
+
+
+class RuntimeConnectionManager:
+    """Parks idle runtime.db connections for reuse within one workflow run."""
+
+    def __init__(
+        self,
+        *,
+        max_idle_per_key: int = _MAX_IDLE_PER_KEY,
+        profiler: QueryProfiler | None = None,
+    ) -> None:
+        self._idle: dict[tuple[str, bool], list[aiosqlite.Connection]] = {}
+        self._max_idle = max(1, max_idle_per_key)
+        self._phase = _UNSCOPED_PHASE
+        self._stats: dict[str, PhaseConnectionStats] = {}
+        self._closed = False
+        self.profiler = profiler
+
+    @property
+    def phase(self) -> str:
+        return self._phase
+
+    def set_phase(self, phase: str) -> None:
+        """Attribute subsequent checkouts to ``phase`` (usually the graph node name)."""
+        self._phase = phase or _UNSCOPED_PHASE
+        if self.profiler is not None:
+            self.profiler.phase = self._phase
+
+    def _phase_stats(self) -> PhaseConnectionStats:
+        stats = self._stats.get(self._phase)
+        if stats is None:
+            stats = self._stats[self._phase] = PhaseConnectionStats()
+        return stats
+
+    def checkout(self, db_path: str | Path, *, readonly: bool) -> aiosqlite.Connection | None:
+        """Return a parked connection for ``db_path`` or None when a new one is needed."""
+        stats = self._phase_stats()
+        stats.acquisitions += 1
+        idle = self._idle.get(_key(db_path, readonly))
+        if idle:
+            stats.reused += 1
+            return idle.pop()
+        return None
+
+    def record_open(self, elapsed_ms: float) -> None:
+        stats = self._phase_stats()
+        stats.opened += 1
+        stats.open_ms += elapsed_ms
+
+    async def release(self, db_path: str | Path, db: aiosqlite.Connection, *, readonly: bool, held_ms: float) -> None:
+        """Park ``db`` for reuse, or close it when the scope is closed or the pool is full."""
+        stats = self._phase_stats()
+        stats.hold_ms += held_ms
+        stats.hold_ms_max = max(stats.hold_ms_max, held_ms)
+        try:
+            reset_cursors(db)
+            if db.in_transaction:
+                await db.rollback()
+            db.row_factory = aiosqlite.Row
+        except Exception:
+            await _close_quietly(db)
+            return
+        idle = self._idle.setdefault(_key(db_path, readonly), [])
+        if self._closed or len(idle) >= self._max_idle:
+            await _close_quietly(db)
+            return
+        idle.append(db)
+
+    def snapshot(self) -> dict[str, dict[str, float | int]]:
+        """Per-phase connection counters, rounded for logs and diagnostics payloads."""
+        out: dict[str, dict[str, float | int]] = {}
+        for phase, stats in self._stats.items():
+            row = asdict(stats)
+            out[phase] = {k: round(v, 2) if isinstance(v, float) else v for k, v in row.items()}
+        return out
+
+    async def close(self) -> None:
+        self._closed = True
+        pending = [db for conns in self._idle.values() for db in conns]
+        self._idle.clear()
+        for db in pending:
+            await _close_quietly(db)
+
+
+def _key(db_path: str | Path, readonly: bool) -> tuple[str, bool]:
+    return (str(Path(db_path).resolve()), readonly)
+
+
+async def _close_quietly(db: aiosqlite.Connection) -> None:
+    try:
+        await db.close()
+    except Exception:
+        _logger.debug("Failed to close pooled runtime connection", exc_info=True)
+
+
+_current_manager: ContextVar[RuntimeConnectionManager | None] = ContextVar("runtime_db_manager", default=None)
+
+
+def current_runtime_db_manager() -> RuntimeConnectionManager | None:
+    """Return the manager for the enclosing ``runtime_db_scope`` (None outside a run)."""
+    return _current_manager.get()
+
+
+@asynccontextmanager
+async def runtime_db_scope(*, profiler: QueryProfiler | None = None) -> AsyncIterator[RuntimeConnectionManager]:
+    """Enable connection reuse (and optional query profiling) for the enclosed run.
+
+    Re-entrant: a nested scope (resume invoked from ``run_workflow``) reuses the
+    outer manager and leaves closing to the outermost scope.
+    """
+    existing = _current_manager.get()
+    if existing is not None:
+        yield existing
+        return
+    manager = RuntimeConnectionManager(profiler=profiler)
+    token = _current_manager.set(manager)
+    try:
+        yield manager
+    finally:
+        _current_manager.reset(token)
+        await manager.close()
+        snapshot = manager.snapshot()
+        if snapshot:
+            _logger.info("Runtime DB connection usage by phase: %s", snapshot)
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 import aiosqlite
 
+from src.db.connection_manager import connect_reusable, current_runtime_db_manager
+
 SCHEMA_PATH = Path(__file__).with_name("schema.sql")
 RUNTIME_BUSY_TIMEOUT_MS = 5000
 _logger = logging.getLogger(__name__)
@@ -23,6 +27,14 @@ async def _init_connection(db: aiosqlite.Connection) -> None:
     await db.execute(f"PRAGMA busy_timeout = {RUNTIME_BUSY_TIMEOUT_MS}")
 
 
+# Desired-state indexes on columns that ordered migrations add to historical DBs;
+# skipped by the compatibility pass and created by their migration instead.
+_LATE_COLUMN_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_decision_log_workflow_phase ON decision_log(workflow_id, phase);",
+    "CREATE INDEX IF NOT EXISTS idx_cost_records_workflow_created ON cost_records(workflow_id, created_at);",
+)
+
+
 async def run_migrations(db: aiosqlite.Connection) -> None:
     schema_sql = SCHEMA_PATH.read_text(encoding="utf-8")
     try:
@@ -32,11 +44,10 @@ async def run_migrations(db: aiosqlite.Connection) -> None:
         # Historical DBs can fail on new desired-state indexes that reference columns
         # introduced by later ordered migrations. Apply a compatibility pass and
         # then let ordered migrations bring the DB up to date.
-        if "no such column: workflow_id" in msg:
-            compat_sql = schema_sql.replace(
-                "CREATE INDEX IF NOT EXISTS idx_decision_log_workflow_phase ON decision_log(workflow_id, phase);",
-                "",
-            )
+        if "no such column" in msg:
+            compat_sql = schema_sql
+            for stmt in _LATE_COLUMN_INDEXES:
+                compat_sql = compat_sql.replace(stmt, "")
             await db.executescript(compat_sql)
         else:
             raise
@@ -538,6 +549,27 @@ async def run_migrations(db: aiosqlite.Connection) -> None:
           AND json_valid(data);
         """,
     )
+    # 24. Composite indexes for hot access paths (see `scripts/check.py index-audit`).
+    await _apply(
+        24,
+        """
+        ALTER TABLE cost_records ADD COLUMN created_at TIMESTAMP;
+        CREATE INDEX IF NOT EXISTS idx_cost_records_workflow_created ON cost_records(workflow_id, created_at);
+        DROP INDEX IF EXISTS idx_chunks_workflow;
+        CREATE INDEX IF NOT EXISTS idx_chunks_workflow_paper ON paper_chunks_meta(workflow_id, paper_id);
+        DROP INDEX IF EXISTS idx_event_log_workflow_type;
+        CREATE INDEX IF NOT EXISTS idx_event_log_workflow_type_ts ON event_log(workflow_id, event_type, ts);
+        CREATE INDEX IF NOT EXISTS idx_event_log_type ON event_log(event_type);
+        CREATE INDEX IF NOT EXISTS idx_dual_screening_paper_stage ON dual_screening_results(paper_id, stage);
+        """,
+    )
+    # 25. Input fingerprint for cached manuscript assembly blocks (src/export/assembly_cache.py).
+    await _apply(
+        25,
+        """
+        ALTER TABLE manuscript_assets ADD COLUMN input_hash TEXT;
+        """,
+    )
     await _validate_schema_contract(db)
     await db.commit()
 
@@ -722,32 +754,97 @@ async def repair_foreign_key_integrity(db: aiosqlite.Connection) -> int:
     return inserted
 
 
-@asynccontextmanager
-async def open_runtime_db(db_path: str | Path, *, readonly: bool = False) -> AsyncIterator[aiosqlite.Connection]:
-    """Open a per-run runtime.db with WAL, FK enforcement, and busy-timeout."""
-    path = Path(db_path)
+# Resolved db path -> schema_version observed right after a full migration pass in
+# this process. A matching MAX(version) means the file is already at the desired
+# state, so get_db skips re-running schema.sql and the ordered migrations.
+_MIGRATED_SCHEMA_VERSIONS: dict[str, int] = {}
+
+
+async def _schema_version(db: aiosqlite.Connection) -> int | None:
+    try:
+        async with db.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version") as cur:
+            row = await cur.fetchone()
+    except aiosqlite.OperationalError:
+        return None
+    return int(row[0]) if row and row[0] is not None else 0
+
+
+async def _ensure_migrated(db: aiosqlite.Connection, path: Path) -> None:
+    """Run migrations once per DB file per process (re-run if the file was replaced)."""
+    key = str(path.resolve())
+    known = _MIGRATED_SCHEMA_VERSIONS.get(key)
+    if known is not None and await _schema_version(db) == known:
+        return
+    await run_migrations(db)
+    version = await _schema_version(db)
+    if version is not None:
+        _MIGRATED_SCHEMA_VERSIONS[key] = version
+
+
+async def _connect_runtime(path: Path, *, readonly: bool, migrate: bool, reusable: bool) -> aiosqlite.Connection:
     connect_timeout = RUNTIME_BUSY_TIMEOUT_MS / 1000.0
+    if reusable:
+        manager = current_runtime_db_manager()
+        profiler = manager.profiler if manager is not None else None
+        connect = functools.partial(connect_reusable, profiler=profiler)
+    else:
+        connect = aiosqlite.connect
     if readonly:
-        db = await aiosqlite.connect(f"file:{path}?mode=ro", uri=True, timeout=connect_timeout)
+        db = await connect(f"file:{path}?mode=ro", uri=True, timeout=connect_timeout)
     else:
-        db = await aiosqlite.connect(str(path), timeout=connect_timeout)
+        db = await connect(str(path), timeout=connect_timeout)
     try:
         db.row_factory = aiosqlite.Row
         await _init_connection(db)
+        if migrate:
+            await _ensure_migrated(db, path)
+    except BaseException:
+        await db.close()
+        raise
+    return db
+
+
+@asynccontextmanager
+async def _runtime_connection(path: Path, *, readonly: bool, migrate: bool) -> AsyncIterator[aiosqlite.Connection]:
+    """Yield a runtime.db connection, reusing a parked one inside ``runtime_db_scope``."""
+    manager = current_runtime_db_manager()
+    if manager is None:
+        db = await _connect_runtime(path, readonly=readonly, migrate=migrate, reusable=False)
+        try:
+            yield db
+        finally:
+            await db.close()
+        return
+    db = manager.checkout(path, readonly=readonly)
+    if db is None:
+        started = time.perf_counter()
+        db = await _connect_runtime(path, readonly=readonly, migrate=migrate, reusable=True)
+        manager.record_open((time.perf_counter() - started) * 1000.0)
+    elif migrate:
+        # A parked connection may have been opened without migrating (open_runtime_db,
+        # the event store) or the file replaced since; the version probe is cheap.
+        try:
+            await _ensure_migrated(db, path)
+        except BaseException:
+            await db.close()
+            raise
+    held_from = time.perf_counter()
+    try:
         yield db
     finally:
-        await db.close()
+        await manager.release(path, db, readonly=readonly, held_ms=(time.perf_counter() - held_from) * 1000.0)
+
+
+@asynccontextmanager
+async def open_runtime_db(db_path: str | Path, *, readonly: bool = False) -> AsyncIterator[aiosqlite.Connection]:
+    """Open a per-run runtime.db with WAL, FK enforcement, and busy-timeout."""
+    async with _runtime_connection(Path(db_path), readonly=readonly, migrate=False) as db:
+        yield db
 
 
 @asynccontextmanager
 async def get_db(db_path: str = "data/checkpoints/review_state.db") -> AsyncIterator[aiosqlite.Connection]:
     path = Path(db_path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    db = await aiosqlite.connect(str(path))
-    try:
-        db.row_factory = aiosqlite.Row
-        await _init_connection(db)
-        await run_migrations(db)
+    async with _runtime_connection(path, readonly=False, migrate=True) as db:
         yield db
-    finally:
-        await db.close()
@@ -0,0 +1,192 @@
+"""Opt-in SQLite statement profiler for runtime.db connections.
+
+Enabled with ``diagnostics.db_profiling`` in settings.yaml.  When on, the
+connections handed out inside a workflow's ``runtime_db_scope`` use a cursor
+subclass that times ``execute`` and every fetch on the connection's worker
+thread and aggregates by (phase, statement template): call count, total and
+max latency, and rows returned.  Statements slower than
+``diagnostics.slow_query_ms`` are logged once per template together with their
+``EXPLAIN QUERY PLAN`` output.  Aggregates are persisted to the ``query_profile``
+table when the run scope closes and surface in ``/api/run/{run_id}/diagnostics``
+and the ``status`` CLI command.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+_logger = logging.getLogger(__name__)
+
+_MAX_TEMPLATE_CHARS = 400
+_WS_RE = re.compile(r"\s+")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_LIST_RE = re.compile(r"(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+")
+_NUM_LITERAL_RE = re.compile(r"(?<![\w?])\d+(?:\.\d+)?\b")
+_STR_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse a statement to a stable template (whitespace, literals, IN-lists)."""
+    text = _WS_RE.sub(" ", sql).strip()
+    text = _STR_LITERAL_RE.sub("'?'", text)
+    text = _NUM_LITERAL_RE.sub("N", text)
+    text = _VALUES_LIST_RE.sub(r"\1, ...", text)
+    text = _IN_LIST_RE.sub("(?, ...)", text)
+    if len(text) > _MAX_TEMPLATE_CHARS:
+        text = text[: _MAX_TEMPLATE_CHARS - 3] + "..."
+    return text
+
+
+@dataclass
+class QueryStats:
+    """Aggregate timing for one (phase, template) pair."""
+
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = 0
+    slow_calls: int = 0
+    plan: str | None = None
+
+
+@dataclass
+class QueryProfiler:
+    """Thread-safe aggregator fed by profiling cursors on aiosqlite worker threads."""
+
+    slow_query_ms: float = 250.0
+    explain_slow_queries: bool = True
+    phase: str = "unscoped"
+    _stats: dict[tuple[str, str], QueryStats] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def _entry(self, phase: str, template: str) -> QueryStats:
+        key = (phase, template)
+        entry = self._stats.get(key)
+        if entry is None:
+            entry = self._stats[key] = QueryStats()
+        return entry
+
+    def record_call(self, phase: str, template: str) -> None:
+        with self._lock:
+            self._entry(phase, template).calls += 1
+
+    def record_time(
+        self, phase: str, template: str, elapsed_ms: float, call_ms: float, rows: int, *, became_slow: bool
+    ) -> bool:
+        """Add ``elapsed_ms`` for one execute/fetch step.
+
+        ``call_ms`` is the cumulative time of the current execution and
+        ``became_slow`` marks the step where it first reached the threshold;
+        returns True when a plan should be captured for the template.
+        """
+        with self._lock:
+            entry = self._entry(phase, template)
+            entry.total_ms += elapsed_ms
+            entry.rows += rows
+            entry.max_ms = max(entry.max_ms, call_ms)
+            if became_slow:
+                entry.slow_calls += 1
+            return became_slow and entry.plan is None and self.explain_slow_queries
+
+    def record_plan(self, phase: str, template: str, plan: str) -> None:
+        with self._lock:
+            self._entry(phase, template).plan = plan
+
+    def rows(self) -> list[dict[str, Any]]:
+        """Aggregates sorted by total time, heaviest first."""
+        with self._lock:
+            items = list(self._stats.items())
+        out = [
+            {
+                "phase": phase,
+                "template": template,
+                "calls": stats.calls,
+                "total_ms": round(stats.total_ms, 3),
+                "max_ms": round(stats.max_ms, 3),
+                "rows": stats.rows,
+                "slow_calls": stats.slow_calls,
+                "plan": stats.plan,
+            }
+            for (phase, template), stats in items
+        ]
+        out.sort(key=lambda row: row["total_ms"], reverse=True)
+        return out
+
+
+class ProfilingCursor(sqlite3.Cursor):
+    """sqlite3 cursor that reports execute/fetch timings to a :class:`QueryProfiler`."""
+
+    profiler: QueryProfiler | None = None
+
+    def _begin(self, sql: str) -> None:
+        self._template = normalize_sql(sql)
+        self._phase = self.profiler.phase if self.profiler is not None else "unscoped"
+        self._call_ms = 0.0
+        self._slow = False
+        self._sql = sql
+        if self.profiler is not None:
+            self.profiler.record_call(self._phase, self._template)
+
+    def _account(self, started: float, rows: int) -> None:
+        profiler = self.profiler
+        template = getattr(self, "_template", None)
+        if profiler is None or template is None:
+            return
+        elapsed = (time.perf_counter() - started) * 1000.0
+        self._call_ms += elapsed
+        became_slow = not self._slow and self._call_ms >= profiler.slow_query_ms
+        self._slow = self._slow or became_slow
+        if profiler.record_time(self._phase, template, elapsed, self._call_ms, rows, became_slow=became_slow):
+            plan = self._explain()
+            profiler.record_plan(self._phase, template, plan)
+            _logger.warning("Slow query (%.1f ms, phase=%s): %s\nPlan:\n%s", self._call_ms, self._phase, template, plan)
+
+    def _explain(self) -> str:
+        params = getattr(self, "_params", ())
+        try:
+            plan_rows = sqlite3.Cursor(self.connection).execute(f"EXPLAIN QUERY PLAN {self._sql}", params).fetchall()
+        except sqlite3.Error as exc:
+            return f"(plan unavailable: {exc})"
+        return "\n".join(str(row[-1]) for row in plan_rows)
+
+    def execute(self, sql: str, parameters: Any = (), /) -> ProfilingCursor:  # type: ignore[override]
+        self._begin(sql)
+        self._params = parameters
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)  # type: ignore[return-value]
+        finally:
+            self._account(started, 0)
+
+    def executemany(self, sql: str, seq_of_parameters: Any, /) -> ProfilingCursor:  # type: ignore[override]
+        self._begin(sql)
+        self._params = ()
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)  # type: ignore[return-value]
+        finally:
+            self._account(started, 0)
+
+    def fetchone(self) -> Any:
+        started = time.perf_counter()
+        row = super().fetchone()
+        self._account(started, 0 if row is None else 1)
+        return row
+
+    def fetchmany(self, size: int | None = None) -> list[Any]:
+        started = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._account(started, len(rows))
+        return rows
+
+    def fetchall(self) -> list[Any]:
+        started = time.perf_counter()
+        rows = super().fetchall()
+        self._account(started, len(rows))
+        return rows
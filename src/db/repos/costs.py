@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 import aiosqlite
 
@@ -108,3 +109,88 @@ class CostsRepo:
             }
             for row in rows
         ]
+
+    async def save_query_profile(self, workflow_id: str, rows: list[dict[str, Any]]) -> None:
+        """Merge profiler aggregates into query_profile (resumed runs accumulate)."""
+        if not rows:
+            return
+        await self.db.executemany(
+            """
+            INSERT INTO query_profile
+                (workflow_id, phase, template, calls, total_ms, max_ms, rows_returned, slow_calls, plan, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(workflow_id, phase, template) DO UPDATE SET
+                calls = query_profile.calls + excluded.calls,
+                total_ms = query_profile.total_ms + excluded.total_ms,
+                max_ms = MAX(query_profile.max_ms, excluded.max_ms),
+                rows_returned = query_profile.rows_returned + excluded.rows_returned,
+                slow_calls = query_profile.slow_calls + excluded.slow_calls,
+                plan = COALESCE(excluded.plan, query_profile.plan),
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            [
+                (
+                    workflow_id,
+                    str(row["phase"]),
+                    str(row["template"]),
+                    int(row["calls"]),
+                    float(row["total_ms"]),
+                    float(row["max_ms"]),
+                    int(row["rows"]),
+                    int(row["slow_calls"]),
+                    row.get("plan"),
+                )
+                for row in rows
+            ],
+        )
+        await self.db.commit()
+
+    async def get_query_profile(self, workflow_id: str, limit: int = 25) -> dict[str, Any]:
+        """Return the heaviest statement templates plus per-phase DB time totals."""
+        async with self.db.execute(
+            """
+            SELECT phase, template, calls, total_ms, max_ms, rows_returned, slow_calls, plan
+            FROM query_profile
+            WHERE workflow_id = ?
+            ORDER BY total_ms DESC
+            LIMIT ?
+            """,
+            (workflow_id, limit),
+        ) as cursor:
+            top = await cursor.fetchall()
+        async with self.db.execute(
+            """
+            SELECT phase, SUM(calls), SUM(total_ms), SUM(slow_calls)
+            FROM query_profile
+            WHERE workflow_id = ?
+            GROUP BY phase
+            ORDER BY SUM(total_ms) DESC
+            """,
+            (workflow_id,),
+        ) as cursor:
+            phases = await cursor.fetchall()
+        return {
+            "enabled": bool(top),
+            "phases": [
+                {
+                    "phase": str(row[0]),
+                    "calls": int(row[1] or 0),
+                    "total_ms": round(float(row[2] or 0.0), 3),
+                    "slow_calls": int(row[3] or 0),
+                }
+                for row in phases
+            ],
+            "top_queries": [
+                {
+                    "phase": str(row[0]),
+                    "template": str(row[1]),
+                    "calls": int(row[2] or 0),
+                    "total_ms": round(float(row[3] or 0.0), 3),
+                    "max_ms": round(float(row[4] or 0.0), 3),
+                    "rows": int(row[5] or 0),
+                    "slow_calls": int(row[6] or 0),
+                    "plan": row[7],
+                }
+                for row in top
+            ],
+        }
@@ -345,6 +345,56 @@ class PapersRepo:
             return None
         return int(row[0])
 
+    async def save_fulltext_artifact(
+        self,
+        workflow_id: str,
+        paper_id: str,
+        *,
+        source: str,
+        tier: str,
+        char_count: int,
+        text_path: str,
+        pdf_path: str | None,
+    ) -> None:
+        """Index a full text written to papers_dir (latest write wins)."""
+        await self.db.execute(
+            """
+            INSERT INTO fulltext_artifacts
+                (workflow_id, paper_id, source, tier, char_count, text_path, pdf_path)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(workflow_id, paper_id) DO UPDATE SET
+                source = excluded.source,
+                tier = excluded.tier,
+                char_count = excluded.char_count,
+                text_path = excluded.text_path,
+                pdf_path = excluded.pdf_path,
+                created_at = CURRENT_TIMESTAMP
+            """,
+            (workflow_id, paper_id, source, tier, char_count, text_path, pdf_path),
+        )
+        await self.db.commit()
+
+    async def get_fulltext_artifact(self, workflow_id: str, paper_id: str) -> dict[str, Any] | None:
+        """Return the indexed full-text artifact for one paper, or None."""
+        async with self.db.execute(
+            """
+            SELECT source, tier, char_count, text_path, pdf_path
+            FROM fulltext_artifacts
+            WHERE workflow_id = ? AND paper_id = ?
+            """,
+            (workflow_id, paper_id),
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row is None:
+            return None
+        return {
+            "source": str(row[0]),
+            "tier": str(row[1]),
+            "char_count": int(row[2]),
+            "text_path": str(row[3]),
+            "pdf_path": str(row[4]) if row[4] else None,
+        }
+
     async def get_paper_id_to_citekey_map(self) -> dict[str, str]:
         """Build a paper_id -> citekey map by joining papers and citations on normalized DOI.
 
@@ -354,6 +354,23 @@ class ScreeningRepo:
         rows = await cursor.fetchall()
         return {str(row[0]) for row in rows}
 
+    async def get_pending_included_paper_ids(self, workflow_id: str) -> set[str]:
+        """Screening-included paper IDs whose synthesis eligibility is not decided yet.
+
+        These await extraction; living-review delta runs hold them next to the
+        parent's already ``included_primary`` studies.
+        """
+        cursor = await self.db.execute(
+            """
+            SELECT paper_id
+            FROM study_cohort_membership
+            WHERE workflow_id = ? AND screening_status = 'included' AND synthesis_eligibility = 'pending'
+            """,
+            (workflow_id,),
+        )
+        rows = await cursor.fetchall()
+        return {str(row[0]) for row in rows}
+
     async def get_title_abstract_include_ids(self, workflow_id: str) -> set[str]:
         """Paper IDs that passed title/abstract screening (include or uncertain).
 
@@ -472,13 +472,14 @@ class WritingRepo:
         await self.db.execute(
             """
             INSERT INTO manuscript_assets
-                (workflow_id, asset_key, asset_type, format, content, source_path, version)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+                (workflow_id, asset_key, asset_type, format, content, source_path, version, input_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             ON CONFLICT(workflow_id, asset_key, version) DO UPDATE SET
                 asset_type = excluded.asset_type,
                 format = excluded.format,
                 content = excluded.content,
-                source_path = excluded.source_path
+                source_path = excluded.source_path,
+                input_hash = excluded.input_hash
             """,
             (
                 asset.workflow_id,
@@ -488,14 +489,28 @@ class WritingRepo:
                 asset.content,
                 asset.source_path,
                 asset.version,
+                asset.input_hash,
             ),
         )
         await self.db.commit()
 
+    @staticmethod
+    def _manuscript_asset_from_row(row: Any) -> ManuscriptAsset:
+        return ManuscriptAsset(
+            workflow_id=str(row[0]),
+            asset_key=str(row[1]),
+            asset_type=str(row[2]),
+            format=str(row[3]),
+            content=str(row[4]),
+            source_path=str(row[5]) if row[5] is not None else None,
+            version=int(row[6]),
+            input_hash=str(row[7]) if row[7] is not None else None,
+        )
+
     async def load_latest_manuscript_asset(self, workflow_id: str, asset_key: str) -> ManuscriptAsset | None:
         cursor = await self.db.execute(
             """
-            SELECT workflow_id, asset_key, asset_type, format, content, source_path, version
+            SELECT workflow_id, asset_key, asset_type, format, content, source_path, version, input_hash
             FROM manuscript_assets
             WHERE workflow_id = ? AND asset_key = ?
             ORDER BY version DESC
@@ -506,15 +521,29 @@ class WritingRepo:
         row = await cursor.fetchone()
         if not row:
             return None
-        return ManuscriptAsset(
-            workflow_id=str(row[0]),
-            asset_key=str(row[1]),
-            asset_type=str(row[2]),
-            format=str(row[3]),
-            content=str(row[4]),
-            source_path=str(row[5]) if row[5] is not None else None,
-            version=int(row[6]),
+        return self._manuscript_asset_from_row(row)
+
+    async def load_latest_manuscript_assets(self, workflow_id: str, asset_type: str) -> list[ManuscriptAsset]:
+        """Latest version of every asset of *asset_type* for the workflow."""
+        cursor = await self.db.execute(
+            """
+            SELECT a.workflow_id, a.asset_key, a.asset_type, a.format, a.content, a.source_path, a.version,
+                   a.input_hash
+            FROM manuscript_assets a
+            JOIN (
+                SELECT asset_key, MAX(version) AS max_version
+                FROM manuscript_assets
+                WHERE workflow_id = ? AND asset_type = ?
+                GROUP BY asset_key
+            ) lv
+              ON a.asset_key = lv.asset_key
+             AND a.version = lv.max_version
+            WHERE a.workflow_id = ? AND a.asset_type = ?
+            ORDER BY a.asset_key
+            """,
+            (workflow_id, asset_type, workflow_id, asset_type),
         )
+        return [self._manuscript_asset_from_row(row) for row in await cursor.fetchall()]
 
     async def _validate_assembly_manifest(self, workflow_id: str, manifest_json: str) -> None:
         try:
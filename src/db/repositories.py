@@ -251,6 +251,7 @@ class WorkflowRepository:
 
         if start_idx <= PHASE_ORDER.index("phase_4b_embedding"):
             await _delete("paper_chunks_meta")
+            await _delete("paper_embeddings")
             await _delete("rag_retrieval_diagnostics")
 
         if start_idx <= PHASE_ORDER.index("phase_4_extraction_quality"):
@@ -549,30 +550,57 @@ class CitationRepository:
         return {str(row[0]) for row in rows if row and row[0]}
 
 
-async def merge_papers_from_parent(
-    parent_db_path: str,
-    dst_db: aiosqlite.Connection,
-) -> int:
-    """Copy included papers and their screening decisions from a parent run DB.
-
-    Only copies papers that are not already present in dst_db (INSERT OR IGNORE).
-    Marks merged papers with source='merged_from_parent' so downstream phases
-    can skip re-screening and re-embedding them.
+# papers.source_database of records imported from a living-review parent run.
+MERGED_FROM_PARENT_SOURCE = "merged_from_parent"
+
+# Per-paper work a living-review delta run inherits from its parent workflow,
+# in foreign-key order.  Rows are re-keyed to the child workflow_id.
+_PARENT_WORK_TABLES = (
+    "screening_decisions",
+    "dual_screening_results",
+    "study_cohort_membership",
+    "extraction_records",
+    "rob_assessments",
+    "casp_assessments",
+    "mmat_assessments",
+    "fulltext_artifacts",
+    "paper_chunks_meta",
+    "paper_embeddings",
+)
 
-    Returns the number of papers merged.
-    """
-    import logging as _logging
 
-    _logger = _logging.getLogger(__name__)
+async def _table_columns(db: aiosqlite.Connection, table: str) -> list[str]:
+    async with db.execute(f"PRAGMA table_info({table})") as cur:
+        return [str(row[1]) for row in await cur.fetchall()]
 
-    merged = 0
-    parent_papers = []
-    parent_decisions: dict[str, str] = {}
 
+async def import_parent_workflow(
+    parent_db_path: str,
+    dst_db: aiosqlite.Connection,
+    workflow_id: str | None = None,
+) -> dict[str, int]:
+    """Import a parent run's corpus and per-paper work into a living-review delta run.
+
+    Copies every parent paper (marked ``source_database='merged_from_parent'``)
+    plus the parent workflow's screening decisions, extraction records,
+    quality assessments, cohort membership, full-text index and RAG chunks,
+    re-keyed to *workflow_id* (default: the newest workflow in *dst_db*).
+    Screening, extraction and embedding already skip papers with persisted
+    work, so only records the parent never saw reach the LLM phases.
+    Existing destination rows win (INSERT OR IGNORE), so the import is
+    idempotent.  Returns the number of rows inserted per table; empty when the
+    parent DB cannot be read.
+    """
+    if workflow_id is None:
+        async with dst_db.execute(
+            "SELECT workflow_id FROM workflows ORDER BY created_at DESC, rowid DESC LIMIT 1"
+        ) as cur:
+            row = await cur.fetchone()
+        workflow_id = str(row[0]) if row else ""
+    counts: dict[str, int] = {}
     try:
         async with aiosqlite.connect(parent_db_path) as src_db:
             src_db.row_factory = aiosqlite.Row
-
             try:
                 async with src_db.execute(
                     "SELECT paper_id, title, abstract, authors, year, doi, url, source_database, "
@@ -580,54 +608,130 @@ async def merge_papers_from_parent(
                 ) as cur:
                     parent_papers = await cur.fetchall()
             except Exception:
-                _logger.warning("merge_papers_from_parent: could not read papers from %s", parent_db_path)
-                return 0
-
-            try:
-                async with src_db.execute("SELECT paper_id, final_decision FROM dual_screening_results") as cur:
-                    for row in await cur.fetchall():
-                        parent_decisions[row["paper_id"]] = row["final_decision"]
-            except Exception:
-                pass
-
-    except Exception:
-        _logger.warning("merge_papers_from_parent: cannot open parent DB at %s", parent_db_path)
-        return 0
-
-    for row in parent_papers:
-        try:
-            await dst_db.execute(
+                _logger.warning("import_parent_workflow: could not read papers from %s", parent_db_path)
+                return {}
+            async with src_db.execute(
+                "SELECT workflow_id FROM workflows ORDER BY created_at DESC, rowid DESC LIMIT 1"
+            ) as cur:
+                parent_row = await cur.fetchone()
+            parent_workflow_id = str(parent_row[0]) if parent_row else None
+
+            before = dst_db.total_changes
+            await dst_db.executemany(
                 """INSERT OR IGNORE INTO papers
                    (paper_id, title, abstract, authors, year, doi, url, source_database,
                     source_category, display_label, openalex_id)
                    VALUES (?,?,?,?,?,?,?,?,?,?,?)""",
-                (
-                    row["paper_id"],
-                    row["title"],
-                    row["abstract"],
-                    row["authors"],
-                    row["year"],
-                    row["doi"],
-                    row["url"],
-                    "merged_from_parent",
-                    "database",
-                    row["display_label"],
-                    row["openalex_id"],
-                ),
+                [
+                    (
+                        row["paper_id"],
+                        row["title"],
+                        row["abstract"],
+                        row["authors"],
+                        row["year"],
+                        row["doi"],
+                        row["url"],
+                        MERGED_FROM_PARENT_SOURCE,
+                        "database",
+                        row["display_label"],
+                        row["openalex_id"],
+                    )
+                    for row in parent_papers
+                ],
             )
-            merged += 1
-
-            decision = parent_decisions.get(row["paper_id"])
-            if decision:
-                await dst_db.execute(
-                    """INSERT OR IGNORE INTO dual_screening_results
-                       (workflow_id, paper_id, stage, agreement, final_decision, adjudication_needed)
-                       VALUES ('merged', ?, 'stage1', 1, ?, 0)""",
-                    (row["paper_id"], decision),
-                )
-        except Exception as exc:
-            _logger.debug("merge_papers_from_parent: skip %s: %s", row["paper_id"], exc)
+            counts["papers"] = dst_db.total_changes - before
+
+            if parent_workflow_id is not None and workflow_id:
+                for table in _PARENT_WORK_TABLES:
+                    try:
+                        dst_columns = set(await _table_columns(dst_db, table))
+                        columns = [c for c in await _table_columns(src_db, table) if c in dst_columns and c != "id"]
+                        if "workflow_id" not in columns:
+                            continue
+                        async with src_db.execute(
+                            f"SELECT {', '.join(columns)} FROM {table} WHERE workflow_id = ?",
+                            (parent_workflow_id,),
+                        ) as cur:
+                            rows = await cur.fetchall()
+                    except Exception as exc:
+                        _logger.debug("import_parent_workflow: skip %s: %s", table, exc)
+                        continue
+                    wf_index = columns.index("workflow_id")
+                    before = dst_db.total_changes
+                    await dst_db.executemany(
+                        f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) "
+                        f"VALUES ({', '.join('?' * len(columns))})",
+                        [tuple(workflow_id if i == wf_index else row[i] for i in range(len(columns))) for row in rows],
+                    )
+                    counts[table] = dst_db.total_changes - before
+    except Exception:
+        _logger.warning("import_parent_workflow: cannot open parent DB at %s", parent_db_path)
+        return {}
 
     await dst_db.commit()
-    _logger.info("merge_papers_from_parent: merged %d papers from %s", merged, parent_db_path)
-    return merged
+    _logger.info("import_parent_workflow: imported %s from %s", counts, parent_db_path)
+    return counts
+
+
+PARENT_SEARCH_QUERY_VARIANT = "living_review_parent"
+
+
+async def carry_parent_identification(
+    parent_db_path: str,
+    dst_db: aiosqlite.Connection,
+    workflow_id: str,
+) -> int:
+    """Copy a parent run's ``search_results`` rows into a living-review delta run.
+
+    Rows are re-keyed to *workflow_id* under query variant
+    ``living_review_parent``, so PRISMA identification counts (summed per
+    database) cover the parent's searches plus the update search.  Call it
+    after the update search has saved its own rows; re-running replaces the
+    carried rows.  Returns the parent's persisted duplicates-removed count
+    (0 when unknown or the parent DB cannot be read).
+    """
+    try:
+        async with aiosqlite.connect(parent_db_path) as src_db:
+            async with src_db.execute(
+                "SELECT workflow_id, dedup_count FROM workflows ORDER BY created_at DESC, rowid DESC LIMIT 1"
+            ) as cur:
+                parent_row = await cur.fetchone()
+            if parent_row is None:
+                return 0
+            async with src_db.execute(
+                """
+                SELECT database_name, source_category, search_date, search_query, limits_applied,
+                       records_retrieved, diagnostic_cause
+                FROM search_results WHERE workflow_id = ?
+                """,
+                (parent_row[0],),
+            ) as cur:
+                rows = await cur.fetchall()
+    except Exception:
+        _logger.warning("carry_parent_identification: cannot read parent DB at %s", parent_db_path)
+        return 0
+    await dst_db.execute(
+        "DELETE FROM search_results WHERE workflow_id = ? AND query_variant = ?",
+        (workflow_id, PARENT_SEARCH_QUERY_VARIANT),
+    )
+    await dst_db.executemany(
+        """
+        INSERT INTO search_results (
+            database_name, source_category, search_date, search_query,
+            limits_applied, records_retrieved, diagnostic_cause, query_variant, workflow_id
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [(*row, PARENT_SEARCH_QUERY_VARIANT, workflow_id) for row in rows],
+    )
+    await dst_db.commit()
+    return int(parent_row[1] or 0)
+
+
+async def merge_papers_from_parent(
+    parent_db_path: str,
+    dst_db: aiosqlite.Connection,
+    workflow_id: str | None = None,
+) -> int:
+    """Import a parent run into *dst_db* (see ``import_parent_workflow``); returns papers merged."""
+    counts = await import_parent_workflow(parent_db_path, dst_db, workflow_id)
+    return counts.get("papers", 0)
@@ -201,6 +201,7 @@ CREATE TABLE IF NOT EXISTS manuscript_assets (
     content TEXT NOT NULL,
     source_path TEXT,
     version INTEGER NOT NULL DEFAULT 1,
+    input_hash TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     PRIMARY KEY (workflow_id, asset_key, version)
 );
@@ -267,6 +268,21 @@ CREATE TABLE IF NOT EXISTS cost_records (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Opt-in SQLite statement profile (settings.yaml diagnostics.db_profiling).
+CREATE TABLE IF NOT EXISTS query_profile (
+    workflow_id TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    template TEXT NOT NULL,
+    calls INTEGER NOT NULL DEFAULT 0,
+    total_ms REAL NOT NULL DEFAULT 0,
+    max_ms REAL NOT NULL DEFAULT 0,
+    rows_returned INTEGER NOT NULL DEFAULT 0,
+    slow_calls INTEGER NOT NULL DEFAULT 0,
+    plan TEXT,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (workflow_id, phase, template)
+);
+
 CREATE TABLE IF NOT EXISTS manuscript_audit_runs (
     audit_run_id TEXT PRIMARY KEY,
     workflow_id TEXT NOT NULL,
@@ -396,6 +412,7 @@ CREATE UNIQUE INDEX IF NOT EXISTS idx_screening_decisions_unique
     ON screening_decisions(workflow_id, paper_id, stage, reviewer_type);
 CREATE INDEX IF NOT EXISTS idx_search_results_workflow ON search_results(workflow_id);
 CREATE INDEX IF NOT EXISTS idx_dual_screening_stage_decision ON dual_screening_results(workflow_id, stage, final_decision);
+CREATE INDEX IF NOT EXISTS idx_dual_screening_paper_stage ON dual_screening_results(paper_id, stage);
 CREATE INDEX IF NOT EXISTS idx_extraction_records_workflow ON extraction_records(workflow_id);
 CREATE INDEX IF NOT EXISTS idx_study_cohort_workflow ON study_cohort_membership(workflow_id);
 CREATE INDEX IF NOT EXISTS idx_study_cohort_synthesis ON study_cohort_membership(workflow_id, synthesis_eligibility);
@@ -407,7 +424,8 @@ CREATE INDEX IF NOT EXISTS idx_decision_log_workflow_phase ON decision_log(workf
 CREATE INDEX IF NOT EXISTS idx_fallback_events_workflow_phase ON fallback_events(workflow_id, phase, created_at);
 CREATE INDEX IF NOT EXISTS idx_gate_results_phase ON gate_results(phase);
 CREATE INDEX IF NOT EXISTS idx_event_log_workflow ON event_log(workflow_id);
-CREATE INDEX IF NOT EXISTS idx_event_log_workflow_type ON event_log(workflow_id, event_type);
+CREATE INDEX IF NOT EXISTS idx_event_log_workflow_type_ts ON event_log(workflow_id, event_type, ts);
+CREATE INDEX IF NOT EXISTS idx_event_log_type ON event_log(event_type);
 CREATE INDEX IF NOT EXISTS idx_validation_runs_workflow ON validation_runs(workflow_id, started_at DESC);
 CREATE INDEX IF NOT EXISTS idx_validation_checks_run_phase ON validation_checks(validation_run_id, phase);
 CREATE INDEX IF NOT EXISTS idx_validation_checks_workflow_status ON validation_checks(workflow_id, status);
@@ -420,6 +438,7 @@ CREATE INDEX IF NOT EXISTS idx_manuscript_blocks_workflow_section_order
     ON manuscript_blocks(workflow_id, section_key, section_version, generation, block_order);
 CREATE INDEX IF NOT EXISTS idx_manuscript_assets_workflow_type_key ON manuscript_assets(workflow_id, asset_type, asset_key);
 CREATE INDEX IF NOT EXISTS idx_cost_records_phase_model ON cost_records(phase, model);
+CREATE INDEX IF NOT EXISTS idx_cost_records_workflow_created ON cost_records(workflow_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_manuscript_audit_runs_workflow ON manuscript_audit_runs(workflow_id, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_manuscript_audit_findings_run ON manuscript_audit_findings(audit_run_id, id);
 
@@ -521,9 +540,37 @@ CREATE TABLE IF NOT EXISTS paper_chunks_meta (
     created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
 );
-CREATE INDEX IF NOT EXISTS idx_chunks_workflow ON paper_chunks_meta(workflow_id);
+CREATE INDEX IF NOT EXISTS idx_chunks_workflow_paper ON paper_chunks_meta(workflow_id, paper_id);
 CREATE INDEX IF NOT EXISTS idx_chunks_paper ON paper_chunks_meta(paper_id);
 
+-- Per-paper centroid of the chunk embeddings above: L2-normalized float32
+-- bytes written by EmbeddingNode (src/rag/paper_vectors.py).
+CREATE TABLE IF NOT EXISTS paper_embeddings (
+    workflow_id TEXT NOT NULL,
+    paper_id    TEXT NOT NULL,
+    dim         INTEGER NOT NULL,
+    chunk_count INTEGER NOT NULL DEFAULT 0,
+    vector      BLOB NOT NULL,
+    created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (workflow_id, paper_id),
+    FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
+);
+
+-- Run-scoped full-text artifacts (src/fulltext/store.py). Files live under
+-- papers_dir: <paper_id>.pdf when a PDF was fetched, <paper_id>.md for the
+-- parsed/provider text that screening, extraction and quality assessment reuse.
+CREATE TABLE IF NOT EXISTS fulltext_artifacts (
+    workflow_id TEXT NOT NULL,
+    paper_id    TEXT NOT NULL,
+    source      TEXT NOT NULL,
+    tier        TEXT NOT NULL,
+    char_count  INTEGER NOT NULL,
+    text_path   TEXT NOT NULL,
+    pdf_path    TEXT,
+    created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (workflow_id, paper_id)
+);
+
 -- ============================================================
 -- RAG diagnostics - per-section retrieval telemetry
 -- ============================================================
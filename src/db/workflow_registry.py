@@ -6,16 +6,20 @@ which runtime.db to open without scanning the filesystem.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
-from collections.abc import AsyncIterator, Sequence
+import time
+from collections.abc import AsyncIterator, Iterable, Sequence
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
 import aiosqlite
 
+from src.db.connection_manager import connect_reusable, reset_cursors
+
 _logger = logging.getLogger(__name__)
 
 REGISTRY_SCHEMA = """
@@ -55,18 +59,180 @@ _MIGRATION_ADD_IS_COMPLETED_HIDDEN = (
 _MIGRATION_ADD_COMPLETED_HIDDEN_AT = "ALTER TABLE workflows_registry ADD COLUMN completed_hidden_at TEXT"
 
 
+_REGISTRY_STATEMENT_CACHE_SIZE = 256
+
+
+async def _connect_registry(path: str, *, readonly: bool = False, pooled: bool = False) -> aiosqlite.Connection:
+    """Open one registry connection and apply the WAL/busy_timeout PRAGMAs."""
+    connect = connect_reusable if pooled else aiosqlite.connect
+    db = await connect(path, timeout=5.0, cached_statements=_REGISTRY_STATEMENT_CACHE_SIZE)
+    await db.execute("PRAGMA journal_mode = WAL")
+    await db.execute("PRAGMA busy_timeout = 5000")
+    if readonly:
+        await db.execute("PRAGMA query_only = ON")
+    return db
+
+
+@dataclass
+class RegistryPoolStats:
+    """Lock-wait and usage counters for one pooled registry database."""
+
+    path: str
+    readers: int
+    writer_acquisitions: int = 0
+    writer_wait_ms_total: float = 0.0
+    writer_wait_ms_max: float = 0.0
+    reader_acquisitions: int = 0
+    reader_wait_ms_total: float = 0.0
+    reader_wait_ms_max: float = 0.0
+    heartbeat_batches: int = 0
+    heartbeat_rows: int = 0
+
+    def to_dict(self) -> dict[str, float | int | str]:
+        return asdict(self)
+
+
+class RegistryPool:
+    """Process-wide connections for one workflows_registry.db.
+
+    One writer connection serialized by an asyncio lock plus a small pool of
+    ``query_only`` reader connections.  PRAGMAs run once per connection instead of
+    once per call, and sqlite3's per-connection statement cache keeps the hot
+    registry statements prepared across heartbeats and history page loads.
+    """
+
+    def __init__(self, path: str, *, readers: int = 4) -> None:
+        self.path = path
+        self._reader_count = max(1, readers)
+        self._writer: aiosqlite.Connection | None = None
+        self._write_lock = asyncio.Lock()
+        self._readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._all_readers: list[aiosqlite.Connection] = []
+        self.stats = RegistryPoolStats(path=path, readers=self._reader_count)
+
+    async def open(self) -> None:
+        self._writer = await _connect_registry(self.path, pooled=True)
+        for _ in range(self._reader_count):
+            reader = await _connect_registry(self.path, readonly=True, pooled=True)
+            self._all_readers.append(reader)
+            self._readers.put_nowait(reader)
+
+    async def close(self) -> None:
+        async with self._write_lock:
+            if self._writer is not None:
+                await self._writer.close()
+                self._writer = None
+        for reader in self._all_readers:
+            await reader.close()
+        self._all_readers.clear()
+        self._readers = asyncio.Queue()
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Yield the shared writer; uncommitted work is rolled back on exit."""
+        started = time.perf_counter()
+        async with self._write_lock:
+            waited_ms = (time.perf_counter() - started) * 1000.0
+            self.stats.writer_acquisitions += 1
+            self.stats.writer_wait_ms_total += waited_ms
+            self.stats.writer_wait_ms_max = max(self.stats.writer_wait_ms_max, waited_ms)
+            if self._writer is None:
+                raise RuntimeError(f"Registry pool for {self.path} is closed")
+            db = self._writer
+            try:
+                yield db
+            finally:
+                reset_cursors(db)
+                db.row_factory = None
+                if db.in_transaction:
+                    await db.rollback()
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Check out a read-only connection for the duration of the block."""
+        started = time.perf_counter()
+        db = await self._readers.get()
+        waited_ms = (time.perf_counter() - started) * 1000.0
+        self.stats.reader_acquisitions += 1
+        self.stats.reader_wait_ms_total += waited_ms
+        self.stats.reader_wait_ms_max = max(self.stats.reader_wait_ms_max, waited_ms)
+        try:
+            yield db
+        finally:
+            reset_cursors(db)
+            db.row_factory = None
+            if db.in_transaction:
+                await db.rollback()
+            self._readers.put_nowait(db)
+
+
+_REGISTRY_POOLS: dict[str, RegistryPool] = {}
+
+
+def _pool_for(path: str) -> RegistryPool | None:
+    if not _REGISTRY_POOLS:
+        return None
+    return _REGISTRY_POOLS.get(str(Path(path).resolve()))
+
+
+async def open_registry_pool(run_root: str, *, readers: int = 4) -> RegistryPool:
+    """Create (or return) the process-wide pool for ``run_root``'s registry.
+
+    Callers own the lifecycle: the web app opens the pool in its lifespan and
+    closes it with :func:`close_registry_pools`.  Without an open pool every
+    registry helper falls back to a one-shot connection.
+    """
+    path = await _ensure_registry(run_root)
+    existing = _REGISTRY_POOLS.get(path)
+    if existing is not None:
+        return existing
+    pool = RegistryPool(path, readers=readers)
+    await pool.open()
+    _REGISTRY_POOLS[path] = pool
+    return pool
+
+
+async def close_registry_pools() -> None:
+    """Close every open registry pool (idempotent)."""
+    pools = list(_REGISTRY_POOLS.values())
+    _REGISTRY_POOLS.clear()
+    for pool in pools:
+        try:
+            await pool.close()
+        except Exception:
+            _logger.debug("Failed to close registry pool for %s", pool.path, exc_info=True)
+
+
+def registry_pool_stats() -> list[dict[str, float | int | str]]:
+    """Return lock-wait metrics for every open registry pool."""
+    return [pool.stats.to_dict() for pool in _REGISTRY_POOLS.values()]
+
+
 @asynccontextmanager
-async def _open_registry(path: str) -> AsyncIterator[aiosqlite.Connection]:
+async def _open_registry(path: str, *, readonly: bool = False) -> AsyncIterator[aiosqlite.Connection]:
     """Open the registry DB with WAL mode and a 5 s busy-timeout.
 
     WAL allows concurrent readers alongside a single writer so note saves never
     block history reads.  busy_timeout lets writers queue instead of immediately
     returning SQLITE_BUSY when another write holds the lock.
+
+    When a :class:`RegistryPool` is open for ``path`` the pooled writer (or a
+    pooled reader when ``readonly``) is yielded instead of a fresh connection.
     """
-    async with aiosqlite.connect(path, timeout=5.0) as db:
-        await db.execute("PRAGMA journal_mode = WAL")
-        await db.execute("PRAGMA busy_timeout = 5000")
+    pool = _pool_for(path)
+    if pool is not None:
+        if readonly:
+            async with pool.reader() as db:
+                yield db
+        else:
+            async with pool.writer() as db:
+                yield db
+        return
+    db = await _connect_registry(path, readonly=readonly)
+    try:
         yield db
+    finally:
+        await db.close()
 
 
 @dataclass
@@ -187,9 +353,17 @@ async def try_claim_for_resume(
         return True, raced_status
 
 
+_ENSURED_REGISTRIES: set[str] = set()
+
+
 async def _ensure_registry(run_root: str) -> str:
-    """Ensure registry db exists with schema, running migrations. Return absolute path."""
+    """Ensure registry db exists with schema, running migrations. Return absolute path.
+
+    Schema and column migrations run once per registry file per process.
+    """
     path = _registry_path(run_root)
+    if path in _ENSURED_REGISTRIES and os.path.isfile(path):
+        return path
     Path(path).parent.mkdir(parents=True, exist_ok=True)
     async with _open_registry(path) as db:
         await db.executescript(REGISTRY_SCHEMA)
@@ -231,6 +405,7 @@ async def _ensure_registry(run_root: str) -> str:
         except Exception:
             pass
         await db.commit()
+    _ENSURED_REGISTRIES.add(path)
     return path
 
 
@@ -268,17 +443,17 @@ async def find_by_workflow_id(run_root: str, workflow_id: str) -> RegistryEntry
     path = _registry_path(run_root)
     if not os.path.isfile(path):
         return None
-    async with _open_registry(path) as db:
+    async with _open_registry(path, readonly=True) as db:
         db.row_factory = aiosqlite.Row
-        cursor = await db.execute(
+        async with db.execute(
             """
             SELECT workflow_id, topic, config_hash, db_path, status, created_at, updated_at
             FROM workflows_registry
             WHERE workflow_id = ?
             """,
             (workflow_id,),
-        )
-        row = await cursor.fetchone()
+        ) as cursor:
+            row = await cursor.fetchone()
     if row is None:
         return None
     entry = RegistryEntry(
@@ -363,10 +538,10 @@ async def find_by_topic(
     path = _registry_path(run_root)
     if not os.path.isfile(path):
         return []
-    async with _open_registry(path) as db:
+    async with _open_registry(path, readonly=True) as db:
         db.row_factory = aiosqlite.Row
         if config_hash:
-            cursor = await db.execute(
+            async with db.execute(
                 """
                 SELECT workflow_id, topic, config_hash, db_path, status, created_at, updated_at
                 FROM workflows_registry
@@ -374,9 +549,10 @@ async def find_by_topic(
                 ORDER BY created_at DESC
                 """,
                 (topic, config_hash),
-            )
+            ) as cursor:
+                rows = await cursor.fetchall()
         else:
-            cursor = await db.execute(
+            async with db.execute(
                 """
                 SELECT workflow_id, topic, config_hash, db_path, status, created_at, updated_at
                 FROM workflows_registry
@@ -384,8 +560,8 @@ async def find_by_topic(
                 ORDER BY created_at DESC
                 """,
                 (topic,),
-            )
-        rows = await cursor.fetchall()
+            ) as cursor:
+                rows = await cursor.fetchall()
     entries: list[RegistryEntry] = []
     for row in rows:
         entry = RegistryEntry(
@@ -485,6 +661,47 @@ async def update_heartbeat(run_root: str, workflow_id: str) -> bool:
     return True
 
 
+async def update_heartbeats(run_root: str, workflow_ids: Iterable[str]) -> int:
+    """Stamp heartbeat_at for many running workflows in a single UPDATE.
+
+    The web heartbeat batcher calls this once per interval for all active runs
+    under ``run_root`` instead of opening one connection per run.  Returns the
+    number of registry rows updated.
+    """
+    ids = sorted({wf for wf in workflow_ids if wf})
+    if not ids:
+        return 0
+    path = _registry_path(run_root)
+    if not os.path.isfile(path):
+        _logger.warning(
+            "Workflow registry missing; cannot update heartbeats for %d workflow(s) under %s",
+            len(ids),
+            run_root,
+        )
+        return 0
+    placeholders = ",".join("?" * len(ids))
+    async with _open_registry(path) as db:
+        before = db.total_changes
+        await db.execute(
+            f"UPDATE workflows_registry SET heartbeat_at = datetime('now') WHERE workflow_id IN ({placeholders})",
+            ids,
+        )
+        await db.commit()
+        updated = db.total_changes - before
+    pool = _pool_for(path)
+    if pool is not None:
+        pool.stats.heartbeat_batches += 1
+        pool.stats.heartbeat_rows += updated
+    if updated < len(ids):
+        _logger.warning(
+            "Workflow registry rows missing; heartbeat updated %d of %d workflow(s) under %s",
+            updated,
+            len(ids),
+            run_root,
+        )
+    return updated
+
+
 async def archive_workflow(run_root: str, workflow_id: str) -> None:
     """Soft archive a workflow in the registry.
 
@@ -569,8 +786,8 @@ async def allocate_workflow_id(run_root: str) -> str:
     path = await _ensure_registry(run_root)
     async with _open_registry(path) as db:
         await db.execute("BEGIN EXCLUSIVE")
-        cursor = await db.execute("SELECT last_seq FROM workflow_counter WHERE id = 1")
-        row = await cursor.fetchone()
+        async with db.execute("SELECT last_seq FROM workflow_counter WHERE id = 1") as cursor:
+            row = await cursor.fetchone()
         next_seq = (row[0] if row else 0) + 1
         await db.execute("UPDATE workflow_counter SET last_seq = ? WHERE id = 1", (next_seq,))
         await db.commit()
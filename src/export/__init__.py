@@ -1,24 +1,31 @@
 """Export package: IEEE LaTeX, submission packager, validators."""
 
-from src.export.bibtex_builder import build_bibtex
-from src.export.docx_exporter import generate_docx
-from src.export.ieee_latex import markdown_to_latex
-from src.export.ieee_validator import ValidationResult as IEEEValidationResult
-from src.export.ieee_validator import validate_ieee
-from src.export.markdown_refs import (
-    assemble_submission_manuscript,
-    build_markdown_figures_section,
-    build_markdown_references_section,
-    strip_appended_sections,
-)
-from src.export.prisma_checklist import (
-    PrismaValidationResult,
-    render_prisma_csv,
-    render_prisma_html,
-    render_prisma_markdown_table,
-    validate_prisma,
-)
-from src.export.submission_packager import package_submission
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from src.export.bibtex_builder import build_bibtex
+    from src.export.docx_exporter import generate_docx
+    from src.export.ieee_latex import markdown_to_latex
+    from src.export.ieee_validator import ValidationResult as IEEEValidationResult
+    from src.export.ieee_validator import validate_ieee
+    from src.export.markdown_refs import (
+        assemble_submission_manuscript,
+        build_markdown_figures_section,
+        build_markdown_references_section,
+        strip_appended_sections,
+    )
+    from src.export.prisma_checklist import (
+        PrismaValidationResult,
+        render_prisma_csv,
+        render_prisma_html,
+        render_prisma_markdown_table,
+        validate_prisma,
+    )
+    from src.export.submission_packager import package_submission
 
 __all__ = [
     "assemble_submission_manuscript",
@@ -37,3 +44,24 @@ __all__ = [
     "render_prisma_html",
     "render_prisma_markdown_table",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "assemble_submission_manuscript": "src.export.markdown_refs",
+        "build_bibtex": "src.export.bibtex_builder",
+        "build_markdown_figures_section": "src.export.markdown_refs",
+        "build_markdown_references_section": "src.export.markdown_refs",
+        "generate_docx": "src.export.docx_exporter",
+        "markdown_to_latex": "src.export.ieee_latex",
+        "package_submission": "src.export.submission_packager",
+        "strip_appended_sections": "src.export.markdown_refs",
+        "validate_ieee": "src.export.ieee_validator",
+        "validate_prisma": "src.export.prisma_checklist",
+        "IEEEValidationResult": "src.export.ieee_validator:ValidationResult",
+        "PrismaValidationResult": "src.export.prisma_checklist",
+        "render_prisma_csv": "src.export.prisma_checklist",
+        "render_prisma_html": "src.export.prisma_checklist",
+        "render_prisma_markdown_table": "src.export.prisma_checklist",
+    },
+)
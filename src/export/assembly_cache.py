@@ -0,0 +1,169 @@
+"""Input-fingerprinted cache for manuscript assembly blocks.
+
+Manuscript assembly re-renders the same appended tables (PICOS, GRADE/SoF,
+RoB/CASP/MMAT, study characteristics), concept/custom diagrams and the
+contradiction paragraph on every writing run, resume and finalize, even
+when only one section changed.  ``AssemblyBlockCache`` keys each rendered
+block by a hash of everything it is built from and reuses the previous
+content while that hash is unchanged, so only dirty blocks are recomputed.
+
+Each fingerprint also covers the source of the modules that render the
+block kind (``_BLOCK_RENDERERS``), so editing a renderer invalidates its
+cached blocks without a manual ``_CACHE_VERSION`` bump.
+
+Entries round-trip through ``manuscript_assets`` rows of type
+``assembly_block`` (``input_hash`` holds the fingerprint); rewinding to the
+writing phase clears them with the other assets.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import hashlib
+import importlib.util
+import json
+from collections.abc import Callable, Iterable
+from enum import Enum
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from src.models import ManuscriptAsset
+
+ASSEMBLY_BLOCK_ASSET_TYPE = "assembly_block"
+
+# Bump when cached blocks must be rebuilt regardless of inputs (e.g. a change
+# of fingerprint layout).  Renderer edits are picked up via _BLOCK_RENDERERS.
+_CACHE_VERSION = 1
+_ASSET_KEY_PREFIX = "block_"
+
+_TABLE_RENDERERS = ("src.export.markdown_refs", "src.export.markdown_utils")
+# Block kind -> modules whose source renders it; part of every fingerprint.
+_BLOCK_RENDERERS: dict[str, tuple[str, ...]] = {
+    "picos": _TABLE_RENDERERS,
+    "grade": _TABLE_RENDERERS,
+    "sof": (*_TABLE_RENDERERS, "src.quality.grade"),
+    "robins_i": _TABLE_RENDERERS,
+    "quality_coverage": _TABLE_RENDERERS,
+    "casp": _TABLE_RENDERERS,
+    "mmat": _TABLE_RENDERERS,
+    "compact_study_table": _TABLE_RENDERERS,
+    "study_characteristics": _TABLE_RENDERERS,
+    "contradiction_paragraph": ("src.writing.contradiction_resolver",),
+    "concept_diagrams": ("src.visualization.concept_diagrams",),
+    "diagram_briefs": ("src.visualization.research_diagram_preparer",),
+    "diagram_placement": ("src.visualization.research_diagram_placement",),
+    "custom_diagrams": ("src.visualization.research_diagram_renderer",),
+}
+
+
+@cache
+def _module_source_hash(module: str) -> str:
+    spec = importlib.util.find_spec(module)
+    if spec is None or not spec.origin:
+        raise ValueError(f"Renderer module {module!r} not found")
+    with open(spec.origin, "rb") as handle:
+        return hashlib.sha256(handle.read()).hexdigest()
+
+
+def renderer_version(name: str) -> str:
+    """Hash of the renderer sources registered for block kind *name*."""
+    try:
+        modules = _BLOCK_RENDERERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown assembly block kind {name!r}; register its renderers in _BLOCK_RENDERERS") from None
+    return hashlib.sha256("\0".join(_module_source_hash(m) for m in modules).encode("utf-8")).hexdigest()
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    # repr() is not stable across processes for arbitrary objects; refuse rather
+    # than produce fingerprints that never match on resume.
+    raise TypeError(f"Cannot fingerprint assembly input of type {type(value).__name__}")
+
+
+def input_fingerprint(name: str, *inputs: Any) -> str:
+    """Stable SHA-256 over block kind *name*, its renderer sources and *inputs*.
+
+    Inputs must be JSON-serialisable, pydantic models or dataclasses; other
+    types raise ``TypeError``.
+    """
+    payload = json.dumps([_CACHE_VERSION, name, renderer_version(name), *inputs], sort_keys=True, default=_jsonable)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AssemblyBlockCache:
+    """Rendered blocks keyed by name, valid while their input fingerprint matches."""
+
+    def __init__(self, entries: dict[str, tuple[str, str]] | None = None) -> None:
+        self._entries: dict[str, tuple[str, str]] = dict(entries or {})
+        self._dirty: set[str] = set()
+        self.reused: list[str] = []
+        self.rebuilt: list[str] = []
+
+    @classmethod
+    def from_assets(cls, assets: Iterable[ManuscriptAsset]) -> AssemblyBlockCache:
+        entries = {
+            asset.asset_key.removeprefix(_ASSET_KEY_PREFIX): (str(asset.input_hash), asset.content)
+            for asset in assets
+            if asset.asset_type == ASSEMBLY_BLOCK_ASSET_TYPE and asset.input_hash
+        }
+        return cls(entries)
+
+    def lookup(self, name: str, key: str, *, valid: Callable[[str], bool] | None = None) -> str | None:
+        """Cached content for *name* when it was built from inputs hashing to *key*.
+
+        ``valid`` can reject a hit whose content points at files that no longer exist.
+        """
+        cached = self._entries.get(name)
+        if cached is None or cached[0] != key or (valid is not None and not valid(cached[1])):
+            return None
+        self.reused.append(name)
+        return cached[1]
+
+    def store(self, name: str, key: str, content: str) -> None:
+        if self._entries.get(name) != (key, content):
+            self._entries[name] = (key, content)
+            self._dirty.add(name)
+        self.rebuilt.append(name)
+
+    def block(self, name: str, inputs: tuple[Any, ...], build: Callable[[], str]) -> str:
+        """Return the cached block for *inputs*, or ``build()`` it and cache the result."""
+        key = input_fingerprint(name, *inputs)
+        cached = self.lookup(name, key)
+        if cached is not None:
+            return cached
+        content = build()
+        self.store(name, key, content)
+        return content
+
+    def dirty_assets(self, workflow_id: str) -> list[ManuscriptAsset]:
+        """Assets for blocks rebuilt since load, ready for ``save_manuscript_asset``."""
+        return [
+            ManuscriptAsset(
+                workflow_id=workflow_id,
+                asset_key=f"{_ASSET_KEY_PREFIX}{name}",
+                asset_type=ASSEMBLY_BLOCK_ASSET_TYPE,
+                format="md",
+                content=self._entries[name][1],
+                input_hash=self._entries[name][0],
+            )
+            for name in sorted(self._dirty)
+        ]
+
+    def mark_saved(self) -> None:
+        self._dirty.clear()
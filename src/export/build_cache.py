@@ -0,0 +1,122 @@
+"""Input-hash cache for submission export outputs.
+
+Packaging a submission converts the manuscript to DOCX, renders the search
+appendix PDF and compiles LaTeX -- subprocess steps that take seconds each and
+whose inputs rarely change between export clicks.  Like the figure render
+cache (``src/visualization/render_pool.py``), each output has a
+``<output name>.build.json`` entry holding the hash of the inputs it was built
+from; a step whose output exists with a matching hash is skipped.  Entries live
+under a hidden ``.export_cache/<output dir name>/`` beside the output's
+directory, never inside it, so listing or zipping ``submission/`` does not ship
+them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import shutil
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Bump when cached export outputs must be rebuilt regardless of inputs.
+_CACHE_VERSION = 1
+CACHE_DIRNAME = ".export_cache"
+
+
+def build_key(step: str, *, files: Iterable[Path] = (), texts: Iterable[str] = ()) -> str:
+    """Hash of a step name, the contents of *files* and extra *texts*.
+
+    Missing files hash as absent, so creating one later invalidates the key.
+    """
+    digest = hashlib.sha256(f"{_CACHE_VERSION}:{step}".encode())
+    for path in files:
+        digest.update(b"\0file\0" + str(Path(path).name).encode("utf-8") + b"\0")
+        try:
+            with open(path, "rb") as handle:
+                for chunk in iter(lambda: handle.read(1 << 20), b""):
+                    digest.update(chunk)
+        except OSError:
+            digest.update(b"<missing>")
+    for text in texts:
+        digest.update(b"\0text\0" + text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def cache_entry_path(output: Path, suffix: str) -> Path:
+    """Path of *output*'s cache entry, outside the directory *output* is published from."""
+    return output.parent.parent / CACHE_DIRNAME / output.parent.name / f"{output.name}{suffix}"
+
+
+def _cache_path(output: Path) -> Path:
+    return cache_entry_path(output, ".build.json")
+
+
+def is_fresh(output: Path, key: str) -> bool:
+    """True when *output* exists and was last built from inputs hashing to *key*."""
+    if not output.is_file():
+        return False
+    try:
+        entry = json.loads(_cache_path(output).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return False
+    return isinstance(entry, dict) and entry.get("key") == key
+
+
+def mark_fresh(output: Path, key: str) -> None:
+    path = _cache_path(output)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"key": key}), encoding="utf-8")
+    except OSError as exc:
+        logger.debug("Could not write export cache entry for %s: %s", output, exc)
+
+
+def invalidate(output: Path) -> None:
+    _cache_path(output).unlink(missing_ok=True)
+
+
+def _stat_signature(path: Path) -> tuple[int, int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if not path.is_file():
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+async def cached_build(output: Path, key: str, build: Callable[[], Awaitable[object]]) -> bool:
+    """Run ``build()`` unless *output* is fresh for *key*; returns True when it ran.
+
+    The cache entry is written only after ``build()`` returns and rewrote
+    *output*, so a failed or partial build -- including one that leaves an
+    older output in place -- is retried on the next export.
+    """
+    if is_fresh(output, key):
+        logger.debug("Export cache hit for %s", output)
+        return False
+    invalidate(output)
+    before = _stat_signature(output)
+    await build()
+    after = _stat_signature(output)
+    if after is not None and after != before:
+        mark_fresh(output, key)
+    return True
+
+
+def copy_if_changed(src: Path, dst: Path) -> bool:
+    """``shutil.copy2`` unless *dst* already has *src*'s size and mtime; True when copied."""
+    try:
+        src_stat = src.stat()
+        dst_stat = dst.stat()
+    except FileNotFoundError:
+        pass
+    else:
+        if src_stat.st_size == dst_stat.st_size and src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+            return False
+    shutil.copy2(src, dst)
+    return True
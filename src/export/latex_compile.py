@@ -0,0 +1,266 @@
+"""Cached, incremental pdflatex/bibtex compilation.
+
+``compile_latex`` replaces the fixed pdflatex -> bibtex -> pdflatex -> pdflatex
+sequence.  It records the hashes of the ``.tex``, the ``.bib`` files, local
+style files (``.sty``/``.cls``/``.bst``) and every ``\\includegraphics`` target
+in a ``<name>.compile.json`` export cache entry (see
+``src/export/build_cache.py``), and on the next export runs only what those
+changes require:
+
+- nothing changed and the PDF is still there: return the cached PDF;
+- only figures changed: pdflatex until the ``.aux`` reaches a fixpoint;
+- only the bibliography changed: bibtex, then pdflatex until fixpoint;
+- the ``.tex`` or a style file changed: pdflatex, bibtex when the citations
+  in the ``.aux`` changed, then pdflatex until fixpoint.
+
+A pdflatex pass is repeated while the ``.aux`` changes or the ``.log`` asks
+for a rerun (capped at ``_MAX_PDFLATEX_PASSES``).  Tool output is forwarded
+line-batched to an optional ``on_log`` callback for live progress.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import subprocess
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.export.build_cache import cache_entry_path
+
+logger = logging.getLogger(__name__)
+
+# Bump when cached PDFs must be recompiled regardless of inputs.
+_CACHE_VERSION = 1
+_MAX_PDFLATEX_PASSES = 5
+_PDFLATEX_TIMEOUT_SECONDS = 60
+_BIBTEX_TIMEOUT_SECONDS = 30
+_LOG_TAIL_LINES = 40
+_LOG_MIN_INTERVAL_SECONDS = 0.5
+_STYLE_SUFFIXES = (".sty", ".cls", ".bst")
+# pdflatex's lookup order for extensionless \includegraphics targets.
+_GRAPHICS_SUFFIXES = (".pdf", ".png", ".jpg", ".jpeg")
+
+_INCLUDEGRAPHICS_RE = re.compile(r"\\includegraphics(?:\[[^\]]*\])?\{([^}]+)\}")
+_RERUN_RE = re.compile(r"Rerun to get|Label\(s\) may have changed|Please rerun LaTeX|Rerun LaTeX")
+_AUX_BIB_LINE_RE = re.compile(r"^\\(?:citation|bibdata|bibstyle)\{.*\}$", re.MULTILINE)
+
+CompileLogCallback = Callable[[str, str], None]
+
+
+@dataclass
+class CompileResult:
+    """Outcome of ``compile_latex``: ``steps`` lists the tool runs, empty on a cache hit."""
+
+    ok: bool
+    detail: str | None = None
+    cached: bool = False
+    steps: list[str] = field(default_factory=list)
+
+
+def _file_hash(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _files_hash(paths: list[Path]) -> str:
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(f"\0{path.name}\0{_file_hash(path) or '<missing>'}".encode())
+    return digest.hexdigest()
+
+
+def _graphics_file(cwd: Path, target: str) -> Path:
+    path = cwd / target.strip()
+    if path.suffix:
+        return path
+    for suffix in _GRAPHICS_SUFFIXES:
+        candidate = path.with_name(path.name + suffix)
+        if candidate.is_file():
+            return candidate
+    return path
+
+
+def compile_inputs(tex_path: Path) -> dict[str, str]:
+    """Per-component input hashes: tex, bib, local style files and figures."""
+    cwd = tex_path.parent
+    tex = tex_path.read_text(encoding="utf-8", errors="ignore")
+    figures = sorted({_graphics_file(cwd, target) for target in _INCLUDEGRAPHICS_RE.findall(tex)})
+    return {
+        "version": str(_CACHE_VERSION),
+        "tex": hashlib.sha256(tex.encode("utf-8")).hexdigest(),
+        "bib": _files_hash(sorted(cwd.glob("*.bib"))),
+        "styles": _files_hash(sorted(p for p in cwd.iterdir() if p.suffix in _STYLE_SUFFIXES)),
+        "figures": _files_hash(figures),
+    }
+
+
+def _state_path(tex_path: Path) -> Path:
+    return cache_entry_path(tex_path, ".compile.json")
+
+
+def _load_state(tex_path: Path) -> dict:
+    try:
+        state = json.loads(_state_path(tex_path).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _aux_bib_key(aux_path: Path) -> str | None:
+    """Hash of the citation/bibdata/bibstyle lines bibtex reads, or None without ``\\bibdata``."""
+    try:
+        aux = aux_path.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return None
+    lines = _AUX_BIB_LINE_RE.findall(aux)
+    if not any(line.startswith("\\bibdata") for line in lines):
+        return None
+    return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+
+class _LogTail:
+    """Keep the last lines of a tool run and forward them at most every 0.5 s."""
+
+    def __init__(self, step: str, on_log: CompileLogCallback | None) -> None:
+        self.step = step
+        self.lines: deque[str] = deque(maxlen=_LOG_TAIL_LINES)
+        self._on_log = on_log
+        self._last_sent = 0.0
+
+    def add(self, line: str) -> None:
+        self.lines.append(line)
+        now = time.monotonic()
+        if self._on_log is not None and now - self._last_sent >= _LOG_MIN_INTERVAL_SECONDS:
+            self._last_sent = now
+            self.flush()
+
+    def flush(self) -> None:
+        if self._on_log is not None:
+            try:
+                self._on_log(self.step, "\n".join(self.lines))
+            except Exception:  # noqa: BLE001 - progress reporting must not break the compile
+                logger.debug("compile log callback failed", exc_info=True)
+
+
+async def run_tool(
+    argv: list[str],
+    cwd: Path,
+    timeout: float,
+    *,
+    on_line: Callable[[str], None] | None = None,
+) -> int | None:
+    """Run one toolchain command without blocking the event loop; returns its exit code.
+
+    Combined stdout/stderr lines go to *on_line* as they arrive.  Raises
+    ``subprocess.TimeoutExpired`` (after killing the process) when it runs
+    longer than *timeout* seconds.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        cwd=cwd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+
+    async def _pump() -> None:
+        assert proc.stdout is not None
+        async for raw in proc.stdout:
+            if on_line is not None:
+                on_line(raw.decode("utf-8", errors="ignore").rstrip("\r\n"))
+        await proc.wait()
+
+    try:
+        await asyncio.wait_for(_pump(), timeout)
+    except TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(argv, timeout) from None
+    return proc.returncode
+
+
+async def compile_latex(tex_path: Path, *, on_log: CompileLogCallback | None = None) -> CompileResult:
+    """Compile *tex_path* to PDF in its directory, reusing or incrementally updating the last build."""
+    cwd = tex_path.parent
+    pdf_path = tex_path.with_suffix(".pdf")
+    aux_path = tex_path.with_suffix(".aux")
+    bbl_path = tex_path.with_suffix(".bbl")
+    inputs = compile_inputs(tex_path)
+    previous = _load_state(tex_path)
+    prev_inputs = previous.get("inputs") or {}
+    built_before = bool(previous.get("ok")) and aux_path.is_file() and previous.get("pdf") == _file_hash(pdf_path)
+
+    if built_before and prev_inputs == inputs:
+        logger.debug("LaTeX compile cache hit for %s", tex_path)
+        return CompileResult(ok=True, cached=True)
+
+    result = CompileResult(ok=False)
+    tails: list[_LogTail] = []
+
+    async def _step(name: str, argv: list[str], timeout: float) -> None:
+        label = f"{name} {sum(1 for s in result.steps if s.startswith(name)) + 1}"
+        tail = _LogTail(label, on_log)
+        tails.append(tail)
+        result.steps.append(label)
+        try:
+            await run_tool(argv, cwd, timeout, on_line=tail.add)
+        finally:
+            tail.flush()
+
+    async def _pdflatex() -> bool:
+        """One pdflatex pass; True when another pass is required."""
+        aux_before = _file_hash(aux_path)
+        await _step("pdflatex", ["pdflatex", "-interaction=nonstopmode", tex_path.name], _PDFLATEX_TIMEOUT_SECONDS)
+        try:
+            log_text = tex_path.with_suffix(".log").read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            log_text = ""
+        return _file_hash(aux_path) != aux_before or bool(_RERUN_RE.search(log_text))
+
+    started_ns = time.time_ns()
+    try:
+        passes = 0
+        rerun = False
+        layout_changed = not built_before or any(prev_inputs.get(k) != inputs[k] for k in ("version", "tex", "styles"))
+        if layout_changed or prev_inputs.get("figures") != inputs["figures"]:
+            rerun = await _pdflatex()
+            passes = 1
+        bib_key = _aux_bib_key(aux_path)
+        if bib_key is not None and (
+            not bbl_path.is_file() or bib_key != previous.get("bibtex") or prev_inputs.get("bib") != inputs["bib"]
+        ):
+            bbl_before = _file_hash(bbl_path)
+            await _step("bibtex", ["bibtex", tex_path.stem], _BIBTEX_TIMEOUT_SECONDS)
+            rerun = rerun or _file_hash(bbl_path) != bbl_before
+        while rerun and passes < _MAX_PDFLATEX_PASSES:
+            rerun = await _pdflatex()
+            passes += 1
+    except subprocess.TimeoutExpired as exc:
+        result.detail = f"LaTeX timeout: {exc}"
+    except FileNotFoundError as exc:
+        result.detail = f"TeX toolchain missing: {exc}"
+
+    refreshed = pdf_path.is_file() and (
+        pdf_path.stat().st_mtime_ns >= started_ns or not any(s.startswith("pdflatex") for s in result.steps)
+    )
+    result.ok = result.detail is None and refreshed
+    if result.ok:
+        state = {"inputs": inputs, "ok": True, "bibtex": _aux_bib_key(aux_path), "pdf": _file_hash(pdf_path)}
+        state_path = _state_path(tex_path)
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        state_path.write_text(json.dumps(state), encoding="utf-8")
+        return result
+    _state_path(tex_path).unlink(missing_ok=True)
+    if result.detail is None:
+        tail_text = "\n".join("\n".join(t.lines) for t in tails[-2:]).strip()
+        result.detail = tail_text[-1000:] or "pdflatex finished without creating PDF"
+    return result
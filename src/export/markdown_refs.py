@@ -5,10 +5,11 @@ from __future__ import annotations
 import json
 import logging
 import re
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from src.export.bibtex_builder import build_citekey_alias_map
+from src.citation.index import CitationIndex, citation_index_for_rows
 from src.export.markdown_utils import ascii_citekey as _ascii_citekey_helper
 from src.export.markdown_utils import clip_table_text as _clip_table_text_helper
 from src.export.markdown_utils import missing_result_display as _missing_result_display_helper
@@ -16,6 +17,7 @@ from src.export.markdown_utils import normalize_doi as _normalize_doi_helper
 from src.export.markdown_utils import sanitize_summary_text as _sanitize_summary_text_helper
 from src.export.markdown_utils import validate_doi_year as _validate_doi_year_helper
 from src.extraction.inference_utils import infer_country_from_text
+from src.manuscript.document import parse_manuscript
 from src.quality.grade import build_sof_table, cluster_grade_assessments_by_theme, sof_table_to_markdown
 from src.writing.date_windows import format_search_eligibility_window, normalize_criteria_date_windows
 from src.writing.headings import (
@@ -23,8 +25,15 @@ from src.writing.headings import (
 )
 from src.writing.headings import strip_section_block_markers as _strip_section_block_markers
 
+if TYPE_CHECKING:
+    from src.export.assembly_cache import AssemblyBlockCache
+
 logger = logging.getLogger(__name__)
 
+_CITATION_PART_SPLIT_RE = re.compile(r"[,;]")
+# Accept Unicode word chars so accented citekeys in the text are captured by the pattern
+_NUMBERABLE_CITEKEY_RE = re.compile(r"^[\w][\w0-9_:\- '.]*$", re.UNICODE)
+
 _SUMMARY_HTML_BOILERPLATE_MARKERS = (
     "html boilerplate",
     "metadata",
@@ -337,6 +346,8 @@ def _dedup_citation_rows_by_doi(rows: list[tuple]) -> list[tuple]:
 def convert_to_numbered_citations(
     body: str,
     citation_rows: list[tuple],
+    *,
+    index: CitationIndex | None = None,
 ) -> tuple[str, list[tuple]]:
     """Replace [AuthorYear] citekeys in body with [N] sequential numbers.
 
@@ -347,81 +358,39 @@ def convert_to_numbered_citations(
 
     Citekeys with non-ASCII characters (e.g. accented author surnames like
     Perez-Encinas) are normalized to ASCII before catalog lookup so they resolve
-    correctly regardless of how they appear in the manuscript text.
+    correctly regardless of how they appear in the manuscript text.  Lookups go
+    through a shared ``CitationIndex`` (built from *citation_rows* when *index*
+    is not given), and numbering and replacement happen in one pass over the
+    manuscript's citation groups.
     """
+    if index is None:
+        index = citation_index_for_rows(citation_rows)
 
-    def _canonical_key(raw: str) -> str:
-        # Forgiving key for matching legacy variants (spaces/punctuation/accents).
-        return re.sub(r"[^A-Za-z0-9]", "", _ascii_citekey(raw)).lower()
-
-    # Build catalog maps for robust lookup.
-    alias_map = build_citekey_alias_map(citation_rows)
-    citekey_map: dict[str, tuple] = {_ascii_citekey(row[1]): row for row in citation_rows}
-    canonical_map: dict[str, str] = {}
-    for row in citation_rows:
-        key = _ascii_citekey(row[1])
-        canonical_map[_canonical_key(key)] = key
-    for alias, mapped_key in alias_map.items():
-        canonical_map.setdefault(_canonical_key(alias), _ascii_citekey(mapped_key))
-    ordered_keys = extract_citekeys_in_order(body)  # already returns ASCII-normalized keys
-    # Augment with legacy space-containing keys that extract_citekeys_in_order
-    # intentionally skips (it expects citekey-like tokens).
-    seen_ordered = set(ordered_keys)
-    for m in re.finditer(r"\[([^\]\[]{1,120})\]", body):
-        for part in [p.strip() for p in re.split(r"[,;]", m.group(1))]:
-            if not part:
-                continue
-            alias_match = alias_map.get(_ascii_citekey(part))
-            if alias_match and alias_match not in seen_ordered:
-                ordered_keys.append(alias_match)
-                seen_ordered.add(alias_match)
-                continue
-            canon = _canonical_key(part)
-            mapped = canonical_map.get(canon)
-            if mapped and mapped not in seen_ordered:
-                ordered_keys.append(mapped)
-                seen_ordered.add(mapped)
     key_to_number: dict[str, int] = {}
     ordered_rows: list[tuple] = []
-    n = 1
-    for key in ordered_keys:
-        if key in citekey_map and key not in key_to_number:
-            key_to_number[key] = n
-            ordered_rows.append(citekey_map[key])
-            n += 1
-
-    # Accept Unicode word chars so accented citekeys in the text are captured by the pattern
-    _valid_key = re.compile(r"^[\w][\w0-9_:\- '.]*$", re.UNICODE)
-
-    def _replacer(match: re.Match) -> str:  # type: ignore[type-arg]
-        bracket_content = match.group(1)
+    pieces: list[str] = []
+    cursor = 0
+    for group in parse_manuscript(body).citation_groups:
         # Split on both commas and semicolons to handle [Smith2023; Jones2024] style
-        parts = [p.strip() for p in re.split(r"[,;]", bracket_content)]
-        valid_parts = [p for p in parts if _valid_key.match(p)]
-        if not valid_parts:
-            return match.group(0)
-        # Normalize each part before catalog lookup (supports space-containing legacy keys).
         nums: list[int] = []
-        for p in valid_parts:
-            ascii_key = _ascii_citekey(p)
-            if ascii_key in key_to_number:
-                nums.append(key_to_number[ascii_key])
+        for part in _CITATION_PART_SPLIT_RE.split(group.content):
+            part = part.strip()
+            if not _NUMBERABLE_CITEKEY_RE.match(part):
                 continue
-            alias_match = alias_map.get(ascii_key)
-            if alias_match and alias_match in key_to_number:
-                nums.append(key_to_number[alias_match])
+            key = index.resolve(part)
+            if key is None:
                 continue
-            canon = _canonical_key(ascii_key)
-            mapped = canonical_map.get(canon)
-            if mapped and mapped in key_to_number:
-                nums.append(key_to_number[mapped])
+            if key not in key_to_number:
+                key_to_number[key] = len(key_to_number) + 1
+                ordered_rows.append(index.rows[key])
+            nums.append(key_to_number[key])
         if not nums:
-            return match.group(0)
-        return ", ".join(f"[{num}]" for num in nums)
-
-    # Extend outer pattern to capture Unicode letters so accented citekeys are matched
-    new_body = re.sub(r"\[([^\]\[]{1,120})\]", _replacer, body)
-    return new_body, ordered_rows
+            continue
+        pieces.append(body[cursor : group.start])
+        pieces.append(", ".join(f"[{num}]" for num in nums))
+        cursor = group.end
+    pieces.append(body[cursor:])
+    return "".join(pieces), ordered_rows
 
 
 # Figure definitions: ordered list of (artifact_key, caption).
@@ -1810,6 +1779,7 @@ def assemble_submission_manuscript(
     diagram_placement_plan_path: str | None = None,
     include_rq_block: bool = False,
     ir_validated: bool = False,
+    block_cache: AssemblyBlockCache | None = None,
 ) -> str:
     """Combine all manuscript sections with HR separators.
 
@@ -1838,7 +1808,14 @@ def assemble_submission_manuscript(
     ir_validated: when True, the body came from validated IR blocks (WS1+WS2 path)
     and redundant sanitization passes are skipped. The assembly does only structural
     transforms (citation numbering, table insertion, appendix stitching).
+    block_cache: when given, the body-independent tables (PICOS, GRADE/SoF,
+    ROBINS-I, quality coverage, CASP, MMAT, study tables) are reused from it
+    while their inputs are unchanged, and cached after rebuilding.
     """
+
+    def _block(name: str, inputs: tuple[Any, ...], build: Callable[[], str]) -> str:
+        return block_cache.block(name, inputs, build) if block_cache is not None else build()
+
     _body_wo_markers = _strip_section_block_markers(body)
     if ir_validated:
         clean_body = _strip_compact_study_tables(_body_wo_markers)
@@ -1943,30 +1920,40 @@ def assemble_submission_manuscript(
 
     picos_section = ""
     if review_config:
-        picos_section = build_picos_table(review_config)
+        picos_section = _block("picos", (review_config,), lambda: build_picos_table(review_config))
 
-    grade_section = ""
-    sof_section = ""
-    if grade_assessments:
-        grade_section = generate_grade_table(grade_assessments)
+    def _build_sof() -> str:
         # Cluster per-study GRADE assessments into canonical outcome themes
         # (accuracy, efficiency, safety, cost, implementation) so the Summary
         # of Findings table shows 3-5 meaningful rows rather than 1-18 per-study rows.
         clustered_grade = cluster_grade_assessments_by_theme(grade_assessments)
-        sof_table = build_sof_table(clustered_grade if clustered_grade else grade_assessments)
-        sof_section = sof_table_to_markdown(sof_table)
+        return sof_table_to_markdown(build_sof_table(clustered_grade if clustered_grade else grade_assessments))
+
+    grade_section = ""
+    sof_section = ""
+    if grade_assessments:
+        grade_section = _block("grade", (grade_assessments,), lambda: generate_grade_table(grade_assessments))
+        sof_section = _block("sof", (grade_assessments,), _build_sof)
 
     robins_section = ""
     if papers and robins_i_assessments:
-        robins_section = build_robins_i_domain_table(papers, robins_i_assessments)
+        robins_section = _block(
+            "robins_i",
+            (papers, robins_i_assessments),
+            lambda: build_robins_i_domain_table(papers, robins_i_assessments),
+        )
     quality_coverage_section = ""
     if papers and (rob2_assessments or robins_i_assessments or casp_assessments or mmat_assessments):
-        quality_coverage_section = build_quality_assessment_coverage_table(
-            papers,
-            rob2_assessments=rob2_assessments or [],
-            robins_i_assessments=robins_i_assessments or [],
-            casp_assessments=casp_assessments or [],
-            mmat_assessments=mmat_assessments or [],
+        quality_coverage_section = _block(
+            "quality_coverage",
+            (papers, rob2_assessments, robins_i_assessments, casp_assessments, mmat_assessments),
+            lambda: build_quality_assessment_coverage_table(
+                papers,
+                rob2_assessments=rob2_assessments or [],
+                robins_i_assessments=robins_i_assessments or [],
+                casp_assessments=casp_assessments or [],
+                mmat_assessments=mmat_assessments or [],
+            ),
         )
 
     # Build paper_id -> citekey label map for CASP/MMAT tables.
@@ -1985,16 +1972,28 @@ def assemble_submission_manuscript(
 
     casp_section = ""
     if casp_assessments:
-        casp_section = generate_casp_table(casp_assessments, paper_id_to_label=_pid_to_label)
+        casp_section = _block(
+            "casp",
+            (casp_assessments, _pid_to_label),
+            lambda: generate_casp_table(casp_assessments, paper_id_to_label=_pid_to_label),
+        )
 
     mmat_section = ""
     if mmat_assessments:
-        mmat_section = generate_mmat_table(mmat_assessments, paper_id_to_label=_pid_to_label)
+        mmat_section = _block(
+            "mmat",
+            (mmat_assessments, _pid_to_label),
+            lambda: generate_mmat_table(mmat_assessments, paper_id_to_label=_pid_to_label),
+        )
 
     # Inject compact study table into the Results body right after the
     # "### Study Characteristics" heading (PRISMA 2020 Item 19).
     if papers and extraction_records:
-        _compact_table = build_compact_study_table(papers, extraction_records)
+        _compact_table = _block(
+            "compact_study_table",
+            (papers, extraction_records),
+            lambda: build_compact_study_table(papers, extraction_records),
+        )
         if _compact_table:
             _study_char_marker = "### Study Characteristics"
             if _study_char_marker in numbered_body:
@@ -2013,11 +2012,15 @@ def assemble_submission_manuscript(
 
     study_table_section = ""
     if papers and extraction_records:
-        study_table_section = build_study_characteristics_table(
-            papers,
-            extraction_records,
-            pre_filtered_count=failed_count,
-            fulltext_paper_ids=fulltext_paper_ids,
+        study_table_section = _block(
+            "study_characteristics",
+            (papers, extraction_records, failed_count, fulltext_paper_ids),
+            lambda: build_study_characteristics_table(
+                papers,
+                extraction_records,
+                pre_filtered_count=failed_count,
+                fulltext_paper_ids=fulltext_paper_ids,
+            ),
         )
 
     figures_section = build_markdown_figures_section(
@@ -7,6 +7,8 @@ import io
 import re
 from dataclasses import dataclass, field
 
+from src.manuscript.document import parse_manuscript
+
 _STATUS_REPORTED = "REPORTED"
 _STATUS_PARTIAL = "PARTIAL"
 _STATUS_MISSING = "MISSING"
@@ -406,22 +408,22 @@ def _split_markdown_sections(md_text: str) -> dict[str, str]:
         "discussion": [],
         "other": [],
     }
-    current = "other"
-    for line in md_text.splitlines():
-        if line.startswith("## "):
-            heading = line[3:].strip().lower()
-            if "intro" in heading or "background" in heading or "rationale" in heading:
-                current = "introduction"
-            elif "method" in heading:
-                current = "methods"
-            elif "result" in heading:
-                current = "results"
-            elif "discussion" in heading or "conclusion" in heading:
-                current = "discussion"
-            else:
-                current = "other"
-            continue
-        sections[current].append(line)
+    doc = parse_manuscript(md_text)
+    h2_sections = doc.h2_sections
+    sections["other"].extend(doc.lines[: h2_sections[0].line_index] if h2_sections else doc.lines)
+    for section in h2_sections:
+        heading = section.heading.strip().lower()
+        if "intro" in heading or "background" in heading or "rationale" in heading:
+            current = "introduction"
+        elif "method" in heading:
+            current = "methods"
+        elif "result" in heading:
+            current = "results"
+        elif "discussion" in heading or "conclusion" in heading:
+            current = "discussion"
+        else:
+            current = "other"
+        sections[current].extend(doc.section_lines(section))
     return {key: "\n".join(val) for key, val in sections.items()}
 
 
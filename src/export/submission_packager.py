@@ -8,15 +8,18 @@ import json
 import logging
 import re
 import shutil
-import subprocess
+import time
+from collections.abc import Awaitable
 from pathlib import Path
 
 from src.db.database import get_db
 from src.db.repositories import CitationRepository, WorkflowRepository
 from src.db.workflow_registry import find_by_workflow_id, find_by_workflow_id_fallback
 from src.export.bibtex_builder import build_bibtex, build_citekey_alias_map
+from src.export.build_cache import build_key, cached_build, copy_if_changed, invalidate
 from src.export.docx_exporter import generate_docx
 from src.export.ieee_latex import markdown_to_latex
+from src.export.latex_compile import CompileLogCallback, compile_latex
 from src.export.markdown_refs import (
     extract_inline_figure_artifact_keys,
     get_existing_figure_entries,
@@ -29,6 +32,8 @@ from src.export.prisma_checklist import (
     validate_prisma,
 )
 from src.export.prisma_flow_export import export_prisma_flow_to_directory
+from src.fulltext.manifest import load_papers_manifest
+from src.manuscript.document import parse_manuscript
 from src.search.pdf_parse import path_is_valid_pdf
 from src.writing.citation_grounding import extract_numeric_citation_refs, extract_used_citekeys
 
@@ -182,27 +187,18 @@ async def _copy_included_study_pdfs(
     run_dir: Path,
     dst_dir: Path,
 ) -> int:
-    """Populate dst_dir with included-study PDFs from data_papers_manifest.json."""
-    if dst_dir.exists():
-        shutil.rmtree(dst_dir)
-    dst_dir.mkdir(parents=True, exist_ok=True)
-
-    manifest_path = run_dir / "data_papers_manifest.json"
-    if not manifest_path.exists():
-        return 0
-
-    try:
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return 0
-    if not isinstance(manifest, dict):
-        return 0
+    """Populate dst_dir with included-study PDFs from data_papers_manifest.json.
 
-    included_ids = set(await _query_included_paper_ids(db_path, workflow_id))
-    copied = 0
+    PDFs already present with the source's size and mtime are not copied again;
+    files for studies that are no longer included are removed.
+    """
+    dst_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_papers_manifest(run_dir / "data_papers_manifest.json")
+    included_ids = set(await _query_included_paper_ids(db_path, workflow_id)) if manifest else set()
+    wanted: dict[Path, Path] = {}
     for paper_id in sorted(included_ids):
         entry = manifest.get(paper_id)
-        if not isinstance(entry, dict):
+        if entry is None:
             continue
         file_path_str = entry.get("file_path")
         if not file_path_str:
@@ -212,10 +208,20 @@ async def _copy_included_study_pdfs(
             continue
         if not path_is_valid_pdf(src):
             continue
-        dst = dst_dir / f"{paper_id}.pdf"
-        shutil.copy2(src, dst)
-        copied += 1
-    return copied
+        wanted[dst_dir / f"{paper_id}.pdf"] = src
+
+    def _sync() -> int:
+        for stale in dst_dir.iterdir():
+            if stale not in wanted:
+                if stale.is_dir():
+                    shutil.rmtree(stale)
+                else:
+                    stale.unlink()
+        for dst, src in wanted.items():
+            copy_if_changed(src, dst)
+        return len(wanted)
+
+    return await asyncio.to_thread(_sync)
 
 
 def _generate_search_appendix_pdf(md_path: Path, pdf_path: Path) -> None:
@@ -559,57 +565,41 @@ async def llm_resolve_unmatched_citations(
     return num_to_citekey
 
 
-def _run_pdflatex(tex_path: Path, cwd: Path) -> tuple[bool, str | None]:
-    """Run pdflatex and bibtex to produce PDF. Returns (success, diagnostic)."""
-    try:
-        first = subprocess.run(
-            ["pdflatex", "-interaction=nonstopmode", tex_path.name],
-            cwd=cwd,
-            capture_output=True,
-            timeout=60,
-        )
-        stem = tex_path.stem
-        bib = subprocess.run(
-            ["bibtex", stem],
-            cwd=cwd,
-            capture_output=True,
-            timeout=30,
-        )
-        second = subprocess.run(
-            ["pdflatex", "-interaction=nonstopmode", tex_path.name],
-            cwd=cwd,
-            capture_output=True,
-            timeout=60,
-        )
-        third = subprocess.run(
-            ["pdflatex", "-interaction=nonstopmode", tex_path.name],
-            cwd=cwd,
-            capture_output=True,
-            timeout=60,
-        )
-        pdf_path = tex_path.with_suffix(".pdf")
-        if pdf_path.exists():
-            return True, None
-        stderr_parts = []
-        for proc in (first, bib, second, third):
-            if proc.stderr:
-                stderr_parts.append(proc.stderr.decode("utf-8", errors="ignore")[:500])
-        detail = "\n".join(part for part in stderr_parts if part).strip() or "pdflatex finished without creating PDF"
-        return False, detail
-    except subprocess.TimeoutExpired as exc:
-        return False, f"pdflatex timeout: {exc}"
-    except FileNotFoundError as exc:
-        return False, f"TeX toolchain missing: {exc}"
+async def _run_export_steps(steps: dict[str, Awaitable[object]], *, workflow_id: str) -> None:
+    """Await independent export steps concurrently, then re-raise the first failure.
+
+    Every step runs to completion (a failing CSV export does not cancel the
+    PDF build); per-step wall time is logged at debug level.
+    """
+
+    async def _timed(name: str, step: Awaitable[object]) -> None:
+        started = time.perf_counter()
+        try:
+            await step
+        finally:
+            logger.debug("Submission packaging %s: %s took %.2fs", workflow_id, name, time.perf_counter() - started)
+
+    results = await asyncio.gather(*(_timed(name, step) for name, step in steps.items()), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
 
 
 async def package_submission(
     workflow_id: str,
     run_root: str = "runs",
+    *,
+    on_log: CompileLogCallback | None = None,
 ) -> Path | None:
     """Package submission directory for a workflow.
 
     Creates submission/ with manuscript.tex, references.bib, figures/, supplementary/.
-    Runs pdflatex to produce manuscript.pdf.
+    Once the .tex is written, the PDF build (pdflatex/bibtex), DOCX and search
+    appendix conversions, supplementary CSVs and study-PDF copies run
+    concurrently; DOCX and appendix outputs built from unchanged inputs are
+    reused (``src/export/build_cache.py``) and LaTeX reruns only the passes
+    its changed inputs require (``src/export/latex_compile.py``).  *on_log*
+    receives ``(step, output tail)`` while pdflatex/bibtex run.
 
     Returns Path to submission/ directory, or None if workflow not found.
     """
@@ -672,8 +662,7 @@ async def package_submission(
             "evidence_network": str(output_path / "fig_evidence_network.png"),
         }
     for _caption, src, rel in get_existing_figure_entries(_manifest_path, _artifacts):
-        dst = figures_dir / Path(rel).name
-        shutil.copy2(src, dst)
+        copy_if_changed(Path(src), figures_dir / Path(rel).name)
 
     # Read author_name from the run's own config_snapshot.yaml (written by StartNode)
     # so the packaged LaTeX reflects the review that was actually run, not whatever
@@ -755,62 +744,89 @@ async def package_submission(
     manuscript_tex = submission_dir / "manuscript.tex"
     manuscript_tex.write_text(latex_content, encoding="utf-8")
 
-    await _export_screening_decisions(db_path, workflow_id, supp_dir / "screening_decisions.csv")
-    await _export_extraction_records(db_path, workflow_id, supp_dir / "extracted_data.csv")
-    await export_prisma_flow_to_directory(supp_dir, db_path, workflow_id)
-
-    (supp_dir / "cover_letter.md").write_text(
-        "# Cover Letter\n\n[Add cover letter content here.]\n",
-        encoding="utf-8",
-    )
-    search_appendix_md = output_path / "doc_search_strategies_appendix.md"
-    if search_appendix_md.exists():
-        _generate_search_appendix_pdf(search_appendix_md, supp_dir / "search_strategies_appendix.pdf")
-    else:
-        (supp_dir / "search_strategies_appendix.pdf").write_bytes(b"")
-    prisma_result = validate_prisma(tex_content=latex_content, md_content=md_content)
-    (supp_dir / "prisma_checklist.md").write_text(
-        render_prisma_markdown_table(prisma_result),
-        encoding="utf-8",
-    )
-    (supp_dir / "prisma_checklist.csv").write_text(
-        render_prisma_csv(prisma_result),
-        encoding="utf-8",
-    )
-    (supp_dir / "prisma_checklist.html").write_text(
-        render_prisma_html(prisma_result),
-        encoding="utf-8",
-    )
-
-    pdf_ok, pdf_detail = _run_pdflatex(manuscript_tex, submission_dir)
-    if not pdf_ok:
-        logger.warning("Submission packaging: PDF build failed for %s: %s", workflow_id, pdf_detail)
-
-    loop = asyncio.get_running_loop()
-    try:
-        await loop.run_in_executor(None, generate_docx, manuscript_md, submission_dir / "manuscript.docx")
-    except Exception as exc:
-        logger.warning("Submission packaging: DOCX generation failed for %s: %s", workflow_id, exc)
-
-    # Copy PROSPERO registration artifacts into supplementary/ if they were generated.
-    _prospero_md_src = output_path / "doc_prospero_registration.md"
-    if _prospero_md_src.exists():
+    # Everything below depends only on the files written above, so the
+    # toolchain subprocesses, thread-pool conversions and DB exports run
+    # concurrently; outputs whose inputs are unchanged are skipped.
+
+    async def _pdf() -> None:
+        result = await compile_latex(manuscript_tex, on_log=on_log)
+        if not result.ok:
+            logger.warning("Submission packaging: PDF build failed for %s: %s", workflow_id, result.detail)
+        elif result.steps:
+            logger.debug("Submission packaging %s: LaTeX ran %s", workflow_id, ", ".join(result.steps))
+
+    async def _docx() -> None:
+        docx_path = submission_dir / "manuscript.docx"
+        image_files = [manuscript_md.parent / rel for rel in parse_manuscript(md_content).figure_paths]
+        key = build_key("manuscript.docx", files=[manuscript_md, *image_files])
         try:
-            shutil.copy2(_prospero_md_src, supp_dir / "prospero_registration_form.md")
+            await cached_build(docx_path, key, lambda: asyncio.to_thread(generate_docx, manuscript_md, docx_path))
         except Exception as exc:
-            logger.warning("Submission packaging: could not copy PROSPERO markdown for %s: %s", workflow_id, exc)
-    _prospero_docx_src = output_path / "doc_prospero_registration.docx"
-    if _prospero_docx_src.exists():
-        try:
-            shutil.copy2(_prospero_docx_src, supp_dir / "prospero_registration_form.docx")
-        except Exception as exc:
-            logger.warning("Submission packaging: could not copy PROSPERO docx for %s: %s", workflow_id, exc)
+            logger.warning("Submission packaging: DOCX generation failed for %s: %s", workflow_id, exc)
+
+    async def _search_appendix() -> None:
+        appendix_pdf = supp_dir / "search_strategies_appendix.pdf"
+        search_appendix_md = output_path / "doc_search_strategies_appendix.md"
+        if not search_appendix_md.exists():
+            invalidate(appendix_pdf)
+            appendix_pdf.write_bytes(b"")
+            return
+        key = build_key(appendix_pdf.name, files=[search_appendix_md])
+        await cached_build(
+            appendix_pdf,
+            key,
+            lambda: asyncio.to_thread(_generate_search_appendix_pdf, search_appendix_md, appendix_pdf),
+        )
 
-    await _copy_included_study_pdfs(
-        db_path=db_path,
+    def _write_checklists_and_copies() -> None:
+        (supp_dir / "cover_letter.md").write_text(
+            "# Cover Letter\n\n[Add cover letter content here.]\n",
+            encoding="utf-8",
+        )
+        prisma_result = validate_prisma(tex_content=latex_content, md_content=md_content)
+        (supp_dir / "prisma_checklist.md").write_text(
+            render_prisma_markdown_table(prisma_result),
+            encoding="utf-8",
+        )
+        (supp_dir / "prisma_checklist.csv").write_text(
+            render_prisma_csv(prisma_result),
+            encoding="utf-8",
+        )
+        (supp_dir / "prisma_checklist.html").write_text(
+            render_prisma_html(prisma_result),
+            encoding="utf-8",
+        )
+        # Copy PROSPERO registration artifacts into supplementary/ if they were generated.
+        _prospero_md_src = output_path / "doc_prospero_registration.md"
+        if _prospero_md_src.exists():
+            try:
+                shutil.copy2(_prospero_md_src, supp_dir / "prospero_registration_form.md")
+            except Exception as exc:
+                logger.warning("Submission packaging: could not copy PROSPERO markdown for %s: %s", workflow_id, exc)
+        _prospero_docx_src = output_path / "doc_prospero_registration.docx"
+        if _prospero_docx_src.exists():
+            try:
+                shutil.copy2(_prospero_docx_src, supp_dir / "prospero_registration_form.docx")
+            except Exception as exc:
+                logger.warning("Submission packaging: could not copy PROSPERO docx for %s: %s", workflow_id, exc)
+
+    await _run_export_steps(
+        {
+            "pdf": _pdf(),
+            "docx": _docx(),
+            "search_appendix": _search_appendix(),
+            "screening_csv": _export_screening_decisions(db_path, workflow_id, supp_dir / "screening_decisions.csv"),
+            "extraction_csv": _export_extraction_records(db_path, workflow_id, supp_dir / "extracted_data.csv"),
+            "prisma_flow": export_prisma_flow_to_directory(supp_dir, db_path, workflow_id),
+            "checklists": asyncio.to_thread(_write_checklists_and_copies),
+            "study_pdfs": _copy_included_study_pdfs(
+                db_path=db_path,
+                workflow_id=workflow_id,
+                run_dir=Path(log_dir),
+                dst_dir=study_pdfs_dir,
+            ),
+        },
         workflow_id=workflow_id,
-        run_dir=Path(log_dir),
-        dst_dir=study_pdfs_dir,
     )
 
     return submission_dir
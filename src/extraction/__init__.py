@@ -1,9 +1,24 @@
 """Extraction package."""
 
-from src.extraction.extractor import ExtractionService
-from src.extraction.study_classifier import StudyClassifier
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from src.extraction.extractor import ExtractionService
+    from src.extraction.study_classifier import StudyClassifier
 
 __all__ = [
     "ExtractionService",
     "StudyClassifier",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "ExtractionService": "src.extraction.extractor",
+        "StudyClassifier": "src.extraction.study_classifier",
+    },
+)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import re
 import time
+from dataclasses import dataclass
 
 from pydantic import BaseModel, Field
 
@@ -18,6 +19,8 @@ from src.extraction.inference_utils import (
 )
 from src.extraction.primary_status import primary_status_from_study_design
 from src.llm.base_client import LLMBackend
+from src.llm.micro_batch import MicroBatcher
+from src.llm.prompt_cache import CacheablePrompt
 from src.llm.pydantic_client import PydanticAIClient
 from src.models import CandidatePaper, ExtractionRecord, OutcomeRecord, StudyDesign
 from src.models.config import ReviewConfig, SettingsConfig
@@ -434,11 +437,16 @@ class _ExtractionLLMResponse(BaseModel):
     conflicts_of_interest: str = ""
 
 
-def _build_extraction_prompt(
-    paper: CandidatePaper,
-    text: str,
-    review: ReviewConfig,
-) -> str:
+class _BatchExtractionItem(_ExtractionLLMResponse):
+    paper_id: str
+
+
+class _BatchExtractionEnvelope(BaseModel):
+    extractions: list[_BatchExtractionItem] = Field(default_factory=list)
+
+
+def _extraction_instructions(review: ReviewConfig) -> str:
+    """Review context and field instructions, identical for every paper of a review."""
     domain_brief = review.domain_brief_lines()
     return "\n".join(
         [
@@ -453,12 +461,7 @@ def _build_extraction_prompt(
             f"Topic anchor terms: {', '.join(review.domain_signal_terms(limit=12))}",
             *(["Domain brief:"] + [f"  - {item}" for item in domain_brief] if domain_brief else []),
             "",
-            f"Title: {paper.title}",
-            "",
-            "Text excerpt (up to 32000 chars):",
-            text[:32000],
-            "",
-            "Extract the following from this study:",
+            "Extract the following from the study below:",
             "- study_duration: Duration of the study or intervention (e.g. '8 weeks', '6 months', 'unknown')",
             "- setting: Study setting as free text (e.g. 'classroom', 'workplace', 'clinical facility', 'laboratory', 'field site', 'online').",
             "- participant_count: Total participants as a plain number string (e.g. '120', '45').",
@@ -487,10 +490,61 @@ def _build_extraction_prompt(
             "- results_summary: Plain text summary of the key findings (2-4 sentences)",
             "- funding_source: Who funded the study (or 'not reported')",
             "- conflicts_of_interest: Any declared COI (or 'none declared')",
+        ]
+    )
+
+
+def _build_extraction_prompt(
+    paper: CandidatePaper,
+    text: str,
+    review: ReviewConfig,
+) -> str:
+    """Review context and field instructions first (shared by every paper), then the paper."""
+    dynamic_suffix = "\n".join(
+        [
+            f"Title: {paper.title}",
+            "",
+            "Text excerpt (up to 32000 chars):",
+            text[:32000],
             "",
             "Return ONLY valid JSON matching the schema.",
         ]
     )
+    return CacheablePrompt(_extraction_instructions(review), dynamic_suffix)
+
+
+def _build_batch_extraction_prompt(items: list[_PendingExtraction], review: ReviewConfig) -> str:
+    """Same instructions as the single-paper prompt, then several short studies keyed by paper_id."""
+    static_prefix = "\n".join(
+        [
+            _extraction_instructions(review),
+            "",
+            "BATCH MODE: several independent studies follow. Apply the instructions above to each study",
+            "separately, using only that study's own title and text.",
+            'Return ONLY valid JSON of the form {"extractions": [...]} with exactly one item per study,',
+            "each item carrying the study's exact paper_id plus the fields above.",
+        ]
+    )
+    lines: list[str] = []
+    for item in items:
+        lines.extend(
+            [
+                f"=== paper_id={item.paper.paper_id} ===",
+                f"Title: {item.paper.title}",
+                "Text:",
+                item.text,
+                "",
+            ]
+        )
+    lines.extend(["Allowed paper_ids:", ", ".join(item.paper.paper_id for item in items)])
+    return CacheablePrompt(static_prefix, "\n".join(lines))
+
+
+@dataclass
+class _PendingExtraction:
+    paper: CandidatePaper
+    study_design: StudyDesign
+    text: str
 
 
 class ExtractionService:
@@ -498,6 +552,12 @@ class ExtractionService:
 
     Uses Gemini Pro LLM when available; falls back to heuristic extraction
     on API errors or when offline.
+
+    With ``extraction.extraction_batch_size`` > 0, records whose extraction
+    text is short (abstract-only or below ``extraction_batch_max_chars``) are
+    coalesced across concurrent ``extract`` calls and sent several per LLM
+    call.  Papers missing from a batch response, or in a batch whose call
+    failed, fall back to the per-paper call.
     """
 
     def __init__(
@@ -513,6 +573,20 @@ class ExtractionService:
         self.settings = settings
         self.review = review
         self.provider = provider
+        self.single_call_count: int = 0
+        extraction_cfg = getattr(settings, "extraction", None)
+        self.batcher: MicroBatcher[_PendingExtraction, ExtractionRecord] = MicroBatcher(
+            self._llm_extract_batch,
+            key=lambda item: item.paper.paper_id,
+            max_size=int(getattr(extraction_cfg, "extraction_batch_size", 0) or 0),
+            label="extraction",
+        )
+
+    def _batch_eligible(self, text: str) -> bool:
+        if not text.strip():
+            return False
+        max_chars = getattr(self.settings.extraction, "extraction_batch_max_chars", 6000)
+        return len(text) <= max_chars
 
     @staticmethod
     def _heuristic_summary(paper: CandidatePaper, full_text: str) -> str:
@@ -594,6 +668,7 @@ class ExtractionService:
         text = _select_extraction_text(full_text)
         prompt = _build_extraction_prompt(paper, text, self.review)
 
+        self.single_call_count += 1
         if self.provider is not None:
             await self.provider.reserve_call_slot("extraction")
         t0 = time.monotonic()
@@ -626,7 +701,73 @@ class ExtractionService:
             schema = _ExtractionLLMResponse.model_json_schema()
             raw = await self.llm_client.complete(prompt, model=model, temperature=temperature, json_schema=schema)
             parsed = _ExtractionLLMResponse.model_validate_json(raw)
+        return self._record_from_response(paper, study_design, text, parsed)
 
+    async def _llm_extract_batch(self, items: list[_PendingExtraction]) -> dict[str, ExtractionRecord]:
+        """Extract several short records in one call; returns only the paper_ids the response covered."""
+        assert self.llm_client is not None
+        assert self.review is not None
+        assert self.settings is not None
+
+        agent = self.settings.agents.get("extraction")
+        if not agent:
+            raise ValueError(
+                "Extraction agent not configured in settings.yaml. Add 'extraction:' under 'agents:' with a model name."
+            )
+        model = agent.model
+        temperature = agent.temperature
+        prompt = _build_batch_extraction_prompt(items, self.review)
+        by_id = {item.paper.paper_id: item for item in items}
+        schema = _BatchExtractionEnvelope.model_json_schema()
+        # Restrict paper_id to this batch so the model cannot invent or drift to other identifiers.
+        item_schema = schema.get("$defs", {}).get(_BatchExtractionItem.__name__, {})
+        paper_id_schema = item_schema.get("properties", {}).get("paper_id")
+        if isinstance(paper_id_schema, dict):
+            paper_id_schema["enum"] = sorted(by_id)
+
+        if self.provider is not None:
+            await self.provider.reserve_call_slot("extraction")
+        t0 = time.monotonic()
+        if self.provider is not None and isinstance(self.llm_client, PydanticAIClient):
+            envelope, tok_in, tok_out, cw, cr, _retries = await self.llm_client.complete_validated(
+                prompt,
+                model=model,
+                temperature=temperature,
+                response_model=_BatchExtractionEnvelope,
+                json_schema=schema,
+            )
+            latency_ms = int((time.monotonic() - t0) * 1000)
+            cost = self.provider.estimate_cost_usd(model, tok_in, tok_out, cw, cr)
+            await self.provider.log_cost(
+                model,
+                tok_in,
+                tok_out,
+                cost,
+                latency_ms,
+                phase="extraction",
+                cache_read_tokens=cr,
+                cache_write_tokens=cw,
+            )
+        else:
+            raw = await self.llm_client.complete(prompt, model=model, temperature=temperature, json_schema=schema)
+            envelope = _BatchExtractionEnvelope.model_validate_json(raw)
+
+        records: dict[str, ExtractionRecord] = {}
+        for extracted in envelope.extractions:
+            item = by_id.get(extracted.paper_id.strip())
+            if item is None or item.paper.paper_id in records:
+                continue
+            parsed = _ExtractionLLMResponse.model_validate(extracted.model_dump(exclude={"paper_id"}))
+            records[item.paper.paper_id] = self._record_from_response(item.paper, item.study_design, item.text, parsed)
+        return records
+
+    def _record_from_response(
+        self,
+        paper: CandidatePaper,
+        study_design: StudyDesign,
+        text: str,
+        parsed: _ExtractionLLMResponse,
+    ) -> ExtractionRecord:
         outcomes: list[OutcomeRecord] = []
         for o in parsed.outcomes or []:
             name = (o.name or "").strip()
@@ -725,7 +866,12 @@ class ExtractionService:
         record: ExtractionRecord
         if self.llm_client is not None and self.review is not None and self.settings is not None:
             try:
-                record = await self._llm_extract(paper, study_design, full_text)
+                batched = None
+                if self.batcher.enabled:
+                    text = _select_extraction_text(full_text)
+                    if self._batch_eligible(text):
+                        batched = await self.batcher.submit(_PendingExtraction(paper, study_design, text))
+                record = batched or await self._llm_extract(paper, study_design, full_text)
             except Exception as exc:
                 # Log both exception type AND message so quota/auth errors are visible
                 # in the server log and diagnosable without a debugger.
@@ -10,6 +10,7 @@ from src.fulltext.retrieval import (
     fetch_full_text,
     resolve_landing_page,
 )
+from src.fulltext.store import FullTextStore, StoredFullText
 
 
 @dataclass(frozen=True)
@@ -46,6 +47,8 @@ __all__ = [
     "FullTextResult",
     "FullTextResolveRequest",
     "FullTextResolver",
+    "FullTextStore",
+    "StoredFullText",
     "fetch_full_text",
     "resolve_landing_page",
 ]
@@ -0,0 +1,126 @@
+"""Papers manifest (``data_papers_manifest.json``) with an append-only journal.
+
+Extraction records one entry per paper (title, DOI, source, saved file path).
+Rewriting the whole JSON object for every paper made manifest I/O quadratic
+in the number of included papers and serialized extraction workers on one
+lock, so writers now append a JSON line to ``data_papers_manifest.jsonl``
+and ``compact_papers_manifest`` folds the journal into the JSON file at phase
+end.  Readers go through ``load_papers_manifest`` / ``lookup_manifest_entry``,
+which merge both files (journal wins) and cache the parsed result until either
+file changes, so a web request for one paper does not re-parse the manifest.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_CACHE_LOCK = threading.Lock()
+_CACHE: dict[str, tuple[tuple[int, int, int, int], dict[str, dict[str, Any]]]] = {}
+
+
+def journal_path(manifest_path: str | Path) -> Path:
+    return Path(manifest_path).with_suffix(".jsonl")
+
+
+def has_papers_manifest(manifest_path: str | Path) -> bool:
+    return Path(manifest_path).is_file() or journal_path(manifest_path).is_file()
+
+
+def append_manifest_entry(manifest_path: str | Path, paper_id: str, entry: dict[str, Any]) -> None:
+    """Append one paper's entry to the journal (a later entry for the same paper replaces it)."""
+    line = json.dumps({"paper_id": paper_id, "entry": entry}, ensure_ascii=False)
+    path = journal_path(manifest_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write(line + "\n")
+
+
+def _stat_signature(path: Path) -> tuple[int, int]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return (0, -1)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_compacted(path: Path) -> dict[str, dict[str, Any]]:
+    if not path.is_file():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning("Could not read papers manifest %s: %s", path, exc)
+        return {}
+    if isinstance(data, dict):
+        return {str(pid): entry for pid, entry in data.items() if isinstance(entry, dict)}
+    if isinstance(data, list):
+        return {str(entry["paper_id"]): entry for entry in data if isinstance(entry, dict) and entry.get("paper_id")}
+    return {}
+
+
+def _replay_journal(path: Path, manifest: dict[str, dict[str, Any]]) -> None:
+    if not path.is_file():
+        return
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from an interrupted writer; earlier lines are intact.
+                continue
+            if isinstance(record, dict) and record.get("paper_id") and isinstance(record.get("entry"), dict):
+                manifest[str(record["paper_id"])] = record["entry"]
+
+
+def load_papers_manifest(manifest_path: str | Path) -> dict[str, dict[str, Any]]:
+    """Return ``{paper_id: entry}`` from the compacted manifest plus any uncompacted journal lines."""
+    path = Path(manifest_path)
+    journal = journal_path(path)
+    signature = (*_stat_signature(path), *_stat_signature(journal))
+    key = str(path.resolve())
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return dict(cached[1])
+    manifest = _read_compacted(path)
+    _replay_journal(journal, manifest)
+    with _CACHE_LOCK:
+        _CACHE[key] = (signature, manifest)
+    return dict(manifest)
+
+
+def lookup_manifest_entry(manifest_path: str | Path, paper_id: str) -> dict[str, Any] | None:
+    return load_papers_manifest(manifest_path).get(paper_id)
+
+
+def compact_papers_manifest(manifest_path: str | Path) -> int:
+    """Fold the journal into the JSON manifest atomically and drop it; returns the entry count."""
+    path = Path(manifest_path)
+    journal = journal_path(path)
+    if not journal.is_file():
+        return len(load_papers_manifest(path))
+    manifest = _read_compacted(path)
+    _replay_journal(journal, manifest)
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+    journal.unlink(missing_ok=True)
+    return len(manifest)
+
+
+def write_papers_manifest(manifest_path: str | Path, manifest: dict[str, dict[str, Any]]) -> None:
+    """Replace the manifest wholesale (used by bulk writers such as fetch-pdfs) and drop the journal."""
+    path = Path(manifest_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+    journal_path(path).unlink(missing_ok=True)
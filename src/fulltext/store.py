@@ -0,0 +1,138 @@
+"""Run-scoped full-text artifact store.
+
+Full-text screening, extraction and quality assessment all need the same
+paper text.  The store keeps one copy per paper under the run's
+``papers_dir`` -- ``<paper_id>.pdf`` when a PDF was fetched and
+``<paper_id>.md`` holding the parsed (or provider-supplied) text -- and indexes
+source, tier and character count in the ``fulltext_artifacts`` table.  Each
+phase consults the store before calling ``fetch_full_text`` and writes back
+what it resolved, so a paper is fetched and its PDF parsed at most once per run.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.search.pdf_parse import is_pdf_bytes
+
+if TYPE_CHECKING:
+    from src.db.repositories import WorkflowRepository
+
+logger = logging.getLogger(__name__)
+
+TIER_PDF = "pdf"
+TIER_TEXT = "text"
+
+
+@dataclass(frozen=True)
+class StoredFullText:
+    """A resolved full text plus where its artifacts live."""
+
+    paper_id: str
+    text: str
+    source: str
+    tier: str
+    pdf_path: Path | None = None
+
+    @property
+    def char_count(self) -> int:
+        return len(self.text)
+
+    def read_pdf_bytes(self) -> bytes | None:
+        if self.pdf_path is None or not self.pdf_path.is_file():
+            return None
+        return self.pdf_path.read_bytes()
+
+
+class FullTextStore:
+    """Write-through cache of full texts for one workflow run.
+
+    Lookups hit an in-process map first, then the ``fulltext_artifacts`` index
+    (when a repository is supplied) and the ``.md`` file it points at.  Without
+    a ``papers_dir`` the store only caches in memory.
+    """
+
+    def __init__(
+        self,
+        papers_dir: str | Path | None,
+        *,
+        repository: WorkflowRepository | None = None,
+        workflow_id: str = "",
+    ) -> None:
+        self.papers_dir = Path(papers_dir) if papers_dir else None
+        self._repository = repository
+        self._workflow_id = workflow_id
+        self._memory: dict[str, StoredFullText] = {}
+
+    async def get(self, paper_id: str) -> StoredFullText | None:
+        cached = self._memory.get(paper_id)
+        if cached is not None:
+            return cached
+        if self._repository is None or self.papers_dir is None:
+            return None
+        try:
+            row = await self._repository.get_fulltext_artifact(self._workflow_id, paper_id)
+        except Exception as exc:
+            logger.debug("FullTextStore: index lookup failed for %s: %s", paper_id, exc)
+            return None
+        if row is None:
+            return None
+        text_path = Path(row["text_path"])
+        try:
+            text = text_path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        if not text.strip():
+            return None
+        stored = StoredFullText(
+            paper_id=paper_id,
+            text=text,
+            source=row["source"],
+            tier=row["tier"],
+            pdf_path=Path(row["pdf_path"]) if row["pdf_path"] else None,
+        )
+        self._memory[paper_id] = stored
+        return stored
+
+    async def put(
+        self,
+        paper_id: str,
+        *,
+        text: str,
+        source: str,
+        pdf_bytes: bytes | None = None,
+    ) -> StoredFullText | None:
+        """Persist ``text`` (and the PDF it came from, if any); blank text is ignored."""
+        if not text.strip():
+            return None
+        pdf_path: Path | None = None
+        tier = TIER_TEXT
+        if self.papers_dir is not None:
+            try:
+                self.papers_dir.mkdir(parents=True, exist_ok=True)
+                if is_pdf_bytes(pdf_bytes):
+                    pdf_path = self.papers_dir / f"{paper_id}.pdf"
+                    pdf_path.write_bytes(pdf_bytes or b"")
+                    tier = TIER_PDF
+                text_path = self.papers_dir / f"{paper_id}.md"
+                text_path.write_text(text, encoding="utf-8")
+                if self._repository is not None:
+                    await self._repository.save_fulltext_artifact(
+                        self._workflow_id,
+                        paper_id,
+                        source=source,
+                        tier=tier,
+                        char_count=len(text),
+                        text_path=str(text_path),
+                        pdf_path=str(pdf_path) if pdf_path else None,
+                    )
+            except Exception as exc:
+                logger.debug("FullTextStore: could not persist %s: %s", paper_id, exc)
+        elif is_pdf_bytes(pdf_bytes):
+            tier = TIER_PDF
+        stored = StoredFullText(paper_id=paper_id, text=text, source=source, tier=tier, pdf_path=pdf_path)
+        self._memory[paper_id] = stored
+        return stored
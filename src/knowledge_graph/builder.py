@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import logging
-import math
 from dataclasses import dataclass, field
 
 from src.models import CandidatePaper, ExtractionRecord
+from src.rag.paper_vectors import PaperVectors
 
 logger = logging.getLogger(__name__)
 
@@ -46,17 +46,6 @@ def _jaccard_sets(a: set, b: set) -> float:
     return inter / union if union > 0 else 0.0
 
 
-def _cosine_sim(a: list[float], b: list[float]) -> float:
-    if not a or not b or len(a) != len(b):
-        return 0.0
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(x * x for x in b))
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return dot / (norm_a * norm_b)
-
-
 def _extract_keyword_set(text: str | None) -> set[str]:
     if not text:
         return set()
@@ -68,9 +57,14 @@ def _extract_keyword_set(text: str | None) -> set[str]:
 def build_paper_graph(
     records: list[ExtractionRecord],
     papers: list[CandidatePaper],
-    chunk_embeddings: dict[str, list[float]] | None = None,
+    paper_vectors: PaperVectors | None = None,
 ) -> PaperGraph:
-    """Build the paper relationship graph from extraction records."""
+    """Build the paper relationship graph from extraction records.
+
+    ``paper_vectors`` holds per-paper centroid embeddings (see
+    ``load_paper_vectors``); pairs that share no outcome, intervention or
+    population fall back to their cosine similarity.
+    """
     try:
         import networkx as nx  # type: ignore[import-untyped]  # noqa: F401
     except ImportError:
@@ -106,6 +100,10 @@ def build_paper_graph(
         intervention_sets[rec.paper_id] = _extract_keyword_set(rec.intervention_description)
         population_sets[rec.paper_id] = _extract_keyword_set(rec.participant_demographics)
 
+    emb_row: dict[str, int] = {}
+    if paper_vectors is not None and paper_vectors.ids:
+        emb_row, emb_sims = paper_vectors.similarity([r.paper_id for r in records])
+
     raw_edges: list[PaperEdge] = []
     n = len(records)
     edge_counts: dict[str, int] = {r.paper_id: 0 for r in records}
@@ -139,8 +137,8 @@ def build_paper_graph(
                 edge_counts[id_b] += 1
                 continue
 
-            if chunk_embeddings and id_a in chunk_embeddings and id_b in chunk_embeddings:
-                emb_sim = _cosine_sim(chunk_embeddings[id_a], chunk_embeddings[id_b])
+            if id_a in emb_row and id_b in emb_row:
+                emb_sim = float(emb_sims[emb_row[id_a], emb_row[id_b]])
                 if emb_sim >= _SIMILARITY_THRESHOLD:
                     raw_edges.append(PaperEdge(id_a, id_b, "embedding_similarity", emb_sim))
                     edge_counts[id_a] += 1
@@ -1,5 +1,14 @@
 """LLM provider abstractions and factories."""
 
-from src.llm.factory import get_chat_client, get_embedder, get_image_client, resolve_agent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from src.llm.factory import get_chat_client, get_embedder, get_image_client, resolve_agent
 
 __all__ = ["get_chat_client", "get_embedder", "get_image_client", "resolve_agent"]
+
+__getattr__ = lazy_exports(__name__, dict.fromkeys(__all__, "src.llm.factory"))
@@ -0,0 +1,98 @@
+"""Coalesce concurrent single-item LLM requests into multi-item batch calls.
+
+Extraction and quality assessment run one coroutine per paper on a bounded
+pool.  For short inputs the fixed prompt (review context, instructions, schema)
+dominates each call, so a ``MicroBatcher`` collects items submitted by those
+coroutines and sends them together: a batch goes out when ``max_size`` items are
+waiting or ``linger_seconds`` after the first one arrived.  ``run_batch`` returns
+results keyed by item key; any item it does not cover -- including every item of
+a failed call, and a lone item -- resolves to ``None`` so the caller makes its
+usual per-item call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+_ItemT = TypeVar("_ItemT")
+_ResultT = TypeVar("_ResultT")
+
+
+class MicroBatcher(Generic[_ItemT, _ResultT]):
+    """Collect concurrently submitted items and resolve each from one shared batch call."""
+
+    def __init__(
+        self,
+        run_batch: Callable[[list[_ItemT]], Awaitable[dict[str, _ResultT]]],
+        *,
+        key: Callable[[_ItemT], str],
+        max_size: int,
+        label: str,
+        linger_seconds: float = 0.5,
+    ) -> None:
+        self._run_batch = run_batch
+        self._key = key
+        self.max_size = max_size
+        self._label = label
+        self._linger_seconds = linger_seconds
+        self._pending: list[tuple[_ItemT, asyncio.Future[_ResultT | None]]] = []
+        self._linger: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.batch_calls: int = 0
+        self.batched_items: int = 0
+        self.missing_fallbacks: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 1
+
+    async def submit(self, item: _ItemT) -> _ResultT | None:
+        """Queue *item* for the next batch; None means the caller should handle it on its own."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[_ResultT | None] = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._linger is None:
+            self._linger = loop.call_later(self._linger_seconds, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._linger is not None:
+            self._linger.cancel()
+            self._linger = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        task = asyncio.get_running_loop().create_task(self._dispatch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, pending: list[tuple[_ItemT, asyncio.Future[_ResultT | None]]]) -> None:
+        results: dict[str, _ResultT] = {}
+        if len(pending) > 1:
+            self.batch_calls += 1
+            try:
+                results = await self._run_batch([item for item, _ in pending])
+            except Exception as exc:
+                logger.warning(
+                    "Batched %s of %d items failed (%s: %s); falling back to per-item calls.",
+                    self._label,
+                    len(pending),
+                    type(exc).__name__,
+                    str(exc)[:200],
+                )
+        for item, future in pending:
+            result = results.get(self._key(item))
+            if result is not None:
+                self.batched_items += 1
+            elif len(pending) > 1:
+                self.missing_fallbacks += 1
+                logger.warning("Batched %s missing %s -- falling back to individual call", self._label, self._key(item))
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,67 @@
+"""Static-prefix / dynamic-suffix prompt layout for provider prompt caching.
+
+Screening, ranking and extraction send thousands of prompts that share a long,
+byte-identical preamble (topic header, PICO, criteria, instructions) and differ
+only in the papers they carry.  Providers cache on exact prompt *prefixes*:
+Gemini and OpenAI do so implicitly once the prefix is long enough, while
+Anthropic (direct or via Bedrock) only caches up to an explicit cache-control
+breakpoint.  Builders therefore return a ``CacheablePrompt`` -- a ``str`` whose
+text is ``static_prefix + dynamic_suffix`` -- and ``PydanticAIClient`` turns it
+into ``[prefix, CachePoint(), suffix]`` for providers that need the marker.
+Because ``CacheablePrompt`` is a ``str``, every existing caller, test double
+and prompt logger keeps working unchanged.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+_EXPLICIT_CACHE_CONTROL_PREFIXES = ("anthropic:", "bedrock:")
+
+
+class CacheablePrompt(str):
+    """Prompt text split into a reusable static prefix and a per-call suffix."""
+
+    static_prefix: str
+    dynamic_suffix: str
+
+    def __new__(cls, static_prefix: str, dynamic_suffix: str, sep: str = "\n\n") -> CacheablePrompt:
+        prefix = f"{static_prefix}{sep}" if static_prefix else ""
+        obj = super().__new__(cls, prefix + dynamic_suffix)
+        obj.static_prefix = prefix
+        obj.dynamic_suffix = dynamic_suffix
+        return obj
+
+    def with_suffix(self, extra: str) -> CacheablePrompt:
+        """Return a copy with *extra* appended to the dynamic part (prefix unchanged)."""
+        return CacheablePrompt(self.static_prefix, self.dynamic_suffix + extra, sep="")
+
+
+def needs_explicit_cache_control(model: str) -> bool:
+    """True for providers that only cache up to an explicit breakpoint."""
+    return model.startswith(_EXPLICIT_CACHE_CONTROL_PREFIXES)
+
+
+def append_to_prompt(prompt: str, extra: str) -> str:
+    """Append *extra* to *prompt*, keeping the cacheable prefix when there is one."""
+    if isinstance(prompt, CacheablePrompt):
+        return prompt.with_suffix(extra)
+    return f"{prompt}{extra}"
+
+
+def prompt_input(prompt: str, model: str) -> str | list[Any]:
+    """Return the ``agent.run`` input for *prompt* on *model*.
+
+    Plain strings and providers with implicit prefix caching get the text as-is;
+    Anthropic-style providers get a cache breakpoint after the static prefix.
+    """
+    if (
+        isinstance(prompt, CacheablePrompt)
+        and prompt.static_prefix
+        and prompt.dynamic_suffix
+        and needs_explicit_cache_control(model)
+    ):
+        from pydantic_ai.messages import CachePoint
+
+        return [prompt.static_prefix, CachePoint(), prompt.dynamic_suffix]
+    return str(prompt)
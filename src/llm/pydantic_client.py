@@ -22,12 +22,15 @@ import asyncio
 import json
 import logging
 import random
+from collections.abc import Callable
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
 from pydantic_ai import Agent, NativeOutput, StructuredDict
 from pydantic_ai.settings import ModelSettings
+from pydantic_ai.usage import RunUsage
 
+from src.llm.prompt_cache import append_to_prompt, prompt_input
 from src.llm.registry import build_agent
 
 logger = logging.getLogger(__name__)
@@ -53,6 +56,8 @@ _DEEPSEEK_DISABLE_THINKING_EXTRA_BODY: dict[str, object] = {"thinking": {"type":
 _MAX_RETRIES = 5
 _BASE_DELAY = 2.0  # seconds
 _MAX_DELAY = 90.0  # seconds cap
+# Minimum gap between partial-output callbacks of a streamed completion.
+_STREAM_DEBOUNCE_SECONDS = 0.25
 
 # HTTP status codes that indicate a transient server-side problem.
 _RETRYABLE_CODES = {"429", "502", "503", "504"}
@@ -128,7 +133,23 @@ def _parse_retry_after(exc: BaseException) -> float:
     return 0.0
 
 
-async def _run_with_retry(agent: Agent[Any, Any], prompt: str, *, model_settings: ModelSettings) -> Any:
+async def _backoff_before_retry(exc: BaseException, attempt: int) -> None:
+    """Sleep before retry *attempt* + 1, honouring any Retry-After hint in *exc*."""
+    retry_after = _parse_retry_after(exc)
+    exponential_delay = min(_BASE_DELAY * (2**attempt) + random.uniform(0, 1), _MAX_DELAY)
+    delay = max(exponential_delay, retry_after)
+    logger.warning(
+        "LLM transient error (attempt %d/%d), retrying in %.1fs%s: %s",
+        attempt + 1,
+        _MAX_RETRIES,
+        delay,
+        f" (Retry-After={retry_after:.0f}s)" if retry_after > 0 else "",
+        exc,
+    )
+    await asyncio.sleep(delay)
+
+
+async def _run_with_retry(agent: Agent[Any, Any], prompt: str | list[Any], *, model_settings: ModelSettings) -> Any:
     """Run *agent* with exponential-backoff retry on transient errors.
 
     Retries up to _MAX_RETRIES times on 429/502/503/504 and similar transient
@@ -144,18 +165,33 @@ async def _run_with_retry(agent: Agent[Any, Any], prompt: str, *, model_settings
         except Exception as exc:
             if not _is_retryable(exc) or attempt == _MAX_RETRIES - 1:
                 raise
-            retry_after = _parse_retry_after(exc)
-            exponential_delay = min(_BASE_DELAY * (2**attempt) + random.uniform(0, 1), _MAX_DELAY)
-            delay = max(exponential_delay, retry_after)
-            logger.warning(
-                "LLM transient error (attempt %d/%d), retrying in %.1fs%s: %s",
-                attempt + 1,
-                _MAX_RETRIES,
-                delay,
-                f" (Retry-After={retry_after:.0f}s)" if retry_after > 0 else "",
-                exc,
-            )
-            await asyncio.sleep(delay)
+            await _backoff_before_retry(exc, attempt)
+    raise RuntimeError("unreachable")  # pragma: no cover
+
+
+async def _stream_with_retry(
+    agent: Agent[Any, Any],
+    prompt: str | list[Any],
+    *,
+    model_settings: ModelSettings,
+    on_partial: Callable[[Any], None],
+) -> tuple[Any, RunUsage]:
+    """Streaming counterpart of _run_with_retry; returns (output, usage).
+
+    *on_partial* receives the cumulative output so far (text, or the partially
+    parsed structured dict) at most every _STREAM_DEBOUNCE_SECONDS.  A retried
+    attempt streams from scratch, so each partial replaces the previous one.
+    """
+    for attempt in range(_MAX_RETRIES):
+        try:
+            async with agent.run_stream(prompt, model_settings=model_settings) as stream:
+                async for partial in stream.stream_output(debounce_by=_STREAM_DEBOUNCE_SECONDS):
+                    on_partial(partial)
+                return await stream.get_output(), stream.usage()
+        except Exception as exc:
+            if not _is_retryable(exc) or attempt == _MAX_RETRIES - 1:
+                raise
+            await _backoff_before_retry(exc, attempt)
     raise RuntimeError("unreachable")  # pragma: no cover
 
 
@@ -212,14 +248,14 @@ class PydanticAIClient:
             # output_retries=3: extraction/screening schemas are complex; LLM sometimes
             # returns malformed JSON. More retries reduce "Exceeded maximum retries" failures.
             agent: Agent = build_agent(model, output_type=output_type, retries=3, output_retries=3)  # type: ignore[arg-type]
-            result = await _run_with_retry(agent, prompt, model_settings=settings)
+            result = await _run_with_retry(agent, prompt_input(prompt, model), model_settings=settings)
             output = result.output
             if isinstance(output, dict):
                 return json.dumps(output)
             return str(output)
         else:
             text_agent: Agent[None, str] = build_agent(model, output_type=str)
-            text_result = await _run_with_retry(text_agent, prompt, model_settings=settings)
+            text_result = await _run_with_retry(text_agent, prompt_input(prompt, model), model_settings=settings)
             return text_result.output
 
     async def complete_text(
@@ -244,12 +280,17 @@ class PydanticAIClient:
         model: str,
         temperature: float,
         json_schema: dict | None = None,
+        on_partial: Callable[[Any], None] | None = None,
     ) -> tuple[str, int, int, int, int]:
         """Run completion and return (text, input_tokens, output_tokens, cache_write, cache_read).
 
         All five values come directly from the provider's usage object so there
         are no word-count heuristics.  cache_write and cache_read are 0 when
         the provider does not report them (e.g. OpenAI, Groq).
+
+        When *on_partial* is given the response is streamed and the callback
+        receives the cumulative partial output (text so far, or the partially
+        parsed dict when *json_schema* is set); the return value is unchanged.
         """
         settings = _model_settings(
             temperature=temperature,
@@ -263,15 +304,17 @@ class PydanticAIClient:
                 output_type = NativeOutput(StructuredDict(json_schema))
             else:
                 output_type = StructuredDict(json_schema)
-            agent = build_agent(model, output_type=output_type, retries=3, output_retries=3)  # type: ignore[arg-type]
-            result = await _run_with_retry(agent, prompt, model_settings=settings)
-            usage = result.usage()
-            text = json.dumps(result.output) if isinstance(result.output, dict) else str(result.output)
+            agent: Agent[Any, Any] = build_agent(model, output_type=output_type, retries=3, output_retries=3)  # type: ignore[arg-type]
         else:
-            text_agent: Agent[None, str] = build_agent(model, output_type=str)
-            result_str = await _run_with_retry(text_agent, prompt, model_settings=settings)
-            usage = result_str.usage()
-            text = result_str.output
+            agent = build_agent(model, output_type=str)
+        if on_partial is not None:
+            output, usage = await _stream_with_retry(
+                agent, prompt_input(prompt, model), model_settings=settings, on_partial=on_partial
+            )
+        else:
+            result = await _run_with_retry(agent, prompt_input(prompt, model), model_settings=settings)
+            output, usage = result.output, result.usage()
+        text = json.dumps(output) if isinstance(output, dict) else str(output)
 
         return (
             text,
@@ -281,6 +324,21 @@ class PydanticAIClient:
             usage.cache_read_tokens or 0,
         )
 
+    async def stream_text(
+        self,
+        prompt: str,
+        *,
+        model: str,
+        temperature: float,
+        on_text: Callable[[str], None],
+    ) -> tuple[str, int, int, int, int]:
+        """Stream a plain-text completion, calling *on_text* with the text so far.
+
+        Returns the same tuple as ``complete_with_usage()`` once the response
+        is complete; callers validate the final text exactly as before.
+        """
+        return await self.complete_with_usage(prompt, model=model, temperature=temperature, on_partial=on_text)
+
     async def complete_validated(
         self,
         prompt: str,
@@ -290,6 +348,7 @@ class PydanticAIClient:
         response_model: type[_T],
         json_schema: dict | None = None,
         max_validation_retries: int = 2,
+        on_partial: Callable[[dict[str, Any]], None] | None = None,
     ) -> tuple[_T, int, int, int, int, int]:
         """Run LLM completion with schema enforcement and caller-side validation retry.
 
@@ -306,6 +365,9 @@ class PydanticAIClient:
 
         After *max_validation_retries* attempts the last exception propagates
         so callers can still fall back to a heuristic if desired.
+
+        *on_partial* streams each attempt and receives the partially parsed
+        JSON object (see ``complete_with_usage()``).
         """
         effective_schema = json_schema or response_model.model_json_schema()
         total_in = total_out = total_cw = total_cr = 0
@@ -318,6 +380,7 @@ class PydanticAIClient:
                 model=model,
                 temperature=temperature,
                 json_schema=effective_schema,
+                on_partial=on_partial,
             )
             total_in += tok_in
             total_out += tok_out
@@ -331,11 +394,12 @@ class PydanticAIClient:
                 last_exc = exc
                 if attempt < max_validation_retries:
                     error_detail = str(exc)[:800]
-                    current_prompt = (
-                        f"{prompt}\n\n"
-                        f"YOUR PREVIOUS RESPONSE FAILED VALIDATION.\n"
-                        f"Fix the following errors and return corrected JSON:\n"
-                        f"{error_detail}"
+                    current_prompt = append_to_prompt(
+                        prompt,
+                        "\n\n"
+                        "YOUR PREVIOUS RESPONSE FAILED VALIDATION.\n"
+                        "Fix the following errors and return corrected JSON:\n"
+                        f"{error_detail}",
                     )
                     logger.warning(
                         "Validation retry %d/%d for %s: %s",
@@ -4,9 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from pydantic_ai import Agent
-
 if TYPE_CHECKING:
+    from pydantic_ai import Agent
     from pydantic_ai.models import Model
     from pydantic_ai.providers import Provider
 
@@ -124,6 +123,8 @@ def infer_agent_model(model: str) -> Model:
 
 def build_agent(model: str, **kwargs: Any) -> Agent[Any, Any]:
     """Construct an Agent with normalized model prefix and explicit provider auth."""
+    from pydantic_ai import Agent
+
     return Agent(infer_agent_model(model), **kwargs)
 
 
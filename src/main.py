@@ -16,10 +16,8 @@ import os
 import sys
 from collections.abc import Sequence
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import aiohttp
-import aiosqlite
 import yaml
 from rich.console import Console
 from rich.table import Table
@@ -30,15 +28,18 @@ from src.db.workflow_registry import (
     find_by_workflow_id_fallback,
 )
 from src.db.workflow_registry import update_status as update_registry_status
-from src.export import package_submission, validate_ieee, validate_prisma
-from src.models.workflow import WorkflowRunResult
-from src.orchestration import run_workflow_resume, run_workflow_sync
 from src.orchestration.context import RunContext, create_progress
-from src.orchestration.workflow import _hash_config
-from src.utils.structured_log import load_events_from_jsonl
+
+# The workflow graph, export pipeline and LLM stack (pydantic_ai, scipy, statsmodels,
+# matplotlib, connectors) are imported inside the commands that need them, so
+# ``status``, ``validate`` and ``--help`` start fast.
+if TYPE_CHECKING:
+    from src.models.workflow import WorkflowRunResult
 
 
 def _as_summary_dict(result: WorkflowRunResult | dict[str, Any]) -> dict[str, Any]:
+    from src.models.workflow import WorkflowRunResult
+
     if isinstance(result, WorkflowRunResult):
         return result.to_output_dict()
     return result
@@ -46,6 +47,8 @@ def _as_summary_dict(result: WorkflowRunResult | dict[str, Any]) -> dict[str, An
 
 async def _run_export(workflow_id: str, run_root: str) -> str | None:
     """Run export for workflow. Returns submission dir path or None."""
+    from src.export.submission_packager import package_submission
+
     result = await package_submission(workflow_id=workflow_id, run_root=run_root)
     return str(result) if result else None
 
@@ -58,6 +61,8 @@ async def _run_prospero(
     run_context: RunContext,
 ) -> str:
     """Regenerate the PROSPERO DOCX by rerunning only finalize for a workflow."""
+    from src.orchestration.workflow import run_workflow_resume
+
     # Use the run's own config snapshot when available so finalize-only
     # regeneration reflects the original workflow inputs, not the current
     # global config/review.yaml that may have changed since the run.
@@ -94,6 +99,9 @@ async def _run_validate(workflow_id: str, run_root: str, console: Console) -> bo
     import json
     from pathlib import Path
 
+    from src.export.ieee_validator import validate_ieee
+    from src.export.prisma_checklist import validate_prisma
+
     entry = await find_by_workflow_id(run_root, workflow_id)
     if entry is None:
         entry = await find_by_workflow_id_fallback(run_root, workflow_id)
@@ -181,9 +189,49 @@ async def _run_status(workflow_id: str, run_root: str, console: Console) -> bool
         console.print(table)
     else:
         console.print(f"[dim]Status:[/] {entry.status} (db: {entry.db_path})")
+    await _print_query_profile(console, entry.db_path, workflow_id)
     return True
 
 
+async def _print_query_profile(console: Console, db_path: str, workflow_id: str) -> None:
+    """Print the persisted SQLite query profile when diagnostics.db_profiling was on."""
+    from src.db.database import open_runtime_db
+    from src.db.repos.costs import CostsRepo
+
+    try:
+        async with open_runtime_db(db_path, readonly=True) as db:
+            profile = await CostsRepo(db).get_query_profile(workflow_id, limit=10)
+    except Exception:
+        return
+    if not profile["enabled"]:
+        return
+    phases = Table(title="DB time by phase")
+    phases.add_column("Phase", style="cyan")
+    phases.add_column("Calls", justify="right")
+    phases.add_column("Total ms", justify="right")
+    phases.add_column("Slow", justify="right")
+    for row in profile["phases"]:
+        phases.add_row(row["phase"], str(row["calls"]), f"{row['total_ms']:.1f}", str(row["slow_calls"]))
+    console.print(phases)
+    top = Table(title="Top queries")
+    top.add_column("Phase", style="cyan")
+    top.add_column("Calls", justify="right")
+    top.add_column("Total ms", justify="right")
+    top.add_column("Max ms", justify="right")
+    top.add_column("Rows", justify="right")
+    top.add_column("Statement", overflow="fold")
+    for row in profile["top_queries"]:
+        top.add_row(
+            row["phase"],
+            str(row["calls"]),
+            f"{row['total_ms']:.1f}",
+            f"{row['max_ms']:.1f}",
+            str(row["rows"]),
+            row["template"],
+        )
+    console.print(top)
+
+
 def _print_run_summary(console: Console, summary: dict) -> None:
     """Print run summary as a Rich table."""
     table = Table(title="Workflow Run Complete")
@@ -231,6 +279,12 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Always start new run; skip resume prompt (needed when running in Progress context)",
     )
+    run.add_argument(
+        "--update",
+        action="store_true",
+        help="Living-review update: start from the latest completed run for this topic and "
+        "screen/extract only new records",
+    )
     run.add_argument(
         "--silent",
         action="store_true",
@@ -301,6 +355,10 @@ async def _try_resume_via_api(
     debug: bool = False,
 ) -> tuple[str, str] | None:
     """If the API is running, delegate resume to it and return (run_id, topic). Else return None."""
+    import aiohttp
+
+    from src.orchestration.workflow import _hash_config
+
     entry = None
     if workflow_id:
         entry = await find_by_workflow_id(run_root, workflow_id)
@@ -345,6 +403,10 @@ async def _backfill_event_log(log_dir: str, workflow_id: str) -> None:
     This makes phase timeline and activity log work in the web UI for CLI runs.
     Uses INSERT OR IGNORE so it is safe to call multiple times.
     """
+    import aiosqlite
+
+    from src.utils.structured_log import load_events_from_jsonl
+
     db_path = str(Path(log_dir) / "runtime.db")
     jsonl_path = str(Path(log_dir) / "app.jsonl")
     events = load_events_from_jsonl(jsonl_path)
@@ -397,6 +459,8 @@ async def _update_registry_from_summary(summary: dict, run_root: str) -> None:
 
 async def _mark_latest_running_interrupted(review_path: str, run_root: str) -> None:
     """Best-effort fallback for abrupt CLI aborts where summary is unavailable."""
+    from src.orchestration.workflow import _hash_config
+
     try:
         review_data = yaml.safe_load(Path(review_path).read_text(encoding="utf-8")) or {}
         topic = str(review_data.get("research_question", "")).strip()
@@ -427,6 +491,8 @@ def main(argv: Sequence[str] | None = None) -> int:
         return 0
 
     if args.command == "run":
+        from src.orchestration.workflow import run_workflow_sync
+
         verbose = not getattr(args, "silent", False)
         debug = getattr(args, "debug", False)
         offline = getattr(args, "offline", False)
@@ -448,6 +514,7 @@ def main(argv: Sequence[str] | None = None) -> int:
                         run_root=args.run_root,
                         run_context=run_context,
                         fresh=getattr(args, "fresh", False),
+                        update=getattr(args, "update", False),
                     )
                 )
             _print_run_summary(console, summary)
@@ -457,6 +524,9 @@ def main(argv: Sequence[str] | None = None) -> int:
                 asyncio.run(_backfill_event_log(str(log_dir), str(workflow_id)))
             asyncio.run(_update_registry_from_summary(summary, args.run_root))
             return 0
+        except FileNotFoundError as exc:
+            console.print(f"[red]Error:[/] {exc}")
+            return 1
         except KeyboardInterrupt:
             console.print("[yellow]Interrupted.[/] Marking running workflow as interrupted.")
             asyncio.run(_mark_latest_running_interrupted(args.config, args.run_root))
@@ -470,6 +540,8 @@ def main(argv: Sequence[str] | None = None) -> int:
         debug = getattr(args, "debug", False)
         if debug:
             verbose = True
+        from src.orchestration.workflow import run_workflow_resume
+
         try:
             # Delegate to API when available so the frontend shows live progress
             if not getattr(args, "no_api", False):
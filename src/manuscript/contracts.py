@@ -19,13 +19,13 @@ from pydantic import BaseModel, Field
 
 from src.db.repositories import CitationRepository, WorkflowRepository
 from src.extraction.inference_utils import _is_substantive_finding, result_not_extractable_text
+from src.manuscript.document import ManuscriptDocument, load_manuscript, parse_manuscript
 from src.manuscript.prisma_disclosure import prisma_disclosure_gaps, should_use_db_prisma_flow_checks
 from src.manuscript.violation_policy import hard_failure, violation_category
 from src.models import ReviewConfig
 from src.models.manuscript_ir import ManuscriptCanonicalDisclosures
 from src.prisma.diagram import build_prisma_counts
 from src.writing.headings import (
-    extract_markdown_heading_inventory,
     normalize_heading_for_parity,
     strip_terminal_citations,
 )
@@ -85,51 +85,16 @@ def _read_optional_utf8_text(path_str: str | None) -> str:
 
 
 def _extract_table_row_count(md_text: str) -> int | None:
-    marker = "### Study Characteristics"
-    pos = md_text.find(marker)
-    if pos < 0:
-        return None
-    section = md_text[pos:]
-    lines = section.splitlines()
-    header_re = re.compile(r"^\|\s*Study \(Year\)\s*\|\s*Country\s*\|\s*Design\s*\|\s*N\s*\|\s*Key Finding\s*\|$")
-    sep_re = re.compile(r"^\|\s*---")
-    row_re = re.compile(r"^\|.*\|$")
-    in_table = False
-    saw_separator = False
-    rows = 0
-    for line in lines:
-        s = line.strip()
-        if not in_table and header_re.match(s):
-            in_table = True
-            continue
-        if not in_table:
-            continue
-        if sep_re.match(s):
-            saw_separator = True
-            continue
-        if s.startswith("_Table 1."):
-            break
-        if saw_separator and row_re.match(s):
-            rows += 1
-            continue
-        if saw_separator and s.startswith("### "):
-            break
-    return rows if in_table and saw_separator else None
+    return parse_manuscript(md_text).study_table_row_count
 
 
 def _extract_markdown_figure_paths(md_text: str) -> list[str]:
-    paths: list[str] = []
-    for m in re.finditer(r"!\[[^\]]*\]\(([^)]+)\)", md_text):
-        raw = m.group(1).strip()
-        if raw:
-            paths.append(raw)
-    return paths
+    return list(parse_manuscript(md_text).figure_paths)
 
 
 def _extract_markdown_figure_numbers(md_text: str) -> tuple[list[int], list[int]]:
-    heading_nums = [int(m.group(1)) for m in re.finditer(r"(?m)^\*\*Fig\.\s*(\d+)\.\*\*", md_text)]
-    embed_nums = [int(m.group(1)) for m in re.finditer(r"!\[Fig\.\s*(\d+)\s*:", md_text)]
-    return heading_nums, embed_nums
+    doc = parse_manuscript(md_text)
+    return list(doc.figure_heading_numbers), list(doc.figure_embed_numbers)
 
 
 def _extract_tex_figure_paths(tex_text: str) -> list[str]:
@@ -151,7 +116,7 @@ def _db_phrase(connector_name: str) -> str:
 
 def _find_failed_db_disclosure_issues(md_text: str, failed_connectors: list[str]) -> list[str]:
     issues: list[str] = []
-    low = md_text.lower()
+    low = parse_manuscript(md_text).lower
     for db in failed_connectors:
         phrase = _db_phrase(db)
         if not phrase:
@@ -169,7 +134,7 @@ def _find_failed_db_disclosure_issues(md_text: str, failed_connectors: list[str]
 
 
 def _body_before_references(md_text: str) -> str:
-    return md_text.split("## References", 1)[0]
+    return parse_manuscript(md_text).body
 
 
 def _phrase_present(text: str, phrase: str) -> bool:
@@ -196,7 +161,7 @@ def _discouraged_term_hits(review_config: ReviewConfig, md_text: str) -> list[st
 
 
 def _extract_headings_md(md_text: str) -> list[tuple[int, str]]:
-    return extract_markdown_heading_inventory(md_text, min_level=2, max_level=4)
+    return list(parse_manuscript(md_text).heading_inventory)
 
 
 def _extract_headings_tex(tex_text: str) -> list[tuple[int, str]]:
@@ -222,12 +187,12 @@ def _find_malformed_heading_lines(md_text: str) -> list[str]:
     """Detect heading lines that likely contain run-on body prose."""
     issues: list[str] = []
     spill_token_re = re.compile(r"\b(The|This|These|We|Our|In|Across|To|A|An)\b")
-    for raw_line in md_text.splitlines():
-        line = raw_line.strip()
-        m = re.match(r"^(#{2,6})\s+(.+)$", line)
-        if not m:
+    doc = parse_manuscript(md_text)
+    for heading in doc.headings:
+        if heading.level < 2:
             continue
-        title = m.group(2).strip()
+        line = doc.lines[heading.line_index].strip()
+        title = heading.title.strip()
         if "## " in title:
             issues.append(line)
             continue
@@ -248,7 +213,6 @@ def _find_malformed_heading_lines(md_text: str) -> list[str]:
 
 def _extract_disclosed_included_counts(md_text: str) -> set[int]:
     """Extract explicit included-study counts disclosed in narrative text."""
-    body = md_text.split("## References", 1)[0]
     counts: set[int] = set()
     patterns = (
         r"\b(\d{1,4})\s+(?:studies|study)\s+(?:were|was)?\s*included\b",
@@ -257,8 +221,7 @@ def _extract_disclosed_included_counts(md_text: str) -> set[int]:
         r"\bwith\s+(\d{1,4})\s+(?:studies|study)\s+ultimately\s+included\b",
         r"\bwe\s+included\s+(\d{1,4})\s+(?:studies|study)\b",
     )
-    for line in body.splitlines():
-        stripped = line.strip()
+    for stripped in parse_manuscript(md_text).body_lines:
         if not stripped or stripped.startswith("|") or stripped.startswith("#"):
             continue
         for pat in patterns:
@@ -298,11 +261,8 @@ _AI_LEAKAGE_PATTERNS = re.compile(
 def _find_snake_case_prose_tokens(md_text: str) -> list[str]:
     """Detect snake_case tokens in manuscript prose outside code/refs."""
     hits: set[str] = set()
-    ref_start = md_text.find("## References")
-    body = md_text[:ref_start] if ref_start > 0 else md_text
     token_re = re.compile(r"\b[a-z][a-z0-9]+_[a-z0-9_]+\b")
-    for line in body.splitlines():
-        stripped = line.strip()
+    for stripped in parse_manuscript(md_text).body_lines:
         if not stripped or stripped.startswith("#") or stripped.startswith("|") or stripped.startswith("!["):
             continue
         for token in token_re.findall(stripped):
@@ -313,14 +273,11 @@ def _find_snake_case_prose_tokens(md_text: str) -> list[str]:
 def _find_model_id_leakage(md_text: str) -> list[str]:
     """Detect raw model identifier leakage in prose."""
     hits: list[str] = []
-    ref_start = md_text.find("## References")
-    body = md_text[:ref_start] if ref_start > 0 else md_text
     model_re = re.compile(
         r"\b(?:google:[A-Za-z0-9._-]+|gemini-[A-Za-z0-9._-]+|models/[A-Za-z0-9._-]+)\b",
         re.IGNORECASE,
     )
-    for line in body.splitlines():
-        stripped = line.strip()
+    for stripped in parse_manuscript(md_text).body_lines:
         if not stripped or stripped.startswith("#"):
             continue
         if model_re.search(stripped):
@@ -330,7 +287,7 @@ def _find_model_id_leakage(md_text: str) -> list[str]:
 
 def _find_meta_feasibility_contradiction(md_text: str) -> bool:
     """Detect contradictory narrative about meta-analysis feasibility."""
-    low = md_text.lower()
+    low = parse_manuscript(md_text).lower
     feasible_markers = (
         "meta-analysis was feasible",
         "conducted a meta-analysis",
@@ -346,7 +303,7 @@ def _find_meta_feasibility_contradiction(md_text: str) -> bool:
 
 def _find_protocol_registration_contradiction(md_text: str) -> bool:
     """Detect contradictory protocol registration claims."""
-    lines = [ln.strip().lower() for ln in md_text.splitlines() if ln.strip()]
+    lines = [ln.strip().lower() for ln in parse_manuscript(md_text).lines if ln.strip()]
     has_non_prospective = any(("not prospectively registered" in ln) or ("post-hoc registration" in ln) for ln in lines)
     if not has_non_prospective:
         return False
@@ -369,55 +326,33 @@ def _canonical_h2_name(raw_heading: str) -> str:
 
 
 def _extract_abstract_lines(md_text: str) -> list[str]:
-    normalized = re.sub(r"\s+(##\s+)", r"\n\n\1", md_text)
-    lines = normalized.splitlines()
-    in_abstract = False
-    abstract_lines: list[str] = []
-    for line in lines:
-        stripped = line.strip()
-        m = re.match(r"^##\s+abstract\b(.*)$", stripped, flags=re.IGNORECASE)
-        if m:
-            in_abstract = True
-            remainder = m.group(1).strip()
-            if remainder:
-                abstract_lines.append(remainder)
-            continue
-        if in_abstract and stripped.startswith("## "):
-            break
-        if in_abstract:
-            if stripped.lower().startswith("**keywords"):
-                continue
-            abstract_lines.append(stripped)
-    return abstract_lines
+    return list(parse_manuscript(md_text).abstract_lines)
+
+
+def _required_h2_key(raw_heading: str) -> str:
+    """Canonical H2 name, folded onto a required section when it starts with one."""
+    key = _canonical_h2_name(raw_heading)
+    for req in _REQUIRED_H2_SECTIONS:
+        if key == req or key.startswith(f"{req} "):
+            return req
+    return key
+
+
+def _h2_keys(doc: ManuscriptDocument) -> list[tuple[int, str]]:
+    """(line index, required-section key) for each H2 heading in order."""
+    return [(section.line_index, _required_h2_key(section.heading)) for section in doc.h2_sections]
 
 
 def _find_missing_required_h2_sections(md_text: str) -> list[str]:
     """Return required top-level sections missing from manuscript."""
-    present: set[str] = set()
-    for line in md_text.splitlines():
-        m = re.match(r"^##\s+(.+)$", line.strip())
-        if not m:
-            continue
-        heading = _canonical_h2_name(m.group(1))
-        for name in _REQUIRED_H2_SECTIONS:
-            if heading == name or heading.startswith(f"{name} "):
-                present.add(name)
-                break
+    present = {key for _, key in _h2_keys(parse_manuscript(md_text))}
     return [name for name in _REQUIRED_H2_SECTIONS if name not in present]
 
 
 def _find_section_order_violation(md_text: str) -> str | None:
     """Return a brief message when required H2 section order is invalid."""
     order: dict[str, int] = {}
-    for idx, line in enumerate(md_text.splitlines()):
-        m = re.match(r"^##\s+(.+)$", line.strip())
-        if not m:
-            continue
-        key = _canonical_h2_name(m.group(1))
-        for req in _REQUIRED_H2_SECTIONS:
-            if key == req or key.startswith(f"{req} "):
-                key = req
-                break
+    for idx, key in _h2_keys(parse_manuscript(md_text)):
         if key in _REQUIRED_H2_SECTIONS and key not in order:
             order[key] = idx
     if len(order) < len(_REQUIRED_H2_SECTIONS):
@@ -430,22 +365,10 @@ def _find_section_order_violation(md_text: str) -> str | None:
 
 def _extract_h2_sections(md_text: str) -> dict[str, str]:
     """Map canonical H2 names to their section body text."""
+    doc = parse_manuscript(md_text)
     sections: dict[str, list[str]] = {}
-    current: str | None = None
-    for raw in md_text.splitlines():
-        stripped = raw.strip()
-        m = re.match(r"^##\s+(.+)$", stripped)
-        if m:
-            key = _canonical_h2_name(m.group(1))
-            for req in _REQUIRED_H2_SECTIONS:
-                if key == req or key.startswith(f"{req} "):
-                    key = req
-                    break
-            current = key
-            sections.setdefault(current, [])
-            continue
-        if current is not None:
-            sections[current].append(raw)
+    for section in doc.h2_sections:
+        sections.setdefault(_required_h2_key(section.heading), []).extend(doc.section_lines(section))
     return {k: "\n".join(v).strip() for k, v in sections.items()}
 
 
@@ -522,7 +445,7 @@ def _find_implications_misplaced(md_text: str) -> list[str]:
 
 def _find_rob_figure_caption_mismatch(md_text: str) -> bool:
     """Detect static ROBINS-I/CASP figure caption when MMAT is the active tool family."""
-    low = md_text.lower()
+    low = parse_manuscript(md_text).lower
     has_mmat = "## mmat quality assessment" in low or "mmat (mixed-methods" in low
     has_legacy_caption = (
         "risk of bias traffic-light plot for included non-randomized studies and reviews (robins-i/casp)" in low
@@ -532,7 +455,7 @@ def _find_rob_figure_caption_mismatch(md_text: str) -> bool:
 
 def _grade_claimed_without_rows(md_text: str) -> bool:
     """Return True when manuscript claims GRADE use in non-negated prose."""
-    lines = [ln.strip().lower() for ln in md_text.splitlines() if "grade" in ln.lower()]
+    lines = [ln.strip().lower() for ln in parse_manuscript(md_text).lines if "grade" in ln.lower()]
     if not lines:
         return False
     negative_markers = (
@@ -552,22 +475,14 @@ def _grade_claimed_without_rows(md_text: str) -> bool:
 
 def _find_duplicate_h2_sections(md_text: str) -> list[str]:
     """Return H2 heading titles that appear more than once."""
-    headings: list[str] = []
-    for line in md_text.splitlines():
-        m = re.match(r"^##\s+(.+)$", line.strip())
-        if m:
-            headings.append(_canonical_h2_name(m.group(1)))
-    counts = Counter(headings)
+    counts = Counter(_canonical_h2_name(section.heading) for section in parse_manuscript(md_text).h2_sections)
     return [title for title, n in counts.items() if n > 1]
 
 
 def _detect_ai_leakage(md_text: str) -> list[str]:
     """Return lines containing AI/chat/code artifact leakage."""
     hits: list[str] = []
-    ref_start = md_text.find("## References")
-    body = md_text[:ref_start] if ref_start > 0 else md_text
-    for line in body.splitlines():
-        stripped = line.strip()
+    for stripped in parse_manuscript(md_text).body_lines:
         if not stripped or stripped.startswith("#"):
             continue
         # Study tables can legitimately mention AI system names (e.g., ChatGPT)
@@ -632,38 +547,14 @@ def _find_abstract_results_placeholder(md_text: str) -> list[str]:
 
 
 def _extract_study_table_key_findings(md_text: str) -> list[str]:
-    marker = "### Study Characteristics"
-    pos = md_text.find(marker)
-    if pos < 0:
-        return []
-    section = md_text[pos:]
-    findings: list[str] = []
-    saw_separator = False
-    in_table = False
-    for line in section.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("| Study (Year) | Country | Design | N | Key Finding |"):
-            in_table = True
-            continue
-        if not in_table:
-            continue
-        if stripped.startswith("|---"):
-            saw_separator = True
-            continue
-        if saw_separator and stripped.startswith("### "):
-            break
-        if saw_separator and stripped.startswith("|"):
-            cells = [cell.strip() for cell in stripped.strip("|").split("|")]
-            if len(cells) >= 5:
-                findings.append(cells[4])
-    return findings
+    return list(parse_manuscript(md_text).study_table_key_findings)
 
 
 def _find_grade_table_pipeline_jargon(md_text: str) -> list[str]:
     jargon_re = re.compile(r"\b(?:\w+=\d+|auto-computed|configured\s+\w+\s+factors|downgrade=\d+)\b", re.IGNORECASE)
     hits: list[str] = []
     in_grade = False
-    for line in md_text.splitlines():
+    for line in parse_manuscript(md_text).lines:
         stripped = line.strip()
         if stripped.lower().startswith("## grade summary of findings"):
             in_grade = True
@@ -680,7 +571,7 @@ def _find_quality_assessment_corruption(md_text: str) -> list[str]:
     heading_re = re.compile(r"^#{2,3}\s+(.+)$")
     active = False
     hits: list[str] = []
-    for line in md_text.splitlines():
+    for line in parse_manuscript(md_text).lines:
         stripped = line.strip()
         heading = heading_re.match(stripped)
         if heading:
@@ -706,7 +597,7 @@ def _summary_is_missing_or_non_substantive(summary: str) -> bool:
 
 def _find_protocol_registration_future_tense(md_text: str) -> bool:
     """Detect future-tense protocol registration claims in finalized manuscript."""
-    low = md_text.lower()
+    low = parse_manuscript(md_text).lower
     patterns = (
         "will be registered",
         "to be registered",
@@ -749,7 +640,8 @@ async def run_manuscript_contracts(
     """Validate manuscript integrity invariants across DB and artifacts."""
     violations: list[ContractViolation] = []
     phase_label = contract_phase or "finalize"
-    md_text = Path(manuscript_md_path).read_text(encoding="utf-8")
+    md_doc = load_manuscript(manuscript_md_path)
+    md_text = md_doc.text
     tex_text = _read_optional_utf8_text(manuscript_tex_path)
 
     synthesis_ids = await repository.get_synthesis_included_paper_ids(workflow_id)
@@ -872,8 +764,8 @@ async def run_manuscript_contracts(
         )
 
     citations = await citation_repository.get_all_citations_for_export()
-    refs_numbers = {int(m.group(1)) for m in re.finditer(r"^\[(\d+)\]\s", md_text, flags=re.MULTILINE)}
-    cited_numbers = {int(m.group(1)) for m in re.finditer(r"\[(\d+)\]", md_text) if int(m.group(1)) > 0}
+    refs_numbers = set(md_doc.reference_numbers)
+    cited_numbers = set(md_doc.cited_numbers)
     if cited_numbers and refs_numbers and not cited_numbers.issubset(refs_numbers):
         violations.append(
             ContractViolation(
@@ -0,0 +1,258 @@
+"""Parse-once manuscript document model.
+
+Manuscript contracts, the PRISMA checklist, the manuscript auditor and the
+markdown exporter all query the same markdown structure: H2 sections,
+headings, the structured abstract, the study characteristics table, figure
+references and bracketed citation groups.  ``parse_manuscript`` indexes that
+structure lazily (each view is built on first use, in one pass over the
+lines) and memoizes documents by content hash, so the finalize gate and
+export, which re-run the validators several times per run, do not re-split
+an unchanged manuscript.
+
+Documents are shared between callers: every view is immutable (tuples,
+frozensets) and callers copy before mutating.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+from src.writing.headings import extract_markdown_heading_inventory
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+_CITATION_GROUP_RE = re.compile(r"\[([^\]\[]{1,120})\]")
+_STUDY_TABLE_MARKER = "### Study Characteristics"
+_STUDY_TABLE_HEADER_RE = re.compile(
+    r"^\|\s*Study \(Year\)\s*\|\s*Country\s*\|\s*Design\s*\|\s*N\s*\|\s*Key Finding\s*\|$"
+)
+
+_CACHE_MAX_DOCUMENTS = 32
+
+
+@dataclass(frozen=True)
+class Heading:
+    """One ATX heading line (``#`` .. ``######``)."""
+
+    level: int
+    title: str
+    line_index: int
+
+
+@dataclass(frozen=True)
+class H2Section:
+    """An H2 heading and the line range of its body (up to the next H2)."""
+
+    heading: str
+    line_index: int
+    end_index: int
+
+
+@dataclass(frozen=True)
+class CitationGroup:
+    """A bracketed token group such as ``[Smith2023, Lee2024]`` or ``[3]``."""
+
+    start: int
+    end: int
+    content: str
+
+
+class ManuscriptDocument:
+    """Indexed, read-only view of one manuscript markdown text."""
+
+    def __init__(self, text: str, digest: str) -> None:
+        self.text = text
+        self.digest = digest
+
+    @cached_property
+    def lines(self) -> tuple[str, ...]:
+        return tuple(self.text.splitlines())
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def headings(self) -> tuple[Heading, ...]:
+        """Headings of every level, matched on whitespace-stripped lines."""
+        out: list[Heading] = []
+        for idx, raw in enumerate(self.lines):
+            m = _HEADING_RE.match(raw.strip())
+            if m:
+                out.append(Heading(level=len(m.group(1)), title=m.group(2), line_index=idx))
+        return tuple(out)
+
+    @cached_property
+    def h2_sections(self) -> tuple[H2Section, ...]:
+        h2 = [h for h in self.headings if h.level == 2]
+        return tuple(
+            H2Section(
+                heading=h.title,
+                line_index=h.line_index,
+                end_index=h2[i + 1].line_index if i + 1 < len(h2) else len(self.lines),
+            )
+            for i, h in enumerate(h2)
+        )
+
+    def section_lines(self, section: H2Section) -> tuple[str, ...]:
+        """Body lines of *section*, excluding its heading line."""
+        return self.lines[section.line_index + 1 : section.end_index]
+
+    @cached_property
+    def heading_inventory(self) -> tuple[tuple[int, str], ...]:
+        """Normalized (level, title) pairs for H2-H4, as used for heading parity."""
+        return tuple(extract_markdown_heading_inventory(self.text, min_level=2, max_level=4))
+
+    @cached_property
+    def body(self) -> str:
+        """Manuscript text before the ``## References`` heading."""
+        return self.text.split("## References", 1)[0]
+
+    @cached_property
+    def body_lines(self) -> tuple[str, ...]:
+        """Whitespace-stripped lines of :attr:`body`."""
+        return tuple(line.strip() for line in self.body.splitlines())
+
+    @cached_property
+    def abstract_lines(self) -> tuple[str, ...]:
+        """Stripped lines of the ``## Abstract`` section, excluding the Keywords line."""
+        normalized = re.sub(r"\s+(##\s+)", r"\n\n\1", self.text)
+        in_abstract = False
+        abstract_lines: list[str] = []
+        for line in normalized.splitlines():
+            stripped = line.strip()
+            m = re.match(r"^##\s+abstract\b(.*)$", stripped, flags=re.IGNORECASE)
+            if m:
+                in_abstract = True
+                remainder = m.group(1).strip()
+                if remainder:
+                    abstract_lines.append(remainder)
+                continue
+            if in_abstract and stripped.startswith("## "):
+                break
+            if in_abstract:
+                if stripped.lower().startswith("**keywords"):
+                    continue
+                abstract_lines.append(stripped)
+        return tuple(abstract_lines)
+
+    @cached_property
+    def _study_table_lines(self) -> tuple[str, ...]:
+        pos = self.text.find(_STUDY_TABLE_MARKER)
+        if pos < 0:
+            return ()
+        return tuple(self.text[pos:].splitlines())
+
+    @cached_property
+    def study_table_row_count(self) -> int | None:
+        """Data rows in the study characteristics table, or None when there is no table."""
+        in_table = False
+        saw_separator = False
+        rows = 0
+        for line in self._study_table_lines:
+            s = line.strip()
+            if not in_table and _STUDY_TABLE_HEADER_RE.match(s):
+                in_table = True
+                continue
+            if not in_table:
+                continue
+            if re.match(r"^\|\s*---", s):
+                saw_separator = True
+                continue
+            if s.startswith("_Table 1."):
+                break
+            if saw_separator and re.match(r"^\|.*\|$", s):
+                rows += 1
+                continue
+            if saw_separator and s.startswith("### "):
+                break
+        return rows if in_table and saw_separator else None
+
+    @cached_property
+    def study_table_key_findings(self) -> tuple[str, ...]:
+        """Key Finding cells of the study characteristics table."""
+        findings: list[str] = []
+        saw_separator = False
+        in_table = False
+        for line in self._study_table_lines:
+            stripped = line.strip()
+            if stripped.startswith("| Study (Year) | Country | Design | N | Key Finding |"):
+                in_table = True
+                continue
+            if not in_table:
+                continue
+            if stripped.startswith("|---"):
+                saw_separator = True
+                continue
+            if saw_separator and stripped.startswith("### "):
+                break
+            if saw_separator and stripped.startswith("|"):
+                cells = [cell.strip() for cell in stripped.strip("|").split("|")]
+                if len(cells) >= 5:
+                    findings.append(cells[4])
+        return tuple(findings)
+
+    @cached_property
+    def figure_paths(self) -> tuple[str, ...]:
+        """Targets of markdown image embeds, in document order."""
+        paths: list[str] = []
+        for m in re.finditer(r"!\[[^\]]*\]\(([^)]+)\)", self.text):
+            raw = m.group(1).strip()
+            if raw:
+                paths.append(raw)
+        return tuple(paths)
+
+    @cached_property
+    def figure_heading_numbers(self) -> tuple[int, ...]:
+        return tuple(int(m.group(1)) for m in re.finditer(r"(?m)^\*\*Fig\.\s*(\d+)\.\*\*", self.text))
+
+    @cached_property
+    def figure_embed_numbers(self) -> tuple[int, ...]:
+        return tuple(int(m.group(1)) for m in re.finditer(r"!\[Fig\.\s*(\d+)\s*:", self.text))
+
+    @cached_property
+    def citation_groups(self) -> tuple[CitationGroup, ...]:
+        """Bracketed groups (up to 120 chars, no nested brackets) with their spans."""
+        return tuple(
+            CitationGroup(start=m.start(), end=m.end(), content=m.group(1))
+            for m in _CITATION_GROUP_RE.finditer(self.text)
+        )
+
+    @cached_property
+    def cited_numbers(self) -> frozenset[int]:
+        """Positive numbers cited as ``[N]`` anywhere in the text."""
+        return frozenset(int(m.group(1)) for m in re.finditer(r"\[(\d+)\]", self.text) if int(m.group(1)) > 0)
+
+    @cached_property
+    def reference_numbers(self) -> frozenset[int]:
+        """Numbers of reference-list entries (lines starting with ``[N] ``)."""
+        return frozenset(int(m.group(1)) for m in re.finditer(r"^\[(\d+)\]\s", self.text, flags=re.MULTILINE))
+
+
+_documents: OrderedDict[str, ManuscriptDocument] = OrderedDict()
+_documents_lock = threading.Lock()
+
+
+def parse_manuscript(md_text: str) -> ManuscriptDocument:
+    """Return the (memoized) indexed document for *md_text*."""
+    digest = hashlib.sha256(md_text.encode("utf-8")).hexdigest()
+    with _documents_lock:
+        document = _documents.get(digest)
+        if document is not None:
+            _documents.move_to_end(digest)
+            return document
+        document = ManuscriptDocument(md_text, digest)
+        _documents[digest] = document
+        if len(_documents) > _CACHE_MAX_DOCUMENTS:
+            _documents.popitem(last=False)
+        return document
+
+
+def load_manuscript(path: str | Path) -> ManuscriptDocument:
+    """Read a manuscript markdown file and return its indexed document."""
+    return parse_manuscript(Path(path).read_text(encoding="utf-8"))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import time
@@ -15,6 +16,7 @@ from pydantic import BaseModel, Field
 from src.llm.factory import get_chat_client
 from src.llm.provider import LLMProvider
 from src.llm.pydantic_client import PydanticAIClient
+from src.manuscript.document import parse_manuscript
 from src.models import (
     AuditProfileName,
     ManuscriptAuditFinding,
@@ -178,26 +180,19 @@ def _profile_catalog_text() -> str:
 
 
 def _markdown_sections(manuscript_text: str) -> list[tuple[str, str]]:
-    lines = manuscript_text.splitlines()
-    heading_rows: list[tuple[int, str]] = []
-    for idx, line in enumerate(lines):
-        stripped = line.strip()
-        if not stripped.startswith("## "):
-            continue
-        heading = stripped[3:].strip()
-        if heading:
-            heading_rows.append((idx, heading))
+    doc = parse_manuscript(manuscript_text)
+    heading_rows = [section for section in doc.h2_sections if section.heading.strip()]
     if not heading_rows:
         return [("full_manuscript", manuscript_text)]
     sections: list[tuple[str, str]] = []
-    if heading_rows[0][0] > 0:
-        front_matter = "\n".join(lines[: heading_rows[0][0]]).strip()
+    if heading_rows[0].line_index > 0:
+        front_matter = "\n".join(doc.lines[: heading_rows[0].line_index]).strip()
         if front_matter:
             sections.append(("front_matter", front_matter))
-    for idx, (start_row, heading) in enumerate(heading_rows):
-        end_row = heading_rows[idx + 1][0] if idx + 1 < len(heading_rows) else len(lines)
-        body = "\n".join(lines[start_row:end_row]).strip()
-        sections.append((heading, body))
+    for idx, section in enumerate(heading_rows):
+        end_row = heading_rows[idx + 1].line_index if idx + 1 < len(heading_rows) else len(doc.lines)
+        body = "\n".join(doc.lines[section.line_index : end_row]).strip()
+        sections.append((section.heading.strip(), body))
     return sections
 
 
@@ -430,6 +425,77 @@ async def _route_audit_profiles_with_llm(
     )
 
 
+def _audit_pass_prompt(
+    *,
+    review: ReviewConfig,
+    profile: str,
+    audit_pass: _AuditPassSpec,
+    domain_brief: str,
+    audit_date: str,
+    contract_summary_json: str,
+    audit_context_json: str,
+) -> str:
+    return (
+        "You are a manuscript peer reviewer.\n"
+        f"Profile: {profile}\n"
+        f"Instructions: {_profile_instructions(profile)}\n"
+        f"Topic focus: {review.expert_topic()}\n"
+        f"Domain: {review.domain}\n"
+        f"Preferred terminology: {', '.join(review.preferred_terminology())}\n"
+        + (domain_brief + "\n" if domain_brief else "")
+        + "Return strict JSON only.\n"
+        + "Use these severity levels: major, minor, note.\n"
+        + "Set blocking=true only for critical defects that should block strict gate.\n\n"
+        + f"Audit context date: {audit_date}.\n"
+        + f"Audit pass label: {audit_pass.label}.\n"
+        + f"Audit pass guidance: {audit_pass.scope_note}\n"
+        + "Treat searches run on or before the audit context date as current, not future-dated. "
+        + "Treat publication years less than or equal to the audit context year as allowable unless the manuscript "
+        + "explicitly claims those studies were unavailable at the time of search.\n"
+        + "Use the structured audit context JSON as authoritative for review metadata, source coverage, and DB-backed "
+        + "counts. Use the deterministic contract summary JSON as authoritative for already-detected structural defects. "
+        + "Do not contradict those inputs.\n"
+        + "Do not repeat contract violations as fresh findings unless they create a broader methodological or interpretive "
+        + "risk that is not already captured by the deterministic code.\n"
+        + "A transparently disclosed failed or unavailable database is a search limitation, not an automatic "
+        + "blocking defect, when multiple major databases were searched and the limitation is described clearly.\n"
+        + "Single-reviewer data collection is a methodological limitation that should be reported accurately, but it "
+        + "is not automatically blocking unless the manuscript misstates the process or the review claims duplicate "
+        + "independent extraction that did not occur.\n\n"
+        + "Absence of a formal inter-rater reliability statistic (for example, Cohen's kappa) is a reporting "
+        + "limitation, not an automatic blocking defect, when the manuscript already discloses dual screening with "
+        + "adjudication and does not falsely claim a computed reliability estimate.\n\n"
+        + "Only set blocking=true for materially misleading or non-verifiable problems, such as contradictory core "
+        + "methods/results statements, unsupported certainty or safety claims, or major omissions that would leave "
+        + "the review uninterpretable to a critical peer reviewer.\n\n"
+        + "Evaluate these dimensions: reporting completeness, methods-to-results coherence, evidence-quality "
+        + "interpretation, risk-of-bias and certainty alignment, search and selection transparency, citation support, "
+        + "and overclaiming.\n\n"
+        + f"Structured audit context JSON:\n{audit_context_json}\n\n"
+        f"Deterministic contract summary JSON:\n{contract_summary_json}\n\n"
+        "Manuscript excerpt for this audit pass:\n"
+        f"{audit_pass.manuscript_excerpt}"
+    )
+
+
+_VERDICT_RANK = {"accept": 0, "minor_revisions": 1, "major_revisions": 2, "reject": 3}
+
+
+def _audit_gate_failed(mode: str, response: _ReviewerResponse) -> bool:
+    """True when *response* alone fails the gate; later passes can only add findings or escalate."""
+    if mode not in ("soft", "strict"):
+        return False
+    if any(f.blocking for f in response.findings) or response.verdict == "reject":
+        return True
+    return mode == "strict" and response.verdict == "major_revisions"
+
+
+@dataclass
+class _AuditPassOutcome:
+    response: _ReviewerResponse | None = None
+    error: str = ""
+
+
 async def run_manuscript_audit(
     *,
     workflow_id: str,
@@ -440,7 +506,13 @@ async def run_manuscript_audit(
     audit_context_json: str,
     provider: LLMProvider,
 ) -> tuple[ManuscriptAuditResult, list[ManuscriptAuditFinding]]:
-    """Run bounded profile-based manuscript audit with explicit cost cap."""
+    """Run bounded profile-based manuscript audit with explicit cost cap.
+
+    Profile/pass calls run concurrently (``manuscript_audit.audit_concurrency``)
+    through the shared rate limiter and are merged in plan order, so findings
+    and their ids match a sequential run.  Once a pass fails the gate, passes
+    that have not started are skipped.
+    """
     client = get_chat_client(timeout_seconds=float(settings.llm.request_timeout_seconds))
     selection, routing_cost = await _route_audit_profiles_with_llm(
         workflow_id=workflow_id,
@@ -453,59 +525,38 @@ async def run_manuscript_audit(
     agent_name = "writing"
     findings: list[ManuscriptAuditFinding] = []
     total_cost = routing_cost
-    verdict_rank = {"accept": 0, "minor_revisions": 1, "major_revisions": 2, "reject": 3}
     merged_verdict = "accept"
     summaries: list[str] = []
     successful_profiles = 0
+    mode = str(getattr(settings.gates, "manuscript_audit_mode", "strict"))
+    cost_cap = float(settings.manuscript_audit.cost_cap_usd)
     audit_passes = _build_audit_pass_plan(manuscript_text)
-
-    for profile in selected:
-        for pass_idx, audit_pass in enumerate(audit_passes, start=1):
-            if total_cost >= float(settings.manuscript_audit.cost_cap_usd):
-                break
+    domain_brief = _audit_domain_brief(review)
+    audit_date = date.today().isoformat()
+    plan = [
+        (profile, pass_idx, audit_pass)
+        for profile in selected
+        for pass_idx, audit_pass in enumerate(audit_passes, start=1)
+    ]
+    outcomes: list[_AuditPassOutcome | None] = [None] * len(plan)
+    semaphore = asyncio.Semaphore(max(1, int(settings.manuscript_audit.audit_concurrency)))
+    gate_failed = asyncio.Event()
+
+    async def _run_pass(slot: int) -> None:
+        nonlocal total_cost
+        profile, _pass_idx, audit_pass = plan[slot]
+        async with semaphore:
+            if gate_failed.is_set() or total_cost >= cost_cap:
+                return
             runtime = await provider.reserve_call_slot(agent_name)
-            domain_brief = _audit_domain_brief(review)
-            audit_date = date.today().isoformat()
-            prompt = (
-                "You are a manuscript peer reviewer.\n"
-                f"Profile: {profile}\n"
-                f"Instructions: {_profile_instructions(profile)}\n"
-                f"Topic focus: {review.expert_topic()}\n"
-                f"Domain: {review.domain}\n"
-                f"Preferred terminology: {', '.join(review.preferred_terminology())}\n"
-                + (domain_brief + "\n" if domain_brief else "")
-                + "Return strict JSON only.\n"
-                + "Use these severity levels: major, minor, note.\n"
-                + "Set blocking=true only for critical defects that should block strict gate.\n\n"
-                + f"Audit context date: {audit_date}.\n"
-                + f"Audit pass label: {audit_pass.label}.\n"
-                + f"Audit pass guidance: {audit_pass.scope_note}\n"
-                + "Treat searches run on or before the audit context date as current, not future-dated. "
-                + "Treat publication years less than or equal to the audit context year as allowable unless the manuscript "
-                + "explicitly claims those studies were unavailable at the time of search.\n"
-                + "Use the structured audit context JSON as authoritative for review metadata, source coverage, and DB-backed "
-                + "counts. Use the deterministic contract summary JSON as authoritative for already-detected structural defects. "
-                + "Do not contradict those inputs.\n"
-                + "Do not repeat contract violations as fresh findings unless they create a broader methodological or interpretive "
-                + "risk that is not already captured by the deterministic code.\n"
-                + "A transparently disclosed failed or unavailable database is a search limitation, not an automatic "
-                + "blocking defect, when multiple major databases were searched and the limitation is described clearly.\n"
-                + "Single-reviewer data collection is a methodological limitation that should be reported accurately, but it "
-                + "is not automatically blocking unless the manuscript misstates the process or the review claims duplicate "
-                + "independent extraction that did not occur.\n\n"
-                + "Absence of a formal inter-rater reliability statistic (for example, Cohen's kappa) is a reporting "
-                + "limitation, not an automatic blocking defect, when the manuscript already discloses dual screening with "
-                + "adjudication and does not falsely claim a computed reliability estimate.\n\n"
-                + "Only set blocking=true for materially misleading or non-verifiable problems, such as contradictory core "
-                + "methods/results statements, unsupported certainty or safety claims, or major omissions that would leave "
-                + "the review uninterpretable to a critical peer reviewer.\n\n"
-                + "Evaluate these dimensions: reporting completeness, methods-to-results coherence, evidence-quality "
-                + "interpretation, risk-of-bias and certainty alignment, search and selection transparency, citation support, "
-                + "and overclaiming.\n\n"
-                + f"Structured audit context JSON:\n{audit_context_json}\n\n"
-                f"Deterministic contract summary JSON:\n{contract_summary_json}\n\n"
-                "Manuscript excerpt for this audit pass:\n"
-                f"{audit_pass.manuscript_excerpt}"
+            prompt = _audit_pass_prompt(
+                review=review,
+                profile=profile,
+                audit_pass=audit_pass,
+                domain_brief=domain_brief,
+                audit_date=audit_date,
+                contract_summary_json=contract_summary_json,
+                audit_context_json=audit_context_json,
             )
             t0 = time.monotonic()
             try:
@@ -517,21 +568,8 @@ async def run_manuscript_audit(
                 )
             except Exception as exc:
                 logger.warning("Manuscript audit profile %s degraded on %s: %s", profile, audit_pass.label, exc)
-                summaries.append(f"{profile}/{audit_pass.label}: audit unavailable")
-                findings.append(
-                    ManuscriptAuditFinding(
-                        finding_id=f"{profile}-{_finding_scope_token(audit_pass.label)}-degraded",
-                        profile=profile,  # type: ignore[arg-type]
-                        severity="note",
-                        category="audit_unavailable",
-                        section=None,
-                        evidence=str(exc)[:500],
-                        recommendation="Re-run manuscript audit once model credentials are configured.",
-                        owner_module="manuscript_audit",
-                        blocking=False,
-                    )
-                )
-                continue
+                outcomes[slot] = _AuditPassOutcome(error=str(exc))
+                return
             latency_ms = int((time.monotonic() - t0) * 1000)
             cost = provider.estimate_cost_usd(runtime.model, tok_in, tok_out, cw, cr)
             total_cost += cost
@@ -546,25 +584,55 @@ async def run_manuscript_audit(
                 cache_read_tokens=cr,
                 cache_write_tokens=cw,
             )
-            successful_profiles += 1
-            if verdict_rank[parsed.verdict] > verdict_rank[merged_verdict]:
-                merged_verdict = parsed.verdict
-            if parsed.summary:
-                summaries.append(f"{profile}/{audit_pass.label}: {parsed.summary}")
-            for idx, f in enumerate(parsed.findings):
-                findings.append(
-                    ManuscriptAuditFinding(
-                        finding_id=f"{profile}-{_finding_scope_token(audit_pass.label)}-{pass_idx}-{idx + 1}",
-                        profile=profile,  # type: ignore[arg-type]
-                        severity=f.severity,
-                        category=f.category,
-                        section=f.section,
-                        evidence=f.evidence,
-                        recommendation=f.recommendation,
-                        owner_module=f.owner_module or "writing",
-                        blocking=bool(f.blocking),
-                    )
+            outcomes[slot] = _AuditPassOutcome(response=parsed)
+            if _audit_gate_failed(mode, parsed):
+                gate_failed.set()
+
+    await asyncio.gather(*(_run_pass(slot) for slot in range(len(plan))))
+
+    skipped_after_gate = 0
+    for (profile, pass_idx, audit_pass), outcome in zip(plan, outcomes):
+        if outcome is None:
+            skipped_after_gate += int(gate_failed.is_set())
+            continue
+        if outcome.response is None:
+            summaries.append(f"{profile}/{audit_pass.label}: audit unavailable")
+            findings.append(
+                ManuscriptAuditFinding(
+                    finding_id=f"{profile}-{_finding_scope_token(audit_pass.label)}-degraded",
+                    profile=profile,  # type: ignore[arg-type]
+                    severity="note",
+                    category="audit_unavailable",
+                    section=None,
+                    evidence=outcome.error[:500],
+                    recommendation="Re-run manuscript audit once model credentials are configured.",
+                    owner_module="manuscript_audit",
+                    blocking=False,
+                )
+            )
+            continue
+        parsed = outcome.response
+        successful_profiles += 1
+        if _VERDICT_RANK[parsed.verdict] > _VERDICT_RANK[merged_verdict]:
+            merged_verdict = parsed.verdict
+        if parsed.summary:
+            summaries.append(f"{profile}/{audit_pass.label}: {parsed.summary}")
+        for idx, f in enumerate(parsed.findings):
+            findings.append(
+                ManuscriptAuditFinding(
+                    finding_id=f"{profile}-{_finding_scope_token(audit_pass.label)}-{pass_idx}-{idx + 1}",
+                    profile=profile,  # type: ignore[arg-type]
+                    severity=f.severity,
+                    category=f.category,
+                    section=f.section,
+                    evidence=f.evidence,
+                    recommendation=f.recommendation,
+                    owner_module=f.owner_module or "writing",
+                    blocking=bool(f.blocking),
                 )
+            )
+    if skipped_after_gate:
+        logger.info("Manuscript audit skipped %d pass(es) after the gate had already failed.", skipped_after_gate)
 
     findings = _dedupe_findings(findings)
 
@@ -572,7 +640,6 @@ async def run_manuscript_audit(
     minor_count = len([f for f in findings if f.severity == "minor"])
     note_count = len([f for f in findings if f.severity == "note"])
     blocking_count = len([f for f in findings if f.blocking])
-    mode = str(getattr(settings.gates, "manuscript_audit_mode", "strict"))
     if successful_profiles == 0:
         merged_verdict = "reject"
         blocking_count = max(blocking_count, 1)
@@ -916,6 +916,12 @@ class ManuscriptAuditConfig(BaseModel):
         ge=0.0,
         description="Hard per-run cost cap for manuscript-audit LLM calls.",
     )
+    audit_concurrency: int = Field(
+        default=3,
+        ge=1,
+        le=8,
+        description="Number of profile/pass audit calls run concurrently (shares the LLM rate limiter).",
+    )
 
 
 class RiskOfBiasConfig(BaseModel):
@@ -1142,6 +1148,39 @@ class ExtractionConfig(BaseModel):
         default=4,
         description="Number of papers extracted concurrently in phase 4. Each paper runs classify+extract+RoB sequentially; papers run in parallel.",
     )
+    extraction_batch_size: int = Field(
+        ge=0,
+        le=20,
+        default=0,
+        description=(
+            "Short records (abstract-only, or extraction text up to extraction_batch_max_chars) packed into one "
+            "LLM extraction call. 0 = one call per paper. Papers missing from a batch response fall back to a "
+            "per-paper call. Phase 4 runs at least this many papers at once so batches can fill."
+        ),
+    )
+    extraction_batch_max_chars: int = Field(
+        ge=500,
+        le=32_000,
+        default=6000,
+        description="Longest extraction text (chars) eligible for batched extraction; longer papers get their own call.",
+    )
+    quality_batch_size: int = Field(
+        ge=0,
+        le=20,
+        default=0,
+        description=(
+            "Studies sharing a quality tool (RoB 2, ROBINS-I, CASP, MMAT) assessed in one LLM call. "
+            "0 = one call per study. Studies missing from a batch response fall back to a per-study call."
+        ),
+    )
+    pipelined_extraction: bool = Field(
+        default=False,
+        description=(
+            "Start extraction for each paper as soon as its full-text decision is final (include/uncertain) "
+            "instead of after all full-text screening. Reuses the text screening already fetched; quality "
+            "assessment still runs in phase 4. Ignored when human_in_the_loop is enabled."
+        ),
+    )
     pdf_tier_timeout_seconds: int = Field(
         ge=5,
         le=60,
@@ -1306,6 +1345,12 @@ class WebConfig(BaseModel):
         default=60,
         description="How often (seconds) the heartbeat updates the workflow registry.",
     )
+    registry_reader_pool_size: int = Field(
+        ge=1,
+        le=16,
+        default=4,
+        description="Read-only connections kept open to workflows_registry.db (one shared writer is added).",
+    )
     max_concurrent_runs: int = Field(
         ge=1,
         le=10,
@@ -1314,6 +1359,25 @@ class WebConfig(BaseModel):
     )
 
 
+class DiagnosticsConfig(BaseModel):
+    """Opt-in runtime instrumentation surfaced in /api/run/{run_id}/diagnostics."""
+
+    db_profiling: bool = Field(
+        default=False,
+        description="Time every runtime.db statement per phase and persist aggregates to query_profile.",
+    )
+    slow_query_ms: float = Field(
+        ge=1.0,
+        le=60000.0,
+        default=250.0,
+        description="Statements slower than this are logged once per template with EXPLAIN QUERY PLAN.",
+    )
+    explain_slow_queries: bool = Field(
+        default=True,
+        description="Capture EXPLAIN QUERY PLAN output for the first slow call of each template.",
+    )
+
+
 class DiagramGenerationConfig(BaseModel):
     max_rounds: int = Field(
         default=1,
@@ -1359,3 +1423,4 @@ class SettingsConfig(BaseModel):
     human_in_the_loop: HumanInTheLoopConfig = Field(default_factory=HumanInTheLoopConfig)
     diagram_generation: DiagramGenerationConfig = Field(default_factory=DiagramGenerationConfig)
     web: WebConfig = Field(default_factory=WebConfig)
+    diagnostics: DiagnosticsConfig = Field(default_factory=DiagnosticsConfig)
@@ -7,7 +7,6 @@ import uuid
 
 from nameparser import HumanName
 from pydantic import BaseModel, Field
-from wordfreq import zipf_frequency
 
 from src.models.enums import SourceCategory
 
@@ -126,6 +125,9 @@ def compute_display_label(paper: CandidatePaper) -> str:
             author_token = surname
 
     # --- Step 2: Title word scan via wordfreq (domain-agnostic) ---
+    # Imported here: wordfreq is slow to load and src.models is on every entry point's import path.
+    from wordfreq import zipf_frequency
+
     # Strip non-content prefixes like "[PDF]" or "[EPUB]" before scanning.
     title_for_scan = re.sub(r"^\[([A-Z]+)\]\s*", "", paper.title or "")
 
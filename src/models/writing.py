@@ -201,6 +201,7 @@ class ManuscriptAsset(BaseModel):
     content: str
     source_path: str | None = None
     version: int = 1
+    input_hash: str | None = None
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
 
@@ -1,13 +1,23 @@
 """Workflow orchestration utilities."""
 
-from src.orchestration.workflow import (
-    run_workflow,
-    run_workflow_resume,
-    run_workflow_sync,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from src.orchestration.workflow import (
+        run_workflow,
+        run_workflow_resume,
+        run_workflow_sync,
+    )
 
 __all__ = [
     "run_workflow",
     "run_workflow_resume",
     "run_workflow_sync",
 ]
+
+# The workflow graph imports every phase runner; load it only when a run starts.
+__getattr__ = lazy_exports(__name__, dict.fromkeys(__all__, "src.orchestration.workflow"))
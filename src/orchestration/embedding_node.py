@@ -3,6 +3,7 @@
 Runs after ExtractionQualityNode, before SynthesisNode.
 Idempotent on resume: skips papers already in paper_chunks_meta.
 Embedding calls go through pydantic_ai.embeddings.Embedder (see rag.embed_model in settings.yaml).
+Per-paper centroid vectors are persisted to paper_embeddings alongside the chunks.
 Auth is handled by PydanticAI per provider (local models need no API key).
 """
 
@@ -19,6 +20,7 @@ from src.models import CostRecord
 from src.orchestration.state import ReviewState
 from src.rag.chunker import chunk_extraction_record, chunk_table_outcomes
 from src.rag.embedder import embed_texts
+from src.rag.paper_vectors import paper_centroids, save_paper_vectors
 
 logger = logging.getLogger(__name__)
 
@@ -155,6 +157,16 @@ class EmbeddingNode(BaseNode[ReviewState]):
                         """,
                         chunk_rows,
                     )
+                    chunk_paper_ids = [chunk.paper_id for chunk in all_chunks]
+                    chunk_counts: dict[str, int] = {}
+                    for pid in chunk_paper_ids:
+                        chunk_counts[pid] = chunk_counts.get(pid, 0) + 1
+                    await save_paper_vectors(
+                        db,
+                        state.workflow_id,
+                        paper_centroids(chunk_paper_ids, embeddings),
+                        chunk_counts,
+                    )
                     await db.commit()
                     logger.info(
                         "EmbeddingNode: embedded %d chunks from %d papers",
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 
+from src.fulltext.manifest import load_papers_manifest
 from src.models import CandidatePaper, ExtractionRecord
 from src.writing.context_builder import sanitize_summary_text_for_writing
 
@@ -67,19 +67,10 @@ def compute_extraction_quality_metrics(
 def load_fulltext_artifact_paper_ids(run_artifacts: dict[str, str], db_path: str) -> set[str]:
     fulltext_paper_ids: set[str] = set()
     manifest_path = Path(run_artifacts.get("papers_manifest", ""))
-    if manifest_path.exists():
-        try:
-            manifest_data = json.loads(manifest_path.read_text(encoding="utf-8"))
-            if isinstance(manifest_data, dict):
-                for paper_id, entry in manifest_data.items():
-                    if isinstance(entry, dict) and entry.get("file_path"):
-                        fulltext_paper_ids.add(str(paper_id))
-            elif isinstance(manifest_data, list):
-                for entry in manifest_data:
-                    if isinstance(entry, dict) and entry.get("paper_id") and entry.get("file_path"):
-                        fulltext_paper_ids.add(str(entry["paper_id"]))
-        except Exception as exc:
-            logger.warning("Could not read papers manifest for extraction metrics: %s", exc)
+    if manifest_path.name:
+        for paper_id, entry in load_papers_manifest(manifest_path).items():
+            if entry.get("file_path"):
+                fulltext_paper_ids.add(paper_id)
     if fulltext_paper_ids:
         return fulltext_paper_ids
 
@@ -0,0 +1,51 @@
+"""Living-review delta runs: carry a parent workflow's corpus into an update run.
+
+An update run imports the parent's papers and per-paper work
+(``import_parent_workflow``); imported papers keep
+``source_database='merged_from_parent'``.  Search results are deduplicated
+against that carried corpus so only unseen records are screened, extracted
+and embedded, while synthesis and writing run over the combined set.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from src.db.repositories import MERGED_FROM_PARENT_SOURCE
+from src.db.workflow_registry import RegistryEntry, find_by_topic
+from src.models import CandidatePaper
+from src.search.deduplication import deduplicate_against_known, deduplicate_papers
+
+
+def is_carried(paper: CandidatePaper) -> bool:
+    """True for papers imported from the parent run (already screened there)."""
+    return paper.source_database == MERGED_FROM_PARENT_SOURCE
+
+
+def combine_with_parent_corpus(papers: Iterable[CandidatePaper]) -> tuple[list[CandidatePaper], int]:
+    """Split *papers* into carried and new, and drop new records the parent already saw.
+
+    Each group is deduplicated on its own, then new records matching a carried
+    one (DOI or fuzzy title) are dropped.  Returns (carried + unseen, n_matched).
+    """
+    carried: list[CandidatePaper] = []
+    fresh: list[CandidatePaper] = []
+    for paper in papers:
+        (carried if is_carried(paper) else fresh).append(paper)
+    if not carried:
+        return fresh, 0
+    carried, _ = deduplicate_papers(carried)
+    unseen, matched = deduplicate_against_known(fresh, carried)
+    return carried + unseen, matched
+
+
+async def find_update_parent(run_root: str, topic: str) -> RegistryEntry | None:
+    """Most recent completed workflow for *topic*, regardless of config hash.
+
+    Update runs usually change the review config (``last_search_date``), so
+    the parent is matched on topic alone.
+    """
+    for entry in await find_by_topic(run_root, topic):
+        if entry.status == "completed":
+            return entry
+    return None
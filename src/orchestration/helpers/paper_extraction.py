@@ -0,0 +1,355 @@
+"""Per-paper extraction step shared by ExtractionQualityNode and the screening hand-off.
+
+``extract_paper`` resolves a paper's text (full-text store first), records it in
+the papers manifest, classifies the study design, runs LLM extraction plus PDF
+table vision and persists the ``ExtractionRecord``.  Quality assessment, cohort
+filtering and GRADE stay in ``run_extraction_quality_node``.
+
+``ExtractionHandoff`` runs that step while full-text screening is still going:
+the screening runner submits each paper as soon as its final full-text decision
+(include/uncertain) is persisted.  Because the record is saved per paper, the
+extraction node later treats those papers as already extracted and only
+assesses their quality; a paper whose hand-off extraction failed simply has no
+record and is extracted again by the node.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.db.repositories import WorkflowRepository
+from src.extraction import ExtractionService, StudyClassifier
+from src.fulltext import FullTextResult
+from src.fulltext.manifest import append_manifest_entry
+from src.fulltext.store import FullTextStore
+from src.llm.provider import LLMProvider
+from src.models import CandidatePaper, DecisionLogEntry, ExtractionRecord, StudyDesign
+from src.orchestration.state import ReviewState
+from src.search.pdf_parse import is_pdf_bytes, parse_pdf_bytes_async
+
+logger = logging.getLogger(__name__)
+
+_HANDOFF_DECISIONS = frozenset({"include", "uncertain"})
+
+
+@dataclass
+class ExtractedPaper:
+    record: ExtractionRecord
+    design: StudyDesign
+    full_text: str
+    ft_result: FullTextResult | None
+    # True when full_text is resolved full text rather than the abstract fallback.
+    resolved: bool = False
+
+
+async def load_or_fetch_full_text(
+    paper: CandidatePaper,
+    *,
+    store: FullTextStore,
+    extraction_cfg: Any,
+    node_label: str,
+) -> tuple[FullTextResult | None, str | None]:
+    """Return (fetch result, resolved text) for ``paper``, consulting the run's full-text store first.
+
+    Resolved text is None when nothing beyond the abstract was found.  Newly
+    resolved text (and its PDF) is written back so later phases reuse it.  A
+    stored entry shorter than ``full_text_min_chars`` is ignored and refetched.
+    """
+    min_chars = getattr(extraction_cfg, "full_text_min_chars", 500)
+    stored = await store.get(paper.paper_id)
+    if stored is not None and stored.char_count >= min_chars:
+        return (
+            FullTextResult(text=stored.text, source=stored.source, pdf_bytes=stored.read_pdf_bytes()),
+            stored.text,
+        )
+    try:
+        from src.extraction.table_extraction import fetch_full_text
+
+        ft_result = await fetch_full_text(
+            doi=paper.doi,
+            url=paper.url,
+            pmid=getattr(paper, "pmid", None),
+            use_sciencedirect=getattr(extraction_cfg, "sciencedirect_full_text", True),
+            use_unpaywall=getattr(extraction_cfg, "unpaywall_full_text", True),
+            use_pmc=getattr(extraction_cfg, "pmc_full_text", True),
+            use_core=getattr(extraction_cfg, "core_full_text", True),
+            use_europepmc=getattr(extraction_cfg, "europepmc_full_text", True),
+            use_semanticscholar=getattr(extraction_cfg, "semanticscholar_full_text", True),
+            use_arxiv_pdf=getattr(extraction_cfg, "arxiv_full_text", True),
+            use_biorxiv_medrxiv=getattr(extraction_cfg, "biorxiv_medrxiv_full_text", True),
+            use_openalex_content=getattr(extraction_cfg, "openalex_content_full_text", False),
+            use_crossref_links=getattr(extraction_cfg, "crossref_links_full_text", True),
+        )
+    except Exception as _ft_err:
+        logger.warning("%s: full-text fetch failed for %s (%s)", node_label, paper.paper_id, _ft_err)
+        return None, None
+    resolved: str | None = None
+    if ft_result and ft_result.text and len(ft_result.text) >= min_chars:
+        resolved = ft_result.text
+    elif ft_result and ft_result.pdf_bytes and len(ft_result.pdf_bytes) > 1000:
+        try:
+            resolved = await parse_pdf_bytes_async(ft_result.pdf_bytes)
+        except Exception as exc:
+            logger.warning("%s: PDF parse failed for %s: %s", node_label, paper.paper_id, exc)
+    if ft_result and resolved:
+        await store.put(
+            paper.paper_id,
+            text=resolved,
+            source=ft_result.source,
+            pdf_bytes=ft_result.pdf_bytes,
+        )
+    return ft_result, resolved or None
+
+
+def _record_in_papers_manifest(state: ReviewState, paper: CandidatePaper, ft_result: FullTextResult | None) -> None:
+    papers_dir_path = Path(state.artifacts.get("papers_dir", ""))
+    papers_manifest_path = Path(state.artifacts.get("papers_manifest", ""))
+    if not papers_dir_path.name:
+        return
+    try:
+        papers_dir_path.mkdir(parents=True, exist_ok=True)
+        saved_path: str | None = None
+        pdf_dest = papers_dir_path / f"{paper.paper_id}.pdf"
+        if not pdf_dest.exists() and ft_result and is_pdf_bytes(ft_result.pdf_bytes):
+            pdf_dest.write_bytes(ft_result.pdf_bytes)
+        if pdf_dest.exists():
+            saved_path = str(pdf_dest)
+        if papers_manifest_path.name:
+            append_manifest_entry(
+                papers_manifest_path,
+                paper.paper_id,
+                {
+                    "title": paper.title or "",
+                    "authors": paper.authors or "",
+                    "year": paper.year,
+                    "doi": paper.doi or "",
+                    "url": paper.url or "",
+                    "source": ft_result.source if ft_result else "abstract",
+                    "file_path": saved_path,
+                    "file_type": (
+                        "pdf" if (saved_path and saved_path.endswith(".pdf")) else ("txt" if saved_path else None)
+                    ),
+                },
+            )
+    except Exception as _save_err:
+        logger.debug("ExtractionNode: could not save fulltext for %s: %s", paper.paper_id, _save_err)
+
+
+async def extract_paper(
+    paper: CandidatePaper,
+    *,
+    state: ReviewState,
+    repository: WorkflowRepository,
+    classifier: StudyClassifier,
+    extractor: ExtractionService,
+    store: FullTextStore,
+    use_llm: bool,
+    node_label: str = "ExtractionNode",
+) -> ExtractedPaper:
+    """Resolve text, classify, extract (plus PDF table vision) and persist one paper's record."""
+    extraction_cfg = getattr(state.settings, "extraction", None)
+    ft_result: FullTextResult | None = None
+    resolved_text: str | None = None
+    if use_llm and extraction_cfg is not None:
+        ft_result, resolved_text = await load_or_fetch_full_text(
+            paper, store=store, extraction_cfg=extraction_cfg, node_label=node_label
+        )
+    if ft_result and resolved_text:
+        full_text = resolved_text
+    else:
+        full_text = (paper.abstract or paper.title or "").strip()
+
+    _record_in_papers_manifest(state, paper, ft_result)
+
+    _is_abstract_only = not ft_result or not ft_result.text
+    try:
+        design = await classifier.classify(
+            state.workflow_id,
+            paper,
+            abstract_only=_is_abstract_only,
+        )
+    except Exception as exc:
+        design = StudyDesign.NON_RANDOMIZED
+        await repository.append_decision_log(
+            DecisionLogEntry(
+                decision_type="study_design_classification",
+                paper_id=paper.paper_id,
+                decision=design.value,
+                rationale=f"Classifier error fallback: {type(exc).__name__}: {exc}",
+                actor="workflow_run",
+                phase="phase_4_extraction_quality",
+            )
+        )
+    record = await extractor.extract(
+        workflow_id=state.workflow_id,
+        paper=paper,
+        study_design=design,
+        full_text=full_text,
+    )
+
+    _pdf_bytes_ok = ft_result is not None and ft_result.pdf_bytes is not None and len(ft_result.pdf_bytes) >= 1024
+    use_vision = (
+        use_llm and extraction_cfg is not None and getattr(extraction_cfg, "use_pdf_vision", True) and _pdf_bytes_ok
+    )
+    if ft_result and ft_result.source != "abstract":
+        try:
+            record.extraction_source = ft_result.source  # type: ignore[assignment]
+        except Exception:
+            logger.warning(
+                "%s: failed to assign extraction_source=%s for paper %s",
+                node_label,
+                ft_result.source,
+                paper.paper_id,
+                exc_info=True,
+            )
+
+    if use_vision:
+        try:
+            from src.extraction.table_extraction import (
+                extract_tables_from_pdf,
+                merge_outcomes,
+            )
+
+            vision_model = extraction_cfg.pdf_vision_model.strip()
+            vision_outcomes = await extract_tables_from_pdf(
+                ft_result.pdf_bytes,
+                model_name=vision_model,
+                repository=repository,
+                workflow_id=state.workflow_id,
+            )
+            if vision_outcomes:
+                merged, _merge_source = merge_outcomes(list(record.outcomes), vision_outcomes)
+                record.outcomes = merged
+                try:
+                    record.extraction_source = _merge_source  # type: ignore[assignment]
+                except Exception:
+                    logger.warning(
+                        "%s: failed to assign merged extraction_source=%s for paper %s",
+                        node_label,
+                        _merge_source,
+                        paper.paper_id,
+                        exc_info=True,
+                    )
+                logger.info(
+                    "%s: vision extracted %d table rows for paper %s (source=%s)",
+                    node_label,
+                    len(vision_outcomes),
+                    paper.paper_id,
+                    _merge_source,
+                )
+        except Exception as _vis_err:
+            logger.warning("%s: PDF vision failed for %s: %s", node_label, paper.paper_id, _vis_err)
+    await repository.save_extraction_record(state.workflow_id, record)
+    return ExtractedPaper(
+        record=record,
+        design=design,
+        full_text=full_text,
+        ft_result=ft_result,
+        resolved=bool(ft_result and resolved_text),
+    )
+
+
+def extraction_pool_size(extraction_cfg: Any) -> int:
+    """Papers processed at once: ``extraction_concurrency``, widened so batched extraction/quality calls can fill."""
+    concurrency = int(getattr(extraction_cfg, "extraction_concurrency", 4) or 4)
+    return max(
+        concurrency,
+        int(getattr(extraction_cfg, "extraction_batch_size", 0) or 0),
+        int(getattr(extraction_cfg, "quality_batch_size", 0) or 0),
+    )
+
+
+def pipelined_extraction_enabled(state: ReviewState) -> bool:
+    """Streaming hand-off is opt-in and never runs when a human gate sits between screening and extraction."""
+    settings = state.settings
+    if settings is None or not getattr(settings.extraction, "pipelined_extraction", False):
+        return False
+    return not settings.human_in_the_loop.enabled
+
+
+class ExtractionHandoff:
+    """Extract full-text includes on a bounded worker pool while screening continues.
+
+    ``on_decision`` matches the screener's ``on_screening_decision`` callback, so
+    it can be chained onto it; ``drain`` waits for every submitted paper.
+    """
+
+    def __init__(
+        self,
+        state: ReviewState,
+        repository: WorkflowRepository,
+        provider: LLMProvider,
+        *,
+        store: FullTextStore,
+        use_llm: bool,
+        papers: list[CandidatePaper],
+    ) -> None:
+        from src.llm.factory import get_chat_client
+
+        assert state.settings is not None and state.review is not None
+        self._state = state
+        self._repository = repository
+        self._store = store
+        self._use_llm = use_llm
+        self._papers_by_id = {p.paper_id: p for p in papers}
+        llm_timeout = float(getattr(getattr(state.settings, "llm", None), "request_timeout_seconds", 120))
+        self._classifier = StudyClassifier(provider=provider, repository=repository, review=state.review)
+        self._extractor = ExtractionService(
+            repository=repository,
+            llm_client=get_chat_client(timeout_seconds=llm_timeout) if use_llm else None,
+            settings=state.settings,
+            review=state.review,
+            provider=provider if use_llm else None,
+        )
+        self._sem = asyncio.Semaphore(extraction_pool_size(state.settings.extraction))
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self.extracted_ids: set[str] = set()
+        self.failed_ids: set[str] = set()
+
+    def on_decision(
+        self,
+        paper_id: str,
+        stage: str,
+        decision: str,
+        reason: str | None = None,
+        confidence: float | None = None,
+    ) -> None:
+        if stage != "fulltext" or str(decision) not in _HANDOFF_DECISIONS:
+            return
+        paper = self._papers_by_id.get(str(paper_id))
+        if paper is not None:
+            self.submit(paper)
+
+    def submit(self, paper: CandidatePaper) -> None:
+        if paper.paper_id in self._tasks:
+            return
+        self._tasks[paper.paper_id] = asyncio.get_running_loop().create_task(self._extract(paper))
+
+    async def _extract(self, paper: CandidatePaper) -> None:
+        async with self._sem:
+            try:
+                await extract_paper(
+                    paper,
+                    state=self._state,
+                    repository=self._repository,
+                    classifier=self._classifier,
+                    extractor=self._extractor,
+                    store=self._store,
+                    use_llm=self._use_llm,
+                    node_label="ExtractionHandoff",
+                )
+                self.extracted_ids.add(paper.paper_id)
+            except Exception as exc:
+                # No record is saved, so ExtractionQualityNode extracts this paper again.
+                self.failed_ids.add(paper.paper_id)
+                logger.warning("ExtractionHandoff: extraction failed for %s: %s", paper.paper_id, exc)
+
+    async def drain(self) -> int:
+        """Wait for all submitted extractions; returns how many produced a record."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        return len(self.extracted_ids)
@@ -20,6 +20,7 @@ from src.knowledge_graph.builder import build_paper_graph
 from src.knowledge_graph.community import detect_communities
 from src.knowledge_graph.gap_detector import detect_research_gaps
 from src.orchestration.state import ReviewState
+from src.rag.paper_vectors import load_paper_vectors
 
 logger = logging.getLogger(__name__)
 
@@ -58,41 +59,19 @@ class KnowledgeGraphNode(BaseNode[ReviewState]):
                     rc.log_status("Knowledge graph already built; skipping.")
             else:
                 if rc:
-                    rc.log_status("Loading chunk embeddings for similarity edges...")
-                # Load chunk embeddings for embedding-based edges
-                chunk_embeddings: dict[str, list[float]] = {}
-                async with db.execute(
-                    "SELECT paper_id, embedding FROM paper_chunks_meta WHERE workflow_id = ? AND embedding IS NOT NULL",
-                    (state.workflow_id,),
-                ) as cursor:
-                    paper_vecs: dict[str, list[list[float]]] = {}
-                    async for row in cursor:
-                        try:
-                            vec = json.loads(row[1])
-                            paper_vecs.setdefault(row[0], []).append(vec)
-                        except (json.JSONDecodeError, TypeError):
-                            continue
-                    # Average chunk embeddings to get per-paper embedding
-                    for pid, vecs in paper_vecs.items():
-                        if vecs:
-                            dim = len(vecs[0])
-                            uniform = all(len(v) == dim for v in vecs)
-                            if not uniform:
-                                logger.warning("Skipping paper %s: mixed embedding dimensions", pid)
-                                continue
-                            mean_vec = [sum(v[i] for v in vecs) / len(vecs) for i in range(dim)]
-                            chunk_embeddings[pid] = mean_vec
+                    rc.log_status("Loading paper embeddings for similarity edges...")
+                paper_vectors = await load_paper_vectors(db, state.workflow_id)
 
                 if rc:
                     rc.log_status(
                         f"Building paper graph ({len(state.extraction_records)} papers, "
-                        f"{len(chunk_embeddings)} with embeddings)..."
+                        f"{len(paper_vectors.ids)} with embeddings)..."
                     )
                 # Build graph
                 graph = build_paper_graph(
                     records=state.extraction_records,
                     papers=state.included_papers,
-                    chunk_embeddings=chunk_embeddings if chunk_embeddings else None,
+                    paper_vectors=paper_vectors if paper_vectors.ids else None,
                 )
 
                 if rc:
@@ -12,8 +12,9 @@ from src.db.database import get_db, repair_foreign_key_integrity
 
 logger = logging.getLogger(__name__)
 from src.db.repositories import WorkflowRepository
-from src.models import ExtractionRecord
+from src.models import CandidatePaper, ExtractionRecord
 from src.models.config import ReviewConfig
+from src.orchestration.helpers.living_review import combine_with_parent_corpus, is_carried
 from src.orchestration.phase_catalog import (
     PHASE_ORDER,
     SUB_PHASE_CHECKPOINTS,
@@ -77,6 +78,13 @@ def _next_phase(checkpoints: dict[str, str]) -> str:
     return "finalize"
 
 
+def _dedup_resume_papers(all_papers: list[CandidatePaper]) -> tuple[list[CandidatePaper], int]:
+    """Deduplicate persisted papers; living-review runs keep carried parent records over new duplicates."""
+    if any(is_carried(p) for p in all_papers):
+        return combine_with_parent_corpus(all_papers)
+    return deduplicate_papers(all_papers)
+
+
 def _extract_screening_kappa_from_phase_done_payloads(
     payloads: list[dict[str, object]],
 ) -> tuple[float | None, str | None, int]:
@@ -146,7 +154,7 @@ async def load_resume_state(
         search_counts = await repo.get_search_counts(workflow_id)
 
         all_papers = await repo.get_all_papers()
-        deduped, recomputed_dedup_count = deduplicate_papers(all_papers)
+        deduped, recomputed_dedup_count = _dedup_resume_papers(all_papers)
 
         # Use stored dedup_count when available; fall back to recomputed value for
         # older runs that predate the dedup_count column.
@@ -237,7 +245,7 @@ async def load_resume_state(
                 checkpoints = await repo.get_checkpoints(workflow_id)
                 search_counts = await repo.get_search_counts(workflow_id)
                 all_papers = await repo.get_all_papers()
-                deduped, recomputed_dedup_count = deduplicate_papers(all_papers)
+                deduped, recomputed_dedup_count = _dedup_resume_papers(all_papers)
                 stored_dedup_count = await repo.get_dedup_count(workflow_id)
                 dedup_count = stored_dedup_count if stored_dedup_count is not None else recomputed_dedup_count
                 included_ids = await repo.get_included_paper_ids(workflow_id)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
 from pathlib import Path
 
 from pydantic_graph import End, GraphRunContext
@@ -15,6 +16,8 @@ from src.db.workflow_registry import update_status as update_registry_status
 from src.export.markdown_refs import is_extraction_failed
 from src.extraction import ExtractionService, StudyClassifier
 from src.extraction.extractor import detect_scope_mismatch
+from src.fulltext.manifest import compact_papers_manifest
+from src.fulltext.store import FullTextStore
 from src.llm.factory import get_chat_client
 from src.llm.provider import LLMProvider
 from src.manuscript.cohort import IncludedSetResolver
@@ -28,7 +31,6 @@ from src.models import (
     PrimaryStudyStatus,
     RecoveryAction,
     StepStatus,
-    StudyDesign,
     WorkflowStepRecord,
 )
 from src.models.workflow import WorkflowRunResult
@@ -37,6 +39,12 @@ from src.orchestration.helpers.extraction_metrics import (
     compute_extraction_quality_metrics,
     load_fulltext_artifact_paper_ids,
 )
+from src.orchestration.helpers.living_review import is_carried
+from src.orchestration.helpers.paper_extraction import (
+    extract_paper,
+    extraction_pool_size,
+    load_or_fetch_full_text,
+)
 from src.orchestration.helpers.runtime import llm_available as helper_llm_available
 from src.orchestration.helpers.runtime import rc as helper_rc
 from src.orchestration.helpers.runtime import rc_print as helper_rc_print
@@ -56,8 +64,7 @@ from src.quality import (
     StudyRouter,
 )
 from src.quality.grade import _PLACEHOLDER_OUTCOME_NAMES
-from src.search.pdf_parse import is_pdf_bytes, parse_pdf_bytes_async
-from src.visualization import render_rob_traffic_light
+from src.visualization import render_figure, render_rob_traffic_light
 from src.writing.context_builder import sanitize_summary_text_for_writing
 
 _log = logging.getLogger(__name__)
@@ -133,6 +140,18 @@ def _should_exclude_low_quality_record(
     return sanitize_summary_text_for_writing(summary_text) == "NR"
 
 
+async def _extraction_cohort_ids(repository: WorkflowRepository, state: ReviewState) -> set[str]:
+    """Paper IDs to extract: the canonical cohort, else title/abstract includes."""
+    ids = await repository.get_included_paper_ids(state.workflow_id)
+    if any(is_carried(paper) for paper in state.deduped_papers):
+        # Living-review update: the parent's studies are already included for
+        # synthesis; new screening includes are still pending extraction.
+        ids |= await repository.get_pending_included_paper_ids(state.workflow_id)
+    if not ids:
+        ids = await repository.get_title_abstract_include_ids(state.workflow_id)
+    return ids
+
+
 async def run_extraction_quality_node(state: ReviewState, ctx: GraphRunContext[ReviewState]) -> End[dict] | None:
     rc = _rc(state)
     assert state.review is not None
@@ -146,11 +165,10 @@ async def run_extraction_quality_node(state: ReviewState, ctx: GraphRunContext[R
 
     _extraction_step: WorkflowStepRecord | None = None
     rob2_rows: list = []
+    extraction_throughput: dict[str, float | int] = {}
     async with get_db(state.db_path) as db:
         repository = WorkflowRepository(db)
-        canonical_included_ids = await repository.get_included_paper_ids(state.workflow_id)
-        if not canonical_included_ids:
-            canonical_included_ids = await repository.get_title_abstract_include_ids(state.workflow_id)
+        canonical_included_ids = await _extraction_cohort_ids(repository, state)
         if canonical_included_ids:
             state.included_papers = [
                 paper for paper in state.deduped_papers if paper.paper_id in canonical_included_ids
@@ -233,8 +251,13 @@ async def run_extraction_quality_node(state: ReviewState, ctx: GraphRunContext[R
         extraction_cfg = getattr(state.settings, "extraction", None)
         gate_cfg = getattr(state.settings, "gates", None)
         _mmat_minimum_score = max(0, int(getattr(gate_cfg, "mmat_minimum_score", 0) or 0))
-        _quality_concurrency = getattr(extraction_cfg, "extraction_concurrency", 4) if extraction_cfg else 4
+        _quality_concurrency = extraction_pool_size(extraction_cfg) if extraction_cfg else 4
         _quality_sem = asyncio.Semaphore(_quality_concurrency)
+        fulltext_store = FullTextStore(
+            state.artifacts.get("papers_dir"),
+            repository=repository,
+            workflow_id=state.workflow_id,
+        )
 
         async def _assess_quality_one(qr: ExtractionRecord) -> None:
             async with _quality_sem:
@@ -264,40 +287,14 @@ async def run_extraction_quality_node(state: ReviewState, ctx: GraphRunContext[R
                 _src_paper = _paper_lookup.get(qr.paper_id)
                 full_text = (_src_paper.abstract or _src_paper.title or "").strip() if _src_paper else ""
                 if _src_paper and extraction_cfg is not None:
-                    ft_result = None
-                    try:
-                        from src.extraction.table_extraction import fetch_full_text
-
-                        ft_result = await fetch_full_text(
-                            doi=_src_paper.doi,
-                            url=_src_paper.url,
-                            pmid=getattr(_src_paper, "pmid", None),
-                            use_sciencedirect=getattr(extraction_cfg, "sciencedirect_full_text", True),
-                            use_unpaywall=getattr(extraction_cfg, "unpaywall_full_text", True),
-                            use_pmc=getattr(extraction_cfg, "pmc_full_text", True),
-                            use_core=getattr(extraction_cfg, "core_full_text", True),
-                            use_europepmc=getattr(extraction_cfg, "europepmc_full_text", True),
-                            use_semanticscholar=getattr(extraction_cfg, "semanticscholar_full_text", True),
-                            use_arxiv_pdf=getattr(extraction_cfg, "arxiv_full_text", True),
-                            use_biorxiv_medrxiv=getattr(extraction_cfg, "biorxiv_medrxiv_full_text", True),
-                            use_openalex_content=getattr(extraction_cfg, "openalex_content_full_text", False),
-                            use_crossref_links=getattr(extraction_cfg, "crossref_links_full_text", True),
-                        )
-                    except Exception as _ft_err:
-                        logger.warning(
-                            "ExtractionQualityNode: full-text fetch failed for quality-only paper %s (%s)",
-                            qr.paper_id,
-                            _ft_err,
-                        )
-                    min_chars = getattr(extraction_cfg, "full_text_min_chars", 500)
-                    if ft_result and ft_result.text and len(ft_result.text) >= min_chars:
-                        full_text = ft_result.text
-                    elif ft_result and ft_result.pdf_bytes and len(ft_result.pdf_bytes) > 1000:
-                        try:
-                            full_text = await parse_pdf_bytes_async(ft_result.pdf_bytes)
-                        except Exception as exc:
-                            logger.warning("Phase 4 retry PDF parse failed for %s: %s", qr.paper_id, exc)
-                            full_text = (_src_paper.abstract or _src_paper.title or "").strip()
+                    _, _resolved_text = await load_or_fetch_full_text(
+                        _src_paper,
+                        store=fulltext_store,
+                        extraction_cfg=extraction_cfg,
+                        node_label="ExtractionQualityNode",
+                    )
+                    if _resolved_text:
+                        full_text = _resolved_text
                 await cohort_resolver.persist_extraction_outcome(
                     qr.paper_id,
                     primary_study_status=getattr(qr, "primary_study_status", PrimaryStudyStatus.UNKNOWN).value,
@@ -329,6 +326,7 @@ async def run_extraction_quality_node(state: ReviewState, ctx: GraphRunContext[R
                     return
                 try:
                     tool = router.route_tool(qr)
+                    rob_assessment_obj = None
                     if tool == "rob2":
                         assessment = await rob2.assess(qr, full_text=full_text)
                         await repository.save_rob2_assessment(state.workflow_id, assessment)
@@ -343,6 +341,7 @@ async def run_extraction_quality_node(state: ReviewState, ctx: GraphRunContext[R
                                     paper_id=qr.paper_id,
                                 )
                             )
+                        rob_assessment_obj = assessment
                     elif tool == "robins_i":
                         assessment = await robins_i.assess(qr, full_text=full_text)
                         await repository.save_robins_i_assessment(state.workflow_id, assessment)
@@ -357,6 +356,7 @@ async def run_extraction_quality_node(state: ReviewState, ctx: GraphRunContext[R
                                     paper_id=qr.paper_id,
                                 )
                             )
+                        rob_assessment_obj = assessment
                     elif tool == "casp":
                         assessment = await casp.assess(qr, full_text=full_text)
                         await repository.save_casp_assessment(state.workflow_id, qr.paper_id, assessment)
@@ -436,6 +436,19 @@ async def run_extraction_quality_node(state: ReviewState, ctx: GraphRunContext[R
                             return
                     else:
                         not_applicable_paper_ids.append(qr.paper_id)
+                        await repository.append_decision_log(
+                            DecisionLogEntry(
+                                decision_type="rob_not_applicable",
+                                paper_id=qr.paper_id,
+                                decision="not_applicable",
+                                rationale=(
+                                    f"Study design '{qr.study_design.value}' is not an "
+                                    "interventional study; ROBINS-I/RoB2 assessment not applicable."
+                                ),
+                                actor="quality_assessment",
+                                phase="phase_4_extraction_quality",
+                            )
+                        )
                     _qr_outcomes = [
                         o.name.strip()
                         for o in qr.outcomes
@@ -449,7 +462,7 @@ async def run_extraction_quality_node(state: ReviewState, ctx: GraphRunContext[R
                         }
                     ]
                     _qr_outcome_name = _qr_outcomes[0] if _qr_outcomes else "primary_outcome"
-                    _grade_pairs.append((qr, None, _qr_outcome_name))
+                    _grade_pairs.append((qr, rob_assessment_obj, _qr_outcome_name))
                 except Exception as exc:
                     await repository.append_decision_log(
                         DecisionLogEntry(
@@ -467,9 +480,8 @@ async def run_extraction_quality_node(state: ReviewState, ctx: GraphRunContext[R
             return_exceptions=True,
         )
 
-        _extract_concurrency = getattr(extraction_cfg, "extraction_concurrency", 4) if extraction_cfg else 4
+        _extract_concurrency = extraction_pool_size(extraction_cfg) if extraction_cfg else 4
         _extract_sem = asyncio.Semaphore(_extract_concurrency)
-        _manifest_lock = asyncio.Lock()
         _extract_done_count: list[int] = [0]
 
         async def _extract_one_paper(paper: CandidatePaper) -> None:
@@ -477,180 +489,27 @@ async def run_extraction_quality_node(state: ReviewState, ctx: GraphRunContext[R
                 if rc and rc.verbose:
                     _rc_print(rc, f"  Extracting {paper.paper_id[:12]}...")
 
-                ft_result = None
-                if use_llm and extraction_cfg is not None:
-                    if rc and hasattr(rc, "log_status"):
-                        paper_num = _extract_done_count[0] + 1
-                        title_snippet = (paper.title or paper.paper_id[:12] or "")[:50]
-                        rc.log_status(f"Fetching full text [{paper_num}/{len(to_process)}]: {title_snippet}...")
-                    try:
-                        from src.extraction.table_extraction import fetch_full_text
-
-                        ft_result = await fetch_full_text(
-                            doi=paper.doi,
-                            url=paper.url,
-                            pmid=getattr(paper, "pmid", None),
-                            use_sciencedirect=getattr(extraction_cfg, "sciencedirect_full_text", True),
-                            use_unpaywall=getattr(extraction_cfg, "unpaywall_full_text", True),
-                            use_pmc=getattr(extraction_cfg, "pmc_full_text", True),
-                            use_core=getattr(extraction_cfg, "core_full_text", True),
-                            use_europepmc=getattr(extraction_cfg, "europepmc_full_text", True),
-                            use_semanticscholar=getattr(extraction_cfg, "semanticscholar_full_text", True),
-                            use_arxiv_pdf=getattr(extraction_cfg, "arxiv_full_text", True),
-                            use_biorxiv_medrxiv=getattr(extraction_cfg, "biorxiv_medrxiv_full_text", True),
-                            use_openalex_content=getattr(extraction_cfg, "openalex_content_full_text", False),
-                            use_crossref_links=getattr(extraction_cfg, "crossref_links_full_text", True),
-                        )
-                    except Exception as _ft_err:
-                        logger.warning(
-                            "ExtractionNode: full-text fetch failed for %s (%s) -- using abstract",
-                            paper.paper_id,
-                            _ft_err,
-                        )
-
-                min_chars = getattr(extraction_cfg, "full_text_min_chars", 500)
-                if ft_result and ft_result.text and len(ft_result.text) >= min_chars:
-                    full_text = ft_result.text
-                    if rc and rc.verbose:
-                        _rc_print(rc, f"    [dim]full-text via {ft_result.source} ({len(full_text)} chars)[/]")
-                elif ft_result and ft_result.pdf_bytes and len(ft_result.pdf_bytes) > 1000:
-                    try:
-                        full_text = await parse_pdf_bytes_async(ft_result.pdf_bytes)
-                        if rc and rc.verbose:
-                            _rc_print(
-                                rc,
-                                f"    [dim]full-text via {ft_result.source} PDF ({len(full_text)} chars)[/]",
-                            )
-                    except Exception as exc:
-                        logger.warning("Phase 4 PDF parse failed for %s: %s", paper.paper_id, exc)
-                        full_text = (paper.abstract or paper.title or "").strip()
-                else:
-                    full_text = (paper.abstract or paper.title or "").strip()
-
-                papers_dir_path = Path(state.artifacts.get("papers_dir", ""))
-                papers_manifest_path = Path(state.artifacts.get("papers_manifest", ""))
-                if papers_dir_path.name:
-                    try:
-                        papers_dir_path.mkdir(parents=True, exist_ok=True)
-                        saved_path: str | None = None
-                        if ft_result and is_pdf_bytes(ft_result.pdf_bytes):
-                            pdf_dest = papers_dir_path / f"{paper.paper_id}.pdf"
-                            pdf_dest.write_bytes(ft_result.pdf_bytes)
-                            saved_path = str(pdf_dest)
-                        if papers_manifest_path.name:
-                            import json as _json
-
-                            async with _manifest_lock:
-                                _manifest: dict = {}
-                                if papers_manifest_path.exists():
-                                    try:
-                                        _manifest = _json.loads(papers_manifest_path.read_text(encoding="utf-8"))
-                                    except Exception:
-                                        _manifest = {}
-                                _manifest[paper.paper_id] = {
-                                    "title": paper.title or "",
-                                    "authors": paper.authors or "",
-                                    "year": paper.year,
-                                    "doi": paper.doi or "",
-                                    "url": paper.url or "",
-                                    "source": ft_result.source if ft_result else "abstract",
-                                    "file_path": saved_path,
-                                    "file_type": (
-                                        "pdf"
-                                        if (saved_path and saved_path.endswith(".pdf"))
-                                        else ("txt" if saved_path else None)
-                                    ),
-                                }
-                                papers_manifest_path.write_text(_json.dumps(_manifest, indent=2), encoding="utf-8")
-                    except Exception as _save_err:
-                        logger.debug("ExtractionNode: could not save fulltext for %s: %s", paper.paper_id, _save_err)
-
-                _is_abstract_only = not ft_result or not ft_result.text
+                if use_llm and extraction_cfg is not None and rc and hasattr(rc, "log_status"):
+                    paper_num = _extract_done_count[0] + 1
+                    title_snippet = (paper.title or paper.paper_id[:12] or "")[:50]
+                    rc.log_status(f"Fetching full text [{paper_num}/{len(to_process)}]: {title_snippet}...")
                 try:
-                    try:
-                        design = await classifier.classify(
-                            state.workflow_id,
-                            paper,
-                            abstract_only=_is_abstract_only,
-                        )
-                    except Exception as exc:
-                        design = StudyDesign.NON_RANDOMIZED
-                        await repository.append_decision_log(
-                            DecisionLogEntry(
-                                decision_type="study_design_classification",
-                                paper_id=paper.paper_id,
-                                decision=design.value,
-                                rationale=f"Classifier error fallback: {type(exc).__name__}: {exc}",
-                                actor="workflow_run",
-                                phase="phase_4_extraction_quality",
-                            )
-                        )
-                    record = await extractor.extract(
-                        workflow_id=state.workflow_id,
-                        paper=paper,
-                        study_design=design,
-                        full_text=full_text,
+                    extracted = await extract_paper(
+                        paper,
+                        state=state,
+                        repository=repository,
+                        classifier=classifier,
+                        extractor=extractor,
+                        store=fulltext_store,
+                        use_llm=use_llm,
                     )
-
-                    _pdf_bytes_ok = (
-                        ft_result is not None and ft_result.pdf_bytes is not None and len(ft_result.pdf_bytes) >= 1024
-                    )
-                    use_vision = (
-                        use_llm
-                        and extraction_cfg is not None
-                        and getattr(extraction_cfg, "use_pdf_vision", True)
-                        and _pdf_bytes_ok
-                    )
-                    if ft_result and ft_result.source != "abstract":
-                        try:
-                            record.extraction_source = ft_result.source  # type: ignore[assignment]
-                        except Exception:
-                            _log.warning(
-                                "ExtractionNode: failed to assign extraction_source=%s for paper %s",
-                                ft_result.source,
-                                paper.paper_id,
-                                exc_info=True,
-                            )
-
-                    if use_vision:
-                        try:
-                            from src.extraction.table_extraction import (
-                                extract_tables_from_pdf,
-                                merge_outcomes,
-                            )
-
-                            vision_model = extraction_cfg.pdf_vision_model.strip()
-                            vision_outcomes = await extract_tables_from_pdf(
-                                ft_result.pdf_bytes,
-                                model_name=vision_model,
-                                repository=repository,
-                                workflow_id=state.workflow_id,
-                            )
-                            if vision_outcomes:
-                                merged, _merge_source = merge_outcomes(list(record.outcomes), vision_outcomes)
-                                record.outcomes = merged
-                                try:
-                                    record.extraction_source = _merge_source  # type: ignore[assignment]
-                                except Exception:
-                                    _log.warning(
-                                        "ExtractionNode: failed to assign merged extraction_source=%s for paper %s",
-                                        _merge_source,
-                                        paper.paper_id,
-                                        exc_info=True,
-                                    )
-                                logger.info(
-                                    "ExtractionNode: vision extracted %d table rows for paper %s (source=%s)",
-                                    len(vision_outcomes),
-                                    paper.paper_id,
-                                    _merge_source,
-                                )
-                        except Exception as _vis_err:
-                            logger.warning(
-                                "ExtractionNode: PDF vision failed for %s: %s",
-                                paper.paper_id,
-                                _vis_err,
-                            )
-                    await repository.save_extraction_record(state.workflow_id, record)
+                    record = extracted.record
+                    design = extracted.design
+                    full_text = extracted.full_text
+                    if rc and rc.verbose and extracted.resolved and extracted.ft_result:
+                        _rc_print(
+                            rc, f"    [dim]full-text via {extracted.ft_result.source} ({len(full_text)} chars)[/]"
+                        )
 
                     if record.primary_study_status in _non_primary_statuses:
                         await cohort_resolver.persist_extraction_outcome(
@@ -917,7 +776,66 @@ async def run_extraction_quality_node(state: ReviewState, ctx: GraphRunContext[R
                     if rc:
                         rc.advance_screening("phase_4_extraction_quality", _extract_done_count[0], len(to_process))
 
+        _extract_started = time.perf_counter()
         await asyncio.gather(*[_extract_one_paper(p) for p in to_process], return_exceptions=True)
+        if to_process:
+            _extract_elapsed = time.perf_counter() - _extract_started
+            extraction_throughput = {
+                "papers": len(to_process),
+                "elapsed_seconds": round(_extract_elapsed, 1),
+                "papers_per_minute": round(len(to_process) * 60 / _extract_elapsed, 1) if _extract_elapsed > 0 else 0,
+                "llm_calls": extractor.single_call_count + extractor.batcher.batch_calls,
+                "batch_calls": extractor.batcher.batch_calls,
+                "batched_papers": extractor.batcher.batched_items,
+                "batch_missing_fallback": extractor.batcher.missing_fallbacks,
+            }
+            await repository.append_decision_log(
+                DecisionLogEntry(
+                    decision_type="extraction_throughput",
+                    paper_id="__pipeline__",
+                    decision=f"{extraction_throughput['papers_per_minute']} papers/min",
+                    rationale=(
+                        f"Extracted {len(to_process)} papers in {extraction_throughput['elapsed_seconds']}s with "
+                        f"{extraction_throughput['llm_calls']} LLM extraction calls "
+                        f"({extractor.batcher.batch_calls} batched covering {extractor.batcher.batched_items} papers, "
+                        f"{extractor.batcher.missing_fallbacks} batch fallbacks)."
+                    ),
+                    actor="workflow_run",
+                    phase="phase_4_extraction_quality",
+                )
+            )
+            if rc and hasattr(rc, "log_status"):
+                rc.log_status(
+                    f"Extraction throughput: {extraction_throughput['papers_per_minute']} papers/min "
+                    f"({extraction_throughput['llm_calls']} LLM calls for {len(to_process)} papers)"
+                )
+        _quality_batchers = (rob2.batcher, robins_i.batcher, casp.batcher, mmat.batcher)
+        _quality_batch_calls = sum(b.batch_calls for b in _quality_batchers)
+        if _quality_batch_calls:
+            extraction_throughput.update(
+                {
+                    "quality_batch_calls": _quality_batch_calls,
+                    "quality_batched_studies": sum(b.batched_items for b in _quality_batchers),
+                    "quality_batch_fallback": sum(b.missing_fallbacks for b in _quality_batchers),
+                }
+            )
+            logger.info(
+                "ExtractionQualityNode: %d batched quality call(s) covered %d studies (%d fell back to single calls)",
+                _quality_batch_calls,
+                extraction_throughput["quality_batched_studies"],
+                extraction_throughput["quality_batch_fallback"],
+            )
+        # Quality-only records (resumed runs, or papers extracted during screening by
+        # the pipelined hand-off) come from the DB, so drop the ones the filters
+        # above excluded; freshly extracted ones were never appended.
+        _filtered_ids = non_primary_paper_ids | low_quality_paper_ids | scope_mismatch_paper_ids
+        if _filtered_ids:
+            records[:] = [r for r in records if r.paper_id not in _filtered_ids]
+        if state.artifacts.get("papers_manifest"):
+            try:
+                compact_papers_manifest(state.artifacts["papers_manifest"])
+            except Exception as _compact_err:
+                logger.warning("ExtractionNode: papers manifest compaction failed: %s", _compact_err)
 
         _abstract_only_sources = frozenset({"text", "heuristic", "", None})
         _abstract_only_count = sum(
@@ -1067,10 +985,11 @@ async def run_extraction_quality_node(state: ReviewState, ctx: GraphRunContext[R
             return End(WorkflowRunResult.from_summary(summary))
 
         _rob_paper_lookup = {p.paper_id: p for p in state.included_papers}
-        render_rob_traffic_light(
+        await render_figure(
+            render_rob_traffic_light,
             rob2_rows,
             robins_i_rows,
-            state.artifacts["rob_traffic_light"],
+            output_path=state.artifacts["rob_traffic_light"],
             paper_lookup=_rob_paper_lookup,
             not_applicable_count=len(not_applicable_paper_ids),
             rob2_output_path=state.artifacts.get("rob2_traffic_light"),
@@ -1082,7 +1001,7 @@ async def run_extraction_quality_node(state: ReviewState, ctx: GraphRunContext[R
         )
     state.extraction_records = records
     if rc:
-        rc.emit_phase_done("phase_4_extraction_quality", {"records": len(records)})
+        rc.emit_phase_done("phase_4_extraction_quality", {"records": len(records), **extraction_throughput})
         if rc.debug:
             rc.emit_debug_state(
                 "phase_4_extraction_quality",
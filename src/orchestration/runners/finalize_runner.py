@@ -13,6 +13,7 @@ from src.citation.ledger import CitationLedger
 from src.db.database import get_db
 from src.db.repositories import CitationRepository, WorkflowRepository
 from src.db.workflow_registry import update_status as update_registry_status
+from src.fulltext.manifest import load_papers_manifest
 from src.models import StepStatus, WorkflowStepRecord
 from src.orchestration.helpers.runtime import rc as helper_rc
 from src.orchestration.helpers.runtime import rc_print as helper_rc_print
@@ -103,38 +104,18 @@ async def run_finalize_node(state: ReviewState, ctx: GraphRunContext[ReviewState
                 _included_ids = set()
             if not _included_ids:
                 _included_ids = {str(p.paper_id) for p in (state.included_papers or []) if getattr(p, "paper_id", "")}
-            _fulltext_ids: set[str] = set()
             _manifest_path = Path(state.artifacts.get("papers_manifest", ""))
-            if _manifest_path.exists():
-                try:
-                    _manifest = json.loads(_manifest_path.read_text(encoding="utf-8"))
-                    for _pid, _entry in (_manifest or {}).items():
-                        if (_entry or {}).get("file_path"):
-                            _fulltext_ids.add(str(_pid))
-                except Exception as _manifest_err:  # noqa: BLE001
-                    logger.warning(
-                        "FinalizeNode: could not derive fulltext IDs from papers manifest: %s",
-                        _manifest_err,
-                    )
+            _manifest = load_papers_manifest(_manifest_path) if _manifest_path.name else {}
+            _fulltext_ids = {_pid for _pid, _entry in _manifest.items() if _entry.get("file_path")}
             _fulltext_retrieved = len(_fulltext_ids.intersection(_included_ids)) if _included_ids else 0
             if _fulltext_retrieved <= 0:
-                if _manifest_path.exists():
-                    try:
-                        _manifest = json.loads(_manifest_path.read_text(encoding="utf-8"))
-                        _fulltext_retrieved = sum(1 for _entry in _manifest.values() if (_entry or {}).get("file_path"))
-                    except Exception as _manifest_err:  # noqa: BLE001
-                        logger.warning(
-                            "FinalizeNode: could not derive fulltext count from papers manifest: %s",
-                            _manifest_err,
-                        )
-                if _fulltext_retrieved <= 0:
-                    _papers_dir = Path(state.output_dir) / "papers"
-                    if _papers_dir.exists():
-                        _fulltext_retrieved = sum(
-                            1
-                            for _pf in _papers_dir.iterdir()
-                            if _pf.stat().st_size > 0 and _pf.suffix in {".pdf", ".txt"}
-                        )
+                _fulltext_retrieved = len(_fulltext_ids)
+            if _fulltext_retrieved <= 0:
+                _papers_dir = Path(state.output_dir) / "papers"
+                if _papers_dir.exists():
+                    _fulltext_retrieved = sum(
+                        1 for _pf in _papers_dir.iterdir() if _pf.stat().st_size > 0 and _pf.suffix in {".pdf", ".txt"}
+                    )
 
             _run_data = ProsperoRunData(
                 search_counts=state.search_counts,
@@ -198,7 +179,11 @@ async def run_finalize_node(state: ReviewState, ctx: GraphRunContext[ReviewState
         try:
             from src.export.submission_packager import package_submission as _pkg_sub
 
-            await _pkg_sub(state.workflow_id, state.run_root)
+            def _on_compile_log(step: str, text: str) -> None:
+                if rc and hasattr(rc, "_emit"):
+                    rc._emit({"type": "compile_log", "document": "manuscript.tex", "step": step, "text": text})
+
+            await _pkg_sub(state.workflow_id, state.run_root, on_log=_on_compile_log)
             logger.info("FinalizeNode: submission/ pre-populated")
         except Exception as _sub_err:  # noqa: BLE001
             logger.warning("FinalizeNode: submission pre-packaging failed: %s", _sub_err)
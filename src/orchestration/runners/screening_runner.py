@@ -14,6 +14,7 @@ from src.db.repositories import WorkflowRepository
 from src.db.workflow_registry import (
     update_status as update_registry_status,
 )
+from src.fulltext.store import FullTextStore
 from src.llm.provider import LLMProvider
 from src.manuscript.cohort import IncludedSetResolver
 from src.models import (
@@ -26,6 +27,8 @@ from src.models import (
 from src.models.workflow import WorkflowRunResult
 from src.orchestration.context import RunContext
 from src.orchestration.gates import GateRunner
+from src.orchestration.helpers.living_review import is_carried
+from src.orchestration.helpers.paper_extraction import ExtractionHandoff, pipelined_extraction_enabled
 from src.orchestration.helpers.runtime import llm_available as helper_llm_available
 from src.orchestration.helpers.runtime import rc as helper_rc
 from src.orchestration.helpers.runtime import rc_print as helper_rc_print
@@ -202,13 +205,22 @@ async def run_screening_node(state: ReviewState, ctx: GraphRunContext[ReviewStat
             on_screening_decision=on_screening_decision,
             on_status=_on_status,
         )
+        fulltext_store = FullTextStore(
+            state.artifacts.get("papers_dir"),
+            repository=repository,
+            workflow_id=state.workflow_id,
+        )
+
+        # Living-review delta runs carry the parent's papers together with their
+        # screening decisions; only unseen records go through the pre-filters,
+        # the batch pre-ranker and dual review.
+        carried_papers = [p for p in state.deduped_papers if is_carried(p)]
+        screening_pool = [p for p in state.deduped_papers if not is_carried(p)]
 
         # --- Gate 0: Metadata pre-filter (no LLM cost) ---
-        meta_acceptable, meta_rejected = metadata_prefilter(state.deduped_papers)
+        meta_acceptable, meta_rejected = metadata_prefilter(screening_pool)
         if meta_rejected:
-            meta_rejected_papers = [
-                p for p in state.deduped_papers if any(d.paper_id == p.paper_id for d in meta_rejected)
-            ]
+            meta_rejected_papers = [p for p in screening_pool if any(d.paper_id == p.paper_id for d in meta_rejected)]
             await repository.bulk_save_screening_decisions(
                 workflow_id=state.workflow_id,
                 stage="title_abstract",
@@ -732,7 +744,7 @@ async def run_screening_node(state: ReviewState, ctx: GraphRunContext[ReviewStat
         include_ids = {d.paper_id for d in all_stage1 if d.decision.value in ("include", "uncertain")}
         prior_ta_includes = await repository.get_title_abstract_include_ids(state.workflow_id)
         include_ids.update(prior_ta_includes)
-        stage1_survivors = [p for p in meta_acceptable if p.paper_id in include_ids]
+        stage1_survivors = [p for p in [*carried_papers, *meta_acceptable] if p.paper_id in include_ids]
 
         # --- Intermediate checkpoint guard for fulltext PDF retrieval + LLM ---
         _existing_cps = await repository.get_checkpoints(state.workflow_id)
@@ -770,16 +782,63 @@ async def run_screening_node(state: ReviewState, ctx: GraphRunContext[ReviewStat
                 if rc:
                     rc.log_pdf_result(paper_id, title, source, success, reason_code=reason_code)
 
-            stage2 = await screener.screen_batch(
-                workflow_id=state.workflow_id,
-                stage="fulltext",
-                papers=stage1_survivors,
-                full_text_by_paper=None,
-                retriever=PDFRetriever(extraction_config=state.settings.extraction),
-                coverage_report_path=state.artifacts["coverage_report"],
-                on_pdf_progress=_pdf_progress if rc else None,
-                on_pdf_result=_on_pdf_result if rc else None,
-            )
+            # Pipelined hand-off: final full-text includes start extraction immediately,
+            # reusing the text just fetched for screening. Records are saved per paper,
+            # so ExtractionQualityNode (or a resumed run) only assesses their quality.
+            handoff: ExtractionHandoff | None = None
+            _logging_decision_cb = screener.on_screening_decision
+            if pipelined_extraction_enabled(state):
+                handoff = ExtractionHandoff(
+                    state,
+                    repository,
+                    provider,
+                    store=fulltext_store,
+                    use_llm=use_real_client,
+                    papers=stage1_survivors,
+                )
+
+                def _on_fulltext_decision(
+                    pid: object,
+                    stg: object,
+                    dec: object,
+                    reason: object = None,
+                    conf: float | None = None,
+                ) -> None:
+                    if _logging_decision_cb is not None:
+                        _logging_decision_cb(pid, stg, dec, reason, conf)  # type: ignore[arg-type]
+                    handoff.on_decision(str(pid), str(stg), str(dec))  # type: ignore[union-attr]
+
+                screener.on_screening_decision = _on_fulltext_decision
+            try:
+                stage2 = await screener.screen_batch(
+                    workflow_id=state.workflow_id,
+                    stage="fulltext",
+                    papers=stage1_survivors,
+                    full_text_by_paper=None,
+                    retriever=PDFRetriever(extraction_config=state.settings.extraction, store=fulltext_store),
+                    coverage_report_path=state.artifacts["coverage_report"],
+                    on_pdf_progress=_pdf_progress if rc else None,
+                    on_pdf_result=_on_pdf_result if rc else None,
+                )
+            finally:
+                if handoff is not None:
+                    screener.on_screening_decision = _logging_decision_cb
+                    _pipelined_extracted = await handoff.drain()
+            if handoff is not None:
+                await repository.append_decision_log(
+                    DecisionLogEntry(
+                        decision_type="pipelined_extraction",
+                        decision="completed",
+                        rationale=(
+                            f"{_pipelined_extracted} included papers extracted during full-text screening; "
+                            f"{len(handoff.failed_ids)} left for the extraction phase."
+                        ),
+                        actor="workflow_run",
+                        phase="phase_3_screening",
+                    )
+                )
+                if rc and hasattr(rc, "log_status"):
+                    rc.log_status(f"Pipelined extraction: {_pipelined_extracted} included papers already extracted.")
 
             if rc:
                 rc.emit_phase_done(
@@ -834,6 +893,13 @@ async def run_screening_node(state: ReviewState, ctx: GraphRunContext[ReviewStat
                     state.included_papers = list(stage1_survivors)
             else:
                 include_ids = {d.paper_id for d in stage2 if d.decision.value in ("include", "uncertain")}
+                # screen_batch returns only papers it screened now; carried and
+                # previously persisted full-text includes come from the DB.
+                include_ids.update(
+                    pid
+                    for pid, decision in (await repository.get_fulltext_final_decisions(state.workflow_id)).items()
+                    if decision in ("include", "uncertain")
+                )
                 state.included_papers = [p for p in stage1_survivors if p.paper_id in include_ids]
 
             # Persist canonical screening cohort membership for downstream parity checks.
@@ -872,6 +938,7 @@ async def run_screening_node(state: ReviewState, ctx: GraphRunContext[ReviewStat
                         source_phase="phase_3_screening",
                     )
                     for p in stage1_survivors
+                    if not is_carried(p)
                 ]
             )
 
@@ -1063,7 +1130,9 @@ async def run_screening_node(state: ReviewState, ctx: GraphRunContext[ReviewStat
                                 stage="fulltext",
                                 papers=chased_ta_survivors,
                                 full_text_by_paper=None,
-                                retriever=PDFRetriever(extraction_config=state.settings.extraction),
+                                retriever=PDFRetriever(
+                                    extraction_config=state.settings.extraction, store=fulltext_store
+                                ),
                                 coverage_report_path=state.artifacts["coverage_report"],
                                 on_pdf_progress=_chased_pdf_progress if rc else None,
                             )
@@ -10,16 +10,17 @@ from pathlib import Path
 from pydantic_graph import End, GraphRunContext
 
 from src.db.database import get_db
-from src.db.repositories import WorkflowRepository
+from src.db.repositories import WorkflowRepository, carry_parent_identification
 from src.db.workflow_registry import (
     register as register_workflow,
 )
 from src.db.workflow_registry import (
     update_status as update_registry_status,
 )
-from src.models import GateStatus, WorkflowStepRecord
+from src.models import DecisionLogEntry, GateStatus, WorkflowStepRecord
 from src.models.workflow import WorkflowRunResult
 from src.orchestration.gates import GateRunner
+from src.orchestration.helpers.living_review import combine_with_parent_corpus, is_carried
 from src.orchestration.helpers.runtime import hash_config as helper_hash_config
 from src.orchestration.helpers.runtime import rc as helper_rc
 from src.orchestration.helpers.search_connectors import build_connectors as helper_build_connectors
@@ -231,25 +232,27 @@ async def run_search_node(state: ReviewState, ctx: GraphRunContext[ReviewState])
         if rc is not None and hasattr(rc, "notify_workflow_id"):
             rc.notify_workflow_id(state.workflow_id, state.run_root)
 
-        # Living review delta: merge previously included papers from the parent
-        # run DB before searching, so they are present when the dedup and
-        # living-review DOI-skip logic runs. This avoids re-screening papers
-        # that were already adjudicated in the prior run.
+        # Living review delta: import the parent run's papers and per-paper work
+        # (screening, extraction, quality, chunks) before searching, so search
+        # results can be deduplicated against the parent corpus and the LLM
+        # phases skip everything the parent already processed.
+        parent_import: dict[str, int] = {}
         if state.parent_db_path:
             try:
-                from src.db.repositories import merge_papers_from_parent
+                from src.db.repositories import import_parent_workflow
 
-                n_merged = await merge_papers_from_parent(state.parent_db_path, db)
+                parent_import = await import_parent_workflow(state.parent_db_path, db, state.workflow_id)
                 logger.info(
-                    "Living refresh: merged %d papers from parent DB %s",
-                    n_merged,
+                    "Living refresh: imported %s from parent DB %s",
+                    parent_import,
                     state.parent_db_path,
                 )
                 if rc:
                     rc._emit(
                         {
                             "type": "living_refresh_merge",
-                            "merged_papers": n_merged,
+                            "merged_papers": parent_import.get("papers", 0),
+                            "imported": parent_import,
                             "parent_db": state.parent_db_path,
                         }
                     )
@@ -358,8 +361,11 @@ async def run_search_node(state: ReviewState, ctx: GraphRunContext[ReviewState])
             except Exception as _supp_err:
                 _log.warning("Supplementary CSV import failed: %s", _supp_err)
 
-        # Living review: skip papers whose DOIs were already screened in a prior run.
-        if state.review.living_review:
+        # Living review without a parent import: skip papers whose DOIs were
+        # already screened in a prior run.  With a parent import the parent's
+        # decisions are in this DB, so combine_with_parent_corpus below does the
+        # matching and counts it for PRISMA identification.
+        if state.review.living_review and not parent_import:
             known_dois: set[str] = set()
             async with db.execute(
                 "SELECT DISTINCT p.doi FROM papers p "
@@ -378,6 +384,31 @@ async def run_search_node(state: ReviewState, ctx: GraphRunContext[ReviewState])
             )
 
         deduped, _ = deduplicate_papers(all_papers)
+        if parent_import:
+            carried = [p for p in await repository.get_all_papers() if is_carried(p)]
+            deduped, matched_parent = combine_with_parent_corpus(carried + deduped)
+            n_unseen = sum(1 for p in deduped if not is_carried(p))
+            # PRISMA identification is cumulative: the parent's searches and
+            # duplicates plus this search's records that match the parent corpus.
+            parent_dedup = await carry_parent_identification(state.parent_db_path, db, state.workflow_id)
+            dedup_count += parent_dedup + matched_parent
+            await repository.append_decision_log(
+                DecisionLogEntry(
+                    decision_type="living_review_delta",
+                    decision="completed",
+                    rationale=(
+                        f"parent_db={state.parent_db_path}, carried={len(deduped) - n_unseen}, "
+                        f"search_matched_parent={matched_parent}, unseen={n_unseen}"
+                    ),
+                    actor="workflow_run",
+                    phase="phase_2_search",
+                )
+            )
+            if rc and hasattr(rc, "log_status"):
+                rc.log_status(
+                    f"Living review update: {matched_parent} search results already in the parent review; "
+                    f"{n_unseen} new records go to screening."
+                )
         tier_weights = state.settings.search.quality_tier_weights or {}
         deduped = sorted(
             deduped,
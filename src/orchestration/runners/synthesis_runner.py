@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import math
@@ -23,6 +24,7 @@ from src.synthesis.meta_analysis import pool_effects
 from src.synthesis.sensitivity import run_sensitivity_analysis
 from src.visualization.forest_plot import render_forest_plot
 from src.visualization.funnel_plot import render_funnel_plot
+from src.visualization.render_pool import render_figure
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +41,7 @@ def _llm_available(settings=None, settings_cfg=None):
     return helper_llm_available(settings=settings, settings_cfg=settings_cfg)
 
 
-def _try_meta_analysis(
+async def _try_meta_analysis(
     records: list,
     outcome_name: str,
     het_threshold: float,
@@ -124,33 +126,37 @@ def _try_meta_analysis(
     rendered_forest: str | None = None
     rendered_funnel: str | None = None
 
-    try:
-        rendered_forest = render_forest_plot(
+    # Forest and funnel plots are independent; render both concurrently off the event loop.
+    renders = [
+        render_figure(
+            render_forest_plot,
             effects=effects,
             variances=variances,
             labels=labels,
             output_path=forest_path,
             title=f"Forest plot: {outcome_name} ({effect_measure})",
         )
-        meta_result = meta_result.model_copy(update={"forest_plot_path": rendered_forest})
-    except Exception:
-        pass
-
+    ]
     if len(effects) >= funnel_min_studies:
-        try:
-            ses = [math.sqrt(v) for v in variances]
-            rendered_funnel = render_funnel_plot(
+        renders.append(
+            render_figure(
+                render_funnel_plot,
                 effect_sizes=effects,
-                standard_errors=ses,
+                standard_errors=[math.sqrt(v) for v in variances],
                 pooled_effect=meta_result.pooled_effect,
                 output_path=funnel_path,
                 title=f"Funnel plot: {outcome_name}",
                 minimum_studies=funnel_min_studies,
             )
-            if rendered_funnel:
-                meta_result = meta_result.model_copy(update={"funnel_plot_path": rendered_funnel})
-        except Exception:
-            pass
+        )
+    forest_out, *funnel_out = await asyncio.gather(*renders, return_exceptions=True)
+
+    if not isinstance(forest_out, BaseException):
+        rendered_forest = None if forest_out is None else str(forest_out)
+        meta_result = meta_result.model_copy(update={"forest_plot_path": rendered_forest})
+    if funnel_out and funnel_out[0] and not isinstance(funnel_out[0], BaseException):
+        rendered_funnel = str(funnel_out[0])
+        meta_result = meta_result.model_copy(update={"funnel_plot_path": rendered_funnel})
 
     return meta_result, rendered_forest, rendered_funnel
 
@@ -226,7 +232,7 @@ async def run_synthesis_node(state: ReviewState, ctx: GraphRunContext[ReviewStat
         effect_measure = state.settings.meta_analysis.effect_measure_continuous
         funnel_min = state.settings.meta_analysis.funnel_plot_minimum_studies
         for group in feasibility.groupings:
-            meta_result, rendered_forest, rendered_funnel = _try_meta_analysis(
+            meta_result, rendered_forest, rendered_funnel = await _try_meta_analysis(
                 records=state.extraction_records,
                 outcome_name=group,
                 het_threshold=het_threshold,
@@ -11,19 +11,24 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+from src.citation.index import citation_index_for_catalog
 from src.db.database import get_db
 from src.db.repositories import CitationRepository, WorkflowRepository
+from src.export.assembly_cache import ASSEMBLY_BLOCK_ASSET_TYPE, AssemblyBlockCache, input_fingerprint
 from src.export.markdown_refs import (
     _normalize_subsection_heading_layout,
     assemble_submission_manuscript,
     is_extraction_failed,
 )
+from src.fulltext.manifest import load_papers_manifest
 from src.llm.provider import LLMProvider
 from src.models import (
     ManuscriptAssembly,
     ManuscriptAsset,
 )
 from src.models.diagrams import (
+    DiagramBriefPack,
+    DiagramGenerationReport,
     DiagramPlacementPlan,
     DiagramStyleGuide,
     FlowchartDiagramInput,
@@ -38,6 +43,7 @@ from src.orchestration.helpers.writing_manuscript import (
     replace_template_tokens,
 )
 from src.orchestration.state import ReviewState
+from src.rag.paper_vectors import load_paper_vectors
 from src.synthesis.contradiction_detector import detect_contradictions
 from src.visualization.concept_diagrams import render_concept_diagrams
 from src.visualization.research_diagram_placement import plan_inline_diagram_placements
@@ -105,6 +111,38 @@ def _sanitize_section_body_for_assembly(section_key: str, raw_text: str) -> str:
     return text
 
 
+def _existing_paths_or_none(content: str) -> bool:
+    """True when every non-null path in a cached ``{key: path}`` JSON map still exists."""
+    try:
+        paths = json.loads(content)
+    except json.JSONDecodeError:
+        return False
+    return isinstance(paths, dict) and all(p is None or Path(p).is_file() for p in paths.values())
+
+
+def _report_outputs_exist(content: str) -> bool:
+    try:
+        report = DiagramGenerationReport.model_validate_json(content)
+    except ValueError:
+        return False
+    return all(Path(r.output_path).is_file() for r in report.results)
+
+
+async def _save_assembly_blocks(state: ReviewState, block_cache: AssemblyBlockCache) -> None:
+    """Persist blocks rebuilt since the last save (non-fatal)."""
+    dirty = block_cache.dirty_assets(state.workflow_id)
+    if not dirty:
+        return
+    try:
+        async with get_db(state.db_path) as db:
+            repo = WorkflowRepository(db)
+            for asset in dirty:
+                await repo.save_manuscript_asset(asset)
+        block_cache.mark_saved()
+    except Exception as exc:
+        logger.debug("Failed to persist manuscript assembly blocks (non-fatal): %s", exc)
+
+
 async def run_post_assembly(
     state: ReviewState,
     *,
@@ -132,6 +170,11 @@ async def run_post_assembly(
         if not included_ids:
             included_ids = await repository.get_included_paper_ids(state.workflow_id)
         included_papers_for_table = await repository.load_papers_by_ids(included_ids)
+        # Rendered tables, diagrams and the contradiction paragraph from the previous
+        # assembly; blocks whose inputs are unchanged are spliced in without rebuilding.
+        block_cache = AssemblyBlockCache.from_assets(
+            await repository.load_latest_manuscript_assets(state.workflow_id, ASSEMBLY_BLOCK_ASSET_TYPE)
+        )
 
     # --- Build titled sections and body ---
     titled_sections = []
@@ -186,27 +229,12 @@ async def run_post_assembly(
     # --- Contradiction detection pass ---
     if state.extraction_records and len(state.extraction_records) >= 2:
         try:
-            _chunk_embeddings: dict[str, list[float]] = {}
             async with get_db(state.db_path) as _emb_db:
-                async with _emb_db.execute(
-                    "SELECT paper_id, embedding FROM paper_chunks_meta WHERE workflow_id = ? AND embedding IS NOT NULL",
-                    (state.workflow_id,),
-                ) as _emb_cursor:
-                    _paper_vecs: dict[str, list[list[float]]] = {}
-                    async for _emb_row in _emb_cursor:
-                        try:
-                            _vec = json.loads(_emb_row[1])
-                            _paper_vecs.setdefault(_emb_row[0], []).append(_vec)
-                        except Exception:
-                            continue
-                for _pid, _vecs in _paper_vecs.items():
-                    if _vecs:
-                        _dim = len(_vecs[0])
-                        _chunk_embeddings[_pid] = [sum(v[i] for v in _vecs) / len(_vecs) for i in range(_dim)]
+                _paper_vectors = await load_paper_vectors(_emb_db, state.workflow_id)
 
             flags = detect_contradictions(
                 state.extraction_records,
-                chunk_embeddings=_chunk_embeddings if _chunk_embeddings else None,
+                paper_vectors=_paper_vectors if _paper_vectors.ids else None,
             )
             state.contradiction_flags = flags
 
@@ -215,15 +243,19 @@ async def run_post_assembly(
                 _contra_model = state.settings.agents.get(
                     "contradiction_resolver", state.settings.agents["writing"]
                 ).model
-                async with get_db(state.db_path) as _contra_db:
-                    _contra_repo = WorkflowRepository(_contra_db)
-                    contra_paragraph = await generate_contradiction_paragraph(
-                        flags,
-                        model_name=_contra_model,
-                        api_key=None,
-                        repository=_contra_repo,
-                        workflow_id=state.workflow_id,
-                    )
+                _contra_key = input_fingerprint("contradiction_paragraph", flags, _contra_model, _use_llm_contra)
+                contra_paragraph = block_cache.lookup("contradiction_paragraph", _contra_key)
+                if contra_paragraph is None:
+                    async with get_db(state.db_path) as _contra_db:
+                        _contra_repo = WorkflowRepository(_contra_db)
+                        contra_paragraph = await generate_contradiction_paragraph(
+                            flags,
+                            model_name=_contra_model,
+                            api_key=None,
+                            repository=_contra_repo,
+                            workflow_id=state.workflow_id,
+                        )
+                    block_cache.store("contradiction_paragraph", _contra_key, contra_paragraph)
                 if contra_paragraph and "## Discussion" in body:
                     _disc_marker = "## Discussion"
                     _disc_idx = body.index(_disc_marker) + len(_disc_marker)
@@ -258,11 +290,7 @@ async def run_post_assembly(
 
     # --- Citation grounding verification ---
     if citation_catalog:
-        _valid_citekeys = [
-            line.strip()[1 : line.strip().index("]")]
-            for line in citation_catalog.splitlines()
-            if line.strip().startswith("[") and "]" in line.strip()
-        ]
+        _valid_citekeys = citation_index_for_catalog(citation_catalog)
         if _valid_citekeys:
             _verified, _hallucinated = verify_citation_grounding(body, _valid_citekeys, "full_manuscript")
             if _hallucinated:
@@ -386,10 +414,10 @@ async def run_post_assembly(
 
     _papers_manifest_path = Path(state.artifacts.get("papers_manifest", ""))
     _fulltext_paper_ids: set[str] = set()
-    if _papers_manifest_path.exists():
+    if _papers_manifest_path.name:
         try:
             _manifest_dir = _papers_manifest_path.parent
-            _manifest_data = json.loads(_papers_manifest_path.read_text(encoding="utf-8"))
+            _manifest_data = load_papers_manifest(_papers_manifest_path)
             for _pid, _entry in _manifest_data.items():
                 _fp_raw = (_entry or {}).get("file_path", "")
                 if not _fp_raw:
@@ -434,6 +462,7 @@ async def run_post_assembly(
         fulltext_paper_ids=_fulltext_paper_ids if _fulltext_paper_ids else None,
         diagram_placement_plan_path=state.artifacts.get("diagram_placement_plan", ""),
         ir_validated=True,
+        block_cache=block_cache,
     )
     manuscript_path.write_text(full_manuscript, encoding="utf-8")
 
@@ -516,6 +545,10 @@ async def run_post_assembly(
                     for s in _latest_sections
                 ],
                 "assets": [{"asset_key": a.asset_key, "version": a.version} for a in _assets],
+                "blocks": {
+                    "reused": sorted(set(block_cache.reused)),
+                    "rebuilt": sorted(set(block_cache.rebuilt)),
+                },
             }
             await _asm_repo.save_manuscript_assembly(
                 ManuscriptAssembly(
@@ -528,6 +561,7 @@ async def run_post_assembly(
             )
     except Exception as asm_exc:
         logger.debug("Failed to persist markdown manuscript assembly (non-fatal): %s", asm_exc)
+    await _save_assembly_blocks(state, block_cache)
     await save_subphase_checkpoint("phase_6d_assembly", papers_processed=len(SECTIONS))
 
     # --- Concept diagrams (LLM -> Graphviz/Kroki -> SVG) ---
@@ -612,22 +646,47 @@ async def run_post_assembly(
             "concept_diagrams", state.settings.agents.get("abstract_generation", state.settings.agents["writing"])
         ).model
         _concept_style_seed = f"{state.workflow_id}|{_topic[:280]}"
-        async with get_db(state.db_path) as _cd_db:
-            _cd_repo = WorkflowRepository(_cd_db)
-            _cd_provider = LLMProvider(state.settings, _cd_repo)
-            _concept_results = await asyncio.wait_for(
-                render_concept_diagrams(
-                    taxonomy_spec=_taxonomy_spec,
-                    framework_spec=_framework_spec,
-                    flowchart_spec=_flowchart_spec,
-                    out_dir=_out_dir,
-                    model=_concept_model,
-                    style_seed=_concept_style_seed,
-                    provider=_cd_provider,
-                    workflow_id=state.workflow_id,
-                ),
-                timeout=180.0,
-            )
+        _concept_key = input_fingerprint(
+            "concept_diagrams",
+            _taxonomy_spec,
+            _framework_spec,
+            _flowchart_spec,
+            _concept_model,
+            _concept_style_seed,
+            str(_out_dir),
+        )
+        _cached_concepts = block_cache.lookup("concept_diagrams", _concept_key, valid=_existing_paths_or_none)
+        if _cached_concepts is not None:
+            _concept_results = {k: Path(v) if v else None for k, v in json.loads(_cached_concepts).items()}
+        else:
+            async with get_db(state.db_path) as _cd_db:
+                _cd_repo = WorkflowRepository(_cd_db)
+                _cd_provider = LLMProvider(state.settings, _cd_repo)
+                _concept_results = await asyncio.wait_for(
+                    render_concept_diagrams(
+                        taxonomy_spec=_taxonomy_spec,
+                        framework_spec=_framework_spec,
+                        flowchart_spec=_flowchart_spec,
+                        out_dir=_out_dir,
+                        model=_concept_model,
+                        style_seed=_concept_style_seed,
+                        provider=_cd_provider,
+                        workflow_id=state.workflow_id,
+                    ),
+                    timeout=180.0,
+                )
+            _requested = {
+                "taxonomy": _taxonomy_spec,
+                "framework": _framework_spec,
+                "flowchart": _flowchart_spec,
+            }
+            # Only cache complete renders so a failed diagram is retried next time.
+            if all(_concept_results.get(k) for k, spec in _requested.items() if spec is not None):
+                block_cache.store(
+                    "concept_diagrams",
+                    _concept_key,
+                    json.dumps({k: str(v) if v else None for k, v in _concept_results.items()}),
+                )
         if rc and rc.verbose:
             for _key, _path in _concept_results.items():
                 if _path:
@@ -647,12 +706,9 @@ async def run_post_assembly(
         _topic = state.review.research_question if state.review else "Systematic Review"
         _rq = state.review.research_question if state.review else _topic
         _manifest_path = Path(state.artifacts.get("papers_manifest", ""))
-        _manifest_entries: dict[str, dict] | list[dict] = {}
-        if _manifest_path.exists():
-            try:
-                _manifest_entries = json.loads(_manifest_path.read_text(encoding="utf-8"))
-            except Exception as _manifest_exc:  # noqa: BLE001
-                logger.warning("Custom diagram: invalid papers manifest: %s", _manifest_exc)
+        _manifest_entries: dict[str, dict] | list[dict] = (
+            load_papers_manifest(_manifest_path) if _manifest_path.name else {}
+        )
 
         async with get_db(state.db_path) as _dg_db:
             _dg_repo = WorkflowRepository(_dg_db)
@@ -708,17 +764,32 @@ async def run_post_assembly(
                 "research_diagram_preparer",
                 state.settings.agents.get("concept_diagrams", state.settings.agents["writing"]),
             )
-            _brief_pack, _prep_usage = await prepare_research_diagram_briefs(
-                workflow_id=state.workflow_id,
-                review_topic=_topic,
-                research_question=_rq,
-                included_studies=_included_rows,
-                extraction_summaries=_extraction_rows,
-                manifest_entries=_manifest_entries,
-                model=_prep_agent.model,
-                temperature=_prep_agent.temperature,
-                provider=_dg_provider,
+            _brief_key = input_fingerprint(
+                "diagram_briefs",
+                _topic,
+                _rq,
+                _included_rows,
+                _extraction_rows,
+                _manifest_entries,
+                _prep_agent.model,
+                _prep_agent.temperature,
             )
+            _cached_briefs = block_cache.lookup("diagram_briefs", _brief_key)
+            if _cached_briefs is not None:
+                _brief_pack = DiagramBriefPack.model_validate_json(_cached_briefs)
+            else:
+                _brief_pack, _prep_usage = await prepare_research_diagram_briefs(
+                    workflow_id=state.workflow_id,
+                    review_topic=_topic,
+                    research_question=_rq,
+                    included_studies=_included_rows,
+                    extraction_summaries=_extraction_rows,
+                    manifest_entries=_manifest_entries,
+                    model=_prep_agent.model,
+                    temperature=_prep_agent.temperature,
+                    provider=_dg_provider,
+                )
+                block_cache.store("diagram_briefs", _brief_key, _brief_pack.model_dump_json())
             _brief_path = Path(state.artifacts.get("diagram_brief_pack", ""))
             if _brief_path.name:
                 _brief_path.write_text(_brief_pack.model_dump_json(indent=2), encoding="utf-8")
@@ -729,17 +800,29 @@ async def run_post_assembly(
                 state.settings.agents.get("writing"),
             )
             _placement_usage: dict[str, int] = {}
-            try:
-                _placement_plan, _placement_usage = await plan_inline_diagram_placements(
-                    workflow_id=state.workflow_id,
-                    brief_pack=_brief_pack,
-                    manuscript_body=body,
-                    model=_placement_agent.model,
-                    temperature=_placement_agent.temperature,
-                    provider=_dg_provider,
-                )
-            except Exception as _placement_exc:  # noqa: BLE001
-                logger.warning("Custom diagram placement planning failed: %s", _placement_exc)
+            _placement_key = input_fingerprint(
+                "diagram_placement",
+                _brief_key,
+                body,
+                _placement_agent.model,
+                _placement_agent.temperature,
+            )
+            _cached_placement = block_cache.lookup("diagram_placement", _placement_key)
+            if _cached_placement is not None:
+                _placement_plan = DiagramPlacementPlan.model_validate_json(_cached_placement)
+            else:
+                try:
+                    _placement_plan, _placement_usage = await plan_inline_diagram_placements(
+                        workflow_id=state.workflow_id,
+                        brief_pack=_brief_pack,
+                        manuscript_body=body,
+                        model=_placement_agent.model,
+                        temperature=_placement_agent.temperature,
+                        provider=_dg_provider,
+                    )
+                    block_cache.store("diagram_placement", _placement_key, _placement_plan.model_dump_json())
+                except Exception as _placement_exc:  # noqa: BLE001
+                    logger.warning("Custom diagram placement planning failed: %s", _placement_exc)
             _placement_path = Path(state.artifacts.get("diagram_placement_plan", ""))
             if _placement_path.name:
                 _placement_path.write_text(_placement_plan.model_dump_json(indent=2), encoding="utf-8")
@@ -766,22 +849,38 @@ async def run_post_assembly(
                 paper_id_to_citekey=_paper_id_to_citekey if _paper_id_to_citekey else None,
             )
 
-            _report = await asyncio.wait_for(
-                render_custom_research_diagrams(
-                    brief_pack=_brief_pack,
-                    out_dir=Path(state.output_dir),
-                    drawing_model=_drawing_agent.model,
-                    critic_model=_critic_agent.model,
-                    style_guide=_style,
-                    max_rounds=int(getattr(_dg_cfg, "max_rounds", 1) or 1),
-                    image_size=str(getattr(_dg_cfg, "image_size", "2K")),
-                    aspect_ratio=str(getattr(_dg_cfg, "aspect_ratio", "16:9")),
-                    repository=_dg_repo,
-                    provider=_dg_provider,
-                    paper_id_to_label=_paper_id_to_label,
-                ),
-                timeout=420.0,
+            _render_key = input_fingerprint(
+                "custom_diagrams",
+                _brief_key,
+                str(state.output_dir),
+                _drawing_agent.model,
+                _critic_agent.model,
+                _style,
+                _dg_cfg,
+                _paper_id_to_label,
             )
+            _cached_report = block_cache.lookup("custom_diagrams", _render_key, valid=_report_outputs_exist)
+            if _cached_report is not None:
+                _report = DiagramGenerationReport.model_validate_json(_cached_report)
+            else:
+                _report = await asyncio.wait_for(
+                    render_custom_research_diagrams(
+                        brief_pack=_brief_pack,
+                        out_dir=Path(state.output_dir),
+                        drawing_model=_drawing_agent.model,
+                        critic_model=_critic_agent.model,
+                        style_guide=_style,
+                        max_rounds=int(getattr(_dg_cfg, "max_rounds", 1) or 1),
+                        image_size=str(getattr(_dg_cfg, "image_size", "2K")),
+                        aspect_ratio=str(getattr(_dg_cfg, "aspect_ratio", "16:9")),
+                        repository=_dg_repo,
+                        provider=_dg_provider,
+                        paper_id_to_label=_paper_id_to_label,
+                    ),
+                    timeout=420.0,
+                )
+                if _report.results and not _report.warnings:
+                    block_cache.store("custom_diagrams", _render_key, _report.model_dump_json())
 
         for _result in _report.results:
             _decision = next(
@@ -831,8 +930,16 @@ async def run_post_assembly(
             fulltext_paper_ids=_fulltext_paper_ids if _fulltext_paper_ids else None,
             diagram_placement_plan_path=state.artifacts.get("diagram_placement_plan", ""),
             ir_validated=True,
+            block_cache=block_cache,
         )
         manuscript_path.write_text(patched, encoding="utf-8")
         logger.info("WritingNode: manuscript patched with concept diagram figures")
     except Exception as _patch_exc:  # noqa: BLE001
         logger.warning("WritingNode: concept diagram manuscript patch failed (non-fatal): %s", _patch_exc)
+    await _save_assembly_blocks(state, block_cache)
+    if block_cache.reused:
+        logger.info(
+            "WritingNode: assembly reused %d cached block(s), rebuilt %d",
+            len(set(block_cache.reused)),
+            len(set(block_cache.rebuilt)),
+        )
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+from src.citation.index import citation_index_for_catalog
 from src.db.repositories import CitationRepository, WorkflowRepository
 from src.llm.provider import LLMProvider
 from src.models import SectionDraft, SectionOutline
@@ -17,6 +19,7 @@ from src.orchestration.runners.writing.rag_retrieval import (
     generate_hyde_documents,
     retrieve_rag_for_section,
 )
+from src.orchestration.runners.writing.section_scheduler import run_section_dag
 from src.orchestration.state import ReviewState
 from src.rag.retriever import RAGRetriever
 from src.writing.citation_grounding import verify_citation_grounding
@@ -34,7 +37,12 @@ from src.writing.orchestration import (
     write_section_with_validation,
 )
 from src.writing.outline_generator import build_fallback_section_outline, generate_section_outline
-from src.writing.prompts.sections import SECTIONS, get_section_context, get_section_word_limit
+from src.writing.prompts.sections import (
+    SECTION_DEPENDENCIES,
+    SECTIONS,
+    get_section_context,
+    get_section_word_limit,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +65,38 @@ def _rc_print(rc, message):
     helper_rc_print(rc, message)
 
 
+# Minimum gap between streamed section_preview events for one section.
+_PREVIEW_MIN_INTERVAL_SECONDS = 1.0
+
+
+def _section_preview_emitter(rc, section: str, stage: str) -> Callable[[str], None] | None:
+    """Return a throttled callback forwarding streamed text as ``section_preview`` events.
+
+    Returns None when the run context has no event stream (CLI runs), which
+    keeps the writer and humanizer on their non-streaming calls.
+    """
+    if rc is None or not hasattr(rc, "_emit"):
+        return None
+    last_sent = [0.0]
+
+    def _emit_preview(text: str) -> None:
+        now = time.monotonic()
+        if not text or now - last_sent[0] < _PREVIEW_MIN_INTERVAL_SECONDS:
+            return
+        last_sent[0] = now
+        rc._emit(
+            {
+                "type": "section_preview",
+                "section": section,
+                "stage": stage,
+                "text": text,
+                "word_count": len(text.split()),
+            }
+        )
+
+    return _emit_preview
+
+
 @dataclass
 class SectionLoopResult:
     """Results from the section writing loop."""
@@ -81,7 +121,7 @@ async def run_section_writing_loop(
     save_writing_checkpoint: Callable,
     save_subphase_checkpoint: Callable,
 ) -> SectionLoopResult:
-    """Execute the section writing loop: HyDE, outlines, per-section RAG+write, phase A/B, retries."""
+    """Execute the section writing loop: HyDE, outlines, per-section RAG+write on the section DAG, retries."""
     result = SectionLoopResult()
     _section_results_by_key: dict[str, object] = {}
 
@@ -298,6 +338,7 @@ async def run_section_writing_loop(
                         rag_context=rag_context,
                         prior_sections_context=prior_sections_context,
                         outline=section_outlines.get(section),
+                        on_partial=_section_preview_emitter(rc, section, "draft"),
                     ),
                     timeout=_section_write_timeout,
                 )
@@ -317,11 +358,7 @@ async def run_section_writing_loop(
                 humanizer_agent = state.settings.agents["humanizer"]
                 h_model = humanizer_agent.model
                 h_temp = humanizer_agent.temperature
-                _valid_citekeys_local = [
-                    line.strip()[1 : line.strip().index("]")]
-                    for line in citation_catalog.splitlines()
-                    if line.strip().startswith("[") and "]" in line.strip()
-                ]
+                _valid_citekeys_local = citation_index_for_catalog(citation_catalog)
                 if rc and rc.verbose:
                     _rc_print(rc, f"    Humanizing {section} ({humanize_iters} pass(es))...")
                 for _ in range(humanize_iters):
@@ -340,6 +377,7 @@ async def run_section_writing_loop(
                                 provider=provider if use_llm_write else None,
                                 enable_verification_repair=bool(humanize_verify_repair),
                                 repair_max_per_pass=int(humanize_repair_max),
+                                on_partial=_section_preview_emitter(rc, section, "humanize"),
                             ),
                             timeout=_humanizer_timeout,
                         )
@@ -441,53 +479,33 @@ async def run_section_writing_loop(
                 rc.advance_screening("phase_6_writing", _sections_done[0], len(SECTIONS))
             return i, _content
 
-    # --- Phase A: abstract, introduction, methods, results ---
-    _PHASE_A_SECTIONS = ["abstract", "introduction", "methods", "results"]
-    _PHASE_B_SECTIONS = ["discussion", "conclusion"]
-
-    def _collect_results(
-        phase_sections: list[str],
-        phase_results: list,
-    ) -> tuple[list[tuple[int, str]], list[str]]:
-        """Extract (index, content) pairs and failed section names."""
-        ordered: list[tuple[int, str]] = []
-        failed: list[str] = []
-        for sec, res in zip(phase_sections, phase_results):
-            if isinstance(res, BaseException):
-                logger.error(
-                    "Writing task failed for section '%s' (%s: %s). Check API quota for the writing model.",
-                    sec,
-                    type(res).__name__,
-                    str(res)[:200],
-                )
-                failed.append(sec)
-            elif isinstance(res, tuple):
-                ordered.append(res)
-        return ordered, failed
-
-    _phase_a_results = await asyncio.gather(
-        *[_write_one_section(SECTIONS.index(s), s) for s in _PHASE_A_SECTIONS if s in SECTIONS],
-        return_exceptions=True,
-    )
-    _ordered_a, _failed_a = _collect_results(
-        [s for s in _PHASE_A_SECTIONS if s in SECTIONS],
-        _phase_a_results,
+    # --- Section scheduling: each section starts once its SECTION_DEPENDENCIES settle ---
+    # Subphase checkpoints are kept for resume/rewind bookkeeping; each is saved
+    # (in order) once all of its sections have settled.
+    _CHECKPOINT_GROUPS = (
+        ("phase_6b_phase_a", ("abstract", "introduction", "methods", "results")),
+        ("phase_6c_phase_b", ("discussion", "conclusion")),
     )
-    await save_subphase_checkpoint("phase_6b_phase_a", papers_processed=len(_ordered_a))
-
-    # Build prior context for Phase B from Results
-    _section_a_cache: dict[str, str] = {}
-    for _, _acontent in _ordered_a:
-        pass
-    for sec, res in zip([s for s in _PHASE_A_SECTIONS if s in SECTIONS], _phase_a_results):
-        if isinstance(res, tuple):
-            _section_a_cache[sec] = res[1]
-
-    _results_draft = _section_a_cache.get("results", "")
-
-    def _build_prior_ctx(for_section: str) -> str:
-        """Build PRIOR SECTIONS CONTEXT block for Discussion/Conclusion."""
-        if not _results_draft:
+    _settled: set[str] = set()
+    _succeeded: set[str] = set()
+    _checkpoints_saved: list[str] = []
+    _checkpoint_lock = asyncio.Lock()
+
+    async def _on_section_settled(section: str) -> None:
+        _settled.add(section)
+        async with _checkpoint_lock:
+            for name, group in _CHECKPOINT_GROUPS:
+                if name in _checkpoints_saved:
+                    continue
+                members = [s for s in group if s in SECTIONS]
+                if not all(s in _settled for s in members):
+                    break
+                await save_subphase_checkpoint(name, papers_processed=sum(s in _succeeded for s in members))
+                _checkpoints_saved.append(name)
+
+    def _build_prior_ctx(for_section: str, results_draft: str) -> str:
+        """Build PRIOR SECTIONS CONTEXT block for sections that depend on Results."""
+        if not results_draft or "results" not in SECTION_DEPENDENCIES.get(for_section, ()):
             return ""
         _max_chars = 2000 if for_section == "discussion" else 900
         _rule = (
@@ -510,37 +528,49 @@ async def run_section_writing_loop(
             "---\n"
             "PRIOR SECTIONS CONTEXT (do not re-state; build on this):\n\n"
             "=== RESULTS SUMMARY (first ~2000 chars) ===\n"
-            + _results_draft[:_max_chars]
+            + results_draft[:_max_chars]
             + "\n=== END PRIOR SECTIONS ===\n\n"
             + _rule
             + "\n---"
         )
 
-    # --- Phase B: discussion, conclusion ---
-    _phase_b_results = await asyncio.gather(
-        *[_write_one_section(SECTIONS.index(s), s, _build_prior_ctx(s)) for s in _PHASE_B_SECTIONS if s in SECTIONS],
-        return_exceptions=True,
-    )
-    _ordered_b, _failed_b = _collect_results(
-        [s for s in _PHASE_B_SECTIONS if s in SECTIONS],
-        _phase_b_results,
-    )
-    await save_subphase_checkpoint("phase_6c_phase_b", papers_processed=len(_ordered_b))
+    async def _write_scheduled(section: str, inputs: dict[str, tuple[int, str]]) -> tuple[int, str]:
+        _results_draft = inputs["results"][1] if "results" in inputs else ""
+        written = await _write_one_section(SECTIONS.index(section), section, _build_prior_ctx(section, _results_draft))
+        _succeeded.add(section)
+        return written
+
+    _outcomes = await run_section_dag(SECTIONS, _write_scheduled, on_settled=_on_section_settled)
+
+    _ordered: list[tuple[int, str]] = []
+    _failed_sections: list[str] = []
+    for sec, res in _outcomes.items():
+        if isinstance(res, BaseException):
+            logger.error(
+                "Writing task failed for section '%s' (%s: %s). Check API quota for the writing model.",
+                sec,
+                type(res).__name__,
+                str(res)[:200],
+            )
+            _failed_sections.append(sec)
+        else:
+            _ordered.append(res)
+    _results_outcome = _outcomes.get("results")
+    _results_draft = _results_outcome[1] if isinstance(_results_outcome, tuple) else ""
 
     # --- Retry failed sections ---
-    _failed_sections = _failed_a + _failed_b
     if _failed_sections:
         logger.warning(
             "WritingNode: retrying %d failed section(s) sequentially: %s",
             len(_failed_sections),
             ", ".join(_failed_sections),
         )
-        _retry_ok: list[tuple[int, str]] = []
         _retry_failed: list[str] = []
         for _sec in _failed_sections:
             try:
-                _prior_ctx = _build_prior_ctx(_sec) if _sec in _PHASE_B_SECTIONS else ""
-                _retry_ok.append(await _write_one_section(SECTIONS.index(_sec), _sec, _prior_ctx))
+                _ordered.append(
+                    await _write_one_section(SECTIONS.index(_sec), _sec, _build_prior_ctx(_sec, _results_draft))
+                )
             except Exception as _retry_exc:
                 logger.error(
                     "Writing retry failed for section '%s' (%s: %s)",
@@ -549,13 +579,10 @@ async def run_section_writing_loop(
                     str(_retry_exc)[:200],
                 )
                 _retry_failed.append(_sec)
-        _ordered_a = _ordered_a + _retry_ok
         _failed_sections = _retry_failed
-    else:
-        _failed_sections = []
 
     # --- Assemble ordered sections ---
-    _ordered = sorted(_ordered_a + _ordered_b, key=lambda t: t[0])
+    _ordered.sort(key=lambda t: t[0])
     sections_written_raw = {idx: content for idx, content in _ordered}
     sections_written = [sections_written_raw.get(i, "") for i in range(len(SECTIONS))]
 
@@ -0,0 +1,56 @@
+"""Dependency-driven section scheduling for the writing phase.
+
+Each section starts as soon as the sections it depends on
+(``SECTION_DEPENDENCIES``) have settled, instead of waiting for a whole
+group of sections to finish.  A failed dependency does not block its
+dependents: they run without that input, as the writer already handles a
+missing prior-sections context.  Concurrency is bounded by the ``write``
+callable (the writing semaphore), so sections that are waiting on inputs
+do not take a slot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from graphlib import TopologicalSorter
+from typing import TypeVar
+
+from src.writing.prompts.sections import SECTION_DEPENDENCIES
+
+T = TypeVar("T")
+
+
+async def run_section_dag(
+    sections: Sequence[str],
+    write: Callable[[str, dict[str, T]], Awaitable[T]],
+    *,
+    dependencies: Mapping[str, Sequence[str]] = SECTION_DEPENDENCIES,
+    on_settled: Callable[[str], Awaitable[None]] | None = None,
+) -> dict[str, T | BaseException]:
+    """Run ``write(section, dependency_results)`` for every section in dependency order.
+
+    ``dependency_results`` holds the successful results of the section's
+    dependencies that are part of ``sections``.  ``on_settled`` is awaited after
+    each section finishes or fails.  Returns results (or the raised exception)
+    keyed by section, in ``sections`` order.  Raises ``graphlib.CycleError``
+    when the dependencies contain a cycle.
+    """
+    wanted = set(sections)
+    graph = {s: [d for d in dependencies.get(s, ()) if d in wanted] for s in sections}
+    tasks: dict[str, asyncio.Task[T]] = {}
+
+    async def _run(section: str) -> T:
+        deps = graph[section]
+        settled = await asyncio.gather(*(tasks[d] for d in deps), return_exceptions=True)
+        inputs = {d: r for d, r in zip(deps, settled) if not isinstance(r, BaseException)}
+        try:
+            return await write(section, inputs)
+        finally:
+            if on_settled is not None:
+                await on_settled(section)
+
+    for section in TopologicalSorter(graph).static_order():
+        tasks[section] = asyncio.create_task(_run(section), name=f"write-section-{section}")
+    results = await asyncio.gather(*(tasks[s] for s in sections), return_exceptions=True)
+    return dict(zip(sections, results))
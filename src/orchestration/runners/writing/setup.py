@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import pathlib
@@ -15,7 +16,7 @@ from src.orchestration.helpers.runtime import rc as helper_rc
 from src.orchestration.helpers.writing_manuscript import build_minimal_sections_for_zero_papers
 from src.orchestration.state import ReviewState
 from src.prisma import build_prisma_counts, render_prisma_diagram
-from src.visualization import render_geographic, render_timeline
+from src.visualization import render_figure, render_geographic, render_timeline
 from src.writing.context_builder import build_writing_grounding
 from src.writing.orchestration import (
     prepare_writing_context,
@@ -110,9 +111,11 @@ async def run_writing_setup(
         included_qualitative=0,
         included_quantitative=len(_canonical_included_ids_for_prisma),
     )
-    render_prisma_diagram(prisma_counts, state.artifacts["prisma_diagram"])
-    render_timeline(state.included_papers, state.artifacts["timeline"])
-    render_geographic(state.included_papers, state.artifacts["geographic"])
+    await asyncio.gather(
+        render_figure(render_prisma_diagram, prisma_counts, output_path=state.artifacts["prisma_diagram"]),
+        render_figure(render_timeline, state.included_papers, output_path=state.artifacts["timeline"]),
+        render_figure(render_geographic, state.included_papers, output_path=state.artifacts["geographic"]),
+    )
     if rc and rc.verbose:
         _rc_print(rc, f"  PRISMA: {prisma_counts} -> {Path(state.artifacts['prisma_diagram']).name}")
         _rc_print(rc, f"  Timeline: {Path(state.artifacts['timeline']).name}")
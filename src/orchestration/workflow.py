@@ -11,10 +11,12 @@ import logging
 import os
 import signal
 
-from pydantic_graph import Graph
+from pydantic_graph import BaseNode, End, Graph
 
 from src.config.loader import load_configs
+from src.db.connection_manager import runtime_db_scope
 from src.db.database import get_db
+from src.db.query_profiler import QueryProfiler
 from src.db.repositories import WorkflowRepository
 from src.db.workflow_registry import (
     find_by_topic,
@@ -31,6 +33,7 @@ from src.models import (
     WorkflowRunResult,
     WorkflowStepRecord,
 )
+from src.models.config import DiagnosticsConfig
 from src.orchestration.context import RunContext
 from src.orchestration.embedding_node import EmbeddingNode
 from src.orchestration.helpers.extraction_metrics import (
@@ -42,6 +45,7 @@ from src.orchestration.helpers.extraction_metrics import (
 from src.orchestration.helpers.extraction_metrics import (
     load_fulltext_artifact_paper_ids as helper_load_fulltext_artifact_paper_ids,
 )
+from src.orchestration.helpers.living_review import find_update_parent
 from src.orchestration.helpers.manuscript_gate import (
     collect_manuscript_gate_failure_reasons as helper_collect_manuscript_gate_failure_reasons,
 )
@@ -336,6 +340,47 @@ RUN_GRAPH = Graph(
 # ---------------------------------------------------------------------------
 
 
+async def _run_graph(
+    start: BaseNode[ReviewState, None, WorkflowRunResult],
+    state: ReviewState,
+    diagnostics: DiagnosticsConfig | None = None,
+) -> WorkflowRunResult:
+    """Run RUN_GRAPH inside a runtime.db connection scope, labelling each node as a phase."""
+    profiler = (
+        QueryProfiler(
+            slow_query_ms=diagnostics.slow_query_ms,
+            explain_slow_queries=diagnostics.explain_slow_queries,
+        )
+        if diagnostics is not None and diagnostics.db_profiling
+        else None
+    )
+    try:
+        async with runtime_db_scope(profiler=profiler) as db_scope:
+            async with RUN_GRAPH.iter(start, state=state) as graph_run:
+                db_scope.set_phase(type(start).__name__)
+                async for node in graph_run:
+                    if not isinstance(node, End):
+                        db_scope.set_phase(type(node).__name__)
+            result = graph_run.result
+    finally:
+        if profiler is not None:
+            await _persist_query_profile(state, profiler)
+    if result is None:
+        raise RuntimeError("Workflow graph ended without a result")
+    return result.output
+
+
+async def _persist_query_profile(state: ReviewState, profiler: QueryProfiler) -> None:
+    rows = profiler.rows()
+    if not rows or not state.db_path or not state.workflow_id:
+        return
+    try:
+        async with get_db(state.db_path) as db:
+            await WorkflowRepository(db).save_query_profile(state.workflow_id, rows)
+    except Exception:
+        logger.warning("Failed to persist query profile for %s", state.workflow_id, exc_info=True)
+
+
 def _make_sigint_handler(rc: RunContext):
     """Return a SIGINT handler that sets proceed_with_partial on first Ctrl+C, aborts on second."""
 
@@ -400,9 +445,7 @@ async def run_workflow_resume(
             loop.add_signal_handler(signal.SIGINT, _make_sigint_handler(run_context))
         except NotImplementedError:
             pass
-    start = ResumeStartNode()
-    result = await RUN_GRAPH.run(start, state=state)
-    return result.output
+    return await _run_graph(ResumeStartNode(), state, state.settings.diagnostics if state.settings else None)
 
 
 async def run_workflow(
@@ -413,8 +456,19 @@ async def run_workflow(
     fresh: bool = False,
     parent_db_path: str | None = None,
     workflow_id: str | None = None,
+    update: bool = False,
 ) -> WorkflowRunResult:
     review, settings = load_configs(review_path, settings_path)
+    if update and not parent_db_path:
+        parent = await find_update_parent(run_root, review.research_question)
+        if parent is None:
+            raise FileNotFoundError(
+                f"No completed workflow for this topic under {run_root!r} to update; run a full review first."
+            )
+        logger.info("Living-review update from workflow %s (%s)", parent.workflow_id, parent.db_path)
+        parent_db_path = parent.db_path
+    if parent_db_path:
+        fresh = True
     config_hash = _hash_config(review_path)
     matches = await find_by_topic(run_root, review.research_question, config_hash)
     resumable = [m for m in matches if m.status != "completed"]
@@ -475,8 +529,7 @@ async def run_workflow(
         parent_db_path=parent_db_path,
         workflow_id=(workflow_id or "").strip(),
     )
-    result = await RUN_GRAPH.run(start, state=initial)
-    return result.output
+    return await _run_graph(start, initial, settings.diagnostics)
 
 
 def run_workflow_sync(
@@ -485,6 +538,7 @@ def run_workflow_sync(
     run_root: str = "runs",
     run_context: RunContext | None = None,
     fresh: bool = False,
+    update: bool = False,
 ) -> WorkflowRunResult:
     return asyncio.run(
         run_workflow(
@@ -493,5 +547,6 @@ def run_workflow_sync(
             run_root=run_root,
             run_context=run_context,
             fresh=fresh,
+            update=update,
         )
     )
@@ -1,5 +1,14 @@
 """PRISMA 2020 flow diagram and related utilities."""
 
-from src.prisma.diagram import build_prisma_counts, render_prisma_diagram
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from src.prisma.diagram import build_prisma_counts, render_prisma_diagram
 
 __all__ = ["build_prisma_counts", "render_prisma_diagram"]
+
+__getattr__ = lazy_exports(__name__, dict.fromkeys(__all__, "src.prisma.diagram"))
@@ -5,12 +5,11 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import matplotlib.patches as mpatches
-import matplotlib.pyplot as plt
-
 from src.models import PRISMACounts
 
 if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
     from src.db.repositories import WorkflowRepository
 
 _EXCLUSION_REASON_LABELS: dict[str, str] = {
@@ -131,6 +130,8 @@ def _draw_box(
     text: str,
     fontsize: int = 9,
 ) -> None:
+    import matplotlib.patches as mpatches
+
     rect = mpatches.FancyBboxPatch(
         (x, y), w, h, boxstyle="round,pad=0.02", fill=True, facecolor="white", edgecolor="black"
     )
@@ -144,6 +145,9 @@ def _draw_arrow(ax: plt.Axes, x1: float, y1: float, x2: float, y2: float) -> Non
 
 def _render_fallback(counts: PRISMACounts, path: Path) -> Path:
     """Custom matplotlib fallback when prisma-flow-diagram is unavailable."""
+    # matplotlib loads on first render; build_prisma_counts callers never pay for it.
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(12, 10))
     ax.set_xlim(0, 10)
     ax.set_ylim(0, 12)
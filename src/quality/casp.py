@@ -9,7 +9,7 @@ from pydantic import BaseModel
 from src.llm.base_client import LLMBackend
 from src.models import CaspAssessment, ExtractionRecord
 from src.models.config import SettingsConfig
-from src.quality.runner import QualityLLMRunner
+from src.quality.runner import QualityBatcher, QualityLLMRunner, single_study_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -26,43 +26,51 @@ class _CaspLLMResponse(BaseModel):
     overall_summary: str = ""
 
 
-def _build_casp_prompt(record: ExtractionRecord, full_text: str) -> str:
+_CASP_INSTRUCTIONS = "\n".join(
+    [
+        "You are an expert systematic review methodologist.",
+        "Assess the qualitative study below using the CASP (Critical Appraisal Skills Programme) checklist.",
+        "",
+        (
+            "If only abstract/results text is available (no full text), use strict conservative scoring: "
+            "set all criteria to false unless the criterion is explicitly supported by the provided text."
+        ),
+        "Answer each CASP question as true or false:",
+        "1. design_appropriate: Was a qualitative methodology appropriate for this research question?",
+        "2. recruitment_strategy: Was the recruitment strategy appropriate to the aims of the research?",
+        "3. data_collection_rigorous: Was the data collection sufficiently rigorous?",
+        "4. reflexivity_considered: Was the relationship between researcher and participants considered?",
+        "5. ethics_considered: Have ethical issues been taken into consideration?",
+        "6. analysis_rigorous: Was the data analysis sufficiently rigorous?",
+        "7. findings_clear: Is there a clear statement of findings?",
+        "8. value_of_research: How valuable is the research?",
+        "Also provide a brief overall_summary (1-2 sentences).",
+    ]
+)
+
+
+def _casp_study_block(record: ExtractionRecord, full_text: str) -> str:
     results = record.results_summary.get("summary", "")[:2000]
     has_full_text = bool(full_text.strip()) and len(full_text.strip()) > 200
     text_source = "full text excerpt" if has_full_text else "abstract/results summary (full text unavailable)"
     text_excerpt = full_text[:3000] if has_full_text else results
     return "\n".join(
         [
-            "You are an expert systematic review methodologist.",
-            "Assess this qualitative study using the CASP (Critical Appraisal Skills Programme) checklist.",
-            "",
             f"Intervention / topic: {record.intervention_description[:400]}",
             f"Results summary: {results}",
             f"Text source: {text_source}",
             "",
             "Text excerpt:",
             text_excerpt,
-            "",
-            (
-                "If only abstract/results text is available (no full text), use strict conservative scoring: "
-                "set all criteria to false unless the criterion is explicitly supported by the provided text."
-            ),
-            "Answer each CASP question as true or false:",
-            "1. design_appropriate: Was a qualitative methodology appropriate for this research question?",
-            "2. recruitment_strategy: Was the recruitment strategy appropriate to the aims of the research?",
-            "3. data_collection_rigorous: Was the data collection sufficiently rigorous?",
-            "4. reflexivity_considered: Was the relationship between researcher and participants considered?",
-            "5. ethics_considered: Have ethical issues been taken into consideration?",
-            "6. analysis_rigorous: Was the data analysis sufficiently rigorous?",
-            "7. findings_clear: Is there a clear statement of findings?",
-            "8. value_of_research: How valuable is the research?",
-            "Also provide a brief overall_summary (1-2 sentences).",
-            "",
-            "Return ONLY valid JSON matching the schema.",
         ]
     )
 
 
+def _build_casp_prompt(record: ExtractionRecord, full_text: str) -> str:
+    """Checklist instructions first (shared by every study), then the study."""
+    return single_study_prompt(_CASP_INSTRUCTIONS, _casp_study_block(record, full_text))
+
+
 class CaspAssessor:
     """Produce typed CASP-style outputs. Uses Gemini Pro when available; heuristic fallback otherwise."""
 
@@ -75,6 +83,13 @@ class CaspAssessor:
         self.llm_client = llm_client
         self.settings = settings
         self.provider = provider
+        self.batcher = QualityBatcher(
+            QualityLLMRunner(llm_client, settings, provider),
+            settings,
+            phase_name="quality_casp",
+            instructions=_CASP_INSTRUCTIONS,
+            response_model=_CaspLLMResponse,
+        )
 
     def _heuristic(self, record: ExtractionRecord) -> CaspAssessment:
         """Conservative heuristic fallback when LLM call fails.
@@ -100,14 +115,18 @@ class CaspAssessor:
     async def assess(self, record: ExtractionRecord, full_text: str = "") -> CaspAssessment:
         if self.llm_client is not None and self.settings is not None:
             try:
-                prompt = _build_casp_prompt(record, full_text)
-                runner = QualityLLMRunner(self.llm_client, self.settings, self.provider)
-                parsed, _metrics = await runner.run_validated(
-                    agent_key="quality_assessment",
-                    phase_name="quality_casp",
-                    prompt=prompt,
-                    response_model=_CaspLLMResponse,
-                )
+                parsed = None
+                if self.batcher.enabled:
+                    parsed = await self.batcher.assess(record.paper_id, _casp_study_block(record, full_text))
+                if parsed is None:
+                    prompt = _build_casp_prompt(record, full_text)
+                    runner = QualityLLMRunner(self.llm_client, self.settings, self.provider)
+                    parsed, _metrics = await runner.run_validated(
+                        agent_key="quality_assessment",
+                        phase_name="quality_casp",
+                        prompt=prompt,
+                        response_model=_CaspLLMResponse,
+                    )
                 summary = parsed.overall_summary or "LLM-based CASP assessment."
                 return CaspAssessment(
                     paper_id=record.paper_id,
@@ -25,7 +25,7 @@ from pydantic import BaseModel
 from src.llm.base_client import LLMBackend
 from src.models import ExtractionRecord, MmatAssessment, MmatStudyType, StudyDesign
 from src.models.config import SettingsConfig
-from src.quality.runner import QualityLLMRunner
+from src.quality.runner import QualityBatcher, QualityLLMRunner, single_study_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -103,13 +103,31 @@ def _type_specific_criteria(study_type: MmatStudyType) -> str:
     )
 
 
-def _build_mmat_prompt(record: ExtractionRecord, study_type: MmatStudyType, full_text: str) -> str:
+_MMAT_INSTRUCTIONS = "\n".join(
+    [
+        "You are an expert systematic review methodologist applying the MMAT 2018.",
+        "Appraise the study below: answer both screening questions, then the type-specific criteria",
+        "listed with the study.",
+        "",
+        "MMAT 2018 SCREENING QUESTIONS (apply to all study types):",
+        "Screening Q1: Are there clear research questions?",
+        "Screening Q2: Do the collected data allow to address the research questions?",
+        "",
+        "Each assessment is a JSON object with this exact schema:",
+        '{"screening_1_clear_question": true|false, "screening_2_appropriate_data": true|false, '
+        '"criterion_1": true|false, "criterion_2": true|false, "criterion_3": true|false, '
+        '"criterion_4": true|false, "criterion_5": true|false, '
+        '"overall_summary": "one paragraph assessment"}',
+        "Answer each criterion truthfully based on available evidence. Use false when information is absent.",
+    ]
+)
+
+
+def _mmat_study_block(record: ExtractionRecord, study_type: MmatStudyType, full_text: str) -> str:
     results = record.results_summary.get("summary", "")[:2000]
     text_excerpt = full_text[:3000] if full_text.strip() else results
-    criteria = _type_specific_criteria(study_type)
     return "\n".join(
         [
-            "You are an expert systematic review methodologist applying the MMAT 2018.",
             f"Study type: {study_type.replace('_', ' ').title()}",
             "",
             "STUDY INFORMATION:",
@@ -120,23 +138,17 @@ def _build_mmat_prompt(record: ExtractionRecord, study_type: MmatStudyType, full
             f"Results: {results}",
             f"Full text excerpt: {text_excerpt}",
             "",
-            "MMAT 2018 SCREENING QUESTIONS (apply to all study types):",
-            "Screening Q1: Are there clear research questions?",
-            "Screening Q2: Do the collected data allow to address the research questions?",
-            "",
             f"TYPE-SPECIFIC CRITERIA ({study_type.replace('_', ' ').upper()}):",
-            criteria,
-            "",
-            "Return ONLY valid JSON with this exact schema:",
-            '{"screening_1_clear_question": true|false, "screening_2_appropriate_data": true|false, '
-            '"criterion_1": true|false, "criterion_2": true|false, "criterion_3": true|false, '
-            '"criterion_4": true|false, "criterion_5": true|false, '
-            '"overall_summary": "one paragraph assessment"}',
-            "Answer each criterion truthfully based on available evidence. Use false when information is absent.",
+            _type_specific_criteria(study_type),
         ]
     )
 
 
+def _build_mmat_prompt(record: ExtractionRecord, study_type: MmatStudyType, full_text: str) -> str:
+    """Appraisal instructions first (shared by every study), then the study and its type criteria."""
+    return single_study_prompt(_MMAT_INSTRUCTIONS, _mmat_study_block(record, study_type, full_text))
+
+
 def _heuristic_mmat(record: ExtractionRecord, study_type: MmatStudyType) -> MmatAssessment:
     """Conservative heuristic fallback: all criteria false except screening Q1."""
     return MmatAssessment(
@@ -168,6 +180,13 @@ class MmatAssessor:
         self.llm_client = llm_client
         self.settings = settings
         self.provider = provider
+        self.batcher = QualityBatcher(
+            QualityLLMRunner(llm_client, settings, provider),
+            settings,
+            phase_name="quality_mmat",
+            instructions=_MMAT_INSTRUCTIONS,
+            response_model=_MmatLLMResponse,
+        )
 
     async def assess(
         self,
@@ -183,16 +202,19 @@ class MmatAssessor:
         if not agent:
             return _heuristic_mmat(record, study_type)
 
-        prompt = _build_mmat_prompt(record, study_type, full_text)
-
         try:
-            runner = QualityLLMRunner(self.llm_client, self.settings, self.provider)
-            parsed, _metrics = await runner.run_validated(
-                agent_key="quality_assessment",
-                phase_name="quality_mmat",
-                prompt=prompt,
-                response_model=_MmatLLMResponse,
-            )
+            parsed = None
+            if self.batcher.enabled:
+                parsed = await self.batcher.assess(record.paper_id, _mmat_study_block(record, study_type, full_text))
+            if parsed is None:
+                prompt = _build_mmat_prompt(record, study_type, full_text)
+                runner = QualityLLMRunner(self.llm_client, self.settings, self.provider)
+                parsed, _metrics = await runner.run_validated(
+                    agent_key="quality_assessment",
+                    phase_name="quality_mmat",
+                    prompt=prompt,
+                    response_model=_MmatLLMResponse,
+                )
             score = sum(
                 [
                     parsed.criterion_1,
@@ -10,7 +10,7 @@ from pydantic import BaseModel
 from src.llm.base_client import LLMBackend
 from src.models import ExtractionRecord, RiskOfBiasJudgment, RoB2Assessment
 from src.models.config import SettingsConfig
-from src.quality.runner import QualityLLMRunner
+from src.quality.runner import QualityBatcher, QualityLLMRunner, single_study_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -49,14 +49,29 @@ def _max_judgment(values: list[RiskOfBiasJudgment]) -> RiskOfBiasJudgment:
     return RiskOfBiasJudgment.LOW
 
 
-def _build_rob2_prompt(record: ExtractionRecord, full_text: str) -> str:
+_ROB2_INSTRUCTIONS = "\n".join(
+    [
+        "You are an expert systematic review methodologist.",
+        "Assess Risk of Bias using the RoB 2 tool for the randomized controlled trial below.",
+        "",
+        "RoB 2 Domains - assign 'low', 'some_concerns', or 'high' for each:",
+        "D1 - Randomization process: Was allocation sequence truly random? Was it concealed?",
+        "D2 - Deviations from intended interventions: Were there deviations? Were participants aware?",
+        "D3 - Missing outcome data: Were outcome data available for all (or nearly all) participants?",
+        "D4 - Measurement of the outcome: Was the outcome measured appropriately and consistently?",
+        "D5 - Selection of the reported result: Was the result selected from multiple analyses?",
+        "Overall: any 'high' -> 'high'; any 'some_concerns' -> 'some_concerns'; else 'low'.",
+        "",
+        "Provide a 1-2 sentence rationale per domain.",
+    ]
+)
+
+
+def _rob2_study_block(record: ExtractionRecord, full_text: str) -> str:
     results = record.results_summary.get("summary", "")[:2000]
     text_excerpt = full_text[:3000] if full_text.strip() else results
     return "\n".join(
         [
-            "You are an expert systematic review methodologist.",
-            "Assess Risk of Bias using the RoB 2 tool for the following randomized controlled trial.",
-            "",
             f"Intervention: {record.intervention_description[:400]}",
             f"Comparator: {record.comparator_description or 'not reported'}",
             f"Setting: {record.setting or 'not reported'}",
@@ -65,20 +80,15 @@ def _build_rob2_prompt(record: ExtractionRecord, full_text: str) -> str:
             "",
             "Text excerpt:",
             text_excerpt,
-            "",
-            "RoB 2 Domains - assign 'low', 'some_concerns', or 'high' for each:",
-            "D1 - Randomization process: Was allocation sequence truly random? Was it concealed?",
-            "D2 - Deviations from intended interventions: Were there deviations? Were participants aware?",
-            "D3 - Missing outcome data: Were outcome data available for all (or nearly all) participants?",
-            "D4 - Measurement of the outcome: Was the outcome measured appropriately and consistently?",
-            "D5 - Selection of the reported result: Was the result selected from multiple analyses?",
-            "Overall: any 'high' -> 'high'; any 'some_concerns' -> 'some_concerns'; else 'low'.",
-            "",
-            "Return ONLY valid JSON matching the schema. Provide a 1-2 sentence rationale per domain.",
         ]
     )
 
 
+def _build_rob2_prompt(record: ExtractionRecord, full_text: str) -> str:
+    """Tool instructions first (shared by every trial), then the trial."""
+    return single_study_prompt(_ROB2_INSTRUCTIONS, _rob2_study_block(record, full_text))
+
+
 class Rob2Assessor:
     """Assess five RoB 2 domains. Uses Gemini Pro when available; heuristic fallback otherwise."""
 
@@ -91,6 +101,13 @@ class Rob2Assessor:
         self.llm_client = llm_client
         self.settings = settings
         self.provider = provider
+        self.batcher = QualityBatcher(
+            QualityLLMRunner(llm_client, settings, provider),
+            settings,
+            phase_name="quality_rob2",
+            instructions=_ROB2_INSTRUCTIONS,
+            response_model=_Rob2LLMResponse,
+        )
 
     def _heuristic(self, record: ExtractionRecord) -> RoB2Assessment:
         """Conservative heuristic fallback when LLM call fails.
@@ -121,14 +138,18 @@ class Rob2Assessor:
     async def assess(self, record: ExtractionRecord, full_text: str = "") -> RoB2Assessment:
         if self.llm_client is not None and self.settings is not None:
             try:
-                prompt = _build_rob2_prompt(record, full_text)
-                runner = QualityLLMRunner(self.llm_client, self.settings, self.provider)
-                parsed, _metrics = await runner.run_validated(
-                    agent_key="quality_assessment",
-                    phase_name="quality_rob2",
-                    prompt=prompt,
-                    response_model=_Rob2LLMResponse,
-                )
+                parsed = None
+                if self.batcher.enabled:
+                    parsed = await self.batcher.assess(record.paper_id, _rob2_study_block(record, full_text))
+                if parsed is None:
+                    prompt = _build_rob2_prompt(record, full_text)
+                    runner = QualityLLMRunner(self.llm_client, self.settings, self.provider)
+                    parsed, _metrics = await runner.run_validated(
+                        agent_key="quality_assessment",
+                        phase_name="quality_rob2",
+                        prompt=prompt,
+                        response_model=_Rob2LLMResponse,
+                    )
                 return RoB2Assessment(
                     paper_id=record.paper_id,
                     domain_1_randomization=_to_rob2_judgment(parsed.domain_1_randomization),
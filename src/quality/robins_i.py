@@ -10,7 +10,7 @@ from pydantic import BaseModel
 from src.llm.base_client import LLMBackend
 from src.models import ExtractionRecord, RobinsIAssessment, RobinsIJudgment
 from src.models.config import SettingsConfig
-from src.quality.runner import QualityLLMRunner
+from src.quality.runner import QualityBatcher, QualityLLMRunner, single_study_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -63,16 +63,51 @@ def _worst(values: list[RobinsIJudgment]) -> RobinsIJudgment:
     return max(values, key=lambda item: ranking[item])
 
 
-def _build_robins_prompt(record: ExtractionRecord, full_text: str) -> str:
+_ROBINS_INSTRUCTIONS = "\n".join(
+    [
+        "You are an expert systematic review methodologist conducting a ROBINS-I risk-of-bias assessment.",
+        "Assess the seven ROBINS-I domains for the non-randomized study below.",
+        "",
+        "ROBINS-I Domain Assessment Rules:",
+        "- Use 'low', 'moderate', 'serious', 'critical', or 'no_information' for each domain.",
+        "- CRITICAL: use 'no_information' when you cannot assess a domain from the available text.",
+        "  Do NOT guess 'moderate' just because you have no information -- 'no_information' is the",
+        "  correct response when evidence is insufficient. Uniform 'moderate' across all domains",
+        "  is scientifically invalid and will be flagged as a pipeline error.",
+        "- Domains that CAN often be assessed from abstract text alone: D2, D6, D7.",
+        "- Domains that USUALLY require full text to assess meaningfully: D1, D3, D4.",
+        "  Use 'no_information' for these when only abstract is available.",
+        "",
+        "D1 - Bias due to Confounding: Were important confounders identified and controlled for?",
+        "  (Requires information about study design, adjustment variables -- often absent in abstracts.)",
+        "D2 - Bias in Selection of Participants: Is the participant selection method described?",
+        "  Were eligible participants excluded in ways that could bias results?",
+        "D3 - Bias in Classification of Interventions: Were intervention vs control groups classified",
+        "  consistently using reliable, pre-specified criteria?",
+        "D4 - Bias due to Deviations from Intended Interventions: Did participants receive the",
+        "  intended intervention? Were there protocol deviations or contamination?",
+        "D5 - Bias due to Missing Data: Are there missing outcome data, dropouts, or loss to follow-up?",
+        "  If sample sizes differ between enrollment and analysis, flag this.",
+        "D6 - Bias in Measurement of Outcomes: Were outcomes measured objectively and consistently?",
+        "  Was the assessor blinded to intervention status?",
+        "D7 - Bias in Selection of the Reported Result: Does the abstract/paper report all outcomes",
+        "  that were measured, or is there evidence of selective reporting or outcome switching?",
+        "Overall: apply worst-domain logic using only domains with actual information (not no_information).",
+        "  If no domain can be assessed, overall should also be 'no_information'.",
+        "",
+        "Provide a specific 1-2 sentence rationale",
+        "for each domain explaining what evidence (or lack thereof) drove your rating.",
+    ]
+)
+
+
+def _robins_study_block(record: ExtractionRecord, full_text: str) -> str:
     results = record.results_summary.get("summary", "")[:2000]
     has_full_text = bool(full_text.strip()) and len(full_text.strip()) > 200
     text_excerpt = full_text[:3000] if has_full_text else results
     text_source = "full text excerpt" if has_full_text else "abstract/results summary (full text unavailable)"
     return "\n".join(
         [
-            "You are an expert systematic review methodologist conducting a ROBINS-I risk-of-bias assessment.",
-            "Assess the seven ROBINS-I domains for the following non-randomized study.",
-            "",
             f"Intervention: {record.intervention_description[:400]}",
             f"Comparator: {record.comparator_description or 'not reported'}",
             f"Setting: {record.setting or 'not reported'}",
@@ -81,40 +116,15 @@ def _build_robins_prompt(record: ExtractionRecord, full_text: str) -> str:
             "",
             f"Available text ({text_source}):",
             text_excerpt,
-            "",
-            "ROBINS-I Domain Assessment Rules:",
-            "- Use 'low', 'moderate', 'serious', 'critical', or 'no_information' for each domain.",
-            "- CRITICAL: use 'no_information' when you cannot assess a domain from the available text.",
-            "  Do NOT guess 'moderate' just because you have no information -- 'no_information' is the",
-            "  correct response when evidence is insufficient. Uniform 'moderate' across all domains",
-            "  is scientifically invalid and will be flagged as a pipeline error.",
-            "- Domains that CAN often be assessed from abstract text alone: D2, D6, D7.",
-            "- Domains that USUALLY require full text to assess meaningfully: D1, D3, D4.",
-            "  Use 'no_information' for these when only abstract is available.",
-            "",
-            "D1 - Bias due to Confounding: Were important confounders identified and controlled for?",
-            "  (Requires information about study design, adjustment variables -- often absent in abstracts.)",
-            "D2 - Bias in Selection of Participants: Is the participant selection method described?",
-            "  Were eligible participants excluded in ways that could bias results?",
-            "D3 - Bias in Classification of Interventions: Were intervention vs control groups classified",
-            "  consistently using reliable, pre-specified criteria?",
-            "D4 - Bias due to Deviations from Intended Interventions: Did participants receive the",
-            "  intended intervention? Were there protocol deviations or contamination?",
-            "D5 - Bias due to Missing Data: Are there missing outcome data, dropouts, or loss to follow-up?",
-            "  If sample sizes differ between enrollment and analysis, flag this.",
-            "D6 - Bias in Measurement of Outcomes: Were outcomes measured objectively and consistently?",
-            "  Was the assessor blinded to intervention status?",
-            "D7 - Bias in Selection of the Reported Result: Does the abstract/paper report all outcomes",
-            "  that were measured, or is there evidence of selective reporting or outcome switching?",
-            "Overall: apply worst-domain logic using only domains with actual information (not no_information).",
-            "  If no domain can be assessed, overall should also be 'no_information'.",
-            "",
-            "Return ONLY valid JSON matching the schema. Provide a specific 1-2 sentence rationale",
-            "for each domain explaining what evidence (or lack thereof) drove your rating.",
         ]
     )
 
 
+def _build_robins_prompt(record: ExtractionRecord, full_text: str) -> str:
+    """Tool instructions first (shared by every study), then the study."""
+    return single_study_prompt(_ROBINS_INSTRUCTIONS, _robins_study_block(record, full_text))
+
+
 class RobinsIAssessor:
     """Assess seven ROBINS-I domains. Uses Gemini Pro when available; heuristic fallback otherwise."""
 
@@ -127,6 +137,13 @@ class RobinsIAssessor:
         self.llm_client = llm_client
         self.settings = settings
         self.provider = provider
+        self.batcher = QualityBatcher(
+            QualityLLMRunner(llm_client, settings, provider),
+            settings,
+            phase_name="quality_robins_i",
+            instructions=_ROBINS_INSTRUCTIONS,
+            response_model=_RobinsILLMResponse,
+        )
 
     _CONFOUNDING_SERIOUS_SIGNALS = ("confounding present", "unmeasured confound", "major confound")
     _MISSING_DATA_SERIOUS_SIGNALS = ("missing data", "missing outcome", "loss to follow-up", "high attrition")
@@ -180,14 +197,18 @@ class RobinsIAssessor:
     async def assess(self, record: ExtractionRecord, full_text: str = "") -> RobinsIAssessment:
         if self.llm_client is not None and self.settings is not None:
             try:
-                prompt = _build_robins_prompt(record, full_text)
-                runner = QualityLLMRunner(self.llm_client, self.settings, self.provider)
-                parsed, _metrics = await runner.run_validated(
-                    agent_key="quality_assessment",
-                    phase_name="quality_robins_i",
-                    prompt=prompt,
-                    response_model=_RobinsILLMResponse,
-                )
+                parsed = None
+                if self.batcher.enabled:
+                    parsed = await self.batcher.assess(record.paper_id, _robins_study_block(record, full_text))
+                if parsed is None:
+                    prompt = _build_robins_prompt(record, full_text)
+                    runner = QualityLLMRunner(self.llm_client, self.settings, self.provider)
+                    parsed, _metrics = await runner.run_validated(
+                        agent_key="quality_assessment",
+                        phase_name="quality_robins_i",
+                        prompt=prompt,
+                        response_model=_RobinsILLMResponse,
+                    )
                 d1 = _to_robins_judgment(parsed.domain_1_confounding)
                 d2 = _to_robins_judgment(parsed.domain_2_selection)
                 d3 = _to_robins_judgment(parsed.domain_3_classification)
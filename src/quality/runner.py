@@ -6,14 +6,19 @@ import time
 from dataclasses import dataclass
 from typing import TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, create_model
 
 from src.llm.base_client import LLMBackend
+from src.llm.micro_batch import MicroBatcher
+from src.llm.prompt_cache import CacheablePrompt
 from src.llm.pydantic_client import PydanticAIClient
 from src.models.config import SettingsConfig
 
 _T = TypeVar("_T", bound=BaseModel)
 
+# Output line for a one-study call; QualityBatcher asks for an envelope instead.
+_SINGLE_OUTPUT_INSTRUCTION = "Return ONLY one valid JSON object for this study, matching the schema."
+
 
 @dataclass
 class QualityRunnerResult:
@@ -44,6 +49,7 @@ class QualityLLMRunner:
         phase_name: str,
         prompt: str,
         response_model: type[_T],
+        json_schema: dict | None = None,
     ) -> tuple[_T, QualityRunnerResult]:
         if self._llm_client is None or self._settings is None:
             raise RuntimeError("LLM client/settings unavailable")
@@ -61,6 +67,7 @@ class QualityLLMRunner:
                 model=model,
                 temperature=temperature,
                 response_model=response_model,
+                json_schema=json_schema,
             )
             latency_ms = int((time.monotonic() - started) * 1000)
             result = QualityRunnerResult(
@@ -82,6 +89,92 @@ class QualityLLMRunner:
                 cache_write_tokens=cw,
             )
             return parsed, result
-        schema = response_model.model_json_schema()
+        schema = json_schema or response_model.model_json_schema()
         raw = await self._llm_client.complete(prompt, model=model, temperature=temperature, json_schema=schema)
         return response_model.model_validate_json(raw), QualityRunnerResult()
+
+
+def single_study_prompt(instructions: str, study_block: str) -> CacheablePrompt:
+    """Tool instructions plus the single-object output line, then the study block."""
+    return CacheablePrompt(f"{instructions}\n\n{_SINGLE_OUTPUT_INSTRUCTION}", study_block)
+
+
+def quality_batch_size(settings: SettingsConfig | None) -> int:
+    return int(getattr(getattr(settings, "extraction", None), "quality_batch_size", 0) or 0)
+
+
+class QualityBatcher(MicroBatcher[tuple[str, str], _T]):
+    """Assess several studies with one tool in a single call (``extraction.quality_batch_size``).
+
+    Each assessor keeps its tool instructions separate from the per-study
+    block, so the batch prompt is the same instructions followed by several
+    study blocks keyed by paper_id.  ``assess`` returns None for a study the
+    batch did not cover; the assessor then makes its usual single call.
+    """
+
+    def __init__(
+        self,
+        runner: QualityLLMRunner,
+        settings: SettingsConfig | None,
+        *,
+        phase_name: str,
+        instructions: str,
+        response_model: type[_T],
+    ) -> None:
+        self._runner = runner
+        self._phase_name = phase_name
+        self._instructions = instructions
+        self._response_model = response_model
+        self._item_model = create_model(
+            f"{response_model.__name__.lstrip('_')}BatchItem",
+            __base__=response_model,
+            paper_id=(str, ...),
+        )
+        self._envelope_model = create_model(
+            f"{response_model.__name__.lstrip('_')}BatchEnvelope",
+            assessments=(list[self._item_model], Field(default_factory=list)),
+        )
+        super().__init__(
+            self._assess_batch,
+            key=lambda item: item[0],
+            max_size=quality_batch_size(settings),
+            label=phase_name,
+        )
+
+    async def assess(self, paper_id: str, study_block: str) -> _T | None:
+        return await self.submit((paper_id, study_block))
+
+    async def _assess_batch(self, items: list[tuple[str, str]]) -> dict[str, _T]:
+        static_prefix = "\n".join(
+            [
+                self._instructions,
+                "",
+                "BATCH MODE: several independent studies follow. Assess each study separately, using only its",
+                'own information. Return ONLY valid JSON of the form {"assessments": [...]}',
+                "with exactly one item per study, each carrying the study's exact paper_id plus the fields above.",
+            ]
+        )
+        lines: list[str] = []
+        for paper_id, block in items:
+            lines.extend([f"=== paper_id={paper_id} ===", block, ""])
+        lines.extend(["Allowed paper_ids:", ", ".join(paper_id for paper_id, _ in items)])
+        schema = self._envelope_model.model_json_schema()
+        # Restrict paper_id to this batch so the model cannot invent or drift to other identifiers.
+        item_schema = schema.get("$defs", {}).get(self._item_model.__name__, {})
+        paper_id_schema = item_schema.get("properties", {}).get("paper_id")
+        if isinstance(paper_id_schema, dict):
+            paper_id_schema["enum"] = sorted(paper_id for paper_id, _ in items)
+        envelope, _metrics = await self._runner.run_validated(
+            agent_key="quality_assessment",
+            phase_name=self._phase_name,
+            prompt=CacheablePrompt(static_prefix, "\n".join(lines)),
+            response_model=self._envelope_model,
+            json_schema=schema,
+        )
+        allowed = {paper_id for paper_id, _ in items}
+        results: dict[str, _T] = {}
+        for item in envelope.assessments:
+            paper_id = item.paper_id.strip()
+            if paper_id in allowed and paper_id not in results:
+                results[paper_id] = self._response_model.model_validate(item.model_dump(exclude={"paper_id"}))
+        return results
@@ -20,6 +20,10 @@ logger = logging.getLogger(__name__)
 CHUNK_MAX_WORDS = 400
 OVERLAP_SENTENCES = 2
 
+# Set once nltk is missing or its punkt data cannot be loaded, so an offline host
+# does not retry the download for every chunked record.
+_nltk_unavailable = False
+
 
 @dataclass
 class TextChunk:
@@ -36,20 +40,25 @@ def _tokenize_sentences(text: str) -> list[str]:
 
     Auto-downloads the punkt_tab tokenizer data on first use if missing.
     """
-    try:
-        import nltk
-        from nltk.tokenize import sent_tokenize
-
+    global _nltk_unavailable
+    if not _nltk_unavailable:
         try:
-            sentences = sent_tokenize(text)
-        except LookupError:
-            nltk.download("punkt_tab", quiet=True)
-            nltk.download("punkt", quiet=True)
-            sentences = sent_tokenize(text)
-        if sentences:
-            return sentences
-    except Exception:
-        pass
+            import nltk
+            from nltk.tokenize import sent_tokenize
+
+            try:
+                sentences = sent_tokenize(text)
+            except LookupError:
+                nltk.download("punkt_tab", quiet=True)
+                nltk.download("punkt", quiet=True)
+                sentences = sent_tokenize(text)
+            if sentences:
+                return sentences
+        except (ImportError, LookupError):
+            _nltk_unavailable = True
+        except Exception as exc:
+            # A failure on this text only; keep nltk for the next record.
+            logger.debug("sent_tokenize failed (%s); using regex split for this text.", exc)
     # Fallback: split on ". ", "! ", "? " boundaries.
     raw = re.split(r"(?<=[.!?])\s+", text.strip())
     return [s for s in raw if s.strip()]
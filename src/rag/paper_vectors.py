@@ -0,0 +1,147 @@
+"""Per-paper centroid embeddings.
+
+EmbeddingNode averages each paper's chunk embeddings into one L2-normalized
+centroid and stores it in ``paper_embeddings`` as a float32 blob, so the
+knowledge graph and contradiction detection load an ``(ids, matrix)`` pair
+instead of re-reading and averaging every chunk's JSON embedding.  Because
+rows are unit vectors, cosine similarity between papers is a dot product.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple
+
+import aiosqlite
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class PaperVectors(NamedTuple):
+    """Paper ids and their centroid matrix (one unit-norm float32 row per id)."""
+
+    ids: list[str]
+    matrix: np.ndarray
+
+    def similarity(self, paper_ids: Sequence[str]) -> tuple[dict[str, int], np.ndarray]:
+        """Row index of each of *paper_ids* that has a vector, and their cosine matrix."""
+        row_of = {pid: i for i, pid in enumerate(self.ids)}
+        present = [pid for pid in dict.fromkeys(paper_ids) if pid in row_of]
+        sub = self.matrix[[row_of[pid] for pid in present]]
+        return {pid: i for i, pid in enumerate(present)}, sub @ sub.T
+
+
+def paper_centroids(paper_ids: Sequence[str], embeddings: Iterable[Sequence[float]]) -> PaperVectors:
+    """Average chunk *embeddings* per paper and L2-normalize the means.
+
+    Papers whose chunks have mixed dimensions are skipped.  Zero-norm means
+    stay zero, so their similarity to every paper is 0.
+    """
+    grouped: dict[str, list[Sequence[float]]] = {}
+    for pid, vec in zip(paper_ids, embeddings):
+        if vec:
+            grouped.setdefault(pid, []).append(vec)
+    ids: list[str] = []
+    rows: list[np.ndarray] = []
+    dim = 0
+    for pid, vecs in grouped.items():
+        if len({len(v) for v in vecs}) != 1:
+            logger.warning("Skipping paper %s: mixed embedding dimensions", pid)
+            continue
+        if dim and len(vecs[0]) != dim:
+            logger.warning("Skipping paper %s: embedding dimension %d != %d", pid, len(vecs[0]), dim)
+            continue
+        dim = len(vecs[0])
+        ids.append(pid)
+        rows.append(np.asarray(vecs, dtype=np.float32).mean(axis=0))
+    if not rows:
+        return PaperVectors([], np.zeros((0, 0), dtype=np.float32))
+    matrix = np.vstack(rows)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+    return PaperVectors(ids, matrix)
+
+
+async def save_paper_vectors(
+    db: aiosqlite.Connection,
+    workflow_id: str,
+    vectors: PaperVectors,
+    chunk_counts: dict[str, int] | None = None,
+) -> None:
+    """Upsert one ``paper_embeddings`` row per paper (caller commits)."""
+    if not vectors.ids:
+        return
+    dim = int(vectors.matrix.shape[1])
+    counts = chunk_counts or {}
+    await db.executemany(
+        """
+        INSERT OR REPLACE INTO paper_embeddings (workflow_id, paper_id, dim, chunk_count, vector)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        [
+            (workflow_id, pid, dim, int(counts.get(pid, 0)), row.astype(np.float32).tobytes())
+            for pid, row in zip(vectors.ids, vectors.matrix)
+        ],
+    )
+
+
+async def _backfill_from_chunks(db: aiosqlite.Connection, workflow_id: str) -> int:
+    """Store centroids for papers that have chunk embeddings but no ``paper_embeddings`` row."""
+    paper_ids: list[str] = []
+    embeddings: list[list[float]] = []
+    async with db.execute(
+        """
+        SELECT c.paper_id, c.embedding FROM paper_chunks_meta c
+        WHERE c.workflow_id = ? AND c.embedding IS NOT NULL
+          AND NOT EXISTS (
+              SELECT 1 FROM paper_embeddings e WHERE e.workflow_id = c.workflow_id AND e.paper_id = c.paper_id
+          )
+        """,
+        (workflow_id,),
+    ) as cursor:
+        async for row in cursor:
+            try:
+                embeddings.append(json.loads(row[1]))
+            except (json.JSONDecodeError, TypeError):
+                continue
+            paper_ids.append(row[0])
+    vectors = paper_centroids(paper_ids, embeddings)
+    if vectors.ids:
+        counts: dict[str, int] = {}
+        for pid in paper_ids:
+            counts[pid] = counts.get(pid, 0) + 1
+        await save_paper_vectors(db, workflow_id, vectors, counts)
+        await db.commit()
+        logger.info("Backfilled %d paper centroid embeddings for %s", len(vectors.ids), workflow_id)
+    return len(vectors.ids)
+
+
+async def load_paper_vectors(db: aiosqlite.Connection, workflow_id: str) -> PaperVectors:
+    """Return the workflow's paper centroids as an ``(ids, matrix)`` pair.
+
+    Papers embedded before ``paper_embeddings`` existed (all of an old run, or
+    the pre-upgrade part of a resumed one) are backfilled from
+    ``paper_chunks_meta`` first.  Returns an empty pair when nothing is embedded.
+    """
+    await _backfill_from_chunks(db, workflow_id)
+    ids: list[str] = []
+    blobs: list[bytes] = []
+    dim = 0
+    async with db.execute(
+        "SELECT paper_id, dim, vector FROM paper_embeddings WHERE workflow_id = ? ORDER BY paper_id",
+        (workflow_id,),
+    ) as cursor:
+        async for pid, row_dim, blob in cursor:
+            if dim and row_dim != dim:
+                logger.warning("Skipping paper %s: embedding dimension %d != %d", pid, row_dim, dim)
+                continue
+            dim = int(row_dim)
+            ids.append(pid)
+            blobs.append(blob)
+    if not ids:
+        return PaperVectors([], np.zeros((0, 0), dtype=np.float32))
+    matrix = np.frombuffer(b"".join(blobs), dtype=np.float32).reshape(len(ids), dim)
+    return PaperVectors(ids, matrix)
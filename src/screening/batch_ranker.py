@@ -23,6 +23,7 @@ import time
 from collections.abc import Callable
 from typing import Protocol, runtime_checkable
 
+from src.llm.prompt_cache import CacheablePrompt
 from src.llm.provider import LLMProvider
 from src.models.config import ScreeningConfig
 from src.models.enums import ExclusionReason, ReviewerType, ScreeningDecisionType
@@ -57,7 +58,9 @@ HARD NEGATIVE SIGNALS (score <= 0.35 unless strong contradictory evidence exists
 - Empty-abstract records that provide no evaluable study information
 """
 
-_USER_TEMPLATE = """Research question: {research_question}
+# Everything up to the paper list is identical for every batch of a run, so it
+# forms the cacheable prompt prefix; only ``_PAPERS_TEMPLATE`` varies per call.
+_CONTEXT_TEMPLATE = """Research question: {research_question}
 Topic focus: {topic_focus}
 Domain: {domain}
 
@@ -76,9 +79,9 @@ Scoring guidance:
 - Score <= 0.35 when a paper evaluates only a broader adjacent digital system, registry, workflow tool, or policy without the intervention anchors or a clear synonym.
 
 Rate each paper below on relevance to this research question.
-Return one ratings entry per input paper (same count as input papers).
+Return one ratings entry per input paper (same count as input papers)."""
 
-Papers to rate:
+_PAPERS_TEMPLATE = """Papers to rate:
 {paper_list}"""
 
 
@@ -228,18 +231,14 @@ class BatchLLMRanker:
         self.validation_npv: float = 0.0
         # Number of near-threshold papers forwarded by uncertain-band logic.
         self.borderline_forwarded_n: int = 0
+        self._static_prefix = self._build_static_prefix()
 
-    async def _score_batch(self, batch: list[CandidatePaper]) -> dict[str, float]:
-        """Call LLM once for this batch; return {paper_id -> score}.
-
-        On any parse failure, returns all papers at score 1.0 (safe fallback:
-        all go to dual-review rather than silently discarding them).
-        """
-        paper_list = _build_paper_list(batch)
-        prompt = (
+    def _build_static_prefix(self) -> str:
+        """System prompt plus review context: byte-identical for every batch of the run."""
+        return (
             _SYSTEM_PROMPT
             + "\n\n"
-            + _USER_TEMPLATE.format(
+            + _CONTEXT_TEMPLATE.format(
                 research_question=self._research_question,
                 topic_focus=self._topic_focus,
                 domain=self._domain,
@@ -251,9 +250,19 @@ class BatchLLMRanker:
                 anchor_terms=", ".join(self._anchor_terms),
                 related_terms=", ".join(self._related_terms),
                 excluded_terms=", ".join(self._excluded_terms) or "none",
-                paper_list=paper_list,
             )
         )
+
+    async def _score_batch(self, batch: list[CandidatePaper]) -> dict[str, float]:
+        """Call LLM once for this batch; return {paper_id -> score}.
+
+        On any parse failure, returns all papers at score 1.0 (safe fallback:
+        all go to dual-review rather than silently discarding them).
+        """
+        prompt = CacheablePrompt(
+            self._static_prefix,
+            _PAPERS_TEMPLATE.format(paper_list=_build_paper_list(batch)),
+        )
         try:
             t0 = time.perf_counter()
             if self._provider is not None:
@@ -6,7 +6,7 @@ import asyncio
 import json
 import logging
 import time
-from collections.abc import Callable, Sequence
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
@@ -16,6 +16,7 @@ _log = logging.getLogger(__name__)
 from pydantic import ValidationError
 
 from src.db.repositories import WorkflowRepository
+from src.llm.prompt_cache import CacheablePrompt
 from src.llm.provider import LLMProvider
 from src.models import (
     BatchScreeningItemPayload,
@@ -47,7 +48,7 @@ from src.screening.prompts import (
     reviewer_a_prompt,
     reviewer_b_prompt,
 )
-from src.search.pdf_retrieval import FullTextCoverageSummary, PDFRetrievalResult, PDFRetriever
+from src.search.pdf_retrieval import FullTextCoverageSummary, PDFRetriever
 
 ScreeningResponse = ScreeningResponsePayload
 _BatchScreeningItem = BatchScreeningItemPayload
@@ -364,106 +365,7 @@ class DualReviewerScreener:
         processed = await self.repository.get_processed_paper_ids(workflow_id, stage)
         to_process = [p for p in papers if p.paper_id not in processed]
 
-        if stage == "fulltext":
-            if full_text_by_paper is None:
-                active_retriever = retriever or PDFRetriever()
-                _pdf_concurrency = self.settings.screening.pdf_retrieval_concurrency
-                _pdf_timeout = self.settings.screening.pdf_retrieval_per_paper_timeout
-                if to_process:
-                    total_fulltext = len(to_process)
-                    full_text_by_paper = {}
-                    processed_so_far = 0
-                    # Process retrieval in chunks so a single non-cooperative provider call
-                    # cannot block the entire phase indefinitely.
-                    chunk_size = max(1, _pdf_concurrency)
-                    for chunk_start in range(0, total_fulltext, chunk_size):
-                        chunk = to_process[chunk_start : chunk_start + chunk_size]
-                        chunk_len = len(chunk)
-                        chunk_timeout_s = max(
-                            float(_pdf_timeout + 15),
-                            (float(_pdf_timeout) * float(chunk_len) / float(max(1, _pdf_concurrency))) + 15.0,
-                        )
-
-                        def _chunk_progress(done: int, _chunk_total: int) -> None:
-                            if on_pdf_progress:
-                                on_pdf_progress(processed_so_far + done, total_fulltext)
-
-                        chunk_results: dict[str, PDFRetrievalResult] = {}
-                        try:
-                            chunk_results, _ = await asyncio.wait_for(
-                                active_retriever.retrieve_batch(
-                                    chunk,
-                                    on_progress=_chunk_progress if on_pdf_progress else None,
-                                    concurrency=_pdf_concurrency,
-                                    per_paper_timeout=_pdf_timeout,
-                                    on_result=on_pdf_result,
-                                ),
-                                timeout=chunk_timeout_s,
-                            )
-                        except TimeoutError:
-                            _log.warning(
-                                "PDF retrieval chunk timed out after %.1fs for workflow %s (%d papers). "
-                                "Marking chunk as timeout and continuing.",
-                                chunk_timeout_s,
-                                workflow_id,
-                                chunk_len,
-                            )
-                            for idx, paper in enumerate(chunk, start=1):
-                                chunk_results[paper.paper_id] = PDFRetrievalResult(
-                                    paper_id=paper.paper_id,
-                                    reason_code="timeout",
-                                    success=False,
-                                    error=f"chunk timeout after {chunk_timeout_s:.1f}s",
-                                )
-                                if on_pdf_result:
-                                    on_pdf_result(
-                                        paper.paper_id,
-                                        paper.title,
-                                        "abstract",
-                                        False,
-                                        "timeout",
-                                    )
-                                if on_pdf_progress:
-                                    on_pdf_progress(processed_so_far + idx, total_fulltext)
-
-                        for paper_id, result in chunk_results.items():
-                            if result.success and result.full_text.strip():
-                                full_text_by_paper[paper_id] = result.full_text
-                        processed_so_far += chunk_len
-
-                    coverage = self._coverage_from_map(to_process, full_text_by_paper)
-                    skip_no_pdf = self.settings.screening.skip_fulltext_if_no_pdf
-                    if not skip_no_pdf:
-                        for paper in to_process:
-                            if paper.paper_id not in full_text_by_paper:
-                                fallback = (paper.abstract or paper.title or "").strip()
-                                full_text_by_paper[paper.paper_id] = fallback
-                else:
-                    coverage = self._coverage_from_map([], {})
-                    full_text_by_paper = {}
-            else:
-                coverage = self._coverage_from_map(to_process, full_text_by_paper)
-            self.last_fulltext_coverage = coverage
-            await self._persist_fulltext_coverage(
-                workflow_id=workflow_id,
-                stage=stage,
-                coverage=coverage,
-                coverage_report_path=coverage_report_path,
-            )
-
-        # ------------------------------------------------------------------
-        # Batch-mode dispatch: when reviewer_batch_size > 0 send N papers per
-        # LLM call instead of one call per paper.
-        # ------------------------------------------------------------------
         batch_size = self.settings.screening.reviewer_batch_size
-        if batch_size > 0 and to_process:
-            return await self._screen_batch_mode(
-                workflow_id=workflow_id,
-                stage=stage,
-                papers=to_process,
-                full_texts=full_text_by_paper,
-            )
-
         total = len(to_process)
         concurrency = self.settings.screening.screening_concurrency
         sem = asyncio.Semaphore(concurrency)
@@ -497,9 +399,53 @@ class DualReviewerScreener:
                     self.on_progress("phase_3_screening", completed_count, total)
                 return result
 
-        raw_results = await asyncio.gather(*[_process_one(p) for p in to_process], return_exceptions=True)
+        outcomes: dict[str, ScreeningDecision | BaseException | None] = {}
+
+        if stage == "fulltext":
+            if full_text_by_paper is None:
+                full_text_by_paper = {}
+                if to_process:
+                    # Retrieval and screening overlap: papers are screened as soon as
+                    # their own text resolves.  Batch mode needs every text up front,
+                    # so it only consumes the stream.
+                    outcomes, coverage = await self._retrieve_and_screen_fulltext(
+                        to_process,
+                        full_text_by_paper,
+                        retriever=retriever or PDFRetriever(),
+                        screen_one=_process_one if batch_size <= 0 else None,
+                        on_pdf_progress=on_pdf_progress,
+                        on_pdf_result=on_pdf_result,
+                    )
+                else:
+                    coverage = self._coverage_from_map([], {})
+            else:
+                coverage = self._coverage_from_map(to_process, full_text_by_paper)
+            self.last_fulltext_coverage = coverage
+            await self._persist_fulltext_coverage(
+                workflow_id=workflow_id,
+                stage=stage,
+                coverage=coverage,
+                coverage_report_path=coverage_report_path,
+            )
+
+        # ------------------------------------------------------------------
+        # Batch-mode dispatch: when reviewer_batch_size > 0 send N papers per
+        # LLM call instead of one call per paper.
+        # ------------------------------------------------------------------
+        if batch_size > 0 and to_process:
+            return await self._screen_batch_mode(
+                workflow_id=workflow_id,
+                stage=stage,
+                papers=to_process,
+                full_texts=full_text_by_paper,
+            )
+
+        pending = [p for p in to_process if p.paper_id not in outcomes]
+        raw_results = await asyncio.gather(*[_process_one(p) for p in pending], return_exceptions=True)
+        outcomes.update({paper.paper_id: outcome for paper, outcome in zip(pending, raw_results)})
         decisions: list[ScreeningDecision] = []
-        for paper, outcome in zip(to_process, raw_results):
+        for paper in to_process:
+            outcome = outcomes.get(paper.paper_id)
             if isinstance(outcome, BaseException):
                 _log.warning(
                     "Screening failed for paper %s (%s): %s -- skipping",
@@ -511,6 +457,66 @@ class DualReviewerScreener:
                 decisions.append(outcome)
         return decisions
 
+    async def _retrieve_and_screen_fulltext(
+        self,
+        papers: Sequence[CandidatePaper],
+        full_text_by_paper: dict[str, str],
+        *,
+        retriever: PDFRetriever,
+        screen_one: Callable[[CandidatePaper], Awaitable[ScreeningDecision | None]] | None,
+        on_pdf_progress: Callable[[int, int], None] | None,
+        on_pdf_result: Callable[[str, str, str, bool, str | None], None] | None,
+    ) -> tuple[dict[str, ScreeningDecision | BaseException | None], FullTextCoverageSummary]:
+        """Producer/consumer full-text pipeline.
+
+        A sliding window of PDF retrievals (``PDFRetriever.stream_batch``) fills
+        ``full_text_by_paper`` and pushes each resolved paper onto a queue;
+        ``screening_concurrency`` workers pull from it and run ``screen_one``
+        while slower retrievals are still in flight.  Returns per-paper outcomes
+        (exceptions included; empty when ``screen_one`` is None) and the
+        retrieval coverage, which ignores abstract fallbacks.
+        """
+        skip_no_pdf = self.settings.screening.skip_fulltext_if_no_pdf
+        queue: asyncio.Queue[CandidatePaper | None] = asyncio.Queue()
+        retrieved: dict[str, str] = {}
+        outcomes: dict[str, ScreeningDecision | BaseException | None] = {}
+        n_workers = max(1, self.settings.screening.screening_concurrency) if screen_one is not None else 0
+
+        async def _produce() -> None:
+            try:
+                async for paper, result in retriever.stream_batch(
+                    papers,
+                    concurrency=self.settings.screening.pdf_retrieval_concurrency,
+                    per_paper_timeout=self.settings.screening.pdf_retrieval_per_paper_timeout,
+                    on_progress=on_pdf_progress,
+                    on_result=on_pdf_result,
+                ):
+                    if result.success and result.full_text.strip():
+                        retrieved[paper.paper_id] = result.full_text
+                        full_text_by_paper[paper.paper_id] = result.full_text
+                    if n_workers:
+                        await queue.put(paper)
+            finally:
+                for _ in range(n_workers):
+                    queue.put_nowait(None)
+
+        async def _consume(screen: Callable[[CandidatePaper], Awaitable[ScreeningDecision | None]]) -> None:
+            while (paper := await queue.get()) is not None:
+                if paper.paper_id not in full_text_by_paper and not skip_no_pdf:
+                    full_text_by_paper[paper.paper_id] = (paper.abstract or paper.title or "").strip()
+                try:
+                    outcomes[paper.paper_id] = await screen(paper)
+                except Exception as exc:
+                    outcomes[paper.paper_id] = exc
+
+        workers = [_consume(screen_one) for _ in range(n_workers)] if screen_one is not None else []
+        await asyncio.gather(_produce(), *workers)
+        if not skip_no_pdf:
+            for paper in papers:
+                if paper.paper_id not in full_text_by_paper:
+                    full_text_by_paper[paper.paper_id] = (paper.abstract or paper.title or "").strip()
+        return outcomes, self._coverage_from_map(papers, retrieved)
+
     @staticmethod
     def _coverage_from_map(
         papers: Sequence[CandidatePaper],
@@ -789,24 +795,26 @@ class DualReviewerScreener:
         goal = f"Screen papers for inclusion in a systematic review on: {self.review.research_question}"
         backstory = f"Domain: {self.review.domain}. Favour recall when uncertain."
 
-        header = _topic_header(self.review, role, goal, backstory)
-        lines = [header, self._BATCH_SYSTEM_PROMPT, "", "Papers to screen:"]
-        allowed_ids: list[str] = []
-        for paper in papers:
-            text = full_texts.get(paper.paper_id, "") if stage == "fulltext" else ""
-            content = (text[:1200] if text else (paper.abstract or ""))[:600].replace("\n", " ")
-            lines.append(f"paper_id={paper.paper_id} | {paper.title} | {content}")
-            allowed_ids.append(paper.paper_id)
-        lines.extend(
+        # Review context and instructions first (identical across every batch for
+        # this reviewer, so providers can cache the prefix), papers last.
+        static_prefix = "\n".join(
             [
+                _topic_header(self.review, role, goal, backstory),
+                self._BATCH_SYSTEM_PROMPT,
                 "",
                 "CONSTRAINT: Return decisions ONLY for the exact paper_id values listed below.",
                 "Any decision for an unlisted paper_id will be ignored and retried individually.",
-                "Allowed paper_ids:",
-                ", ".join(allowed_ids),
             ]
         )
-        return "\n".join(lines)
+        lines = ["Papers to screen:"]
+        allowed_ids: list[str] = []
+        for paper in papers:
+            text = full_texts.get(paper.paper_id, "") if stage == "fulltext" else ""
+            content = (text[:1200] if text else (paper.abstract or ""))[:600].replace("\n", " ")
+            lines.append(f"paper_id={paper.paper_id} | {paper.title} | {content}")
+            allowed_ids.append(paper.paper_id)
+        lines.extend(["", "Allowed paper_ids:", ", ".join(allowed_ids)])
+        return CacheablePrompt(static_prefix, "\n".join(lines))
 
     def _parse_batch_response(
         self,
@@ -15,7 +15,7 @@ from __future__ import annotations
 
 import logging
 import re
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 
 from thefuzz import fuzz
 
@@ -191,3 +191,64 @@ def deduplicate_papers(
 
     duplicates += title_dups
     return final_list, duplicates
+
+
+def _build_title_lsh(papers: list[CandidatePaper]) -> Callable[[str], list[int]] | None:
+    """MinHash LSH over normalized titles; returns a query -> candidate-indices function, or None without datasketch."""
+    try:
+        from datasketch import MinHash, MinHashLSH
+    except ImportError:
+        return None
+    num_perm = 128
+
+    def _signature(title: str) -> MinHash:
+        mh = MinHash(num_perm=num_perm)
+        for shingle in _shingled_tokens(_normalize_title(title)):
+            mh.update(shingle.encode("utf-8"))
+        return mh
+
+    lsh = MinHashLSH(threshold=0.65, num_perm=num_perm)
+    for idx, paper in enumerate(papers):
+        lsh.insert(str(idx), _signature(paper.title or ""))
+    return lambda title: [int(key) for key in lsh.query(_signature(title))]
+
+
+def deduplicate_against_known(
+    papers: Iterable[CandidatePaper],
+    known: Iterable[CandidatePaper],
+    fuzzy_threshold: int = 90,
+) -> tuple[list[CandidatePaper], int]:
+    """Drop papers that duplicate a record in *known* (e.g. a parent run's corpus).
+
+    Same matching rules as ``deduplicate_papers`` -- paper_id or DOI exact-match,
+    then fuzzy title -- but *known* records always win and are not returned.
+    Fuzzy candidates come from a MinHash LSH index over *known* for large
+    corpora and a direct scan for small ones.
+
+    Returns (unseen_papers, n_matched).
+    """
+    known_list = list(known)
+    known_ids = {p.paper_id for p in known_list}
+    known_dois = {doi for doi in (_normalize_doi(p.doi) for p in known_list) if doi}
+    known_titles = [(p.title or "").lower() for p in known_list]
+    exact_titles = {norm for norm in (_normalize_title(t) for t in known_titles) if norm}
+    lsh_query = _build_title_lsh(known_list) if len(known_list) > BRUTE_FORCE_THRESHOLD else None
+
+    def _title_match(title: str) -> bool:
+        normalized = _normalize_title(title)
+        if not normalized:
+            return False
+        if normalized in exact_titles:
+            return True
+        candidates = [known_titles[i] for i in lsh_query(title)] if lsh_query is not None else known_titles
+        return any(fuzz.ratio(title, other) >= fuzzy_threshold for other in candidates)
+
+    unseen: list[CandidatePaper] = []
+    matched = 0
+    for paper in papers:
+        doi = _normalize_doi(paper.doi)
+        if paper.paper_id in known_ids or (doi and doi in known_dois) or _title_match((paper.title or "").lower()):
+            matched += 1
+            continue
+        unseen.append(paper)
+    return unseen, matched
@@ -85,8 +85,8 @@ def is_binary_garbage(text: str) -> bool:
     return (non_printable / total) > 0.15
 
 
-def validated_full_text(text: str, *, max_chars: int = DEFAULT_PDF_MAX_CHARS) -> str:
-    """Reject empty, binary, or garbage decoded PDF text."""
+def validated_full_text(text: str, *, max_chars: int | None = DEFAULT_PDF_MAX_CHARS) -> str:
+    """Reject empty, binary, or garbage decoded PDF text (``max_chars=None`` keeps it all)."""
     cleaned = str(text or "")[:max_chars]
     if not cleaned.strip():
         return ""
@@ -95,7 +95,7 @@ def validated_full_text(text: str, *, max_chars: int = DEFAULT_PDF_MAX_CHARS) ->
     return cleaned
 
 
-def parse_pdf_bytes(body: bytes, *, max_chars: int = DEFAULT_PDF_MAX_CHARS) -> str:
+def parse_pdf_bytes(body: bytes, *, max_chars: int | None = DEFAULT_PDF_MAX_CHARS) -> str:
     """Parse raw PDF bytes into markdown text (sync — run via thread pool only)."""
     if not body or len(body) < 100:
         return ""
@@ -115,7 +115,7 @@ def parse_pdf_bytes(body: bytes, *, max_chars: int = DEFAULT_PDF_MAX_CHARS) -> s
         return validated_full_text(decoded, max_chars=max_chars)
 
 
-async def parse_pdf_bytes_async(body: bytes, *, max_chars: int = DEFAULT_PDF_MAX_CHARS) -> str:
+async def parse_pdf_bytes_async(body: bytes, *, max_chars: int | None = DEFAULT_PDF_MAX_CHARS) -> str:
     """Offload PDF parsing to bounded thread pool so the event loop stays responsive."""
     loop = asyncio.get_running_loop()
     executor = _get_parse_executor()
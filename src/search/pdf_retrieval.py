@@ -5,7 +5,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from collections.abc import Callable, Sequence
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import TYPE_CHECKING
 from urllib.parse import quote, urlparse
 
 import aiohttp
@@ -20,12 +21,19 @@ from src.search.pdf_parse import (
 )
 from src.utils.ssl_context import tcp_connector_with_certifi
 
+if TYPE_CHECKING:
+    from src.fulltext.store import FullTextStore
+
 logger = logging.getLogger(__name__)
 
-# Maximum characters to keep from parsed PDF text before passing to the extractor.
+# Maximum characters of full text handed to the screener.  The full-text store
+# keeps the untruncated document so extraction can still reach late sections.
 # Gemini 2.5 Pro supports 1M tokens; 32K chars is well within budget and
 # covers most academic papers (8-15 pages ~ 24K-45K chars).
 _PDF_MAX_CHARS = DEFAULT_PDF_MAX_CHARS
+# Extra seconds past per_paper_timeout before stream_batch abandons a retrieval
+# whose provider call ignored cancellation (matches the old chunk timeout slack).
+_HARD_DEADLINE_GRACE_SECONDS = 15.0
 
 
 class PDFRetrievalResult(BaseModel):
@@ -49,9 +57,15 @@ class FullTextCoverageSummary(BaseModel):
 
 
 class PDFRetriever:
-    def __init__(self, timeout_seconds: int = 20, extraction_config: object | None = None):
+    def __init__(
+        self,
+        timeout_seconds: int = 20,
+        extraction_config: object | None = None,
+        store: FullTextStore | None = None,
+    ):
         self.timeout_seconds = timeout_seconds
         self._ext_cfg = extraction_config
+        self._store = store
 
     @staticmethod
     def _infer_reason_code(source: str, diagnostics: list[str], error: str | None) -> str:
@@ -101,6 +115,33 @@ class PDFRetriever:
         return "<abstract" in sample or "<dc:" in sample or '"abstract"' in sample
 
     async def retrieve(self, paper: CandidatePaper) -> PDFRetrievalResult:
+        """Resolve full text for ``paper``, reusing and filling the run's full-text store when set."""
+        if self._store is not None:
+            stored = await self._store.get(paper.paper_id)
+            if stored is not None:
+                return PDFRetrievalResult(
+                    paper_id=paper.paper_id,
+                    resolved_url=paper.url,
+                    full_text=stored.text[:_PDF_MAX_CHARS],
+                    source=stored.source,
+                    reason_code=self._infer_reason_code(stored.source, [], None),
+                    diagnostics=[f"FullTextStore: reused {stored.tier} artifact ({stored.char_count} chars)"],
+                    success=True,
+                )
+        result = await self._retrieve_uncached(paper)
+        if self._store is not None and result.success and result.full_text.strip():
+            await self._store.put(
+                paper.paper_id,
+                text=result.full_text,
+                source=result.source,
+                pdf_bytes=result.pdf_bytes,
+            )
+        # The store keeps the whole document for extraction; screening only needs the head.
+        if len(result.full_text) > _PDF_MAX_CHARS:
+            result = result.model_copy(update={"full_text": result.full_text[:_PDF_MAX_CHARS]})
+        return result
+
+    async def _retrieve_uncached(self, paper: CandidatePaper) -> PDFRetrievalResult:
         # Primary: use unified fetch_full_text (Unpaywall, Semantic Scholar, CORE,
         # Europe PMC, ScienceDirect, PMC, arXiv, landing-page resolver) for papers
         # with a DOI or URL.
@@ -138,7 +179,7 @@ class PDFRetriever:
                     **_tier_kwargs,
                 )
                 if ft_result and ft_result.source != "abstract":
-                    validated_text = validated_full_text(ft_result.text, max_chars=_PDF_MAX_CHARS)
+                    validated_text = validated_full_text(ft_result.text, max_chars=None)
                     if validated_text and len(validated_text) >= 500:
                         return PDFRetrievalResult(
                             paper_id=paper.paper_id,
@@ -153,7 +194,7 @@ class PDFRetriever:
                             success=True,
                         )
                     if ft_result.pdf_bytes and len(ft_result.pdf_bytes) > 1000:
-                        parsed = await parse_pdf_bytes_async(ft_result.pdf_bytes, max_chars=_PDF_MAX_CHARS)
+                        parsed = await parse_pdf_bytes_async(ft_result.pdf_bytes, max_chars=None)
                         if not parsed:
                             return PDFRetrievalResult(
                                 paper_id=paper.paper_id,
@@ -208,7 +249,7 @@ class PDFRetriever:
                         content_type = response.headers.get("Content-Type", "").lower()
                         body = await response.read()
                 if "application/pdf" in content_type:
-                    parsed_text = await parse_pdf_bytes_async(body, max_chars=_PDF_MAX_CHARS)
+                    parsed_text = await parse_pdf_bytes_async(body, max_chars=None)
                     if not parsed_text:
                         return PDFRetrievalResult(
                             paper_id=paper.paper_id,
@@ -236,15 +277,15 @@ class PDFRetriever:
 
                     lp = await _resolve_landing_page(url)
                     if lp:
-                        full_text = validated_full_text(lp.text, max_chars=_PDF_MAX_CHARS)
+                        full_text = validated_full_text(lp.text, max_chars=None)
                         lp_pdf = lp.pdf_bytes if lp.pdf_bytes and len(lp.pdf_bytes) > 1000 else None
                         if not full_text and lp_pdf:
-                            full_text = await parse_pdf_bytes_async(lp_pdf, max_chars=_PDF_MAX_CHARS)
+                            full_text = await parse_pdf_bytes_async(lp_pdf, max_chars=None)
                         if full_text and len(full_text.strip()) >= 500:
                             return PDFRetrievalResult(
                                 paper_id=paper.paper_id,
                                 resolved_url=url,
-                                full_text=full_text[:_PDF_MAX_CHARS],
+                                full_text=full_text,
                                 pdf_bytes=lp_pdf,
                                 source=lp.source if lp.source else "landing_page",
                                 reason_code="oa_recovered",
@@ -256,7 +297,7 @@ class PDFRetriever:
                 if self._looks_metadata_only_endpoint(url, content_type, body):
                     fallback_diagnostics.append(f"Resolver: metadata-only endpoint for {url[:80]}")
                     continue
-                decoded = body[:_PDF_MAX_CHARS].decode("utf-8", errors="ignore")
+                decoded = body.decode("utf-8", errors="ignore")
                 if decoded.strip():
                     return PDFRetrievalResult(
                         paper_id=paper.paper_id,
@@ -325,23 +366,7 @@ class PDFRetriever:
 
         async def _fetch_one(paper: CandidatePaper) -> PDFRetrievalResult:
             async with sem:
-                try:
-                    return await asyncio.wait_for(self.retrieve(paper), timeout=per_paper_timeout)
-                except TimeoutError:
-                    return PDFRetrievalResult(
-                        paper_id=paper.paper_id,
-                        reason_code="timeout",
-                        success=False,
-                        error=f"per-paper timeout after {per_paper_timeout}s",
-                    )
-                except Exception as exc:
-                    logger.warning("PDFRetriever: unhandled retrieval error for %s: %s", paper.paper_id, exc)
-                    return PDFRetrievalResult(
-                        paper_id=paper.paper_id,
-                        reason_code="unexpected_error",
-                        success=False,
-                        error=str(exc)[:400],
-                    )
+                return await self._retrieve_with_timeout(paper, per_paper_timeout)
 
         task_to_paper: dict[asyncio.Task[PDFRetrievalResult], CandidatePaper] = {
             asyncio.create_task(_fetch_one(paper)): paper for paper in papers
@@ -439,6 +464,125 @@ class PDFRetriever:
         )
         return results, summary
 
+    async def stream_batch(
+        self,
+        papers: Sequence[CandidatePaper],
+        *,
+        concurrency: int = 8,
+        per_paper_timeout: int = 45,
+        on_progress: Callable[[int, int], None] | None = None,
+        on_result: Callable[[str, str, str, bool, str | None], None] | None = None,
+    ) -> AsyncIterator[tuple[CandidatePaper, PDFRetrievalResult]]:
+        """Yield ``(paper, result)`` in completion order from a sliding window of retrievals.
+
+        At most ``concurrency`` retrievals are in flight and a finished one is
+        replaced immediately, so a slow publisher only occupies its own slot.
+        Each paper has its own hard deadline (``per_paper_timeout`` plus a grace
+        period for provider calls that ignore cancellation) rather than sharing
+        a batch- or chunk-wide timeout.
+        """
+        total = len(papers)
+        done_count = 0
+        hard_timeout = float(per_paper_timeout) + _HARD_DEADLINE_GRACE_SECONDS
+        remaining = iter(papers)
+        inflight: dict[asyncio.Task[PDFRetrievalResult], tuple[CandidatePaper, float]] = {}
+
+        def _launch() -> None:
+            while len(inflight) < max(1, concurrency):
+                paper = next(remaining, None)
+                if paper is None:
+                    return
+                task = asyncio.create_task(self._retrieve_with_timeout(paper, per_paper_timeout))
+                inflight[task] = (paper, time.monotonic() + hard_timeout)
+
+        def _notify(paper: CandidatePaper, outcome: PDFRetrievalResult) -> None:
+            if on_progress is not None:
+                try:
+                    on_progress(done_count, total)
+                except Exception as exc:
+                    logger.warning("PDFRetriever: on_progress callback failed: %s", exc)
+            if on_result is not None:
+                try:
+                    on_result(paper.paper_id, paper.title, outcome.source, outcome.success, outcome.reason_code)
+                except Exception as exc:
+                    logger.warning("PDFRetriever: on_result callback failed for %s: %s", paper.paper_id, exc)
+
+        try:
+            _launch()
+            while inflight:
+                next_deadline = min(deadline for _, deadline in inflight.values())
+                done, _ = await asyncio.wait(
+                    set(inflight),
+                    timeout=max(0.0, next_deadline - time.monotonic()),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                finished: list[tuple[CandidatePaper, PDFRetrievalResult]] = []
+                for task in done:
+                    paper, _ = inflight.pop(task)
+                    try:
+                        outcome = task.result()
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as exc:
+                        logger.warning("PDFRetriever: task result failed for %s: %s", paper.paper_id, exc)
+                        outcome = PDFRetrievalResult(
+                            paper_id=paper.paper_id,
+                            reason_code="unexpected_error",
+                            success=False,
+                            error=str(exc)[:400],
+                        )
+                    finished.append((paper, outcome))
+                now = time.monotonic()
+                for task, (paper, deadline) in list(inflight.items()):
+                    if deadline <= now:
+                        logger.warning(
+                            "PDFRetriever: %s exceeded its %.1fs deadline; releasing its slot",
+                            paper.paper_id,
+                            hard_timeout,
+                        )
+                        task.cancel()
+                        del inflight[task]
+                        finished.append(
+                            (
+                                paper,
+                                PDFRetrievalResult(
+                                    paper_id=paper.paper_id,
+                                    reason_code="timeout",
+                                    success=False,
+                                    error=f"per-paper deadline exceeded after {hard_timeout:.1f}s",
+                                ),
+                            )
+                        )
+                _launch()
+                for paper, outcome in finished:
+                    done_count += 1
+                    _notify(paper, outcome)
+                    yield paper, outcome
+        finally:
+            for task in inflight:
+                task.cancel()
+            if inflight:
+                await asyncio.wait(set(inflight), timeout=2.0)
+
+    async def _retrieve_with_timeout(self, paper: CandidatePaper, per_paper_timeout: int) -> PDFRetrievalResult:
+        try:
+            return await asyncio.wait_for(self.retrieve(paper), timeout=per_paper_timeout)
+        except TimeoutError:
+            return PDFRetrievalResult(
+                paper_id=paper.paper_id,
+                reason_code="timeout",
+                success=False,
+                error=f"per-paper timeout after {per_paper_timeout}s",
+            )
+        except Exception as exc:
+            logger.warning("PDFRetriever: unhandled retrieval error for %s: %s", paper.paper_id, exc)
+            return PDFRetrievalResult(
+                paper_id=paper.paper_id,
+                reason_code="unexpected_error",
+                success=False,
+                error=str(exc)[:400],
+            )
+
     async def _candidate_urls(self, paper: CandidatePaper) -> list[str]:
         urls: list[str] = []
         if paper.url:
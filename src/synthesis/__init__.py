@@ -1,16 +1,23 @@
 """Synthesis and meta-analysis package."""
 
-from src.synthesis.effect_size import (
-    compute_binary_effect_size,
-    compute_mean_difference_effect_size,
-    compute_standardized_mean_difference,
-)
-from src.synthesis.feasibility import (
-    SynthesisFeasibility,
-    assess_meta_analysis_feasibility,
-)
-from src.synthesis.meta_analysis import pool_effects
-from src.synthesis.narrative import NarrativeSynthesis, build_narrative_synthesis
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from src.synthesis.effect_size import (
+        compute_binary_effect_size,
+        compute_mean_difference_effect_size,
+        compute_standardized_mean_difference,
+    )
+    from src.synthesis.feasibility import (
+        SynthesisFeasibility,
+        assess_meta_analysis_feasibility,
+    )
+    from src.synthesis.meta_analysis import pool_effects
+    from src.synthesis.narrative import NarrativeSynthesis, build_narrative_synthesis
 
 __all__ = [
     "NarrativeSynthesis",
@@ -22,3 +29,18 @@ __all__ = [
     "compute_standardized_mean_difference",
     "pool_effects",
 ]
+
+# scipy/statsmodels load on first use, not when e.g. src.db.repos imports feasibility models.
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "compute_binary_effect_size": "src.synthesis.effect_size",
+        "compute_mean_difference_effect_size": "src.synthesis.effect_size",
+        "compute_standardized_mean_difference": "src.synthesis.effect_size",
+        "SynthesisFeasibility": "src.synthesis.feasibility",
+        "assess_meta_analysis_feasibility": "src.synthesis.feasibility",
+        "pool_effects": "src.synthesis.meta_analysis",
+        "NarrativeSynthesis": "src.synthesis.narrative",
+        "build_narrative_synthesis": "src.synthesis.narrative",
+    },
+)
@@ -5,8 +5,8 @@ Identifies pairs of papers that:
 2. Show opposite effect directions (e.g. one reports benefit, other reports harm)
 3. Have non-overlapping 95% confidence intervals (when CI data is available)
 
-Uses pre-computed chunk embeddings when available (from EmbeddingNode),
-falling back to text overlap similarity for runs without embeddings.
+Uses the per-paper centroid embeddings persisted by EmbeddingNode when
+available, falling back to text overlap similarity for runs without embeddings.
 
 O(N^2) pairwise comparison; batched in groups of 500 to bound memory.
 """
@@ -14,10 +14,10 @@ O(N^2) pairwise comparison; batched in groups of 500 to bound memory.
 from __future__ import annotations
 
 import logging
-import math
 from dataclasses import dataclass
 
 from src.models import ExtractionRecord
+from src.rag.paper_vectors import PaperVectors
 
 logger = logging.getLogger(__name__)
 
@@ -91,18 +91,6 @@ def _text_jaccard(a: str, b: str) -> float:
     return intersection / union if union > 0 else 0.0
 
 
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
-    """Compute cosine similarity between two float vectors."""
-    if not a or not b or len(a) != len(b):
-        return 0.0
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(x * x for x in b))
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return dot / (norm_a * norm_b)
-
-
 def _ci_overlap(
     lo_a: float | None,
     hi_a: float | None,
@@ -131,15 +119,16 @@ def _parse_ci(outcome: object) -> tuple[float | None, float | None]:
 
 def detect_contradictions(
     records: list[ExtractionRecord],
-    chunk_embeddings: dict[str, list[float]] | None = None,
+    paper_vectors: PaperVectors | None = None,
     batch_size: int = 500,
 ) -> list[ContradictionFlag]:
     """Detect contradictions across all pairs of extraction records.
 
     Args:
         records: All ExtractionRecord instances from the review.
-        chunk_embeddings: Optional dict mapping paper_id -> mean embedding vector.
-            When provided, cosine similarity is used; otherwise Jaccard on text.
+        paper_vectors: Optional per-paper centroid embeddings (ids, matrix).
+            Pairs where both papers have a vector use cosine similarity;
+            otherwise Jaccard on text.
         batch_size: Number of pairs to process at once.
 
     Returns:
@@ -150,6 +139,9 @@ def detect_contradictions(
 
     flags: list[ContradictionFlag] = []
     n = len(records)
+    emb_row: dict[str, int] = {}
+    if paper_vectors is not None and paper_vectors.ids:
+        emb_row, emb_sims = paper_vectors.similarity([r.paper_id for r in records])
 
     for i in range(n):
         for j in range(i + 1, n):
@@ -163,11 +155,8 @@ def detect_contradictions(
                 continue
 
             # Compute similarity using embeddings if available, else Jaccard
-            if chunk_embeddings and rec_a.paper_id in chunk_embeddings and rec_b.paper_id in chunk_embeddings:
-                similarity = _cosine_similarity(
-                    chunk_embeddings[rec_a.paper_id],
-                    chunk_embeddings[rec_b.paper_id],
-                )
+            if rec_a.paper_id in emb_row and rec_b.paper_id in emb_row:
+                similarity = float(emb_sims[emb_row[rec_a.paper_id], emb_row[rec_b.paper_id]])
             else:
                 similarity = _text_jaccard(summary_a, summary_b)
 
@@ -0,0 +1,35 @@
+"""Lazy package re-exports (PEP 562).
+
+Package ``__init__`` modules re-export their public API for convenience, but
+importing one submodule (e.g. ``src.synthesis.feasibility``) runs the package
+``__init__`` first.  Eager re-exports there pulled scipy, statsmodels, matplotlib
+and pydantic_ai into every CLI command and web cold start.  ``lazy_exports``
+gives a package a module-level ``__getattr__`` that imports the defining
+submodule on first attribute access instead.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> Callable[[str], Any]:
+    """Return a module ``__getattr__`` resolving ``name`` from ``exports[name]``.
+
+    Values are ``"module.path"`` (same attribute name) or ``"module.path:attr"``
+    for re-exports under another name.  Resolved values are cached on the package.
+    """
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module_name, _, attr = target.partition(":")
+        value = getattr(importlib.import_module(module_name), attr or name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
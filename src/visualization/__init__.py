@@ -3,10 +3,12 @@
 from src.visualization.forest_plot import render_forest_plot
 from src.visualization.funnel_plot import render_funnel_plot
 from src.visualization.geographic import render_geographic
+from src.visualization.render_pool import render_figure
 from src.visualization.rob_figure import render_rob_traffic_light
 from src.visualization.timeline import render_timeline
 
 __all__ = [
+    "render_figure",
     "render_forest_plot",
     "render_funnel_plot",
     "render_geographic",
@@ -0,0 +1,179 @@
+"""Off-loop figure rendering with an input-hash cache.
+
+matplotlib rendering is CPU-bound and holds the GIL, so calling a renderer from
+a node blocks the event loop (and SSE delivery) for seconds.  ``render_figure``
+runs a renderer in a small process pool instead -- each worker has its own
+pyplot state on the Agg backend, so independent figures render in parallel --
+and skips the render entirely when the output already exists and was produced
+from identical inputs (resume, rewind to a later phase, re-export).
+
+The cache key hashes the renderer's qualified name, the source of the module
+defining it (so editing a renderer invalidates its figures) and its arguments;
+it is stored in a hidden ``.<output name>.render.json`` file next to the output.
+Renderers or arguments that cannot be pickled (e.g. test doubles) run inline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.util
+import json
+import logging
+import multiprocessing
+import os
+import pickle
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from enum import Enum
+from functools import cache, partial
+from pathlib import Path
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Bump when cached figures must be re-rendered regardless of inputs.
+_CACHE_VERSION = 1
+
+_render_executor: ProcessPoolExecutor | None = None
+_render_pool_size = max(1, min(4, os.cpu_count() or 1))
+
+
+def _init_render_worker() -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def configure_figure_render_pool(max_workers: int = 4) -> None:
+    """Configure the figure-rendering process pool (call once at startup)."""
+    global _render_executor, _render_pool_size
+    _render_pool_size = max(1, int(max_workers))
+    if _render_executor is not None:
+        _render_executor.shutdown(wait=False, cancel_futures=True)
+    _render_executor = ProcessPoolExecutor(
+        max_workers=_render_pool_size,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_render_worker,
+    )
+
+
+def _get_render_executor() -> ProcessPoolExecutor:
+    if _render_executor is None:
+        configure_figure_render_pool(_render_pool_size)
+    assert _render_executor is not None
+    return _render_executor
+
+
+def _discard_render_executor() -> None:
+    global _render_executor
+    if _render_executor is not None:
+        _render_executor.shutdown(wait=False, cancel_futures=True)
+        _render_executor = None
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return repr(value)
+
+
+@cache
+def _module_source_hash(module: str) -> str:
+    """sha256 of *module*'s source file, or "" when it has none (``__main__``, builtins)."""
+    try:
+        spec = importlib.util.find_spec(module)
+    except (ImportError, ValueError):
+        return ""
+    if spec is None or not spec.origin or not os.path.isfile(spec.origin):
+        return ""
+    with open(spec.origin, "rb") as handle:
+        return hashlib.sha256(handle.read()).hexdigest()
+
+
+def figure_cache_key(fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    module = getattr(fn, "__module__", "") or ""
+    name = f"{module}.{getattr(fn, '__qualname__', type(fn).__name__)}"
+    payload = json.dumps(
+        {"v": _CACHE_VERSION, "fn": name, "src": _module_source_hash(module), "args": args, "kwargs": kwargs},
+        sort_keys=True,
+        default=_jsonable,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cache_path(output_path: str | Path) -> Path:
+    path = Path(output_path)
+    return path.with_name(f".{path.name}.render.json")
+
+
+def _cached_result(output_path: str | Path, key: str, extra_outputs: list[str]) -> tuple[bool, Any]:
+    if not all(Path(path).is_file() for path in (output_path, *extra_outputs)):
+        return False, None
+    try:
+        entry = json.loads(_cache_path(output_path).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return False, None
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return False, None
+    return True, entry.get("result")
+
+
+def _store_result(output_path: str | Path, key: str, result: Any) -> None:
+    stored = None if result is None else str(result)
+    try:
+        _cache_path(output_path).write_text(json.dumps({"key": key, "result": stored}), encoding="utf-8")
+    except OSError as exc:
+        logger.debug("Could not write figure cache entry for %s: %s", output_path, exc)
+
+
+def _picklable(*objects: Any) -> bool:
+    try:
+        pickle.dumps(objects)
+    except Exception:
+        return False
+    return True
+
+
+async def render_figure(fn: Callable[..., _T], *args: Any, output_path: str, **kwargs: Any) -> _T | str | None:
+    """Run ``fn(*args, output_path=output_path, **kwargs)`` off the event loop, reusing a cached output.
+
+    On a cache hit the stored return value is given back as a string (renderers
+    return the output path, or None when they chose not to draw).  Exceptions
+    raised by the renderer propagate to the caller as before.
+    """
+    kwargs = {**kwargs, "output_path": output_path}
+    key = figure_cache_key(fn, args, kwargs)
+    # Secondary outputs (e.g. ``rob2_output_path``) must also still exist for a hit.
+    extra_outputs = [str(v) for k, v in kwargs.items() if k.endswith("_output_path") and v]
+    hit, cached = _cached_result(output_path, key, extra_outputs)
+    if hit:
+        logger.debug("Figure cache hit for %s", output_path)
+        return cached
+
+    call = partial(fn, *args, **kwargs)
+    result: _T
+    if _picklable(call):
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(_get_render_executor(), call)
+        except (BrokenProcessPool, OSError) as exc:
+            logger.warning("Figure render pool unavailable (%s); rendering %s inline.", exc, output_path)
+            _discard_render_executor()
+            result = call()
+    else:
+        result = call()
+    _store_result(output_path, key, result)
+    return result
@@ -27,6 +27,7 @@ from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from src.db.workflow_registry import _open_registry as _open_registry_db
+from src.db.workflow_registry import close_registry_pools, open_registry_pool
 from src.web.routers import (
     advanced_router,
     artifacts_router,
@@ -53,6 +54,7 @@ from src.web.state import (
     _refresh_allowed_roots,
     _repair_registry_statuses_from_runtime,
     _RunRecord,
+    _web_cfg,
 )
 from src.web.state import _active_runs as _active_runs  # noqa: F811  -- re-export
 from src.web.state import _lifecycle_coordinator as _lifecycle_coordinator  # noqa: F811  -- re-export
@@ -86,6 +88,10 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception:
         pass
     await _repair_registry_statuses_from_runtime("runs")
+    try:
+        await open_registry_pool("runs", readers=_web_cfg.registry_reader_pool_size)
+    except Exception:
+        _logger.warning("Registry pool unavailable; falling back to per-call connections", exc_info=True)
     eviction = asyncio.create_task(_eviction_loop())
     yield
     eviction.cancel()
@@ -122,6 +128,7 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
                 _SHUTDOWN_TASK_TIMEOUT_SECONDS,
                 len(pending_workflow_tasks),
             )
+    await close_registry_pools()
 
 
 # ---------------------------------------------------------------------------
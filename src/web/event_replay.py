@@ -115,7 +115,7 @@ async def load_checkpoints(db_path: str, workflow_id: str) -> dict[str, str]:
 
 async def load_replay_events(db_path: str, workflow_id: str | None = None) -> list[dict[str, Any]]:
     """Load persisted events and align UI timeline phases with checkpoint truth."""
-    events = await EventStore().load(db_path)
+    events = await EventStore().load(db_path, workflow_id)
     wf_id = workflow_id or await resolve_workflow_id(db_path)
     if not wf_id:
         return events
@@ -27,6 +27,14 @@ DURABLE_EVENT_TYPES = frozenset(
     }
 )
 
+# Live-only events: streamed to connected clients but never written to
+# event_log.  Each one supersedes the previous event of the same type and
+# section (or document, for LaTeX compile logs), whose text is dropped so the
+# in-memory log stays bounded.
+EPHEMERAL_EVENT_TYPES = frozenset({"section_preview", "compile_log"})
+
+_TERMINAL_EVENT_TYPES = frozenset({"done", "error", "cancelled"})
+
 
 class EventRecord(Protocol):
     event_log: list[dict[str, Any]]
@@ -42,6 +50,7 @@ class EventStore:
 
     def __init__(self) -> None:
         self._flush_tasks: dict[int, set[asyncio.Task[None]]] = {}
+        self._live_ephemeral: dict[int, dict[tuple[str, str], dict[str, Any]]] = {}
 
     async def persist(self, db_path: str, workflow_id: str, events: list[dict[str, Any]]) -> None:
         if not events or not workflow_id:
@@ -93,12 +102,21 @@ class EventStore:
         else:
             await asyncio.wait_for(coro, timeout=timeout)
 
-    async def load(self, db_path: str) -> list[dict[str, Any]]:
+    async def load(self, db_path: str, workflow_id: str | None = None) -> list[dict[str, Any]]:
         try:
             async with aiosqlite.connect(db_path) as db:
                 db.row_factory = aiosqlite.Row
-                async with db.execute("SELECT id, payload, ts FROM event_log ORDER BY id ASC") as cur:
-                    rows = await cur.fetchall()
+                rows = []
+                if workflow_id:
+                    # idx_event_log_workflow keys are (workflow_id, rowid): no sort needed.
+                    async with db.execute(
+                        "SELECT id, payload, ts FROM event_log WHERE workflow_id = ? ORDER BY id ASC",
+                        (workflow_id,),
+                    ) as cur:
+                        rows = await cur.fetchall()
+                if not rows:
+                    async with db.execute("SELECT id, payload, ts FROM event_log ORDER BY id ASC") as cur:
+                        rows = await cur.fetchall()
             events: list[dict[str, Any]] = []
             for row in rows:
                 event = json.loads(row["payload"])
@@ -122,16 +140,35 @@ class EventStore:
             new = record.event_log[record._flush_index :]
             if not new:
                 return
-            await self.persist(record.db_path, record.workflow_id, new)
+            await self.persist(
+                record.db_path,
+                record.workflow_id,
+                [e for e in new if e.get("type") not in EPHEMERAL_EVENT_TYPES],
+            )
             record._flush_index += len(new)
 
+    def _supersede_ephemeral(self, record: EventRecord, event: dict[str, Any]) -> None:
+        live = self._live_ephemeral.setdefault(id(record), {})
+        key = (str(event.get("type")), str(event.get("section") or event.get("document") or ""))
+        previous = live.get(key)
+        if previous is not None:
+            previous["text"] = ""
+            previous["superseded"] = True
+        live[key] = event
+
     def append(self, record: EventRecord, event: dict[str, Any]) -> None:
         if not event.get("id"):
             event["id"] = f"evt-{uuid.uuid4().hex}"
         if not event.get("ts"):
             event["ts"] = datetime.datetime.now(datetime.UTC).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
         event_type = str(event.get("type") or "")
-        event["durability"] = "durable" if event_type in DURABLE_EVENT_TYPES else "eventual"
+        if event_type in EPHEMERAL_EVENT_TYPES:
+            event["durability"] = "ephemeral"
+            self._supersede_ephemeral(record, event)
+        else:
+            event["durability"] = "durable" if event_type in DURABLE_EVENT_TYPES else "eventual"
+        if event_type in _TERMINAL_EVENT_TYPES:
+            self._live_ephemeral.pop(id(record), None)
         record.event_log.append(event)
         try:
             asyncio.create_task(self.notify(record))
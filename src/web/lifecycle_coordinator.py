@@ -205,7 +205,7 @@ class RunLifecycleCoordinator:
         registry = pathlib.Path(resolved.run_root) / "workflows_registry.db"
         if registry.exists():
             try:
-                async with _open_registry_db(str(registry)) as db:
+                async with _open_registry_db(str(registry), readonly=True) as db:
                     db.row_factory = aiosqlite.Row
                     async with db.execute(
                         """
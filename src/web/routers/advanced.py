@@ -16,7 +16,6 @@ from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import FileResponse, StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 
-from src.export.prisma_flow_export import build_prisma_flow_zip_bytes
 from src.web.run_concurrency import acquire_run_slot_or_raise
 from src.web.run_resolver import resolve_runtime_db
 from src.web.shared import (
@@ -277,6 +276,8 @@ async def download_prisma_flow_zip(run_id: str) -> StreamingResponse:
     """Download PRISMA flow data as a ZIP of CSV files (summary, per-paper records, search identification)."""
     db_path = await resolve_runtime_db(run_id)
     workflow_id = await _resolve_workflow_id_from_db(db_path) or run_id
+    from src.export.prisma_flow_export import build_prisma_flow_zip_bytes
+
     try:
         zip_bytes = await build_prisma_flow_zip_bytes(db_path, workflow_id)
     except Exception as exc:
@@ -3,21 +3,24 @@
 from __future__ import annotations
 
 import asyncio
-import io
 import json as _json
 import logging
 import pathlib
-import zipfile
 from collections.abc import AsyncGenerator
 from typing import Any
 from urllib.parse import urlparse
 
 import aiosqlite
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
 from src.config.loader import load_configs as _load_configs
-from src.export.submission_packager import package_submission
+from src.fulltext.manifest import (
+    has_papers_manifest,
+    load_papers_manifest,
+    lookup_manifest_entry,
+    write_papers_manifest,
+)
 from src.manuscript.readiness import compute_readiness_scorecard
 from src.search.pdf_parse import is_pdf_bytes, path_is_valid_pdf
 from src.web.control_plane_service import ControlPlaneService
@@ -31,6 +34,14 @@ from src.web.shared import (
     _resolve_workflow_id_from_db,
 )
 from src.web.state import _lifecycle_coordinator
+from src.web.zip_stream import (
+    CACHE_DIRNAME,
+    ZipEntry,
+    build_cached_archive,
+    cached_archive_path,
+    entries_digest,
+    stream_and_cache,
+)
 
 _logger = logging.getLogger(__name__)
 
@@ -42,6 +53,26 @@ router = APIRouter(tags=["artifacts"])
 # ---------------------------------------------------------------------------
 
 
+async def _zip_download_response(
+    request: Request,
+    entries: list[ZipEntry],
+    *,
+    cache_dir: pathlib.Path,
+    cache_name: str,
+    headers: dict[str, str],
+) -> Response:
+    """Serve a cached archive (Range-capable) or stream a fresh one while caching it."""
+    digest = await asyncio.to_thread(entries_digest, entries)
+    target = cached_archive_path(cache_dir, cache_name, digest)
+    if not target.is_file() and request.headers.get("range"):
+        # Resumed download of an archive that is not cached yet: byte offsets
+        # need the finished file, so build it before answering.
+        await asyncio.to_thread(build_cached_archive, entries, target)
+    if target.is_file():
+        return FileResponse(target, media_type="application/zip", headers=headers)
+    return StreamingResponse(stream_and_cache(entries, target), media_type="application/zip", headers=headers)
+
+
 async def _load_phase_metric_map(
     db: aiosqlite.Connection,
     workflow_id: str,
@@ -417,14 +448,7 @@ async def get_run_manuscript(run_id: str, fmt: str = "md") -> dict[str, Any]:
 async def get_papers_reference(run_id: str) -> dict[str, Any]:
     db_path = await resolve_runtime_db(run_id)
     run_dir = pathlib.Path(db_path).parent
-    manifest_path = run_dir / "data_papers_manifest.json"
-
-    manifest: dict[str, Any] = {}
-    if manifest_path.exists():
-        try:
-            manifest = _json.loads(manifest_path.read_text(encoding="utf-8"))
-        except Exception:
-            manifest = {}
+    manifest = load_papers_manifest(run_dir / "data_papers_manifest.json")
 
     try:
         async with aiosqlite.connect(db_path) as db:
@@ -486,15 +510,10 @@ async def get_paper_file(run_id: str, paper_id: str) -> StreamingResponse:
     run_dir = pathlib.Path(db_path).parent
     manifest_path = run_dir / "data_papers_manifest.json"
 
-    if not manifest_path.exists():
+    if not has_papers_manifest(manifest_path):
         raise HTTPException(status_code=404, detail="No papers manifest found for this run.")
 
-    try:
-        manifest = _json.loads(manifest_path.read_text(encoding="utf-8"))
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"Could not read manifest: {exc}") from exc
-
-    entry = manifest.get(paper_id)
+    entry = lookup_manifest_entry(manifest_path, paper_id)
     if not entry:
         raise HTTPException(status_code=404, detail=f"Paper {paper_id} not in manifest.")
 
@@ -530,19 +549,13 @@ async def get_paper_file(run_id: str, paper_id: str) -> StreamingResponse:
 
 
 @router.get("/api/run/{run_id}/studies-files.zip")
-async def download_study_files_zip(run_id: str) -> StreamingResponse:
+async def download_study_files_zip(run_id: str, request: Request) -> Response:
     db_path = await resolve_runtime_db(run_id)
     run_dir = pathlib.Path(db_path).parent
     manifest_path = run_dir / "data_papers_manifest.json"
-    if not manifest_path.exists():
+    if not has_papers_manifest(manifest_path):
         raise HTTPException(status_code=404, detail="No papers manifest found for this run.")
-
-    try:
-        manifest = _json.loads(manifest_path.read_text(encoding="utf-8"))
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"Could not read manifest: {exc}") from exc
-    if not isinstance(manifest, dict):
-        raise HTTPException(status_code=500, detail="Invalid papers manifest format.")
+    manifest = load_papers_manifest(manifest_path)
 
     try:
         async with aiosqlite.connect(db_path) as db:
@@ -565,7 +578,7 @@ async def download_study_files_zip(run_id: str) -> StreamingResponse:
         raise HTTPException(status_code=404, detail="No included studies found for this run.")
 
     included_ids = {str(row["paper_id"]) for row in rows}
-    zip_entries: list[tuple[pathlib.Path, str]] = []
+    zip_entries: list[ZipEntry] = []
     for paper_id in sorted(included_ids):
         entry = manifest.get(paper_id, {})
         if not isinstance(entry, dict):
@@ -578,7 +591,7 @@ async def download_study_files_zip(run_id: str) -> StreamingResponse:
             continue
         if not path_is_valid_pdf(file_path):
             continue
-        zip_entries.append((file_path, f"{paper_id}.pdf"))
+        zip_entries.append(ZipEntry(file_path, f"{paper_id}.pdf"))
 
     if not zip_entries:
         raise HTTPException(
@@ -589,14 +602,11 @@ async def download_study_files_zip(run_id: str) -> StreamingResponse:
     topic = await _get_topic_for_db(db_path)
     zip_name = _make_download_slug(workflow_id or run_id, topic) + "-studies-files.zip"
 
-    buf = io.BytesIO()
-    with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for file_path, arcname in zip_entries:
-            zf.write(file_path, arcname=arcname)
-    buf.seek(0)
-    return StreamingResponse(
-        buf,
-        media_type="application/zip",
+    return await _zip_download_response(
+        request,
+        zip_entries,
+        cache_dir=run_dir / CACHE_DIRNAME,
+        cache_name="studies-files",
         headers={"Content-Disposition": f'attachment; filename="{zip_name}"'},
     )
 
@@ -614,12 +624,7 @@ async def fetch_pdfs_for_run(run_id: str) -> StreamingResponse:
 
     papers_dir.mkdir(parents=True, exist_ok=True)
 
-    manifest: dict[str, Any] = {}
-    if manifest_path.exists():
-        try:
-            manifest = _json.loads(manifest_path.read_text(encoding="utf-8"))
-        except Exception:
-            manifest = {}
+    manifest = load_papers_manifest(manifest_path)
 
     try:
         async with aiosqlite.connect(db_path) as db:
@@ -762,6 +767,7 @@ async def fetch_pdfs_for_run(run_id: str) -> StreamingResponse:
                     "title": title,
                     "authors": rows[orig_idx]["authors"] or "",
                     "year": rows[orig_idx]["year"],
+                    "journal": rows[orig_idx]["journal"] or "",
                     "doi": doi,
                     "url": url,
                     "source": source,
@@ -788,7 +794,7 @@ async def fetch_pdfs_for_run(run_id: str) -> StreamingResponse:
                 )
                 yield f"data: {_json.dumps({'type': 'progress', 'current': orig_idx + 1, 'total': total, 'paper_id': paper_id, 'title': title, 'status': result_status, 'source': source, 'file_type': file_type})}\n\n"
 
-        manifest_path.write_text(_json.dumps(manifest, indent=2), encoding="utf-8")
+        write_papers_manifest(manifest_path, manifest)
 
         attempted = total - skipped
         failed = attempted - succeeded
@@ -863,8 +869,22 @@ async def trigger_export(run_id: str, run_root: str = "runs", force: bool = Fals
                     status_code=409,
                     detail=("Submission package exists but is incomplete; retry with force=true to rebuild"),
                 )
+    from src.export.submission_packager import package_submission
+    from src.web.state import _append_event
+
+    record = (
+        _lifecycle_coordinator.get(run_id)
+        or _lifecycle_coordinator.find_active_by_workflow(workflow_id)
+        or _lifecycle_coordinator.find_attached_done_by_workflow(workflow_id)
+    )
+
+    def _on_compile_log(step: str, text: str) -> None:
+        # Ephemeral: streamed to the run's SSE subscribers, never persisted.
+        if record is not None:
+            _append_event(record, {"type": "compile_log", "document": "manuscript.tex", "step": step, "text": text})
+
     try:
-        submission_dir = await package_submission(workflow_id, run_root)
+        submission_dir = await package_submission(workflow_id, run_root, on_log=_on_compile_log)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Export failed: {exc}") from exc
     if submission_dir is None:
@@ -962,6 +982,7 @@ async def get_run_diagnostics(run_id: str, run_root: str = "runs") -> dict[str,
         phase_performance_rows = await repo.get_phase_performance_summary(workflow_id)
         screening_diagnostics = await _build_screening_diagnostics(db, workflow_id)
         extraction_diagnostics = await _build_extraction_diagnostics(repo, db, workflow_id, db_path)
+        query_profile = await repo.get_query_profile(workflow_id)
     payload = control_plane_snapshot.as_diagnostics_payload()
     payload.update(
         {
@@ -971,13 +992,14 @@ async def get_run_diagnostics(run_id: str, run_root: str = "runs") -> dict[str,
             "screening_diagnostics": screening_diagnostics,
             "extraction_diagnostics": extraction_diagnostics,
             "audit_summary": _format_manuscript_audit_summary(latest_audit),
+            "query_profile": query_profile,
         }
     )
     return payload
 
 
 @router.get("/api/run/{run_id}/submission.zip")
-async def download_submission_zip(run_id: str) -> StreamingResponse:
+async def download_submission_zip(run_id: str, request: Request) -> Response:
     db_path = await resolve_runtime_db(run_id)
     summary_path = pathlib.Path(db_path).parent / "run_summary.json"
     if not summary_path.exists():
@@ -992,15 +1014,16 @@ async def download_submission_zip(run_id: str) -> StreamingResponse:
     workflow_id: str = summary.get("workflow_id", run_id)
     topic = await _get_topic_for_db(db_path)
     download_name = _make_download_slug(workflow_id, topic) + ".zip"
-    buf = io.BytesIO()
-    with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for fpath in sorted(submission_dir.rglob("*")):
-            if fpath.is_file():
-                zf.write(fpath, arcname=fpath.relative_to(submission_dir))
-    buf.seek(0)
-    return StreamingResponse(
-        buf,
-        media_type="application/zip",
+    zip_entries = [
+        ZipEntry(fpath, fpath.relative_to(submission_dir).as_posix())
+        for fpath in sorted(submission_dir.rglob("*"))
+        if fpath.is_file()
+    ]
+    return await _zip_download_response(
+        request,
+        zip_entries,
+        cache_dir=pathlib.Path(db_path).parent / CACHE_DIRNAME,
+        cache_name="submission",
         headers={"Content-Disposition": f"attachment; filename={download_name}"},
     )
 
@@ -74,6 +74,17 @@ def _format_cost_group_rows(rows: list[dict[str, Any]], label_key: str) -> list[
                 "tokens_out": int(row.get("tokens_out") or 0),
             }
         )
+        if "cache_read_tokens" in row:
+            cache_read = int(row.get("cache_read_tokens") or 0)
+            tokens_in = formatted[-1]["tokens_in"]
+            formatted[-1].update(
+                {
+                    "cache_read_tokens": cache_read,
+                    "cache_write_tokens": int(row.get("cache_write_tokens") or 0),
+                    # Share of prompt tokens served from the provider's prefix cache.
+                    "cache_hit_ratio": round(cache_read / tokens_in, 4) if tokens_in > 0 else 0.0,
+                }
+            )
     return formatted
 
 
@@ -141,7 +152,7 @@ async def _fetch_registry_cost_rows(
     if not registry.exists():
         return []
 
-    async with _open_registry_db(str(registry)) as reg_db:
+    async with _open_registry_db(str(registry), readonly=True) as reg_db:
         reg_db.row_factory = aiosqlite.Row
         where_archived = "" if include_archived else "WHERE COALESCE(is_archived, 0) = 0"
         async with reg_db.execute(
@@ -381,7 +392,9 @@ async def get_db_cost_dashboard(run_id: str) -> dict[str, Any]:
                            COUNT(*) AS calls,
                            COALESCE(SUM(tokens_in), 0) AS tokens_in,
                            COALESCE(SUM(tokens_out), 0) AS tokens_out,
-                           COALESCE(SUM(cost_usd), 0.0) AS cost_usd
+                           COALESCE(SUM(cost_usd), 0.0) AS cost_usd,
+                           COALESCE(SUM(cache_read_tokens), 0) AS cache_read_tokens,
+                           COALESCE(SUM(cache_write_tokens), 0) AS cache_write_tokens
                     FROM cost_records
                     GROUP BY group_key
                     ORDER BY cost_usd DESC
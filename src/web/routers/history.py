@@ -249,9 +249,11 @@ async def list_history(
     if not registry.exists():
         return []
     try:
-        async with _open_registry_db(str(registry)) as db:
+        if str(registry) not in _registry_migrated:
+            async with _open_registry_db(str(registry)) as db:
+                await _ensure_registry_columns(db, str(registry))
+        async with _open_registry_db(str(registry), readonly=True) as db:
             db.row_factory = aiosqlite.Row
-            await _ensure_registry_columns(db, str(registry))
             async with db.execute(
                 """SELECT workflow_id, topic, status, db_path,
                           COALESCE(created_at, '') AS created_at,
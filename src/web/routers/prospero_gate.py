@@ -13,7 +13,6 @@ from src.db.workflow_registry import find_by_workflow_id, run_root_from_db_path
 from src.db.workflow_registry import update_status as _update_status
 from src.models.config import ReviewConfig
 from src.orchestration.helpers.prospero_validation import validate_prospero_id
-from src.protocol.generator import ProtocolGenerator
 from src.web.run_resolver import resolve_registry_entry, resolve_runtime_db
 from src.web.shared import ResumeRequest, SubmitProsperoRequest
 from src.web.state import _lifecycle_coordinator, _resume_wrapper
@@ -49,6 +48,8 @@ def _regenerate_prospero_artifacts(run_dir: pathlib.Path, workflow_id: str) -> N
         raise FileNotFoundError(f"Review config not found in {run_dir}")
 
     review, settings = load_configs(review_path=str(review_path), settings_path="config/settings.yaml")
+    from src.protocol.generator import ProtocolGenerator
+
     generator = ProtocolGenerator(output_dir=str(run_dir))
     generator.generate_pre_registration_artifacts(workflow_id, review, settings)
 
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from fastapi import APIRouter
 
+from src.db.workflow_registry import registry_pool_stats
+
 router = APIRouter(prefix="/api", tags=["system"])
 
 
 @router.get("/health")
 async def health_check() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/registry/metrics")
+async def registry_metrics() -> dict[str, Any]:
+    """Lock-wait and heartbeat batching counters for pooled registry connections."""
+    return {"pools": registry_pool_stats()}
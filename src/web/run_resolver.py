@@ -111,7 +111,7 @@ class RunResolver:
         if not registry.exists():
             return None
         try:
-            async with _open_registry_db(str(registry)) as db:
+            async with _open_registry_db(str(registry), readonly=True) as db:
                 db.row_factory = aiosqlite.Row
                 async with db.execute(
                     f"SELECT {_REGISTRY_ROW_COLUMNS} FROM workflows_registry WHERE workflow_id = ?",
@@ -284,7 +284,7 @@ async def _query_included_papers_rows(
         return []
 
     if for_fetch:
-        select_cols = "p.paper_id, p.title, p.authors, p.year, p.doi, p.url, p.source_database"
+        select_cols = "p.paper_id, p.title, p.authors, p.year, p.journal, p.doi, p.url, p.source_database"
         order_by = "p.paper_id"
     else:
         select_cols = (
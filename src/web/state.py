@@ -20,7 +20,7 @@ from fastapi import HTTPException
 from src.config.env_context import async_env_override_context
 from src.config.loader import load_configs as _load_configs
 from src.db.workflow_registry import _open_registry as _open_registry_db
-from src.db.workflow_registry import update_heartbeat as _update_registry_heartbeat
+from src.db.workflow_registry import update_heartbeats as _update_registry_heartbeats
 from src.db.workflow_registry import update_status as _update_registry_status
 from src.models.workflow import WorkflowRunResult
 from src.web.event_replay import load_replay_events
@@ -218,7 +218,7 @@ async def _refresh_allowed_roots() -> None:
     registry = pathlib.Path("runs") / "workflows_registry.db"
     if registry.exists():
         try:
-            async with _open_registry_db(str(registry)) as db:
+            async with _open_registry_db(str(registry), readonly=True) as db:
                 async with db.execute("SELECT db_path FROM workflows_registry") as cur:
                     rows = await cur.fetchall()
             for (db_path,) in rows:
@@ -247,7 +247,7 @@ async def _repair_registry_statuses_from_runtime(run_root: str = "runs") -> None
     if not registry.exists():
         return
     try:
-        async with _open_registry_db(str(registry)) as db:
+        async with _open_registry_db(str(registry), readonly=True) as db:
             db.row_factory = aiosqlite.Row
             async with db.execute(
                 """
@@ -336,17 +336,66 @@ async def _resolve_effective_status(
 # ---------------------------------------------------------------------------
 
 
-async def _heartbeat_loop(run_root: str, workflow_id: str, interval: int = 60) -> None:
-    """Background task: update heartbeat_at every `interval` seconds while a workflow runs."""
-    try:
-        while True:
-            await asyncio.sleep(interval)
+class _HeartbeatBatcher:
+    """Process-wide heartbeat writer shared by every active run.
+
+    Each run registers its (run_root, workflow_id) pair; one background task
+    stamps all of them with a single registry UPDATE per run_root every interval
+    and exits once no runs remain.
+    """
+
+    def __init__(self) -> None:
+        self._members: dict[str, set[str]] = {}
+        self._interval = 60
+        self._task: asyncio.Task[None] | None = None
+
+    def add(self, run_root: str, workflow_id: str, interval: int) -> None:
+        running = self._task is not None and not self._task.done()
+        self._interval = min(self._interval, interval) if running else interval
+        self._members.setdefault(run_root, set()).add(workflow_id)
+        if not running:
+            self._task = asyncio.create_task(self._loop())
+
+    def discard(self, run_root: str, workflow_id: str) -> None:
+        ids = self._members.get(run_root)
+        if ids is None:
+            return
+        ids.discard(workflow_id)
+        if not ids:
+            self._members.pop(run_root, None)
+
+    async def flush(self) -> None:
+        for run_root, ids in list(self._members.items()):
             try:
-                await _update_registry_heartbeat(run_root, workflow_id)
+                await _update_registry_heartbeats(run_root, list(ids))
             except Exception:
-                pass
+                _logger.debug("Heartbeat batch failed for %s", run_root, exc_info=True)
+
+    async def _loop(self) -> None:
+        try:
+            while self._members:
+                await asyncio.sleep(self._interval)
+                await self.flush()
+        except asyncio.CancelledError:
+            pass
+
+
+_heartbeat_batcher = _HeartbeatBatcher()
+
+
+async def _heartbeat_loop(run_root: str, workflow_id: str, interval: int = 60) -> None:
+    """Background task: keep heartbeat_at fresh while a workflow runs.
+
+    Membership-only: the shared batcher issues the registry writes.  Cancelling
+    this task removes the workflow from the next batch.
+    """
+    _heartbeat_batcher.add(run_root, workflow_id, interval)
+    try:
+        await asyncio.get_running_loop().create_future()
     except asyncio.CancelledError:
         pass
+    finally:
+        _heartbeat_batcher.discard(run_root, workflow_id)
 
 
 async def _event_flusher_loop(record: _RunRecord, interval: int = 5) -> None:
@@ -0,0 +1,131 @@
+"""Streaming ZIP archives for run downloads (submission.zip, studies-files.zip).
+
+``iter_zip`` writes the archive through :mod:`zipfile` into an unseekable sink
+and yields compressed bytes as each source file is read, so the first byte
+goes out before the last PDF is touched and memory stays at one chunk.
+Already-compressed formats (PDF, PNG, JPEG, office zips) are stored rather
+than deflated.
+
+Finished archives are cached under the run directory keyed by a digest of the
+entry manifest (arcname, size, mtime), so a repeat download is served from
+disk by ``FileResponse`` -- which also handles HTTP ``Range`` requests for
+resumed downloads.  Any change to the included files changes the digest and
+invalidates the cached copy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import uuid
+import zipfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+CACHE_DIRNAME = ".download_cache"
+STORED_SUFFIXES = frozenset(
+    {".pdf", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".zip", ".gz", ".docx", ".xlsx", ".pptx"}
+)
+_CHUNK_SIZE = 64 * 1024
+# Bump when the archive layout changes so stale cache entries are not served.
+_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ZipEntry:
+    """A file on disk and the name it gets inside the archive."""
+
+    path: Path
+    arcname: str
+
+
+def entries_digest(entries: Iterable[ZipEntry]) -> str:
+    """Stable hash of the archive manifest; changes whenever any member file changes."""
+    manifest: list[list[object]] = [[_FORMAT_VERSION]]
+    for entry in entries:
+        stat = entry.path.stat()
+        manifest.append([entry.arcname, stat.st_size, stat.st_mtime_ns])
+    return hashlib.sha256(json.dumps(manifest, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def cached_archive_path(cache_dir: Path, name: str, digest: str) -> Path:
+    return cache_dir / f"{name}-{digest[:16]}.zip"
+
+
+class _ChunkSink:
+    """Write-only, unseekable file object; ``zipfile`` then emits data descriptors."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_zip(entries: Iterable[ZipEntry]) -> Iterator[bytes]:
+    """Yield the bytes of a ZIP archive containing ``entries`` as they are produced."""
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED, allowZip64=True) as zf:  # type: ignore[arg-type]
+        for entry in entries:
+            info = zipfile.ZipInfo.from_file(entry.path, arcname=entry.arcname)
+            stored = entry.path.suffix.lower() in STORED_SUFFIXES
+            info.compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+            with entry.path.open("rb") as src, zf.open(info, mode="w") as dst:
+                while chunk := src.read(_CHUNK_SIZE):
+                    dst.write(chunk)
+                    if data := sink.drain():
+                        yield data
+            if data := sink.drain():
+                yield data
+    if data := sink.drain():
+        yield data
+
+
+def stream_and_cache(entries: list[ZipEntry], target: Path) -> Iterator[bytes]:
+    """Stream the archive while teeing it to ``target``.
+
+    The copy is written to a unique ``.partial`` file and atomically renamed
+    only after the last byte, so an aborted download never leaves a truncated
+    archive in the cache.  Older archives for the same download name are pruned.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    partial = target.with_name(f"{target.name}.{uuid.uuid4().hex}.partial")
+    completed = False
+    try:
+        with partial.open("wb") as fh:
+            for chunk in iter_zip(entries):
+                fh.write(chunk)
+                yield chunk
+        os.replace(partial, target)
+        completed = True
+        _prune_stale(target)
+    finally:
+        if not completed:
+            partial.unlink(missing_ok=True)
+
+
+def build_cached_archive(entries: list[ZipEntry], target: Path) -> Path:
+    """Write the archive to ``target`` without streaming it anywhere else."""
+    for _chunk in stream_and_cache(entries, target):
+        pass
+    return target
+
+
+def _prune_stale(target: Path) -> None:
+    name = target.name.rsplit("-", 1)[0]
+    pattern = re.compile(rf"{re.escape(name)}-[0-9a-f]{{16}}\.zip")
+    for sibling in target.parent.iterdir():
+        if sibling != target and pattern.fullmatch(sibling.name):
+            sibling.unlink(missing_ok=True)
@@ -1,7 +1,17 @@
 """Manuscript section writing with citation lineage."""
 
-from src.writing.section_writer import SectionWriter
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from src.writing.section_writer import SectionWriter
 
 __all__ = [
     "SectionWriter",
 ]
+
+# Keep ``src.writing.headings`` & co. importable without loading the LLM stack.
+__getattr__ = lazy_exports(__name__, {"SectionWriter": "src.writing.section_writer"})
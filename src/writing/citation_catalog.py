@@ -6,6 +6,7 @@ import logging
 import re
 import unicodedata
 
+from src.citation.index import citation_index_for_catalog
 from src.config.env_context import get_env
 from src.db.repositories import CitationRepository
 from src.models import (
@@ -253,12 +254,8 @@ def build_citation_catalog_from_papers(papers: list[CandidatePaper]) -> str:
 
 
 def _extract_valid_citekeys(citation_catalog: str) -> set[str]:
-    keys: set[str] = set()
-    for line in citation_catalog.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("[") and "]" in stripped:
-            keys.add(stripped[1 : stripped.index("]")].strip())
-    return keys
+    """Catalog citekeys, read from the shared per-catalog ``CitationIndex``."""
+    return set(citation_index_for_catalog(citation_catalog).keys)
 
 
 def _extract_included_study_citekeys(citation_catalog: str) -> set[str]:
@@ -10,6 +10,9 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Collection
+
+from src.citation.index import CitationIndex, citation_index_for_keys
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +25,6 @@ _BRACKET_BLOCK_RE = re.compile(r"\[([^\[\]\n]{1,120})\]")
 _CITEKEY_RE = re.compile(r"\[((?:[A-Za-z][A-Za-z0-9_\-']+\d{4}[a-z]?|Ref\d+|Paper_[A-Za-z0-9_\-]+))\]")
 _CITEKEY_TOKEN_RE = re.compile(r"^(?:[A-Za-z][A-Za-z0-9_\-']+\d{4}[a-z]?|Ref\d+|Paper_[A-Za-z0-9_\-]+)$")
 _NUMERIC_CITATION_RE = re.compile(r"^\d+$")
-_PLACEHOLDER_CITEKEY_RE = re.compile(r"^(Ref\d+|Paper_[A-Za-z0-9_\-]+)$")
 _UUID_LIKE_BRACKET_RE = re.compile(r"\[(?:[0-9a-f]{7,}(?:-[0-9a-f]{2,})+)\]", re.IGNORECASE)
 _TEMPLATE_BRACKET_RE = re.compile(
     r"\[(?:INTERVENTION|OUTCOME|OUTCOME MEASURE|POPULATION|COMPARATOR)\]",
@@ -86,20 +88,28 @@ def extract_and_strip_inline_citekeys(text: str) -> tuple[str, list[str]]:
     return cleaned.strip(), extracted
 
 
+def _as_citation_index(valid_citekeys: Collection[str]) -> CitationIndex:
+    if isinstance(valid_citekeys, CitationIndex):
+        return valid_citekeys
+    return citation_index_for_keys(valid_citekeys)
+
+
 def verify_citation_grounding(
     section_text: str,
-    valid_citekeys: list[str],
+    valid_citekeys: Collection[str],
     section_name: str = "unknown",
 ) -> tuple[list[str], list[str]]:
     """Verify that all citekeys in section_text are in valid_citekeys.
 
+    ``valid_citekeys`` may be a shared ``CitationIndex`` or any collection of keys.
+
     Returns:
         (verified_keys, hallucinated_keys) -- both as lists.
         hallucinated_keys contains citekeys present in the text but not in
         valid_citekeys. These are likely LLM hallucinations.
     """
     used = extract_used_citekeys(section_text)
-    valid_set = set(valid_citekeys)
+    valid_set = valid_citekeys if isinstance(valid_citekeys, (set, frozenset, CitationIndex)) else set(valid_citekeys)
     hallucinated = [k for k in used if k not in valid_set]
     verified = [k for k in used if k in valid_set]
 
@@ -115,50 +125,27 @@ def verify_citation_grounding(
 
 def _fuzzy_match_citekey(
     unknown: str,
-    valid_citekeys: list[str],
+    valid_citekeys: Collection[str],
 ) -> str | None:
     """Attempt to match an unknown citekey to a valid one using author+year heuristics.
 
     Strategy:
-    1. Extract the year token (last 4-digit sequence in the key).
+    1. Extract the year token (first 4-digit sequence in the key).
     2. Extract the author token (alphabetic prefix before the year).
-    3. Find valid citekeys whose year matches and whose author token is a
-       case-insensitive substring of the valid citekey (or vice-versa).
+    3. Find valid citekeys whose year matches and whose letters start with
+       the author token's first four letters (case-insensitive).
     4. Return the best single match when confidence is high; None otherwise.
+
+    The year -> author-prefix table lives on the ``CitationIndex``, so repeated
+    lookups against the same key list do not re-scan it.
     """
-    # Placeholder keys are internal/generated identifiers and do not carry
-    # reliable author-year semantics for fuzzy matching.
-    if _PLACEHOLDER_CITEKEY_RE.fullmatch(unknown):
-        return None
-
-    _year_m = re.search(r"(\d{4})", unknown)
-    if not _year_m:
-        return None
-    year_str = _year_m.group(1)
-    author_token = unknown[: _year_m.start()].lower()
-    if len(author_token) < 2:
-        return None
-
-    # Restrict matching to year-anchored keys only.
-    year_candidates = [k for k in valid_citekeys if re.search(rf"{year_str}[a-z]?$", k, flags=re.IGNORECASE)]
-    if not year_candidates:
-        return None
-
-    # Strict confidence gate: require a >=4-char author prefix and a unique match.
-    prefix = re.sub(r"[^a-z]", "", author_token)[:4]
-    if len(prefix) < 4:
-        return None
-    prefix_matches = [k for k in year_candidates if re.sub(r"\d+", "", k).lower().startswith(prefix)]
-    if len(prefix_matches) == 1:
-        return prefix_matches[0]
-
-    return None
+    return _as_citation_index(valid_citekeys).fuzzy_match(unknown)
 
 
 def repair_hallucinated_citekeys(
     text: str,
     hallucinated: list[str],
-    valid_citekeys: list[str],
+    valid_citekeys: Collection[str],
 ) -> str:
     """Legacy safety-net for text-first drafts with unresolved citekeys.
 
@@ -172,8 +159,9 @@ def repair_hallucinated_citekeys(
     """
     result = text
     if hallucinated:
+        index = _as_citation_index(valid_citekeys)
         for key in hallucinated:
-            matched = _fuzzy_match_citekey(key, valid_citekeys)
+            matched = index.fuzzy_match(key)
             replacement = f"[{matched}]" if matched else ""
             if matched:
                 logger.info(
@@ -183,7 +171,7 @@ def repair_hallucinated_citekeys(
                 )
             else:
                 logger.warning("Unresolved hallucinated citekey [%s] removed from prose", key)
-            result = re.sub(re.escape(f"[{key}]"), replacement, result)
+            result = result.replace(f"[{key}]", replacement)
 
     # Cleanup punctuation/spacing artifacts after dropping unresolved tokens
     # and after removing known non-citation bracket artifacts.
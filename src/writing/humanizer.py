@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from src.llm.factory import get_chat_client
@@ -65,13 +66,16 @@ async def humanize_async(
     timeout_seconds: float | None = None,
     enable_verification_repair: bool = True,
     repair_max_per_pass: int = 1,
+    on_partial: Callable[[str], None] | None = None,
 ) -> str:
     """Refine AI-generated text for academic naturalness using Gemini Pro.
 
     Truncates input to max_chars (at a word boundary) before sending.
     Falls back to returning the original text if the LLM call fails.
     When provider is supplied, the LLM call's token counts and cost are
-    logged to the cost_records table.
+    logged to the cost_records table.  When on_partial is supplied the
+    refinement is streamed and on_partial receives the text so far; the
+    integrity checks still apply to the complete response.
     """
     # Cut at the last whitespace before max_chars to avoid splitting mid-word.
     if len(text) > max_chars:
@@ -94,9 +98,14 @@ async def humanize_async(
     try:
         prompt = f"{build_humanize_system_prompt(section)}\n\n{_HUMANIZE_USER_TEMPLATE.format(text=truncated)}"
         t0 = time.monotonic()
-        refined, tok_in, tok_out, cw, cr = await client.complete_with_usage(
-            prompt, model=model, temperature=temperature
-        )
+        if on_partial is not None:
+            refined, tok_in, tok_out, cw, cr = await client.stream_text(
+                prompt, model=model, temperature=temperature, on_text=on_partial
+            )
+        else:
+            refined, tok_in, tok_out, cw, cr = await client.complete_with_usage(
+                prompt, model=model, temperature=temperature
+            )
         latency_ms = int((time.monotonic() - t0) * 1000)
         if provider is not None:
             from src.llm.provider import LLMProvider as _LLMProvider
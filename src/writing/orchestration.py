@@ -439,8 +439,13 @@ async def write_section_with_validation(
     rag_context: str = "",
     prior_sections_context: str = "",
     outline: SectionOutline | None = None,
+    on_partial: Callable[[str], None] | None = None,
 ) -> SectionWriteResult:
-    """Write a section, validate with citation ledger, return content."""
+    """Write a section, validate with citation ledger, return content.
+
+    *on_partial* receives streamed preview markdown of each generation
+    attempt; only the final, validated draft is returned.
+    """
     from src.writing.prompts.sections import get_section_context
 
     effective_context = get_section_context(section, grounding=grounding) if grounding is not None else context
@@ -471,6 +476,7 @@ async def write_section_with_validation(
             section=section,
             context=ctx,
             word_limit=word_limit,
+            on_partial=on_partial,
         )
         _structured, _contract_issues = _validate_structured_section_draft(section, _structured, valid_citekeys)
         if section == "results" and results_pack is not None:
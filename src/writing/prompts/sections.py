@@ -39,6 +39,17 @@ SECTIONS = [
     "conclusion",
 ]
 
+# Sections whose finished draft a section's prompt consumes (as PRIOR SECTIONS
+# CONTEXT).  The writing scheduler starts a section once these have settled.
+SECTION_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "abstract": (),
+    "introduction": (),
+    "methods": (),
+    "results": (),
+    "discussion": ("results",),
+    "conclusion": ("results",),
+}
+
 # Instruction added to every non-abstract section to prevent the LLM from
 # writing its own duplicate heading (the assembly pipeline adds headings).
 _NO_HEADING_RULE = (
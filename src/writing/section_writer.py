@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
 from src.llm.factory import get_chat_client
 from src.llm.provider import LLMProvider
@@ -30,6 +32,41 @@ class SectionWriteMetadata:
 
 from src.writing.prompts.base import PROHIBITED_PHRASES, get_citation_catalog_constraint
 
+_ABSTRACT_PREVIEW_FIELDS = ("background", "objectives", "methods", "results", "conclusions")
+
+
+def partial_draft_preview(partial: dict[str, Any]) -> str:
+    """Render a partially streamed section or abstract payload as preview markdown.
+
+    Tolerates the incomplete shapes a streamed JSON object passes through
+    (missing keys, half-written blocks); the result is display-only.
+    """
+    lines: list[str] = []
+    blocks = partial.get("blocks")
+    if isinstance(blocks, list):
+        for block in blocks:
+            text = str(block.get("text") or "").strip() if isinstance(block, dict) else ""
+            if not text:
+                continue
+            lines.append(f"### {text}" if block.get("block_type") == "subheading" else text)
+    else:
+        for field in _ABSTRACT_PREVIEW_FIELDS:
+            text = str(partial.get(field) or "").strip()
+            if text:
+                lines.append(f"**{field.capitalize()}:** {text}")
+    return "\n\n".join(lines)
+
+
+def _streaming_kwargs(on_partial: Callable[[str], None] | None) -> dict[str, Any]:
+    """Keyword arguments that switch ``complete_validated`` to streaming previews.
+
+    Empty when no callback is set so non-streaming backends keep their
+    original call signature.
+    """
+    if on_partial is None:
+        return {}
+    return {"on_partial": lambda partial: on_partial(partial_draft_preview(partial))}
+
 
 class SectionWriter:
     """Writes manuscript sections using LLM with citation catalog and style constraints."""
@@ -254,14 +291,20 @@ class SectionWriter:
         context: str,
         word_limit: int | None = None,
         agent_name: str = "writing",
+        on_partial: Callable[[str], None] | None = None,
     ) -> tuple[StructuredSectionDraft, SectionWriteMetadata]:
-        """Generate a structured section IR using schema-constrained output."""
+        """Generate a structured section IR using schema-constrained output.
+
+        When *on_partial* is given the response is streamed and the callback
+        receives preview markdown of the section written so far.
+        """
         if section == "abstract":
             if agent_name == "writing" and "abstract_generation" in self.settings.agents:
                 agent_name = "abstract_generation"
             return await self._write_abstract_structured_async(
                 context=context,
                 agent_name=agent_name,
+                on_partial=on_partial,
             )
         prompt = self._build_structured_section_prompt(section, context, word_limit)
         agent_cfg = (
@@ -282,6 +325,7 @@ class SectionWriter:
                 temperature=agent_cfg.temperature,
                 response_model=StructuredSectionDraft,
                 json_schema=self._structured_schema(),
+                **_streaming_kwargs(on_partial),
             )
             if retries > 0:
                 logger.info(
@@ -315,6 +359,7 @@ class SectionWriter:
         *,
         context: str,
         agent_name: str,
+        on_partial: Callable[[str], None] | None = None,
     ) -> tuple[StructuredSectionDraft, SectionWriteMetadata]:
         agent_cfg = (
             self.settings.agents.get(agent_name)
@@ -346,6 +391,7 @@ class SectionWriter:
                     model=full_model,
                     temperature=agent_cfg.temperature,
                     response_model=StructuredAbstractOutput,
+                    **_streaming_kwargs(on_partial),
                 )
                 total_tokens_in += tok_in
                 total_tokens_out += tok_out
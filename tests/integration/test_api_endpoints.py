@@ -31,6 +31,7 @@ import pytest_asyncio
 from src.db.database import get_db
 from src.db.repositories import WorkflowRepository
 from src.db.workflow_registry import REGISTRY_SCHEMA
+from src.fulltext.manifest import load_papers_manifest
 from src.models import CandidatePaper, ExtractionRecord, PrimaryStudyStatus, ScreeningDecisionType, StudyDesign
 from src.search.pdf_retrieval import PDFRetrievalResult
 from src.web.app import _active_runs, _fetch_run_stats, _inject_csv_paths_into_yaml, _RunRecord, app
@@ -1654,10 +1655,10 @@ async def test_fetch_pdfs_emits_reason_codes(
         )
         await db.execute(
             """
-            INSERT INTO papers (paper_id, title, authors, year, source_database, doi, url)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+            INSERT INTO papers (paper_id, title, authors, year, journal, source_database, doi, url)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            ("paper-1", "Paper One", "Author A", 2024, "testdb", "10.1000/test", "https://example.org/p1"),
+            ("paper-1", "Paper One", "Author A", 2024, "J Test", "testdb", "10.1000/test", "https://example.org/p1"),
         )
         await db.execute(
             """
@@ -1698,6 +1699,7 @@ async def test_fetch_pdfs_emits_reason_codes(
         assert done["host_rollups"]["example.org"]["failed"] == 1
         assert done["results"][0]["reason_code"] == "publisher_403"
         assert done["results"][0]["reason_class"] == "paywall_or_auth"
+        assert load_papers_manifest(run_dir / "data_papers_manifest.json")["paper-1"]["journal"] == "J Test"
     finally:
         _active_runs.pop(run_id, None)
 
@@ -2023,6 +2025,49 @@ async def test_export_returns_409_for_incomplete_submission_without_force(
     assert "incomplete" in response.json()["detail"].lower()
 
 
+@pytest.mark.asyncio
+async def test_export_streams_compile_log_events_to_run_record(
+    client: httpx.AsyncClient,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    run_id = "export-compile-log-run"
+    workflow_id = "wf-export-compile-log"
+    run_dir = tmp_path / "run"
+    submission_dir = run_dir / "submission"
+    submission_dir.mkdir(parents=True)
+    (run_dir / "run_summary.json").write_text(
+        json.dumps({"workflow_id": workflow_id, "output_dir": str(run_dir), "artifacts": {}}),
+        encoding="utf-8",
+    )
+
+    async def _resolve(_identifier: str, _run_root: str = "runs") -> str:
+        return str(run_dir / "runtime.db")
+
+    async def _package(_workflow_id: str, _run_root: str, *, on_log=None):
+        assert on_log is not None
+        on_log("pdflatex 1", "This is pdfTeX")
+        on_log("pdflatex 1", "This is pdfTeX\nOutput written on manuscript.pdf")
+        (submission_dir / "manuscript.pdf").write_bytes(b"%PDF")
+        return submission_dir
+
+    monkeypatch.setattr("src.web.routers.artifacts.resolve_runtime_db", _resolve)
+    monkeypatch.setattr("src.export.submission_packager.package_submission", _package)
+    record = _RunRecord(run_id, "Compile log topic")
+    record.workflow_id = workflow_id
+    record.done = True
+    _active_runs[run_id] = record
+    try:
+        response = await client.post(f"/api/run/{run_id}/export?force=true&run_root={tmp_path}")
+        assert response.status_code == 200
+        logs = [e for e in record.event_log if e.get("type") == "compile_log"]
+        assert [e["step"] for e in logs] == ["pdflatex 1", "pdflatex 1"]
+        assert all(e["durability"] == "ephemeral" and e["document"] == "manuscript.tex" for e in logs)
+        assert logs[0]["superseded"] and logs[1]["text"].endswith("manuscript.pdf")
+    finally:
+        _active_runs.pop(run_id, None)
+
+
 @pytest.mark.asyncio
 async def test_submission_zip_endpoint_accepts_workflow_identifier_via_resolver(
     client: httpx.AsyncClient,
@@ -2063,6 +2108,87 @@ async def test_submission_zip_endpoint_accepts_workflow_identifier_via_resolver(
         assert "manuscript.tex" in zf.namelist()
 
 
+@pytest.mark.asyncio
+async def test_submission_zip_is_cached_and_supports_range(
+    client: httpx.AsyncClient,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    workflow_id = "wf-submission-range"
+    run_dir = tmp_path / "2026-03-17" / "wf-submission-range-topic" / "run_01-00-00PM"
+    db_path = run_dir / "runtime.db"
+    submission_dir = run_dir / "submission"
+    (submission_dir / "figures").mkdir(parents=True, exist_ok=True)
+    (submission_dir / "manuscript.tex").write_text("tex " * 5000, encoding="utf-8")
+    (submission_dir / "figures" / "prisma.png").write_bytes(b"\x89PNG" + b"0" * 4096)
+    (run_dir / "run_summary.json").write_text(
+        json.dumps({"workflow_id": workflow_id, "output_dir": str(run_dir), "artifacts": {}}),
+        encoding="utf-8",
+    )
+
+    async def _resolve(_identifier: str, _run_root: str = "runs") -> str:
+        return str(db_path)
+
+    async def _topic(_db_path: str) -> str:
+        return "Topic"
+
+    monkeypatch.setattr("src.web.routers.artifacts.resolve_runtime_db", _resolve)
+    monkeypatch.setattr("src.web.routers.artifacts._get_topic_for_db", _topic)
+
+    first = await client.get(f"/api/run/{workflow_id}/submission.zip")
+    assert first.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(first.content)) as zf:
+        assert sorted(zf.namelist()) == ["figures/prisma.png", "manuscript.tex"]
+    assert len(list((run_dir / ".download_cache").glob("submission-*.zip"))) == 1
+
+    partial = await client.get(f"/api/run/{workflow_id}/submission.zip", headers={"Range": "bytes=10-"})
+    assert partial.status_code == 206
+    assert partial.content == first.content[10:]
+
+
+@pytest.mark.asyncio
+async def test_submission_zip_excludes_export_cache_entries(
+    client: httpx.AsyncClient,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from src.export.build_cache import build_key, cache_entry_path, cached_build
+
+    workflow_id = "wf-submission-cache"
+    run_dir = tmp_path / "2026-03-17" / "wf-submission-cache-topic" / "run_01-00-00PM"
+    submission_dir = run_dir / "submission"
+    submission_dir.mkdir(parents=True, exist_ok=True)
+    tex = submission_dir / "manuscript.tex"
+    tex.write_text("tex", encoding="utf-8")
+    docx = submission_dir / "manuscript.docx"
+
+    async def _build_docx() -> None:
+        docx.write_bytes(b"docx")
+
+    await cached_build(docx, build_key("docx", files=[tex]), _build_docx)
+    compile_state = cache_entry_path(tex, ".compile.json")
+    compile_state.write_text("{}", encoding="utf-8")
+    (run_dir / "run_summary.json").write_text(
+        json.dumps({"workflow_id": workflow_id, "output_dir": str(run_dir), "artifacts": {}}),
+        encoding="utf-8",
+    )
+
+    async def _resolve(_identifier: str, _run_root: str = "runs") -> str:
+        return str(run_dir / "runtime.db")
+
+    async def _topic(_db_path: str) -> str:
+        return "Topic"
+
+    monkeypatch.setattr("src.web.routers.artifacts.resolve_runtime_db", _resolve)
+    monkeypatch.setattr("src.web.routers.artifacts._get_topic_for_db", _topic)
+
+    response = await client.get(f"/api/run/{workflow_id}/submission.zip")
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
+        assert sorted(zf.namelist()) == ["manuscript.docx", "manuscript.tex"]
+    assert compile_state.is_file() and compile_state.parent.parent.parent == run_dir
+
+
 @pytest.mark.asyncio
 async def test_manuscript_docx_endpoint_accepts_workflow_identifier_via_resolver(
     client: httpx.AsyncClient,
@@ -14,6 +14,9 @@ from src.models import (
     CandidatePaper,
     CohortMembershipRecord,
     ExtractionRecord,
+    ReviewerType,
+    ScreeningDecision,
+    ScreeningDecisionType,
     SourceCategory,
     StudyDesign,
 )
@@ -332,3 +335,75 @@ async def test_search_node_csv_strict_gate_failure_returns_end(
     assert isinstance(next_node, End)
     assert next_node.data.status.value == "failed"
     assert next_node.data.gate == "search_volume"
+
+
+@pytest.mark.asyncio
+async def test_search_node_living_review_update_counts_parent_matches(
+    tmp_path: Path,
+    minimal_config_paths: tuple[Path, Path],
+    mock_search_connectors: None,
+) -> None:
+    """With a parent import, already-screened DOIs are matched against the parent corpus and counted."""
+    review_path, settings_path = minimal_config_paths
+    parent_db = tmp_path / "runs" / "2026-01-01" / "wf-parent" / "run_01" / "runtime.db"
+    await init_runtime_workflow_db(parent_db, "wf-parent", status="completed")
+    async with get_db(str(parent_db)) as db:
+        repo = WorkflowRepository(db)
+        await repo.save_paper(
+            CandidatePaper(
+                paper_id="parent-1",
+                title="Screened paper",
+                authors=["Author A"],
+                year=2020,
+                source_database="openalex",
+                doi="10.1234/screened",
+            )
+        )
+        await repo.save_screening_decision(
+            "wf-parent",
+            "title_abstract",
+            ScreeningDecision(
+                paper_id="parent-1",
+                decision=ScreeningDecisionType.INCLUDE,
+                reviewer_type=ReviewerType.REVIEWER_A,
+                confidence=0.9,
+            ),
+        )
+        await db.commit()
+
+    workflow_id = "wf-living-update"
+    run_dir = tmp_path / "runs" / "2026-07-16" / workflow_id / "run_01"
+    db_path = run_dir / "runtime.db"
+    await init_runtime_workflow_db(db_path, workflow_id)
+    export = run_dir / "embase.csv"
+    export.write_text(
+        "Title,Authors,Year,DOI,Abstract\n"
+        "Screened paper,Author A,2020,10.1234/screened,Abstract.\n"
+        "New paper,Author B,2026,10.1234/new,Abstract.\n",
+        encoding="utf-8",
+    )
+    review, settings = load_configs(str(review_path), str(settings_path))
+    review.living_review = True
+    review.supplementary_csv_paths = [str(export)]
+    state = ReviewState(
+        review_path=str(review_path),
+        settings_path=str(settings_path),
+        run_root=str(tmp_path / "runs"),
+        workflow_id=workflow_id,
+        db_path=str(db_path),
+        log_dir=str(run_dir),
+        output_dir=str(run_dir),
+        review=review,
+        settings=settings,
+        parent_db_path=str(parent_db),
+        artifacts={
+            "run_summary": str(run_dir / "run_summary.json"),
+            "protocol": str(run_dir / "doc_protocol.md"),
+            "search_appendix": str(run_dir / "search_appendix.md"),
+        },
+    )
+
+    await SearchNode().run(_graph_ctx(state))
+
+    assert sorted(p.doi for p in state.deduped_papers) == ["10.1234/new", "10.1234/screened"]
+    assert state.dedup_count == 1
@@ -0,0 +1,149 @@
+"""Unit tests for the input-fingerprinted manuscript assembly block cache."""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+import pytest
+
+import src.export.assembly_cache as assembly_cache
+import src.export.markdown_refs as markdown_refs
+from src.db.database import get_db
+from src.db.repositories import WorkflowRepository
+from src.export.assembly_cache import ASSEMBLY_BLOCK_ASSET_TYPE, AssemblyBlockCache, input_fingerprint
+from src.export.markdown_refs import assemble_submission_manuscript
+from src.models import CandidatePaper, ExtractionRecord, ManuscriptAsset
+from src.models.enums import SourceCategory
+
+
+def _paper(paper_id: str) -> CandidatePaper:
+    return CandidatePaper(
+        paper_id=paper_id,
+        title=f"Study {paper_id}",
+        authors=["Author, A."],
+        year=2023,
+        source_database="pubmed",
+        source_category=SourceCategory.DATABASE,
+    )
+
+
+def _record(paper_id: str, n: int = 100) -> ExtractionRecord:
+    return ExtractionRecord(
+        paper_id=paper_id,
+        study_design="non_randomized",
+        participant_count=n,
+        setting="Community clinic",
+        intervention_description="Structured intervention program",
+        results_summary={},
+    )
+
+
+def test_block_is_rebuilt_only_when_its_inputs_change() -> None:
+    cache = AssemblyBlockCache()
+    builds: list[str] = []
+
+    def _build(value: str) -> str:
+        builds.append(value)
+        return f"table:{value}"
+
+    assert cache.block("picos", ("a",), lambda: _build("a")) == "table:a"
+    assert cache.block("picos", ("a",), lambda: _build("a")) == "table:a"
+    assert cache.block("picos", ("b",), lambda: _build("b")) == "table:b"
+    assert builds == ["a", "b"]
+    assert cache.reused == ["picos"]
+
+    restored = AssemblyBlockCache.from_assets(cache.dirty_assets("wf-1"))
+    assert restored.block("picos", ("b",), lambda: _build("c")) == "table:b"
+    assert builds == ["a", "b"]
+
+
+def test_lookup_rejects_hits_that_fail_validation() -> None:
+    cache = AssemblyBlockCache({"concept_diagrams": ("k", "{}")})
+    assert cache.lookup("concept_diagrams", "k", valid=lambda content: False) is None
+    assert cache.lookup("concept_diagrams", "other") is None
+    assert cache.lookup("concept_diagrams", "k") == "{}"
+
+
+def test_assembly_splices_unchanged_tables_from_cache(tmp_path: Path, monkeypatch) -> None:
+    calls: list[str] = []
+    real_study_table = markdown_refs.build_study_characteristics_table
+
+    def _counting_study_table(*args, **kwargs):
+        calls.append("study_characteristics")
+        return real_study_table(*args, **kwargs)
+
+    monkeypatch.setattr(markdown_refs, "build_study_characteristics_table", _counting_study_table)
+    cache = AssemblyBlockCache()
+
+    def _assemble(body: str, records: list[ExtractionRecord]) -> str:
+        return assemble_submission_manuscript(
+            body=body,
+            manuscript_path=tmp_path / "ms.md",
+            artifacts={},
+            citation_rows=[],
+            papers=[_paper("p1")],
+            extraction_records=records,
+            block_cache=cache,
+        )
+
+    first = _assemble("## Results\n\nFindings here.\n", [_record("p1")])
+    edited = _assemble("## Results\n\nEdited findings.\n", [_record("p1")])
+    assert calls == ["study_characteristics"]
+    assert "Edited findings." in edited
+    assert first.split("---", 1)[1] == edited.split("---", 1)[1]
+
+    _assemble("## Results\n\nEdited findings.\n", [_record("p1", n=250)])
+    assert calls == ["study_characteristics", "study_characteristics"]
+
+
+@pytest.mark.asyncio
+async def test_block_assets_round_trip_with_input_hash(tmp_path: Path) -> None:
+    async with get_db(str(tmp_path / "blocks.db")) as db:
+        repo = WorkflowRepository(db)
+        cache = AssemblyBlockCache()
+        cache.block("grade", ("v1",), lambda: "grade table")
+        for asset in cache.dirty_assets("wf-1"):
+            await repo.save_manuscript_asset(asset)
+        await repo.save_manuscript_asset(
+            ManuscriptAsset(workflow_id="wf-1", asset_key="sec_figures", asset_type="figure", format="md", content="x")
+        )
+
+        assets = await repo.load_latest_manuscript_assets("wf-1", ASSEMBLY_BLOCK_ASSET_TYPE)
+
+    assert [(a.asset_key, a.content) for a in assets] == [("block_grade", "grade table")]
+    assert assets[0].input_hash
+    assert AssemblyBlockCache.from_assets(assets).block("grade", ("v1",), lambda: "rebuilt") == "grade table"
+
+
+def test_renderer_source_change_invalidates_only_its_block_kinds(monkeypatch) -> None:
+    before = {name: input_fingerprint(name, "same") for name in ("picos", "contradiction_paragraph")}
+    original = assembly_cache._module_source_hash
+
+    def _edited(module: str) -> str:
+        return "edited" if module == "src.export.markdown_refs" else original(module)
+
+    monkeypatch.setattr(assembly_cache, "_module_source_hash", _edited)
+    assert input_fingerprint("picos", "same") != before["picos"]
+    assert input_fingerprint("contradiction_paragraph", "same") == before["contradiction_paragraph"]
+
+
+def test_every_cached_block_kind_registers_resolvable_renderers() -> None:
+    root = Path(__file__).resolve().parents[2]
+    sources = [
+        root / "src" / "export" / "markdown_refs.py",
+        root / "src" / "orchestration" / "runners" / "writing" / "post_assembly.py",
+    ]
+    pattern = re.compile(r'(?:_block|input_fingerprint|block_cache\.lookup)\(\s*"([a-z_]+)"')
+    kinds = {kind for path in sources for kind in pattern.findall(path.read_text(encoding="utf-8"))}
+    assert {"picos", "study_characteristics", "contradiction_paragraph", "custom_diagrams"} <= kinds
+    for kind in kinds:
+        assert assembly_cache.renderer_version(kind)
+    with pytest.raises(ValueError, match="Unknown assembly block kind"):
+        input_fingerprint("unregistered", "x")
+
+
+def test_fingerprint_refuses_inputs_without_a_stable_serialisation() -> None:
+    with pytest.raises(TypeError, match="object"):
+        input_fingerprint("picos", object())
+    assert input_fingerprint("picos", {"ids": {"b", "a"}}) == input_fingerprint("picos", {"ids": {"a", "b"}})
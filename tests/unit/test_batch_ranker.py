@@ -413,3 +413,32 @@ async def test_rank_and_split_threshold_boundary() -> None:
     assert forwarded[0].paper_id == "p1"
     assert len(excluded) == 1
     assert excluded[0].paper_id == "p2"
+
+
+# ---------------------------------------------------------------------------
+# Test: every batch shares the same cacheable prompt prefix
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_batches_share_static_prompt_prefix() -> None:
+    """Review context is a fixed prefix; only the paper list differs between batches."""
+    papers = [_make_paper("p1"), _make_paper("p2")]
+    prompts: list[str] = []
+
+    class _RecordingClient:
+        async def complete_batch(self, prompt: str, *, model: str, temperature: float) -> str:
+            prompts.append(prompt)
+            pid = "p1" if "id=p1" in prompt else "p2"
+            return _envelope([{"id": pid, "score": 0.9, "reason": "relevant"}])
+
+    ranker = _make_ranker(papers, [], batch_size=1)
+    ranker._client = _RecordingClient()
+    forwarded, _excluded = await ranker.rank_and_split(papers)
+
+    assert len(forwarded) == 2
+    assert len(prompts) == 2
+    prefixes = {prompt.static_prefix for prompt in prompts}  # type: ignore[attr-defined]
+    assert len(prefixes) == 1
+    assert "id=p" not in prefixes.pop()
+    assert all(prompt.rstrip().endswith(("Study p1 | test abstract", "Study p2 | test abstract")) for prompt in prompts)
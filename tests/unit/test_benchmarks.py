@@ -0,0 +1,80 @@
+"""Tests for the offline benchmark harness (``python -m scripts.check bench``)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from pydantic import BaseModel, Field
+
+from benchmarks.corpus import FIXTURE_DIR, load_seed_corpus
+from benchmarks.pipeline import run_pipeline
+from benchmarks.run import compare_to_baseline
+from benchmarks.stub_llm import sample_from_schema
+
+
+class _Item(BaseModel):
+    paper_id: str
+    score: float = Field(ge=0.0, le=1.0)
+
+
+class _Envelope(BaseModel):
+    items: list[_Item]
+
+
+def test_stub_fills_batch_envelopes_with_every_allowed_paper_id() -> None:
+    schema = _Envelope.model_json_schema()
+    schema["$defs"]["_Item"]["properties"]["paper_id"]["enum"] = ["p1", "p2", "p3"]
+    payload = _Envelope.model_validate(sample_from_schema(schema))
+    assert [item.paper_id for item in payload.items] == ["p1", "p2", "p3"]
+
+
+def test_compare_to_baseline_ignores_noise_and_flags_slowdowns() -> None:
+    baseline = {"phases": {"search": {"wall_seconds": 2.0, "db_ms": 100.0}, "export": {"wall_seconds": 0.01}}}
+    report = {
+        "phases": {
+            "search": {"wall_seconds": 3.0, "db_ms": 110.0},
+            "export": {"wall_seconds": 0.04},
+            "new_phase": {"wall_seconds": 9.0},
+        }
+    }
+    comparison = compare_to_baseline(report, baseline, tolerance=0.25)
+    assert comparison["regressions"] == ["search.wall_seconds"]
+    assert comparison["phases"]["search"] == {"wall_seconds": 1.5, "db_ms": 1.1}
+    assert comparison["phases"]["export"]["wall_seconds"] is None
+    assert "new_phase" not in comparison["phases"]
+
+
+def test_seed_corpus_read_leaves_fixture_dir_untouched() -> None:
+    before = sorted(p.name for p in FIXTURE_DIR.iterdir())
+    corpus = load_seed_corpus()
+    assert corpus.papers and corpus.topic
+    assert sorted(p.name for p in FIXTURE_DIR.iterdir()) == before
+    assert not (FIXTURE_DIR / "runtime.db-shm").exists()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_every_phase_offline(tmp_path) -> None:
+    report = (await run_pipeline(120, tmp_path, screen_cap=30)).to_dict()
+    assert list(report["phases"]) == [
+        "search",
+        "dedup",
+        "prefilter",
+        "screening",
+        "extraction",
+        "embedding",
+        "retrieval",
+        "writing",
+        "export",
+    ]
+    phases = report["phases"]
+    assert phases["search"]["items"] == 120
+    assert 0 < report["counts"]["duplicates_removed"] < 120
+    assert report["counts"]["included"] > 0
+    assert phases["extraction"]["items"] == report["counts"]["included"]
+    assert phases["retrieval"]["items"] > 0
+    assert phases["search"]["db_calls"] > 0 and phases["screening"]["db_ms"] > 0
+    assert report["peak_rss_mb"] > 0
+    assert (tmp_path / "manuscript.tex").stat().st_size > 0
+    assert "@" in (tmp_path / "references.bib").read_text(encoding="utf-8")
+    json.dumps(report)
@@ -133,3 +133,27 @@ def test_fallback_when_nltk_unavailable(monkeypatch: pytest.MonkeyPatch) -> None
     chunks = chunk_extraction_record(record)
     assert chunks, "Expected chunks even when nltk is unavailable"
     assert all(c.content.strip() for c in chunks)
+
+
+def test_only_missing_punkt_data_disables_nltk(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A one-off tokenizer error falls back for that text; missing punkt data latches the fallback."""
+    import nltk
+    import nltk.tokenize
+
+    import src.rag.chunker as chunker_mod
+
+    def _value_error(_text: str) -> list[str]:
+        raise ValueError("bad input")
+
+    def _lookup_error(_text: str) -> list[str]:
+        raise LookupError("punkt_tab not found")
+
+    monkeypatch.setattr(chunker_mod, "_nltk_unavailable", False)
+    monkeypatch.setattr(nltk, "download", lambda *args, **kwargs: False)
+    monkeypatch.setattr(nltk.tokenize, "sent_tokenize", _value_error)
+    assert chunker_mod._tokenize_sentences("One. Two.") == ["One.", "Two."]
+    assert chunker_mod._nltk_unavailable is False
+
+    monkeypatch.setattr(nltk.tokenize, "sent_tokenize", _lookup_error)
+    assert chunker_mod._tokenize_sentences("One. Two.") == ["One.", "Two."]
+    assert chunker_mod._nltk_unavailable is True
@@ -0,0 +1,53 @@
+"""Unit tests for the shared citekey resolution index."""
+
+from __future__ import annotations
+
+import json
+
+from benchmarks.citations import run_citation_benchmark
+from src.citation.index import CitationIndex, citation_index_for_catalog, citation_index_for_rows
+from src.export.markdown_refs import convert_to_numbered_citations
+
+
+def _row(cid: str, citekey: str, surname: str, year: int) -> tuple:
+    return (cid, citekey, None, f"Study {cid}", json.dumps([f"{surname}, A."]), year, "J", None, None)
+
+
+def test_resolve_tries_ascii_alias_then_canonical_keys() -> None:
+    index = CitationIndex.from_rows(
+        [_row("c1", "Perez-Encinas2021", "Pérez-Encinas", 2021), _row("c2", "Lee2019a", "Lee", 2019)]
+    )
+    assert index.resolve("Pérez-Encinas2021") == "Perez-Encinas2021"
+    assert index.resolve("lee 2019a") == "Lee2019a"
+    assert index.resolve("Unknown2020") is None
+    assert "Lee2019a" in index and len(index) == 2
+
+
+def test_fuzzy_match_requires_unique_year_and_author_prefix() -> None:
+    index = CitationIndex(["Smith2023", "Smithers2023", "Jones2021a", "Ref12"])
+    assert index.fuzzy_match("Jonesy2021") == "Jones2021a"
+    assert index.fuzzy_match("Smith2023b") is None
+    assert index.fuzzy_match("Ref2021") is None
+
+
+def test_indexes_are_memoized_per_source() -> None:
+    rows = [_row("c1", "Smith2023", "Smith", 2023)]
+    assert citation_index_for_rows(rows) is citation_index_for_rows(list(rows))
+    catalog = "[Smith2023] Trial (2023)\n[Lee2019] Cohort (2019)\nnot a key"
+    assert citation_index_for_catalog(catalog).keys == {"Smith2023", "Lee2019"}
+    assert citation_index_for_catalog(catalog) is citation_index_for_catalog(catalog)
+
+
+def test_numbering_follows_first_appearance_across_aliases() -> None:
+    rows = [_row("c1", "Smith2023", "Smith", 2023), _row("c2", "Lee2019", "Lee", 2019)]
+    body = "A [Lee 2019]. B [Smith2023; Missing2020]. C [lee2019, Smith2023]. D [Missing2020]."
+    numbered, ordered = convert_to_numbered_citations(body, rows)
+    assert numbered == "A [1]. B [2]. C [1], [2]. D [Missing2020]."
+    assert [row[0] for row in ordered] == ["c2", "c1"]
+
+
+def test_citation_benchmark_reports_every_pass() -> None:
+    report = run_citation_benchmark(40, repeat=1)
+    assert report["refs"] == 40 and report["numbered_refs"] > 0
+    assert report["unresolved_after_numbering"] > 0
+    assert {"numbering_shared_ms", "grounding_repair_shared_ms"} <= set(report)
@@ -0,0 +1,113 @@
+"""Unit tests for run-scoped runtime.db connection reuse."""
+
+from __future__ import annotations
+
+import aiosqlite
+import pytest
+
+import src.db.database as database_module
+from src.db.connection_manager import current_runtime_db_manager, runtime_db_scope
+from src.db.database import get_db, open_runtime_db
+
+
+@pytest.mark.asyncio
+async def test_get_db_migrates_once_per_file(tmp_path, monkeypatch) -> None:
+    db_path = str(tmp_path / "runtime.db")
+    calls: list[int] = []
+    original = database_module.run_migrations
+
+    async def _counting(db: aiosqlite.Connection) -> None:
+        calls.append(1)
+        await original(db)
+
+    monkeypatch.setattr(database_module, "run_migrations", _counting)
+    for _ in range(3):
+        async with get_db(db_path) as db:
+            await db.execute("SELECT 1")
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_db_remigrates_replaced_file(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "runtime.db"
+    async with get_db(str(db_path)):
+        pass
+    db_path.unlink()
+    calls: list[int] = []
+    original = database_module.run_migrations
+
+    async def _counting(db: aiosqlite.Connection) -> None:
+        calls.append(1)
+        await original(db)
+
+    monkeypatch.setattr(database_module, "run_migrations", _counting)
+    async with get_db(str(db_path)) as db:
+        async with db.execute("SELECT name FROM sqlite_master WHERE name = 'papers'") as cur:
+            assert await cur.fetchone() is not None
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_scope_reuses_connections_and_attributes_phases(tmp_path) -> None:
+    db_path = str(tmp_path / "runtime.db")
+    assert current_runtime_db_manager() is None
+    async with runtime_db_scope() as scope:
+        scope.set_phase("SearchNode")
+        async with get_db(db_path) as first:
+            pass
+        scope.set_phase("ScreeningNode")
+        async with get_db(db_path) as second:
+            assert second is first
+            assert second.row_factory is aiosqlite.Row
+        async with open_runtime_db(db_path, readonly=True) as reader:
+            assert reader is not first
+        async with runtime_db_scope() as nested:
+            assert nested is scope
+        snapshot = scope.snapshot()
+    assert snapshot["SearchNode"]["opened"] == 1
+    assert snapshot["ScreeningNode"]["reused"] == 1
+    assert snapshot["ScreeningNode"]["acquisitions"] == 2
+    assert current_runtime_db_manager() is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_checkouts_get_distinct_connections(tmp_path) -> None:
+    db_path = str(tmp_path / "runtime.db")
+    async with runtime_db_scope():
+        async with get_db(db_path) as a, get_db(db_path) as b:
+            assert a is not b
+
+
+@pytest.mark.asyncio
+async def test_released_connection_drops_stale_snapshot_and_uncommitted_writes(tmp_path) -> None:
+    db_path = str(tmp_path / "runtime.db")
+    async with runtime_db_scope():
+        async with get_db(db_path) as db:
+            await db.execute("CREATE TABLE probe (i INTEGER)")
+            await db.executemany("INSERT INTO probe VALUES (?)", [(1,), (2,), (3,)])
+            await db.commit()
+            leftover = await db.execute("SELECT i FROM probe")
+            await leftover.fetchone()
+        async with aiosqlite.connect(db_path) as other:
+            await other.execute("INSERT INTO probe VALUES (4)")
+            await other.commit()
+        async with get_db(db_path) as db:
+            async with db.execute("SELECT COUNT(*) FROM probe") as cur:
+                assert (await cur.fetchone())[0] == 4
+            await db.execute("INSERT INTO probe VALUES (5)")
+        async with get_db(db_path) as db:
+            async with db.execute("SELECT COUNT(*) FROM probe") as cur:
+                assert (await cur.fetchone())[0] == 4
+
+
+@pytest.mark.asyncio
+async def test_get_db_migrates_connection_parked_by_open_runtime_db(tmp_path) -> None:
+    db_path = str(tmp_path / "runtime.db")
+    async with runtime_db_scope():
+        async with open_runtime_db(db_path) as raw:
+            async with raw.execute("SELECT name FROM sqlite_master WHERE name = 'papers'") as cur:
+                assert await cur.fetchone() is None
+        async with get_db(db_path) as db:
+            assert db is raw
+            async with db.execute("SELECT name FROM sqlite_master WHERE name = 'papers'") as cur:
+                assert await cur.fetchone() is not None
@@ -117,3 +117,24 @@ def test_build_screening_diagnostics_from_metrics() -> None:
 def test_format_cost_group_rows_defaults_unknown(label_key: str) -> None:
     rows = _format_cost_group_rows([{"calls": 0, "tokens_in": 0, "tokens_out": 0, "cost_usd": 0.0}], label_key)
     assert rows[0][label_key] == "unknown"
+
+
+def test_format_cost_group_rows_adds_cache_hit_ratio_when_queried() -> None:
+    rows = _format_cost_group_rows(
+        [
+            {
+                "group_key": "phase_4_extraction_quality",
+                "calls": 10,
+                "tokens_in": 2000,
+                "tokens_out": 300,
+                "cost_usd": 0.1,
+                "cache_read_tokens": 1500,
+                "cache_write_tokens": 200,
+            },
+            {"group_key": "idle", "calls": 0, "tokens_in": 0, "tokens_out": 0, "cost_usd": 0.0, "cache_read_tokens": 0},
+        ],
+        "phase",
+    )
+    assert rows[0]["cache_hit_ratio"] == 0.75
+    assert rows[0]["cache_write_tokens"] == 200
+    assert rows[1]["cache_hit_ratio"] == 0.0
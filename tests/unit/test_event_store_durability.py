@@ -12,7 +12,7 @@ import aiosqlite
 import pytest
 
 from src.db.database import get_db
-from src.web.event_store import DURABLE_EVENT_TYPES, EventStore
+from src.web.event_store import DURABLE_EVENT_TYPES, EPHEMERAL_EVENT_TYPES, EventStore
 
 
 @dataclass
@@ -137,3 +137,45 @@ async def test_failed_flush_retries_on_next_flush(tmp_path: Path) -> None:
 
 def test_durable_event_types_include_terminal_markers() -> None:
     assert {"done", "error", "cancelled", "phase_start", "phase_done"}.issubset(DURABLE_EVENT_TYPES)
+
+
+@pytest.mark.asyncio
+async def test_section_previews_are_streamed_but_not_persisted(tmp_path: Path) -> None:
+    store = EventStore()
+    db_path = tmp_path / "runtime.db"
+    workflow_id = "wf-previews"
+    await _init_runtime_db(db_path, workflow_id)
+
+    record = _StubRecord(db_path=str(db_path), workflow_id=workflow_id)
+    store.append(record, {"type": "section_preview", "section": "methods", "text": "Draft one"})
+    store.append(record, {"type": "section_preview", "section": "results", "text": "Results so far"})
+    store.append(record, {"type": "section_preview", "section": "methods", "text": "Draft one, two"})
+    store.append(record, {"type": "status", "message": "writing"})
+    await store.flush_pending(record)
+
+    assert "section_preview" in EPHEMERAL_EVENT_TYPES
+    first, other, latest = record.event_log[:3]
+    assert first["text"] == "" and first["superseded"] is True
+    assert other["text"] == "Results so far" and latest["text"] == "Draft one, two"
+    assert latest["durability"] == "ephemeral"
+    assert record._flush_index == 4
+
+    async with aiosqlite.connect(str(db_path)) as db:
+        rows = await (
+            await db.execute("SELECT event_type FROM event_log WHERE workflow_id=?", (workflow_id,))
+        ).fetchall()
+    assert [r[0] for r in rows] == ["status"]
+
+
+@pytest.mark.asyncio
+async def test_compile_logs_supersede_per_document() -> None:
+    store = EventStore()
+    record = _StubRecord()
+    store.append(record, {"type": "compile_log", "document": "manuscript.tex", "step": "pdflatex 1", "text": "a"})
+    store.append(record, {"type": "compile_log", "document": "appendix.tex", "step": "pdflatex 1", "text": "b"})
+    store.append(record, {"type": "compile_log", "document": "manuscript.tex", "step": "bibtex 1", "text": "c"})
+
+    first, other, latest = record.event_log
+    assert first["superseded"] is True and first["text"] == ""
+    assert other["text"] == "b" and latest["text"] == "c"
+    assert latest["durability"] == "ephemeral"
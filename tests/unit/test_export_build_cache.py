@@ -0,0 +1,105 @@
+"""Unit tests for the export input-hash cache and concurrent packaging steps."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+from src.export.build_cache import build_key, cached_build, copy_if_changed, is_fresh
+from src.export.submission_packager import _run_export_steps
+
+
+@pytest.mark.asyncio
+async def test_cached_build_skips_unchanged_inputs(tmp_path: Path) -> None:
+    source = tmp_path / "manuscript.md"
+    source.write_text("# Draft", encoding="utf-8")
+    output = tmp_path / "manuscript.docx"
+    runs: list[str] = []
+
+    async def _build() -> None:
+        runs.append(source.read_text(encoding="utf-8"))
+        output.write_bytes(b"docx")
+
+    assert await cached_build(output, build_key("docx", files=[source]), _build)
+    assert not await cached_build(output, build_key("docx", files=[source]), _build)
+    source.write_text("# Revised", encoding="utf-8")
+    assert await cached_build(output, build_key("docx", files=[source]), _build)
+    assert runs == ["# Draft", "# Revised"]
+
+    output.unlink()
+    assert not is_fresh(output, build_key("docx", files=[source]))
+
+
+@pytest.mark.asyncio
+async def test_failed_build_is_not_cached(tmp_path: Path) -> None:
+    output = tmp_path / "appendix.pdf"
+    key = build_key("appendix", texts=["x"])
+
+    async def _no_output() -> None:
+        return None
+
+    assert await cached_build(output, key, _no_output)
+    assert not is_fresh(output, key)
+
+    output.write_bytes(b"%PDF stale")
+    assert await cached_build(output, key, _no_output)
+    assert not is_fresh(output, key)
+
+
+@pytest.mark.asyncio
+async def test_cache_entries_stay_outside_the_output_directory(tmp_path: Path) -> None:
+    submission = tmp_path / "submission"
+    submission.mkdir()
+    output = submission / "manuscript.docx"
+    key = build_key("docx", texts=["x"])
+
+    async def _build() -> None:
+        output.write_bytes(b"docx")
+
+    assert await cached_build(output, key, _build)
+    assert is_fresh(output, key)
+    assert [p.name for p in submission.iterdir()] == ["manuscript.docx"]
+    assert (tmp_path / ".export_cache" / "submission" / "manuscript.docx.build.json").is_file()
+
+
+def test_copy_if_changed_skips_identical_copies(tmp_path: Path) -> None:
+    src = tmp_path / "fig.png"
+    src.write_bytes(b"png")
+    dst = tmp_path / "out.png"
+    assert copy_if_changed(src, dst)
+    assert not copy_if_changed(src, dst)
+    src.write_bytes(b"png2")
+    os.utime(src, ns=(src.stat().st_atime_ns, src.stat().st_mtime_ns + 1_000_000))
+    assert copy_if_changed(src, dst)
+    assert dst.read_bytes() == b"png2"
+
+
+@pytest.mark.asyncio
+async def test_export_steps_run_concurrently_and_reraise_failures() -> None:
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def _step(name: str) -> None:
+        started.append(name)
+        if len(started) == 2:
+            release.set()
+        await asyncio.wait_for(release.wait(), timeout=2)
+
+    await _run_export_steps({"a": _step("a"), "b": _step("b")}, workflow_id="wf")
+    assert sorted(started) == ["a", "b"]
+
+    finished: list[str] = []
+
+    async def _fails() -> None:
+        raise RuntimeError("csv export failed")
+
+    async def _slow() -> None:
+        await asyncio.sleep(0.01)
+        finished.append("pdf")
+
+    with pytest.raises(RuntimeError, match="csv export failed"):
+        await _run_export_steps({"csv": _fails(), "pdf": _slow()}, workflow_id="wf")
+    assert finished == ["pdf"]
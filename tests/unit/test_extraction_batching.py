@@ -0,0 +1,120 @@
+"""Unit tests for batched extraction of short (abstract-only) records."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from src.db.database import get_db
+from src.db.repositories import WorkflowRepository
+from src.extraction.extractor import ExtractionService
+from src.models import CandidatePaper, ReviewConfig, ReviewType, SettingsConfig, StudyDesign
+
+
+def _item(paper_id: str | None = None) -> dict[str, object]:
+    item: dict[str, object] = {
+        "study_duration": "8 weeks",
+        "setting": "classroom",
+        "participant_count": "40",
+        "country": "Japan",
+        "intervention_description": "ai tutor",
+        "outcomes": [{"name": "exam score", "description": "final exam"}],
+        "results_summary": "Students using the tutor scored higher on the final exam.",
+    }
+    if paper_id is not None:
+        item["paper_id"] = paper_id
+    return item
+
+
+class _BatchAwareClient:
+    """Answers batch calls for every paper except ``drop``; single calls get one record."""
+
+    def __init__(self, drop: str | None = None) -> None:
+        self.drop = drop
+        self.batch_prompts: list[str] = []
+        self.single_prompts: list[str] = []
+
+    async def complete(self, prompt: str, *, model: str, temperature: float, json_schema: dict | None = None) -> str:
+        _ = (model, temperature)
+        if json_schema and "extractions" in json_schema.get("properties", {}):
+            self.batch_prompts.append(prompt)
+            allowed = json_schema["$defs"]["_BatchExtractionItem"]["properties"]["paper_id"]["enum"]
+            return json.dumps({"extractions": [_item(pid) for pid in allowed if pid != self.drop]})
+        self.single_prompts.append(prompt)
+        return json.dumps(_item())
+
+
+def _review() -> ReviewConfig:
+    return ReviewConfig(
+        research_question="How do AI tutors impact outcomes?",
+        review_type=ReviewType.SYSTEMATIC,
+        pico={"population": "students", "intervention": "ai tutor", "comparison": "usual", "outcome": "scores"},
+        keywords=["ai tutor"],
+        domain="education",
+        scope="health education",
+        inclusion_criteria=["related to ai tutoring"],
+        exclusion_criteria=["not peer reviewed"],
+        date_range_start=2015,
+        date_range_end=2026,
+        target_databases=["openalex"],
+    )
+
+
+def _settings(batch_size: int) -> SettingsConfig:
+    return SettingsConfig(
+        agents={"extraction": {"model": "google:gemini-2.5-flash", "temperature": 0.1}},
+        extraction={"extraction_batch_size": batch_size, "extraction_batch_max_chars": 2000},
+    )
+
+
+def _paper(pid: str) -> CandidatePaper:
+    return CandidatePaper(paper_id=pid, title=f"Study {pid}", authors=["A Author"], source_database="openalex")
+
+
+@pytest.mark.asyncio
+async def test_short_records_share_one_call_and_missing_items_fall_back(tmp_path) -> None:
+    client = _BatchAwareClient(drop="p3")
+    papers = [_paper(f"p{i}") for i in range(1, 5)]
+    async with get_db(str(tmp_path / "batch.db")) as db:
+        repo = WorkflowRepository(db)
+        await repo.create_workflow("wf-1", "topic", "hash")
+        for paper in papers:
+            await repo.save_paper(paper)
+        extractor = ExtractionService(repo, llm_client=client, settings=_settings(4), review=_review())
+        records = await asyncio.gather(
+            *[
+                extractor.extract("wf-1", paper, StudyDesign.RCT, f"Abstract of {paper.paper_id}: 40 students.")
+                for paper in papers
+            ]
+        )
+
+    assert [r.paper_id for r in records] == ["p1", "p2", "p3", "p4"]
+    assert all(r.results_summary["source"] == "llm" and r.participant_count == 40 for r in records)
+    assert len(client.batch_prompts) == 1
+    assert "paper_id=p1" in client.batch_prompts[0] and "paper_id=p4" in client.batch_prompts[0]
+    assert len(client.single_prompts) == 1 and "Study p3" in client.single_prompts[0]
+    assert extractor.batcher.batch_calls == 1
+    assert extractor.batcher.batched_items == 3
+    assert extractor.batcher.missing_fallbacks == 1
+
+
+@pytest.mark.asyncio
+async def test_long_text_and_disabled_batching_use_per_paper_calls(tmp_path) -> None:
+    client = _BatchAwareClient()
+    async with get_db(str(tmp_path / "batch.db")) as db:
+        repo = WorkflowRepository(db)
+        await repo.create_workflow("wf-1", "topic", "hash")
+        for pid in ("long", "s0", "s1", "s2"):
+            await repo.save_paper(_paper(pid))
+        batching = ExtractionService(repo, llm_client=client, settings=_settings(4), review=_review())
+        await batching.extract("wf-1", _paper("long"), StudyDesign.RCT, "Full text body. " * 400)
+        unbatched = ExtractionService(repo, llm_client=client, settings=_settings(0), review=_review())
+        await asyncio.gather(
+            *[unbatched.extract("wf-1", _paper(f"s{i}"), StudyDesign.RCT, "Short abstract.") for i in range(3)]
+        )
+
+    assert client.batch_prompts == []
+    assert len(client.single_prompts) == 4
+    assert batching.single_call_count == 1 and unbatched.single_call_count == 3
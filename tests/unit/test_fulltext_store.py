@@ -0,0 +1,114 @@
+"""Unit tests for the run-scoped full-text artifact store."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.db.database import get_db
+from src.db.repositories import WorkflowRepository
+from src.fulltext import FullTextResult
+from src.fulltext.store import TIER_PDF, TIER_TEXT, FullTextStore
+from src.models.papers import CandidatePaper
+from src.orchestration.helpers.paper_extraction import load_or_fetch_full_text
+from src.search.pdf_parse import DEFAULT_PDF_MAX_CHARS as _PDF_MAX_CHARS
+from src.search.pdf_retrieval import PDFRetrievalResult, PDFRetriever
+
+_PDF = b"%PDF-1.4\n" + b"0" * 2048
+
+
+@pytest.mark.asyncio
+async def test_store_persists_text_next_to_pdf_and_reloads_from_index(tmp_path) -> None:
+    papers_dir = tmp_path / "papers"
+    async with get_db(str(tmp_path / "runtime.db")) as db:
+        repo = WorkflowRepository(db)
+        writer = FullTextStore(papers_dir, repository=repo, workflow_id="wf-1")
+        await writer.put("p-1", text="# Parsed body", source="unpaywall", pdf_bytes=_PDF)
+        await writer.put("p-2", text="provider text", source="pmc")
+        assert await writer.put("p-3", text="   ", source="pmc") is None
+
+        reader = FullTextStore(papers_dir, repository=repo, workflow_id="wf-1")
+        first = await reader.get("p-1")
+        second = await reader.get("p-2")
+        assert await reader.get("p-3") is None
+        assert await FullTextStore(papers_dir, repository=repo, workflow_id="wf-2").get("p-1") is None
+        row = await repo.get_fulltext_artifact("wf-1", "p-1")
+
+    assert (papers_dir / "p-1.md").read_text(encoding="utf-8") == "# Parsed body"
+    assert first is not None and first.tier == TIER_PDF and first.read_pdf_bytes() == _PDF
+    assert second is not None and second.tier == TIER_TEXT and second.pdf_path is None
+    assert row is not None and row["source"] == "unpaywall" and row["char_count"] == len("# Parsed body")
+
+
+@pytest.mark.asyncio
+async def test_retriever_reuses_stored_text_without_fetching(tmp_path) -> None:
+    paper = CandidatePaper(
+        paper_id="p-1",
+        title="Stored paper",
+        authors=["A Author"],
+        year=2024,
+        source_database="test",
+        doi="10.1000/test",
+    )
+    store = FullTextStore(tmp_path / "papers")
+    retriever = PDFRetriever(store=store)
+    fetched = PDFRetrievalResult(paper_id="p-1", success=True, full_text="body " * 200, source="pmc")
+
+    with patch.object(retriever, "_retrieve_uncached", new=AsyncMock(return_value=fetched)) as uncached:
+        first = await retriever.retrieve(paper)
+        second = await retriever.retrieve(paper)
+
+    assert uncached.await_count == 1
+    assert first.full_text == second.full_text
+    assert second.success is True and second.source == "pmc"
+    assert (tmp_path / "papers" / "p-1.md").is_file()
+
+
+def _paper(paper_id: str = "p-1") -> CandidatePaper:
+    return CandidatePaper(
+        paper_id=paper_id,
+        title="Long paper",
+        authors=["A Author"],
+        year=2024,
+        source_database="test",
+        doi="10.1000/long",
+    )
+
+
+@pytest.mark.asyncio
+async def test_store_keeps_untruncated_text_while_screening_gets_the_head(tmp_path) -> None:
+    long_text = "Introduction. " * (_PDF_MAX_CHARS // 10) + "\n## Results\nTable 3: effect size 0.42"
+    assert len(long_text) > _PDF_MAX_CHARS + 1000
+    store = FullTextStore(tmp_path / "papers")
+    retriever = PDFRetriever(store=store)
+
+    fetched = AsyncMock(return_value=FullTextResult(text=long_text, source="pmc"))
+    with patch("src.fulltext.fetch_full_text", new=fetched):
+        screened = await retriever.retrieve(_paper())
+    fetch = AsyncMock()
+    with patch("src.extraction.table_extraction.fetch_full_text", new=fetch):
+        _, resolved = await load_or_fetch_full_text(_paper(), store=store, extraction_cfg=None, node_label="test")
+    reused = await retriever.retrieve(_paper())
+
+    assert screened.success is True and len(screened.full_text) == _PDF_MAX_CHARS
+    assert "## Results" not in screened.full_text
+    assert fetch.await_count == 0
+    assert resolved == long_text
+    assert len(reused.full_text) == _PDF_MAX_CHARS
+
+
+@pytest.mark.asyncio
+async def test_extraction_refetches_stored_text_below_min_chars(tmp_path) -> None:
+    store = FullTextStore(tmp_path / "papers")
+    await store.put("p-1", text="short stub", source="landing_page")
+    full = "Body of the article. " * 100
+    fetch = AsyncMock(return_value=FullTextResult(text=full, source="unpaywall"))
+
+    with patch("src.extraction.table_extraction.fetch_full_text", new=fetch):
+        _, resolved = await load_or_fetch_full_text(_paper(), store=store, extraction_cfg=None, node_label="test")
+
+    assert fetch.await_count == 1
+    assert resolved == full
+    stored = await store.get("p-1")
+    assert stored is not None and stored.text == full
@@ -0,0 +1,81 @@
+"""Cold-start import budget for the CLI and the web server.
+
+Each case runs a fresh interpreter under ``python -X importtime`` and parses the
+per-module report.  Heavy subsystems must not load on these paths at all; the
+time budget is a loose ceiling so a regression shows up without making the test
+flaky on slow machines.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+# Modules that belong to the workflow graph, LLM stack, statistics and plotting.
+_HEAVY_MODULES = (
+    "pydantic_ai",
+    "scipy",
+    "statsmodels",
+    "matplotlib",
+    "networkx",
+    "src.orchestration.workflow",
+    "src.export.submission_packager",
+)
+
+# Total import time (sum of per-module self time) in seconds.
+_CLI_BUDGET_SECONDS = 2.0
+_WEB_BUDGET_SECONDS = 6.0
+
+
+def _import_report(args: list[str], tmp_path: Path) -> tuple[set[str], float]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(_REPO_ROOT)},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    modules: set[str] = set()
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            total_us += int(match.group(1))
+            modules.add(match.group(4))
+    assert modules, proc.stderr[-2000:]
+    return modules, total_us / 1_000_000
+
+
+def _heavy(modules: set[str]) -> list[str]:
+    return sorted(m for m in modules if any(m == h or m.startswith(h + ".") for h in _HEAVY_MODULES))
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        ["status", "--workflow-id", "wf-missing", "--run-root", "runs"],
+        ["validate", "--workflow-id", "wf-missing", "--run-root", "runs"],
+    ],
+)
+def test_cli_read_only_commands_skip_heavy_imports(command: list[str], tmp_path: Path) -> None:
+    modules, seconds = _import_report(["-m", "src.main", *command], tmp_path)
+    assert "src.db.workflow_registry" in modules
+    assert _heavy(modules) == []
+    assert seconds < _CLI_BUDGET_SECONDS
+
+
+def test_web_app_cold_start_skips_heavy_imports(tmp_path: Path) -> None:
+    modules, seconds = _import_report(["-c", "import src.web.app"], tmp_path)
+    assert "src.web.app" in modules
+    assert _heavy(modules) == []
+    assert seconds < _WEB_BUDGET_SECONDS
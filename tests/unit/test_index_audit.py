@@ -0,0 +1,45 @@
+"""Tests for the runtime.db index audit and the migration-24 composite indexes."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from scripts.lib.check_index_audit import FIXTURE_DIR, MIGRATION_24_INDEXES, audit_database
+from src.db.database import get_db
+from src.web.event_store import EventStore
+
+
+@pytest.mark.asyncio
+async def test_migrations_create_hot_path_indexes(tmp_path) -> None:
+    async with get_db(str(tmp_path / "runtime.db")) as db:
+        async with db.execute("SELECT name FROM sqlite_master WHERE type = 'index'") as cur:
+            names = {row[0] for row in await cur.fetchall()}
+    assert set(MIGRATION_24_INDEXES) <= names
+    assert "idx_chunks_workflow" not in names
+    assert "idx_event_log_workflow_type" not in names
+
+
+def test_audit_fixture_has_no_unindexed_scans() -> None:
+    manifest = json.loads((FIXTURE_DIR / "manifest.json").read_text(encoding="utf-8"))
+    results = {r.name: r for r in audit_database(FIXTURE_DIR / "runtime.db", manifest["workflow_id"], repeat=1)}
+    assert all(not r.flagged for r in results.values()), {n: r.flagged for n, r in results.items() if r.flagged}
+    assert results["costs.total_for_workflow"].before_plan == ["SCAN cost_records"]
+    assert any("idx_dual_screening_paper_stage" in step for step in results["screening.explorer_join"].plan)
+
+
+@pytest.mark.asyncio
+async def test_event_store_load_filters_by_workflow(tmp_path) -> None:
+    db_path = str(tmp_path / "runtime.db")
+    async with get_db(db_path) as db:
+        for workflow_id, n in (("wf-a", 1), ("wf-b", 2), ("wf-a", 3)):
+            await db.execute(
+                "INSERT INTO event_log (workflow_id, event_type, payload, ts) VALUES (?, 'status', ?, 't')",
+                (workflow_id, json.dumps({"id": f"e{n}", "n": n})),
+            )
+        await db.commit()
+    store = EventStore()
+    assert [e["n"] for e in await store.load(db_path, "wf-a")] == [1, 3]
+    assert [e["n"] for e in await store.load(db_path, "wf-missing")] == [1, 2, 3]
+    assert [e["n"] for e in await store.load(db_path)] == [1, 2, 3]
@@ -4,6 +4,7 @@ from src.knowledge_graph.builder import PaperEdge, PaperGraph, PaperNode, build_
 from src.knowledge_graph.community import detect_communities
 from src.knowledge_graph.gap_detector import detect_research_gaps
 from src.models import CandidatePaper, ExtractionRecord, OutcomeRecord, StudyDesign
+from src.rag.paper_vectors import paper_centroids
 
 
 def _paper(paper_id: str, title: str) -> CandidatePaper:
@@ -68,11 +69,8 @@ def test_build_paper_graph_with_embeddings_creates_similarity_edge() -> None:
         results_summary={"summary": "Improved."},
     )
     papers = [_paper("p1", "One"), _paper("p2", "Two")]
-    embeddings = {
-        "p1": [0.1, 0.2, 0.3],
-        "p2": [0.4, 0.5, 0.6],
-    }
-    graph = build_paper_graph([rec_a, rec_b], papers, chunk_embeddings=embeddings)
+    vectors = paper_centroids(["p1", "p2"], [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
+    graph = build_paper_graph([rec_a, rec_b], papers, paper_vectors=vectors)
     assert any(edge.rel_type == "embedding_similarity" for edge in graph.edges)
 
 
@@ -0,0 +1,147 @@
+"""Unit tests for the cached, incremental LaTeX compile."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.export.latex_compile import compile_latex, run_tool
+
+# Minimal stand-ins for the TeX toolchain: pdflatex writes \citation/\bibdata
+# lines (plus \bibcite once a .bbl exists) to the .aux and a PDF derived from
+# the .tex, .bbl and figure bytes; bibtex writes a .bbl from the cited keys and
+# the .bib.  Both append their name to calls.txt.
+_FAKE_PDFLATEX = r"""
+import re, sys
+from pathlib import Path
+tex = Path(sys.argv[-1])
+stem = tex.with_suffix("")
+source = tex.read_text()
+keys = re.findall(r"\\cite\{([^}]+)\}", source)
+bbl = stem.with_suffix(".bbl")
+aux = [f"\\citation{{{k}}}" for k in keys] + ["\\bibdata{references}"]
+if bbl.exists():
+    aux += [f"\\bibcite{{{k}}}{{{i}}}" for i, k in enumerate(bbl.read_text().split()[1:], 1)]
+stem.with_suffix(".aux").write_text("\n".join(aux) + "\n")
+figures = b"".join(Path(f).read_bytes() for f in re.findall(r"\\includegraphics\{([^}]+)\}", source))
+body = source.encode() + (bbl.read_bytes() if bbl.exists() else b"") + figures
+stem.with_suffix(".pdf").write_bytes(b"%PDF-1.4\n" + body)
+stem.with_suffix(".log").write_text("fake pdfTeX\n")
+print("This is fake pdfTeX")
+print(f"Output written on {stem.name}.pdf")
+with open("calls.txt", "a") as fh:
+    fh.write("pdflatex\n")
+"""
+_FAKE_BIBTEX = r"""
+import re, sys
+from pathlib import Path
+stem = Path(sys.argv[-1])
+keys = re.findall(r"\\citation\{([^}]+)\}", stem.with_suffix(".aux").read_text())
+bib = Path("references.bib").read_text()
+stem.with_suffix(".bbl").write_text(f"{len(bib)} " + " ".join(keys))
+with open("calls.txt", "a") as fh:
+    fh.write("bibtex\n")
+"""
+
+
+@pytest.fixture
+def fake_tex(tmp_path: Path, monkeypatch) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    for name, source in (("pdflatex", _FAKE_PDFLATEX), ("bibtex", _FAKE_BIBTEX)):
+        script = bin_dir / name
+        script.write_text(f"#!{sys.executable}\n{source}", encoding="utf-8")
+        script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    doc_dir = tmp_path / "submission"
+    (doc_dir / "figures").mkdir(parents=True)
+    (doc_dir / "figures" / "fig1.png").write_bytes(b"png-v1")
+    (doc_dir / "references.bib").write_text("@article{Smith2020,}", encoding="utf-8")
+    tex = doc_dir / "manuscript.tex"
+    tex.write_text("Body \\cite{Smith2020}.\n\\includegraphics{figures/fig1.png}\n", encoding="utf-8")
+    return tex
+
+
+def _calls(tex: Path) -> list[str]:
+    calls_path = tex.parent / "calls.txt"
+    calls = calls_path.read_text().split() if calls_path.exists() else []
+    calls_path.unlink(missing_ok=True)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_full_build_reaches_fixpoint_then_repeat_export_is_cached(fake_tex: Path) -> None:
+    logs: list[tuple[str, str]] = []
+
+    first = await compile_latex(fake_tex, on_log=lambda step, text: logs.append((step, text)))
+
+    assert first.ok and not first.cached
+    assert _calls(fake_tex) == ["pdflatex", "bibtex", "pdflatex", "pdflatex"]
+    assert first.steps == ["pdflatex 1", "bibtex 1", "pdflatex 2", "pdflatex 3"]
+    assert ("pdflatex 1", "This is fake pdfTeX\nOutput written on manuscript.pdf") in logs
+    assert not any(p.name.startswith(".") for p in fake_tex.parent.iterdir())
+    assert (fake_tex.parent.parent / ".export_cache" / "submission" / "manuscript.tex.compile.json").is_file()
+
+    repeat = await compile_latex(fake_tex)
+    assert repeat.ok and repeat.cached and repeat.steps == []
+    assert _calls(fake_tex) == []
+
+
+@pytest.mark.asyncio
+async def test_figure_or_bibliography_change_reruns_only_required_passes(fake_tex: Path) -> None:
+    assert (await compile_latex(fake_tex)).ok
+    _calls(fake_tex)
+
+    (fake_tex.parent / "figures" / "fig1.png").write_bytes(b"png-v2")
+    figure_only = await compile_latex(fake_tex)
+    assert figure_only.ok and _calls(fake_tex) == ["pdflatex"]
+    assert b"png-v2" in fake_tex.with_suffix(".pdf").read_bytes()
+
+    (fake_tex.parent / "references.bib").write_text("@article{Smith2020, title={Revised}}", encoding="utf-8")
+    bib_only = await compile_latex(fake_tex)
+    assert bib_only.ok and _calls(fake_tex) == ["bibtex", "pdflatex"]
+
+
+@pytest.mark.asyncio
+async def test_new_citation_reruns_bibtex_and_deleted_pdf_is_rebuilt(fake_tex: Path) -> None:
+    assert (await compile_latex(fake_tex)).ok
+    _calls(fake_tex)
+
+    fake_tex.write_text(fake_tex.read_text() + "More \\cite{Jones2021}.\n", encoding="utf-8")
+    assert (await compile_latex(fake_tex)).ok
+    assert _calls(fake_tex) == ["pdflatex", "bibtex", "pdflatex", "pdflatex"]
+
+    fake_tex.with_suffix(".pdf").unlink()
+    rebuilt = await compile_latex(fake_tex)
+    assert rebuilt.ok and not rebuilt.cached
+    assert _calls(fake_tex)[0] == "pdflatex"
+
+
+@pytest.mark.asyncio
+async def test_missing_toolchain_is_reported_and_not_cached(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("PATH", str(tmp_path / "empty-bin"))
+    tex = tmp_path / "manuscript.tex"
+    tex.write_text("Body.\n", encoding="utf-8")
+
+    result = await compile_latex(tex)
+
+    assert not result.ok and "TeX toolchain missing" in (result.detail or "")
+    assert not (tmp_path.parent / ".export_cache" / tmp_path.name / "manuscript.tex.compile.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_run_tool_streams_output_and_times_out(tmp_path: Path) -> None:
+    lines: list[str] = []
+    code = await run_tool(
+        [sys.executable, "-c", "import sys; print('one'); sys.stderr.write('warn\\n'); sys.exit(3)"],
+        tmp_path,
+        10,
+        on_line=lines.append,
+    )
+    assert code == 3 and sorted(lines) == ["one", "warn"]
+    with pytest.raises(subprocess.TimeoutExpired):
+        await run_tool([sys.executable, "-c", "import time; time.sleep(5)"], tmp_path, 0.2)
@@ -5,7 +5,18 @@ from __future__ import annotations
 import pytest
 
 from src.db.database import get_db
-from src.db.repositories import WorkflowRepository, merge_papers_from_parent
+from src.db.repositories import (
+    WorkflowRepository,
+    carry_parent_identification,
+    import_parent_workflow,
+    merge_papers_from_parent,
+)
+from src.db.workflow_registry import register, update_status
+from src.models import CandidatePaper
+from src.orchestration.helpers.living_review import combine_with_parent_corpus, find_update_parent
+from src.orchestration.runners.extraction_runner import _extraction_cohort_ids
+from src.orchestration.state import ReviewState
+from src.search.deduplication import deduplicate_against_known
 
 
 async def _setup_parent_db(db_path: str, paper_ids: list) -> None:
@@ -120,3 +131,134 @@ async def test_merge_graceful_on_bad_parent_path(tmp_path) -> None:
         await WorkflowRepository(dst_db).create_workflow("wf-dst", "topic", "hash")
         n = await merge_papers_from_parent("/nonexistent/path/parent.db", dst_db)
         assert n == 0
+
+
+@pytest.mark.asyncio
+async def test_import_rekeys_parent_work_to_child_workflow(tmp_path) -> None:
+    parent_db = str(tmp_path / "parent.db")
+    await _setup_parent_db(parent_db, ["p1", "p2"])
+    async with get_db(parent_db) as db:
+        await db.execute(
+            "INSERT INTO study_cohort_membership (workflow_id, paper_id, screening_status, synthesis_eligibility) "
+            "VALUES ('wf-parent', 'p1', 'included', 'included_primary')"
+        )
+        await db.execute(
+            "INSERT INTO extraction_records (workflow_id, paper_id, study_design, data) "
+            "VALUES ('wf-parent', 'p1', 'rct', '{}')"
+        )
+        await db.commit()
+    async with get_db(str(tmp_path / "dst.db")) as dst_db:
+        await WorkflowRepository(dst_db).create_workflow("wf-child", "topic", "hash")
+        counts = await import_parent_workflow(parent_db, dst_db, "wf-child")
+        assert counts["papers"] == 2
+        assert counts["dual_screening_results"] == 2
+        assert counts["extraction_records"] == 1
+        cur = await dst_db.execute("SELECT DISTINCT workflow_id FROM dual_screening_results")
+        assert [r[0] for r in await cur.fetchall()] == ["wf-child"]
+        cur = await dst_db.execute("SELECT paper_id, synthesis_eligibility FROM study_cohort_membership")
+        assert [tuple(r) for r in await cur.fetchall()] == [("p1", "included_primary")]
+        cur = await dst_db.execute("SELECT workflow_id FROM extraction_records WHERE paper_id='p1'")
+        assert (await cur.fetchone())[0] == "wf-child"
+
+
+def _paper(pid: str, title: str, doi: str | None = None, source: str = "openalex") -> CandidatePaper:
+    return CandidatePaper(paper_id=pid, title=title, authors=["A"], doi=doi, source_database=source)
+
+
+def test_deduplicate_against_known_keeps_only_unseen_records() -> None:
+    known = [
+        _paper("k1", "Nurse staffing and patient outcomes", doi="10.1/abc"),
+        _paper("k2", "Telehealth for rural diabetes care"),
+    ]
+    fresh = [
+        _paper("n1", "A different title", doi="https://doi.org/10.1/ABC"),
+        _paper("n2", "Telehealth for rural diabetes care."),
+        _paper("n3", "Exercise interventions in older adults"),
+        _paper("k1", "Renamed record"),
+    ]
+    unseen, matched = deduplicate_against_known(fresh, known)
+    assert [p.paper_id for p in unseen] == ["n3"]
+    assert matched == 3
+
+
+def test_combine_with_parent_corpus_keeps_carried_records_first() -> None:
+    carried = _paper("k1", "Telehealth for rural diabetes care", source="merged_from_parent")
+    papers = [_paper("n1", "Telehealth for rural diabetes care"), carried, _paper("n2", "Exercise in older adults")]
+    combined, matched = combine_with_parent_corpus(papers)
+    assert [p.paper_id for p in combined] == ["k1", "n2"]
+    assert matched == 1
+
+    no_parent, matched = combine_with_parent_corpus([_paper("n1", "Only new")])
+    assert [p.paper_id for p in no_parent] == ["n1"] and matched == 0
+
+
+@pytest.mark.asyncio
+async def test_find_update_parent_picks_completed_run_for_topic(tmp_path) -> None:
+    run_root = str(tmp_path / "runs")
+    assert await find_update_parent(run_root, "Topic") is None
+    for name in ("a.db", "b.db"):
+        (tmp_path / name).touch()
+    await register(run_root, "wf-0001", "Topic", "hash-a", str(tmp_path / "a.db"))
+    await update_status(run_root, "wf-0001", "completed")
+    await register(run_root, "wf-0002", "Topic", "hash-b", str(tmp_path / "b.db"))
+    parent = await find_update_parent(run_root, "Topic")
+    assert parent is not None and parent.workflow_id == "wf-0001"
+
+
+_SEARCH_ROW = (
+    "INSERT INTO search_results (database_name, source_category, search_date, search_query, "
+    "records_retrieved, workflow_id) VALUES (?, 'database', ?, 'q', ?, ?)"
+)
+
+
+@pytest.mark.asyncio
+async def test_carry_parent_identification_makes_search_counts_cumulative(tmp_path) -> None:
+    parent_db = str(tmp_path / "parent.db")
+    await _setup_parent_db(parent_db, ["p1"])
+    async with get_db(parent_db) as db:
+        await db.executemany(
+            _SEARCH_ROW, [("openalex", "2025-01-01", 40, "wf-parent"), ("pubmed", "2025-01-01", 10, "wf-parent")]
+        )
+        await WorkflowRepository(db).save_dedup_count("wf-parent", 7)
+    async with get_db(str(tmp_path / "dst.db")) as dst_db:
+        repo = WorkflowRepository(dst_db)
+        await repo.create_workflow("wf-child", "topic", "hash")
+        await dst_db.execute(_SEARCH_ROW, ("openalex", "2026-01-01", 5, "wf-child"))
+        for _ in range(2):
+            assert await carry_parent_identification(parent_db, dst_db, "wf-child") == 7
+        databases, _ = await repo.get_search_counts_by_category("wf-child")
+    assert databases == {"openalex": 45, "pubmed": 10}
+
+
+async def _cohort_ids(tmp_path, *, carried: bool) -> set[str]:
+    async with get_db(str(tmp_path / f"cohort-{carried}.db")) as db:
+        repo = WorkflowRepository(db)
+        await repo.create_workflow("wf-1", "topic", "hash")
+        for pid, eligibility in (("old", "included_primary"), ("new", "pending")):
+            await db.execute(
+                "INSERT INTO papers (paper_id, title, authors, source_database) VALUES (?, 't', '[\"a\"]', ?)",
+                (pid, "merged_from_parent" if pid == "old" and carried else "openalex"),
+            )
+            await db.execute(
+                "INSERT INTO study_cohort_membership (workflow_id, paper_id, screening_status, synthesis_eligibility) "
+                "VALUES ('wf-1', ?, 'included', ?)",
+                (pid, eligibility),
+            )
+        await db.commit()
+        state = ReviewState(
+            review_path="config/review.yaml",
+            settings_path="config/settings.yaml",
+            run_root=str(tmp_path),
+            workflow_id="wf-1",
+            deduped_papers=[
+                _paper("old", "Old study", source="merged_from_parent" if carried else "openalex"),
+                _paper("new", "New study"),
+            ],
+        )
+        return await _extraction_cohort_ids(repo, state)
+
+
+@pytest.mark.asyncio
+async def test_pending_includes_join_extraction_cohort_only_for_update_runs(tmp_path) -> None:
+    assert await _cohort_ids(tmp_path, carried=True) == {"old", "new"}
+    assert "new" not in await _cohort_ids(tmp_path, carried=False)
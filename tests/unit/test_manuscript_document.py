@@ -0,0 +1,50 @@
+"""Tests for the parse-once manuscript document model."""
+
+from __future__ import annotations
+
+from src.manuscript.document import load_manuscript, parse_manuscript
+
+_MD = """# Title
+
+Front matter.
+
+## Abstract
+**Background:** Sleep matters.
+**Keywords:** sleep
+
+## Introduction
+Intro text [Smith2023, Lee2024].
+
+### Study Characteristics
+| Study (Year) | Country | Design | N | Key Finding |
+|---|---|---|---|---|
+| Smith (2023) | US | RCT | 40 | Improved sleep [1]. |
+
+![Fig. 1: PRISMA](figures/prisma.png)
+
+## References
+[1] Smith J. Sleep. 2023.
+"""
+
+
+def test_document_indexes_sections_tables_figures_and_citations() -> None:
+    doc = parse_manuscript(_MD)
+    assert [s.heading for s in doc.h2_sections] == ["Abstract", "Introduction", "References"]
+    intro = doc.h2_sections[1]
+    assert doc.section_lines(intro)[0] == "Intro text [Smith2023, Lee2024]."
+    assert doc.abstract_lines == ("**Background:** Sleep matters.", "")
+    assert doc.study_table_row_count == 1
+    assert doc.study_table_key_findings == ("Improved sleep [1].",)
+    assert doc.figure_paths == ("figures/prisma.png",)
+    assert doc.figure_embed_numbers == (1,)
+    assert doc.cited_numbers == frozenset({1}) and doc.reference_numbers == frozenset({1})
+    assert "## References" not in doc.body
+    group = next(g for g in doc.citation_groups if "Smith2023" in g.content)
+    assert _MD[group.start : group.end] == "[Smith2023, Lee2024]"
+
+
+def test_documents_are_memoized_by_content(tmp_path) -> None:
+    path = tmp_path / "doc_manuscript.md"
+    path.write_text(_MD, encoding="utf-8")
+    assert load_manuscript(path) is parse_manuscript(_MD)
+    assert parse_manuscript(_MD + "\n") is not parse_manuscript(_MD)
@@ -1,8 +1,22 @@
 from __future__ import annotations
 
-from src.manuscript.reviewer import _build_audit_pass_plan, _build_manuscript_excerpt, select_audit_profiles
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import src.manuscript.reviewer as reviewer
+from src.manuscript.reviewer import (
+    _build_audit_pass_plan,
+    _build_manuscript_excerpt,
+    _ReviewerFinding,
+    _ReviewerResponse,
+    run_manuscript_audit,
+    select_audit_profiles,
+)
 from src.models import DomainExpertConfig, ReviewConfig, SettingsConfig
 from src.models.enums import ReviewType
+from src.models.manuscript_review import ManuscriptAuditProfileSelection
 
 
 def _settings() -> SettingsConfig:
@@ -84,3 +98,123 @@ def test_long_manuscript_adds_critical_section_audit_pass() -> None:
     assert [item.label for item in passes] == ["balanced_overview", "critical_sections"]
     assert "## Methods" in passes[1].manuscript_excerpt
     assert "## Results" in passes[1].manuscript_excerpt
+
+
+def _minimal_review() -> ReviewConfig:
+    return ReviewConfig(
+        research_question="Does telehealth follow-up reduce readmissions?",
+        review_type=ReviewType.SYSTEMATIC,
+        pico={
+            "population": "adults after discharge",
+            "intervention": "telehealth follow-up",
+            "comparison": "usual care",
+            "outcome": "readmission",
+        },
+        keywords=["telehealth"],
+        domain="health services",
+        scope="Readmission outcomes.",
+        inclusion_criteria=["Randomized trials."],
+        exclusion_criteria=["Opinion pieces."],
+        date_range_start=2015,
+        date_range_end=2026,
+        target_databases=["pubmed"],
+    )
+
+
+class _FakeProvider:
+    def __init__(self) -> None:
+        self.cost_rows: list[str] = []
+
+    async def reserve_call_slot(self, agent_name: str) -> SimpleNamespace:
+        return SimpleNamespace(model="test:model", temperature=0.0)
+
+    def estimate_cost_usd(self, model: str, tok_in: int, tok_out: int, cw: int = 0, cr: int = 0) -> float:
+        return 0.001
+
+    async def log_cost(self, model: str, *args, phase: str, **kwargs) -> None:
+        self.cost_rows.append(phase)
+
+
+class _FakeAuditClient:
+    """Answers each profile after a profile-specific delay, tracking peak concurrency."""
+
+    def __init__(self, delays: dict[str, float], blocking_profiles: frozenset[str] = frozenset()) -> None:
+        self.delays = delays
+        self.blocking_profiles = blocking_profiles
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def complete_validated(self, prompt: str, **kwargs):
+        profile = prompt.split("Profile: ", 1)[1].split("\n", 1)[0]
+        self.calls.append(profile)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(profile, 0.0))
+        finally:
+            self.in_flight -= 1
+        finding = _ReviewerFinding(
+            severity="minor",
+            category=f"{profile}-issue",
+            evidence=f"{profile} evidence",
+            recommendation="Revise.",
+            blocking=profile in self.blocking_profiles,
+        )
+        return _ReviewerResponse(verdict="minor_revisions", summary=profile, findings=[finding]), 10, 5, 0, 0, 0
+
+
+def _patch_audit(monkeypatch, client: _FakeAuditClient, profiles: list[str]) -> None:
+    async def _route(**kwargs):
+        return ManuscriptAuditProfileSelection(selected_profiles=profiles), 0.0
+
+    monkeypatch.setattr(reviewer, "get_chat_client", lambda **kwargs: client)
+    monkeypatch.setattr(reviewer, "_route_audit_profiles_with_llm", _route)
+
+
+async def _audit(settings: SettingsConfig, provider: _FakeProvider):
+    return await run_manuscript_audit(
+        workflow_id="wf-audit",
+        review=_minimal_review(),
+        settings=settings,
+        manuscript_text="# Title\n\n## Methods\nShort methods.\n",
+        contract_summary_json="{}",
+        audit_context_json="{}",
+        provider=provider,  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.asyncio
+async def test_audit_passes_run_concurrently_and_merge_in_plan_order(monkeypatch) -> None:
+    profiles = ["general_systematic_review", "implementation_science", "qualitative_methods"]
+    client = _FakeAuditClient({"general_systematic_review": 0.03, "implementation_science": 0.01})
+    _patch_audit(monkeypatch, client, profiles)
+    settings = _settings()
+    settings.gates.manuscript_audit_mode = "observe"
+    settings.manuscript_audit.audit_concurrency = 2
+    provider = _FakeProvider()
+
+    result, findings = await _audit(settings, provider)
+
+    assert client.peak == 2
+    assert [f.profile for f in findings] == profiles
+    assert result.summary.split(" | ") == [f"{p}/balanced_overview: {p}" for p in profiles]
+    assert provider.cost_rows == ["phase_7_audit"] * 3
+    assert result.total_cost_usd == pytest.approx(0.003)
+
+
+@pytest.mark.asyncio
+async def test_audit_skips_unstarted_passes_once_gate_has_failed(monkeypatch) -> None:
+    profiles = ["general_systematic_review", "implementation_science", "qualitative_methods"]
+    client = _FakeAuditClient({}, blocking_profiles=frozenset({"general_systematic_review"}))
+    _patch_audit(monkeypatch, client, profiles)
+    settings = _settings()
+    settings.gates.manuscript_audit_mode = "strict"
+    settings.manuscript_audit.audit_concurrency = 1
+    provider = _FakeProvider()
+
+    result, findings = await _audit(settings, provider)
+
+    assert client.calls == ["general_systematic_review"]
+    assert result.passed is False
+    assert [f.blocking for f in findings] == [True]
@@ -0,0 +1,88 @@
+"""Unit tests for the pipelined screening-to-extraction hand-off."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.models import CandidatePaper
+from src.models.config import ReviewConfig, SettingsConfig
+from src.models.enums import ReviewType
+from src.orchestration.helpers.paper_extraction import ExtractionHandoff, pipelined_extraction_enabled
+from src.orchestration.state import ReviewState
+
+
+def _state(*, pipelined: bool = True, hitl: bool = False) -> ReviewState:
+    settings = SettingsConfig(
+        agents={"extraction": {"model": "google:gemini-2.5-flash", "temperature": 0.1}},
+        extraction={"pipelined_extraction": pipelined, "extraction_concurrency": 2},
+        human_in_the_loop={"enabled": hitl},
+    )
+    review = ReviewConfig(
+        research_question="rq",
+        review_type=ReviewType.SYSTEMATIC,
+        pico={"population": "students", "intervention": "ai tutor", "comparison": "standard", "outcome": "learning"},
+        keywords=["ai tutor"],
+        domain="education",
+        scope="health education",
+        inclusion_criteria=["include if related"],
+        exclusion_criteria=["exclude if unrelated"],
+        date_range_start=2015,
+        date_range_end=2026,
+        target_databases=["openalex"],
+    )
+    return ReviewState(
+        review_path="review.yaml",
+        settings_path="settings.yaml",
+        run_root="runs",
+        workflow_id="wf-1",
+        review=review,
+        settings=settings,
+    )
+
+
+def _paper(pid: str) -> CandidatePaper:
+    return CandidatePaper(paper_id=pid, title=f"Study {pid}", authors=["A Author"], source_database="openalex")
+
+
+def test_pipelined_extraction_is_opt_in_and_disabled_by_hitl() -> None:
+    assert pipelined_extraction_enabled(_state()) is True
+    assert pipelined_extraction_enabled(_state(pipelined=False)) is False
+    assert pipelined_extraction_enabled(_state(hitl=True)) is False
+
+
+@pytest.mark.asyncio
+async def test_handoff_extracts_only_final_fulltext_includes() -> None:
+    papers = [_paper("p1"), _paper("p2"), _paper("p3"), _paper("p4")]
+    started: list[str] = []
+
+    async def _fake_extract(paper: CandidatePaper, **_kwargs: object) -> None:
+        started.append(paper.paper_id)
+        await asyncio.sleep(0)
+        if paper.paper_id == "p4":
+            raise RuntimeError("extractor down")
+
+    handoff = ExtractionHandoff(
+        _state(),
+        repository=None,  # type: ignore[arg-type]
+        provider=None,  # type: ignore[arg-type]
+        store=None,  # type: ignore[arg-type]
+        use_llm=False,
+        papers=papers,
+    )
+    with patch("src.orchestration.helpers.paper_extraction.extract_paper", new=_fake_extract):
+        handoff.on_decision("p1", "fulltext", "include")
+        handoff.on_decision("p1", "fulltext", "include")
+        handoff.on_decision("p2", "fulltext", "uncertain")
+        handoff.on_decision("p3", "fulltext", "exclude")
+        handoff.on_decision("p3", "title_abstract", "include")
+        handoff.on_decision("p4", "fulltext", "include")
+        handoff.on_decision("unknown", "fulltext", "include")
+        extracted = await handoff.drain()
+
+    assert sorted(started) == ["p1", "p2", "p4"]
+    assert extracted == 2
+    assert handoff.extracted_ids == {"p1", "p2"}
+    assert handoff.failed_ids == {"p4"}
@@ -0,0 +1,114 @@
+"""Unit tests for per-paper centroid embeddings."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from src.db.database import get_db
+from src.models import ExtractionRecord, StudyDesign
+from src.rag.paper_vectors import load_paper_vectors, paper_centroids, save_paper_vectors
+from src.synthesis.contradiction_detector import detect_contradictions
+
+
+def test_centroids_are_normalized_means_and_skip_mixed_dimensions() -> None:
+    vectors = paper_centroids(
+        ["p1", "p1", "p2", "p3", "p3"],
+        [[1.0, 0.0], [0.0, 1.0], [0.0, 0.0], [1.0, 0.0], [1.0, 0.0, 0.0]],
+    )
+    assert vectors.ids == ["p1", "p2"]
+    assert vectors.matrix.dtype == np.float32
+    np.testing.assert_allclose(vectors.matrix[0], [np.sqrt(0.5), np.sqrt(0.5)], rtol=1e-6)
+    np.testing.assert_array_equal(vectors.matrix[1], [0.0, 0.0])
+
+    rows, sims = vectors.similarity(["p2", "missing", "p1"])
+    assert rows == {"p2": 0, "p1": 1}
+    assert sims[rows["p1"], rows["p1"]] == pytest.approx(1.0)
+    assert sims[rows["p1"], rows["p2"]] == 0.0
+
+
+async def _seed_papers(db, *paper_ids: str) -> None:
+    await db.executemany(
+        "INSERT INTO papers (paper_id, title, authors, source_database) VALUES (?, 't', '[\"a\"]', 'openalex')",
+        [(pid,) for pid in paper_ids],
+    )
+
+
+@pytest.mark.asyncio
+async def test_saved_vectors_round_trip_as_float32_matrix(tmp_path) -> None:
+    async with get_db(str(tmp_path / "vectors.db")) as db:
+        await _seed_papers(db, "p1", "p2")
+        saved = paper_centroids(["p2", "p1"], [[3.0, 4.0], [1.0, 0.0]])
+        await save_paper_vectors(db, "wf1", saved, {"p1": 1, "p2": 1})
+        await db.commit()
+
+        loaded = await load_paper_vectors(db, "wf1")
+
+    assert loaded.ids == ["p1", "p2"]
+    np.testing.assert_allclose(loaded.matrix, [[1.0, 0.0], [0.6, 0.8]], rtol=1e-6)
+
+
+@pytest.mark.asyncio
+async def test_load_backfills_centroids_from_chunk_embeddings(tmp_path) -> None:
+    async with get_db(str(tmp_path / "backfill.db")) as db:
+        await _seed_papers(db, "p1")
+        await db.executemany(
+            """
+            INSERT INTO paper_chunks_meta (chunk_id, workflow_id, paper_id, chunk_index, content, embedding)
+            VALUES (?, 'wf1', 'p1', ?, 'text', ?)
+            """,
+            [("c1", 0, json.dumps([2.0, 0.0])), ("c2", 1, json.dumps([0.0, 2.0])), ("c3", 2, "not json")],
+        )
+        await db.commit()
+
+        loaded = await load_paper_vectors(db, "wf1")
+        async with db.execute("SELECT chunk_count FROM paper_embeddings WHERE paper_id = 'p1'") as cur:
+            row = await cur.fetchone()
+
+    assert loaded.ids == ["p1"]
+    np.testing.assert_allclose(loaded.matrix[0], [np.sqrt(0.5), np.sqrt(0.5)], rtol=1e-6)
+    assert row[0] == 2
+
+
+@pytest.mark.asyncio
+async def test_load_backfills_papers_missing_from_partially_populated_table(tmp_path) -> None:
+    async with get_db(str(tmp_path / "partial.db")) as db:
+        await _seed_papers(db, "old", "new")
+        await db.executemany(
+            """
+            INSERT INTO paper_chunks_meta (chunk_id, workflow_id, paper_id, chunk_index, content, embedding)
+            VALUES (?, 'wf1', ?, 0, 'text', ?)
+            """,
+            [("c-old", "old", json.dumps([0.0, 5.0])), ("c-new", "new", json.dumps([1.0, 0.0]))],
+        )
+        await save_paper_vectors(db, "wf1", paper_centroids(["new"], [[1.0, 0.0]]), {"new": 1})
+        await db.commit()
+
+        loaded = await load_paper_vectors(db, "wf1")
+        async with db.execute("SELECT COUNT(*) FROM paper_embeddings WHERE workflow_id = 'wf1'") as cur:
+            stored = (await cur.fetchone())[0]
+
+    assert loaded.ids == ["new", "old"]
+    np.testing.assert_allclose(loaded.matrix, [[1.0, 0.0], [0.0, 1.0]], rtol=1e-6)
+    assert stored == 2
+
+
+def test_contradictions_use_centroid_similarity_when_available() -> None:
+    records = [
+        ExtractionRecord(
+            paper_id=pid,
+            study_design=StudyDesign.RCT,
+            intervention_description="telehealth follow-up",
+            results_summary={"summary": summary},
+        )
+        for pid, summary in (("p1", "Telehealth improved adherence."), ("p2", "Calls showed no effect overall."))
+    ]
+
+    assert detect_contradictions(records) == []
+
+    vectors = paper_centroids(["p1", "p2"], [[1.0, 0.1], [1.0, 0.0]])
+    flags = detect_contradictions(records, paper_vectors=vectors)
+    assert [(f.paper_id_a, f.paper_id_b) for f in flags] == [("p1", "p2")]
+    assert flags[0].similarity > 0.99
@@ -0,0 +1,58 @@
+"""Unit tests for the append-only papers manifest."""
+
+from __future__ import annotations
+
+import json
+
+from src.fulltext.manifest import (
+    append_manifest_entry,
+    compact_papers_manifest,
+    has_papers_manifest,
+    journal_path,
+    load_papers_manifest,
+    lookup_manifest_entry,
+)
+
+
+def test_journal_entries_overlay_compacted_manifest(tmp_path) -> None:
+    manifest_path = tmp_path / "data_papers_manifest.json"
+    manifest_path.write_text(
+        json.dumps({"p-1": {"file_path": None}, "p-2": {"file_path": "old.pdf"}}), encoding="utf-8"
+    )
+    assert has_papers_manifest(manifest_path)
+
+    append_manifest_entry(manifest_path, "p-2", {"file_path": "papers/p-2.pdf"})
+    append_manifest_entry(manifest_path, "p-3", {"file_path": None})
+    with journal_path(manifest_path).open("a", encoding="utf-8") as fh:
+        fh.write('{"paper_id": "torn"')
+
+    manifest = load_papers_manifest(manifest_path)
+    assert set(manifest) == {"p-1", "p-2", "p-3"}
+    assert lookup_manifest_entry(manifest_path, "p-2") == {"file_path": "papers/p-2.pdf"}
+    assert lookup_manifest_entry(manifest_path, "missing") is None
+
+
+def test_compaction_folds_journal_and_cache_tracks_changes(tmp_path) -> None:
+    manifest_path = tmp_path / "data_papers_manifest.json"
+    assert load_papers_manifest(manifest_path) == {}
+    assert not has_papers_manifest(manifest_path)
+
+    for n in range(3):
+        append_manifest_entry(manifest_path, f"p-{n}", {"title": f"T{n}"})
+    assert len(load_papers_manifest(manifest_path)) == 3
+    append_manifest_entry(manifest_path, "p-0", {"title": "updated"})
+    assert lookup_manifest_entry(manifest_path, "p-0") == {"title": "updated"}
+
+    assert compact_papers_manifest(manifest_path) == 3
+    assert not journal_path(manifest_path).exists()
+    on_disk = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert on_disk["p-0"] == {"title": "updated"}
+    assert load_papers_manifest(manifest_path) == on_disk
+
+
+def test_legacy_list_manifest_is_keyed_by_paper_id(tmp_path) -> None:
+    manifest_path = tmp_path / "data_papers_manifest.json"
+    manifest_path.write_text(
+        json.dumps([{"paper_id": "p-1", "file_path": "a.pdf"}, {"title": "no id"}]), encoding="utf-8"
+    )
+    assert load_papers_manifest(manifest_path) == {"p-1": {"paper_id": "p-1", "file_path": "a.pdf"}}
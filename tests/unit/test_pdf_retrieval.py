@@ -148,3 +148,48 @@ async def test_retrieve_batch_stall_watchdog_marks_pending_as_timeout():
     assert summary.failed == 1
     assert results[paper.paper_id].reason_code == "timeout"
     assert "stall watchdog" in (results[paper.paper_id].error or "")
+
+
+@pytest.mark.asyncio
+async def test_stream_batch_yields_in_completion_order_with_sliding_window():
+    retriever = PDFRetriever()
+    papers = [_paper().model_copy(update={"paper_id": pid}) for pid in ("slow", "a", "b", "c")]
+    started: list[str] = []
+
+    async def _retrieve(paper: CandidatePaper) -> PDFRetrievalResult:
+        started.append(paper.paper_id)
+        await asyncio.sleep(0.2 if paper.paper_id == "slow" else 0.01)
+        return PDFRetrievalResult(paper_id=paper.paper_id, success=True, full_text="text")
+
+    with patch.object(retriever, "retrieve", new=AsyncMock(side_effect=_retrieve)):
+        order = [paper.paper_id async for paper, _ in retriever.stream_batch(papers, concurrency=2)]
+
+    assert order == ["a", "b", "c", "slow"]
+    assert started == ["slow", "a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_stream_batch_per_paper_deadline_releases_wedged_slot():
+    retriever = PDFRetriever()
+    papers = [_paper().model_copy(update={"paper_id": pid}) for pid in ("wedged", "ok")]
+
+    async def _retrieve(paper: CandidatePaper) -> PDFRetrievalResult:
+        if paper.paper_id == "wedged":
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                await asyncio.sleep(3600)  # ignores the first cancellation, like a stuck provider call
+        return PDFRetrievalResult(paper_id=paper.paper_id, success=True, full_text="text")
+
+    with (
+        patch.object(retriever, "retrieve", new=AsyncMock(side_effect=_retrieve)),
+        patch("src.search.pdf_retrieval._HARD_DEADLINE_GRACE_SECONDS", 0.1),
+    ):
+        results = {
+            paper.paper_id: result
+            async for paper, result in retriever.stream_batch(papers, concurrency=1, per_paper_timeout=0.2)
+        }
+
+    assert results["ok"].success is True
+    assert results["wedged"].reason_code == "timeout"
+    assert "deadline" in (results["wedged"].error or "")
@@ -0,0 +1,65 @@
+"""Unit tests for the static-prefix / dynamic-suffix prompt layout."""
+
+from __future__ import annotations
+
+from pydantic_ai.messages import CachePoint
+
+from src.extraction.extractor import _build_extraction_prompt
+from src.llm.prompt_cache import CacheablePrompt, append_to_prompt, prompt_input
+from src.models.config import ReviewConfig
+from src.models.enums import ReviewType
+from src.models.papers import CandidatePaper
+
+
+def _review() -> ReviewConfig:
+    return ReviewConfig(
+        research_question="rq",
+        review_type=ReviewType.SYSTEMATIC,
+        pico={"population": "students", "intervention": "ai tutor", "comparison": "standard", "outcome": "learning"},
+        keywords=["ai tutor"],
+        domain="education",
+        scope="health education",
+        inclusion_criteria=["include if related"],
+        exclusion_criteria=["exclude if unrelated"],
+        date_range_start=2015,
+        date_range_end=2026,
+        target_databases=["openalex"],
+    )
+
+
+def _paper(pid: str) -> CandidatePaper:
+    return CandidatePaper(paper_id=pid, title=f"Study {pid}", authors=["A Author"], source_database="openalex")
+
+
+def test_cacheable_prompt_is_plain_text_with_split_parts() -> None:
+    prompt = CacheablePrompt("static", "dynamic")
+    retried = append_to_prompt(prompt, "\n\nfix it")
+
+    assert prompt == "static\n\ndynamic"
+    assert prompt.static_prefix == "static\n\n"
+    assert isinstance(retried, CacheablePrompt)
+    assert retried.static_prefix == prompt.static_prefix
+    assert retried == "static\n\ndynamic\n\nfix it"
+    assert append_to_prompt("plain", "!") == "plain!"
+
+
+def test_prompt_input_adds_cache_point_only_where_required() -> None:
+    prompt = CacheablePrompt("static", "dynamic")
+
+    parts = prompt_input(prompt, "anthropic:claude-sonnet-4-5")
+    assert isinstance(parts, list)
+    assert parts[0] == "static\n\n" and isinstance(parts[1], CachePoint) and parts[2] == "dynamic"
+    assert prompt_input(prompt, "google:gemini-2.5-flash") == "static\n\ndynamic"
+    assert type(prompt_input(prompt, "google:gemini-2.5-flash")) is str
+    assert prompt_input("plain", "anthropic:claude-sonnet-4-5") == "plain"
+
+
+def test_extraction_prompt_prefix_is_shared_across_papers() -> None:
+    review = _review()
+    first = _build_extraction_prompt(_paper("p1"), "first body", review)
+    second = _build_extraction_prompt(_paper("p2"), "second body", review)
+
+    assert isinstance(first, CacheablePrompt) and isinstance(second, CacheablePrompt)
+    assert first.static_prefix == second.static_prefix
+    assert "Extract the following" in first.static_prefix
+    assert "Study p1" not in first.static_prefix and "first body" in first.dynamic_suffix
@@ -80,3 +80,15 @@ async def test_complete_uses_structured_dict_for_non_google(monkeypatch) -> None
     )
     assert _FakeAgent.captured_output_type is not None
     assert not isinstance(_FakeAgent.captured_output_type, NativeOutput)
+
+
+async def test_stream_text_reports_partials_and_returns_final_text() -> None:
+    seen: list[str] = []
+    text, tokens_in, tokens_out, _, _ = await mod.PydanticAIClient().stream_text(
+        "x",
+        model="test",
+        temperature=0.0,
+        on_text=seen.append,
+    )
+    assert seen and seen[-1] == text
+    assert tokens_in > 0 and tokens_out > 0
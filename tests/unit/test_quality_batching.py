@@ -0,0 +1,100 @@
+"""Unit tests for multi-study batched quality assessment calls."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from src.models import ExtractionRecord, RiskOfBiasJudgment, SettingsConfig, StudyDesign
+from src.quality.mmat import MmatAssessor
+from src.quality.rob2 import Rob2Assessor
+
+
+class _BatchAwareClient:
+    """Answers batch calls for every study except ``drop``; single calls get one assessment."""
+
+    def __init__(self, item: dict[str, object], drop: str | None = None) -> None:
+        self.item = item
+        self.drop = drop
+        self.batch_prompts: list[str] = []
+        self.single_prompts: list[str] = []
+
+    async def complete(self, prompt: str, *, model: str, temperature: float, json_schema: dict | None = None) -> str:
+        _ = (model, temperature)
+        if json_schema and "assessments" in json_schema.get("properties", {}):
+            self.batch_prompts.append(prompt)
+            item_def = next(d for d in json_schema["$defs"].values() if "paper_id" in d.get("properties", {}))
+            allowed = item_def["properties"]["paper_id"]["enum"]
+            return json.dumps({"assessments": [{**self.item, "paper_id": pid} for pid in allowed if pid != self.drop]})
+        self.single_prompts.append(prompt)
+        return json.dumps(self.item)
+
+
+def _settings(batch_size: int) -> SettingsConfig:
+    return SettingsConfig(
+        agents={"quality_assessment": {"model": "google:gemini-2.5-pro", "temperature": 0.1}},
+        extraction={"quality_batch_size": batch_size},
+    )
+
+
+def _record(pid: str, design: StudyDesign = StudyDesign.RCT) -> ExtractionRecord:
+    return ExtractionRecord(
+        paper_id=pid,
+        study_design=design,
+        intervention_description="AI tutor intervention",
+        outcomes=[{"name": "score", "description": "exam performance"}],
+        results_summary={"summary": f"Trial {pid} improved exam scores."},
+    )
+
+
+_ROB2_LOW = {
+    **{
+        f"domain_{i}_{name}": "low"
+        for i, name in enumerate(["randomization", "deviations", "missing_data", "measurement", "selection"], start=1)
+    },
+    "overall_judgment": "low",
+    "overall_rationale": "Well conducted.",
+}
+
+
+@pytest.mark.asyncio
+async def test_rob2_studies_share_one_call_and_missing_study_falls_back() -> None:
+    client = _BatchAwareClient(_ROB2_LOW, drop="p2")
+    assessor = Rob2Assessor(llm_client=client, settings=_settings(3))
+    results = await asyncio.gather(*[assessor.assess(_record(pid), full_text="") for pid in ("p1", "p2", "p3")])
+
+    assert [r.paper_id for r in results] == ["p1", "p2", "p3"]
+    assert all(r.overall_judgment == RiskOfBiasJudgment.LOW and not r.fallback_used for r in results)
+    assert len(client.batch_prompts) == 1
+    assert client.batch_prompts[0].startswith("You are an expert systematic review methodologist.")
+    assert "paper_id=p1" in client.batch_prompts[0] and "paper_id=p3" in client.batch_prompts[0]
+    assert len(client.single_prompts) == 1 and "Trial p2" in client.single_prompts[0]
+    assert "one valid JSON object for this study" in client.single_prompts[0]
+    assert "one valid JSON object" not in client.batch_prompts[0]
+    assert assessor.batcher.batch_calls == 1
+    assert assessor.batcher.batched_items == 2
+    assert assessor.batcher.missing_fallbacks == 1
+
+
+@pytest.mark.asyncio
+async def test_mmat_batch_keeps_type_specific_criteria_per_study() -> None:
+    item = {
+        "screening_1_clear_question": True,
+        "screening_2_appropriate_data": True,
+        **{f"criterion_{i}": True for i in range(1, 6)},
+        "overall_summary": "Meets all criteria.",
+    }
+    client = _BatchAwareClient(item)
+    assessor = MmatAssessor(llm_client=client, settings=_settings(2))
+    mixed, qualitative = await asyncio.gather(
+        assessor.assess(_record("m1", StudyDesign.MIXED_METHODS)),
+        assessor.assess(_record("q1", StudyDesign.QUALITATIVE)),
+    )
+
+    assert mixed.overall_score == 5 and qualitative.overall_score == 5
+    assert client.single_prompts == []
+    prompt = client.batch_prompts[0]
+    assert "TYPE-SPECIFIC CRITERIA (MIXED METHODS)" in prompt and "TYPE-SPECIFIC CRITERIA (QUALITATIVE)" in prompt
+    assert "Return ONLY valid JSON with this exact schema" not in prompt and '{"assessments": [...]}' in prompt
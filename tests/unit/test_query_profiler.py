@@ -0,0 +1,84 @@
+"""Unit tests for the opt-in runtime.db query profiler."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.db.connection_manager import runtime_db_scope
+from src.db.database import get_db
+from src.db.query_profiler import QueryProfiler, normalize_sql
+from src.db.repositories import WorkflowRepository
+
+
+def test_normalize_sql_collapses_literals_and_lists() -> None:
+    a = normalize_sql("SELECT *  FROM papers\n WHERE id IN (?, ?, ?) AND year > 2020 AND title = 'x'")
+    b = normalize_sql("SELECT * FROM papers WHERE id IN (?,?) AND year > 1999 AND title = 'it''s'")
+    assert a == b
+    assert a == "SELECT * FROM papers WHERE id IN (?, ...) AND year > N AND title = '?'"
+    assert normalize_sql("INSERT INTO t VALUES (?, ?), (?, ?), (?, ?)") == "INSERT INTO t VALUES (?, ...), ..."
+
+
+@pytest.mark.asyncio
+async def test_profiler_aggregates_by_phase_and_template(tmp_path) -> None:
+    db_path = str(tmp_path / "runtime.db")
+    profiler = QueryProfiler(slow_query_ms=10_000.0)
+    async with runtime_db_scope(profiler=profiler) as scope:
+        scope.set_phase("SearchNode")
+        async with get_db(db_path) as db:
+            await db.execute("CREATE TABLE probe (i INTEGER)")
+            await db.executemany("INSERT INTO probe VALUES (?)", [(1,), (2,), (3,)])
+            await db.commit()
+        scope.set_phase("ScreeningNode")
+        for limit in (1, 2):
+            async with get_db(db_path) as db:
+                async with db.execute(f"SELECT i FROM probe LIMIT {limit}") as cur:
+                    await cur.fetchall()
+    rows = {(r["phase"], r["template"]): r for r in profiler.rows()}
+    select = rows[("ScreeningNode", "SELECT i FROM probe LIMIT N")]
+    assert select["calls"] == 2
+    assert select["rows"] == 3
+    assert select["slow_calls"] == 0 and select["plan"] is None
+    assert ("SearchNode", "INSERT INTO probe VALUES (?)") in rows
+
+
+@pytest.mark.asyncio
+async def test_slow_query_captures_plan_once(tmp_path) -> None:
+    db_path = str(tmp_path / "runtime.db")
+    profiler = QueryProfiler(slow_query_ms=0.0)
+    async with runtime_db_scope(profiler=profiler):
+        async with get_db(db_path) as db:
+            await db.execute("CREATE TABLE probe (i INTEGER)")
+            for _ in range(2):
+                async with db.execute("SELECT i FROM probe WHERE i = ?", (1,)) as cur:
+                    await cur.fetchall()
+    row = next(r for r in profiler.rows() if r["template"] == "SELECT i FROM probe WHERE i = ?")
+    assert row["slow_calls"] == 2
+    assert row["plan"] and "probe" in row["plan"]
+
+
+@pytest.mark.asyncio
+async def test_query_profile_round_trip_accumulates(tmp_path) -> None:
+    db_path = str(tmp_path / "runtime.db")
+    rows = [
+        {
+            "phase": "SearchNode",
+            "template": "SELECT N",
+            "calls": 2,
+            "total_ms": 5.0,
+            "max_ms": 3.0,
+            "rows": 2,
+            "slow_calls": 0,
+            "plan": None,
+        },
+    ]
+    async with get_db(db_path) as db:
+        repo = WorkflowRepository(db)
+        assert (await repo.get_query_profile("wf-1"))["enabled"] is False
+        await repo.save_query_profile("wf-1", rows)
+        await repo.save_query_profile("wf-1", [dict(rows[0], max_ms=4.0, plan="SCAN t")])
+        profile = await repo.get_query_profile("wf-1")
+    assert profile["enabled"] is True
+    top = profile["top_queries"][0]
+    assert top["calls"] == 4 and top["total_ms"] == 10.0 and top["max_ms"] == 4.0
+    assert top["plan"] == "SCAN t"
+    assert profile["phases"] == [{"phase": "SearchNode", "calls": 4, "total_ms": 10.0, "slow_calls": 0}]
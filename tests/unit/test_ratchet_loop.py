@@ -109,7 +109,9 @@ async def _citation_validation_stub(self, section: str, content: str):
 def _patch_writer(monkeypatch, responses: list[tuple[StructuredSectionDraft, float]]):
     calls = {"count": 0}
 
-    async def _fake_write(self, section: str, context: str, word_limit=None, agent_name: str = "writing"):
+    async def _fake_write(
+        self, section: str, context: str, word_limit=None, agent_name: str = "writing", on_partial=None
+    ):
         _ = (self, section, context, word_limit, agent_name)
         calls["count"] += 1
         draft, cost_usd = responses[calls["count"] - 1]
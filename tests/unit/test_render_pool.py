@@ -0,0 +1,82 @@
+"""Unit tests for off-loop figure rendering and its input-hash cache."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from src.visualization import render_pool
+from src.visualization.forest_plot import render_forest_plot
+from src.visualization.render_pool import figure_cache_key, render_figure
+
+
+@pytest.mark.asyncio
+async def test_identical_inputs_reuse_existing_output(tmp_path) -> None:
+    calls: list[list[int]] = []
+
+    def _render(values: list[int], output_path: str) -> Path:
+        # A closure cannot be pickled, so this exercises the inline path.
+        calls.append(values)
+        path = Path(output_path)
+        path.write_text(",".join(map(str, values)), encoding="utf-8")
+        return path
+
+    out = str(tmp_path / "fig.png")
+    first = await render_figure(_render, [1, 2], output_path=out)
+    again = await render_figure(_render, [1, 2], output_path=out)
+    assert str(first) == again == out
+    assert calls == [[1, 2]]
+
+    await render_figure(_render, [1, 3], output_path=out)
+    assert calls == [[1, 2], [1, 3]]
+
+    Path(out).unlink()
+    await render_figure(_render, [1, 3], output_path=out)
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_missing_secondary_output_forces_rerender(tmp_path) -> None:
+    calls: list[str] = []
+
+    def _render(output_path: str, rob2_output_path: str) -> str:
+        calls.append(output_path)
+        Path(output_path).write_text("a", encoding="utf-8")
+        Path(rob2_output_path).write_text("b", encoding="utf-8")
+        return output_path
+
+    primary, secondary = str(tmp_path / "robins.png"), str(tmp_path / "rob2.png")
+    await render_figure(_render, output_path=primary, rob2_output_path=secondary)
+    await render_figure(_render, output_path=primary, rob2_output_path=secondary)
+    assert len(calls) == 1
+    Path(secondary).unlink()
+    await render_figure(_render, output_path=primary, rob2_output_path=secondary)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_module_level_renderer_runs_in_process_pool(tmp_path) -> None:
+    out = tmp_path / "forest.png"
+    result = await render_figure(
+        render_forest_plot,
+        effects=[0.2, 0.4, 0.3],
+        variances=[0.01, 0.02, 0.015],
+        labels=["a", "b", "c"],
+        output_path=str(out),
+        title="Forest plot",
+    )
+    assert Path(result) == out
+    assert out.stat().st_size > 0
+    assert (tmp_path / ".forest.png.render.json").is_file()
+
+
+def test_cache_key_tracks_renderer_module_source(monkeypatch) -> None:
+    source = Path("src/visualization/forest_plot.py").read_bytes()
+    assert render_pool._module_source_hash("src.visualization.forest_plot") == hashlib.sha256(source).hexdigest()
+
+    key = figure_cache_key(render_forest_plot, (), {"output_path": "f.png"})
+    assert figure_cache_key(render_forest_plot, (), {"output_path": "f.png"}) == key
+    monkeypatch.setattr(render_pool, "_module_source_hash", lambda _module: "edited")
+    assert figure_cache_key(render_forest_plot, (), {"output_path": "f.png"}) != key
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 
 import pytest
@@ -23,6 +24,7 @@ from src.models import (
 from src.models.config import ScreeningConfig
 from src.screening.dual_screener import DualReviewerScreener, ReviewerSpec, ScreeningLLMClient
 from src.screening.prompts import reviewer_a_prompt
+from src.search.pdf_retrieval import PDFRetrievalResult, PDFRetriever
 
 
 class _ScriptedClient(ScreeningLLMClient):
@@ -292,6 +294,55 @@ async def test_screen_batch_excludes_missing_fulltext_when_policy_enabled(tmp_pa
         assert results[0].exclusion_reason == ExclusionReason.NO_FULL_TEXT
 
 
+@pytest.mark.asyncio
+async def test_fulltext_screening_starts_before_slow_retrievals_finish(tmp_path) -> None:
+    fast = CandidatePaper(title="Fast host", authors=["Y"], source_database="openalex")
+    slow = CandidatePaper(title="Slow host", authors=["Z"], source_database="openalex")
+    settings = SettingsConfig(
+        agents={
+            "screening_reviewer_a": {"model": "google:gemini-2.5-flash-lite", "temperature": 0.1},
+            "screening_reviewer_b": {"model": "google:gemini-2.5-flash-lite", "temperature": 0.3},
+            "screening_adjudicator": {"model": "google:gemini-2.5-pro", "temperature": 0.2},
+        },
+        screening=ScreeningConfig(insufficient_content_min_words=0, skip_fulltext_if_no_pdf=True),
+    )
+    screened: list[int] = []
+    screened_during_slow_fetch: list[bool] = []
+
+    class _Retriever(PDFRetriever):
+        async def retrieve(self, paper: CandidatePaper) -> PDFRetrievalResult:
+            if paper.paper_id == slow.paper_id:
+                for _ in range(200):
+                    if screened:
+                        break
+                    await asyncio.sleep(0.01)
+                screened_during_slow_fetch.append(bool(screened))
+            return PDFRetrievalResult(paper_id=paper.paper_id, success=False, reason_code="no_pdf")
+
+    async with get_db(str(tmp_path / "screening_pipeline.db")) as db:
+        repo = WorkflowRepository(db)
+        await repo.create_workflow("wf-pipeline", "topic", "hash")
+        screener = DualReviewerScreener(
+            repository=repo,
+            provider=LLMProvider(settings, repo),
+            review=_review(),
+            settings=settings,
+            llm_client=_ScriptedClient([]),
+        )
+        screener.on_progress = lambda _phase, done, _total: screened.append(done)
+        results = await screener.screen_batch(
+            workflow_id="wf-pipeline",
+            stage="fulltext",
+            papers=[slow, fast],
+            retriever=_Retriever(),
+        )
+    assert screened_during_slow_fetch == [True]
+    assert [r.paper_id for r in results] == [slow.paper_id, fast.paper_id]
+    assert all(r.exclusion_reason == ExclusionReason.NO_FULL_TEXT for r in results)
+    assert screener.last_fulltext_coverage is not None
+    assert screener.last_fulltext_coverage.failed == 2
+
+
 # ---------------------------------------------------------------------------
 # Helpers shared by batch-mode tests
 # ---------------------------------------------------------------------------
@@ -398,6 +449,15 @@ def test_batch_prompt_contains_explicit_allowed_ids_constraint() -> None:
     assert "CONSTRAINT: Return decisions ONLY for the exact paper_id values listed below." in prompt
     assert "Allowed paper_ids:" in prompt
     assert "p1, p2, p3" in prompt
+    other = screener._build_batch_prompt(
+        papers=[_paper("p4")],
+        stage="title_abstract",
+        full_texts={},
+        spec=ReviewerSpec(agent_name="screening_reviewer_a", reviewer_type=ReviewerType.REVIEWER_A),
+    )
+    # Papers live only in the suffix so the long header is a reusable cache prefix.
+    assert prompt.static_prefix == other.static_prefix
+    assert "p1" not in prompt.static_prefix
 
 
 # ---------------------------------------------------------------------------
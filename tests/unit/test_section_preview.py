@@ -0,0 +1,51 @@
+"""Streamed section previews: partial-draft rendering and event throttling."""
+
+from __future__ import annotations
+
+from src.orchestration.runners.writing import section_loop
+from src.writing.section_writer import partial_draft_preview
+
+
+class _EventSink:
+    def __init__(self) -> None:
+        self.events: list[dict] = []
+
+    def _emit(self, event: dict) -> None:
+        self.events.append(event)
+
+
+def test_partial_draft_preview_tolerates_incomplete_blocks() -> None:
+    partial = {
+        "section_key": "methods",
+        "blocks": [
+            {"block_type": "subheading", "text": "Search Strategy"},
+            {"block_type": "paragraph", "text": "We searched three databases"},
+            {"block_type": "paragraph"},
+        ],
+    }
+    assert partial_draft_preview(partial) == "### Search Strategy\n\nWe searched three databases"
+    assert partial_draft_preview({"background": "Sleep matters.", "objectives": ""}) == (
+        "**Background:** Sleep matters."
+    )
+    assert partial_draft_preview({}) == ""
+
+
+def test_preview_emitter_throttles_and_skips_runs_without_event_stream(monkeypatch) -> None:
+    clock = iter([10.0, 10.4, 11.2])
+    monkeypatch.setattr(section_loop.time, "monotonic", lambda: next(clock))
+    sink = _EventSink()
+    emit = section_loop._section_preview_emitter(sink, "results", "draft")
+    assert emit is not None
+    emit("First words")
+    emit("First words and")
+    emit("First words and more")
+    assert [e["text"] for e in sink.events] == ["First words", "First words and more"]
+    assert sink.events[-1] | {"text": ""} == {
+        "type": "section_preview",
+        "section": "results",
+        "stage": "draft",
+        "text": "",
+        "word_count": 4,
+    }
+    assert section_loop._section_preview_emitter(None, "results", "draft") is None
+    assert section_loop._section_preview_emitter(object(), "results", "draft") is None
@@ -0,0 +1,70 @@
+"""Unit tests for the dependency-driven writing section scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from graphlib import CycleError
+
+import pytest
+
+from src.orchestration.runners.writing.section_scheduler import run_section_dag
+from src.writing.prompts.sections import SECTION_DEPENDENCIES, SECTIONS
+
+
+def test_every_section_declares_its_dependencies() -> None:
+    assert set(SECTION_DEPENDENCIES) == set(SECTIONS)
+    assert all(dep in SECTIONS for deps in SECTION_DEPENDENCIES.values() for dep in deps)
+
+
+@pytest.mark.asyncio
+async def test_dependents_start_without_waiting_for_unrelated_sections() -> None:
+    events: list[str] = []
+    slow_release = asyncio.Event()
+
+    async def _write(section: str, inputs: dict[str, str]) -> str:
+        events.append(f"start:{section}")
+        if section == "introduction":
+            await slow_release.wait()
+        if section == "conclusion":
+            slow_release.set()
+        events.append(f"end:{section}")
+        return f"{section}<{','.join(sorted(inputs.values()))}>"
+
+    results = await run_section_dag(SECTIONS, _write)
+
+    # Conclusion ran (and released introduction) while introduction was still in flight.
+    assert events.index("start:conclusion") < events.index("end:introduction")
+    assert events.index("end:results") < events.index("start:discussion")
+    assert results["discussion"] == "discussion<results<>>"
+    assert list(results) == SECTIONS
+
+
+@pytest.mark.asyncio
+async def test_failed_dependency_runs_dependents_without_it() -> None:
+    settled: list[str] = []
+
+    async def _write(section: str, inputs: dict[str, str]) -> str:
+        if section == "results":
+            raise RuntimeError("quota")
+        return ",".join(inputs)
+
+    async def _on_settled(section: str) -> None:
+        settled.append(section)
+
+    results = await run_section_dag(
+        ["results", "discussion"],
+        _write,
+        on_settled=_on_settled,
+    )
+    assert isinstance(results["results"], RuntimeError)
+    assert results["discussion"] == ""
+    assert settled == ["results", "discussion"]
+
+
+@pytest.mark.asyncio
+async def test_cyclic_dependencies_are_rejected() -> None:
+    async def _write(section: str, inputs: dict[str, str]) -> str:
+        return section
+
+    with pytest.raises(CycleError):
+        await run_section_dag(["a", "b"], _write, dependencies={"a": ("b",), "b": ("a",)})
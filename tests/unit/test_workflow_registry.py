@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import aiosqlite
 import pytest
 
 from src.db.workflow_registry import (
     _RESUMABLE_REGISTRY_STATUSES,
+    _open_registry,
+    _registry_path,
+    close_registry_pools,
     find_by_topic,
     find_by_workflow_id,
     find_by_workflow_id_fallback,
+    open_registry_pool,
     register,
+    registry_pool_stats,
     try_claim_for_resume,
+    update_heartbeats,
     update_status,
 )
 
@@ -203,3 +210,77 @@ async def test_try_claim_for_resume_blocks_when_running(tmp_path) -> None:
     claimed, blocking = await try_claim_for_resume(run_root, "wf-live")
     assert claimed is False
     assert blocking == "running"
+
+
+@pytest.mark.asyncio
+async def test_update_heartbeats_stamps_all_workflows_in_one_call(tmp_path) -> None:
+    run_root = str(tmp_path)
+    db_path = tmp_path / "run" / "runtime.db"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    db_path.write_text("")
+    for workflow_id in ("wf-hb1", "wf-hb2", "wf-hb3"):
+        await register(run_root, workflow_id, "Topic", "hash", str(db_path))
+    updated = await update_heartbeats(run_root, ["wf-hb1", "wf-hb3", "wf-unknown"])
+    assert updated == 2
+    async with aiosqlite.connect(_registry_path(run_root)) as db:
+        async with db.execute(
+            "SELECT workflow_id FROM workflows_registry WHERE heartbeat_at IS NOT NULL ORDER BY workflow_id"
+        ) as cur:
+            stamped = [row[0] for row in await cur.fetchall()]
+    assert stamped == ["wf-hb1", "wf-hb3"]
+
+
+@pytest.mark.asyncio
+async def test_update_heartbeats_empty_or_missing_registry_is_noop(tmp_path) -> None:
+    assert await update_heartbeats(str(tmp_path), []) == 0
+    assert await update_heartbeats(str(tmp_path), ["wf-x"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_registry_pool_serves_reads_and_writes_and_records_metrics(tmp_path) -> None:
+    run_root = str(tmp_path)
+    db_path = tmp_path / "run" / "runtime.db"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    db_path.write_text("")
+    pool = await open_registry_pool(run_root, readers=2)
+    try:
+        assert await open_registry_pool(run_root) is pool
+        await register(run_root, "wf-pool", "Pooled topic", "hash", str(db_path))
+        assert await update_status(run_root, "wf-pool", "failed") is True
+        entry = await find_by_workflow_id(run_root, "wf-pool")
+        assert entry is not None and entry.status == "failed"
+        assert await update_heartbeats(run_root, ["wf-pool"]) == 1
+
+        stats = registry_pool_stats()
+        assert len(stats) == 1
+        assert stats[0]["writer_acquisitions"] >= 3
+        assert stats[0]["reader_acquisitions"] >= 1
+        assert stats[0]["heartbeat_batches"] == 1
+        assert stats[0]["heartbeat_rows"] == 1
+    finally:
+        await close_registry_pools()
+    assert registry_pool_stats() == []
+    entry = await find_by_workflow_id(run_root, "wf-pool")
+    assert entry is not None and entry.status == "failed"
+
+
+@pytest.mark.asyncio
+async def test_registry_pool_reader_is_query_only_and_writer_discards_uncommitted(tmp_path) -> None:
+    run_root = str(tmp_path)
+    db_path = tmp_path / "run" / "runtime.db"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    db_path.write_text("")
+    pool = await open_registry_pool(run_root, readers=1)
+    try:
+        await register(run_root, "wf-ro", "Topic", "hash", str(db_path))
+        async with _open_registry(pool.path, readonly=True) as db:
+            with pytest.raises(aiosqlite.OperationalError):
+                await db.execute("UPDATE workflows_registry SET status = 'x'")
+        with pytest.raises(RuntimeError):
+            async with _open_registry(pool.path) as db:
+                await db.execute("UPDATE workflows_registry SET status = 'dirty' WHERE workflow_id = 'wf-ro'")
+                raise RuntimeError("boom")
+        entry = await find_by_workflow_id(run_root, "wf-ro")
+        assert entry is not None and entry.status == "running"
+    finally:
+        await close_registry_pools()
@@ -0,0 +1,64 @@
+"""Unit tests for streaming, cached ZIP downloads."""
+
+from __future__ import annotations
+
+import io
+import os
+import zipfile
+
+from src.web.zip_stream import (
+    ZipEntry,
+    build_cached_archive,
+    cached_archive_path,
+    entries_digest,
+    iter_zip,
+    stream_and_cache,
+)
+
+
+def _entries(tmp_path) -> list[ZipEntry]:
+    pdf = tmp_path / "paper.pdf"
+    pdf.write_bytes(b"%PDF-1.4 " + os.urandom(200_000))
+    tex = tmp_path / "manuscript.tex"
+    tex.write_text("\\section{Intro} " * 20_000, encoding="utf-8")
+    return [ZipEntry(pdf, "paper.pdf"), ZipEntry(tex, "src/manuscript.tex")]
+
+
+def test_iter_zip_streams_valid_archive_with_stored_pdfs(tmp_path) -> None:
+    entries = _entries(tmp_path)
+    chunks = list(iter_zip(entries))
+    assert len(chunks) > 2
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zf:
+        assert zf.testzip() is None
+        infos = {info.filename: info for info in zf.infolist()}
+        assert infos["paper.pdf"].compress_type == zipfile.ZIP_STORED
+        assert infos["src/manuscript.tex"].compress_type == zipfile.ZIP_DEFLATED
+        assert zf.read("paper.pdf") == entries[0].path.read_bytes()
+
+
+def test_digest_tracks_member_changes(tmp_path) -> None:
+    entries = _entries(tmp_path)
+    before = entries_digest(entries)
+    assert entries_digest(entries) == before
+    entries[1].path.write_text("changed", encoding="utf-8")
+    assert entries_digest(entries) != before
+
+
+def test_stream_and_cache_publishes_only_complete_archives(tmp_path) -> None:
+    entries = _entries(tmp_path)
+    cache_dir = tmp_path / "cache"
+    stale = cached_archive_path(cache_dir, "submission", "0" * 64)
+    cache_dir.mkdir()
+    stale.write_bytes(b"old")
+    target = cached_archive_path(cache_dir, "submission", entries_digest(entries))
+
+    aborted = stream_and_cache(entries, target)
+    next(aborted)
+    aborted.close()
+    assert not target.exists()
+    assert not list(cache_dir.glob("*.partial"))
+
+    streamed = b"".join(stream_and_cache(entries, target))
+    assert target.read_bytes() == streamed
+    assert not stale.exists()
+    assert build_cached_archive(entries, target) == target